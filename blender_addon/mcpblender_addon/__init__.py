@@ -2,6 +2,9 @@ from __future__ import annotations
 
 """Blender addon entrypoint for MCPBLENDER bridge."""
 
+import os
+from typing import Any, Dict, Mapping, Optional
+
 bl_info = {
     "name": "MCPBLENDER Core Bridge",
     "author": "MCPBLENDER",
@@ -13,6 +16,28 @@ bl_info = {
 
 _bridge_server = None
 
+# Worker pool and connection limits handed to launch_server(); None keeps the bridge default.
+# Each can be overridden with an environment variable, e.g. MCPBLENDER_BRIDGE_POOL_SIZE=4.
+BRIDGE_LIMITS: Dict[str, Any] = {
+    "pool_size": None,
+    "queue_size": None,
+    "max_connections": None,
+    "idle_timeout": None,
+    "retry_after": None,
+}
+
+
+def bridge_limits(environ: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
+    environ = os.environ if environ is None else environ
+    limits: Dict[str, Any] = {}
+    for name, value in BRIDGE_LIMITS.items():
+        raw = environ.get(f"MCPBLENDER_BRIDGE_{name.upper()}")
+        if raw:
+            value = float(raw) if name == "idle_timeout" else int(raw)
+        if value is not None:
+            limits[name] = value
+    return limits
+
 
 def register() -> None:  # pragma: no cover - Blender runtime only
     global _bridge_server
@@ -20,7 +45,7 @@ def register() -> None:  # pragma: no cover - Blender runtime only
 
     try:
         if _bridge_server is None:
-            _bridge_server = launch_server(host="127.0.0.1", port=9876)
+            _bridge_server = launch_server(host="127.0.0.1", port=9876, **bridge_limits())
     except Exception as exc:
         print(f"[MCPBLENDER] Failed to start bridge: {exc}", flush=True)
 
@@ -8,9 +8,15 @@ from .core_actions import (
     blender_health,
     capture_snapshot,
     create_cube,
+    delete_many,
     delete_object,
+    mesh_from_buffers,
     scenegraph_get,
+    scenegraph_nearest,
+    scenegraph_query_region,
     scenegraph_search,
+    scenegraph_within_radius,
+    transform_many,
     transform_object,
 )
 
@@ -20,9 +26,15 @@ __all__ = [
     "blender_health",
     "capture_snapshot",
     "create_cube",
+    "delete_many",
     "delete_object",
+    "mesh_from_buffers",
     "scenegraph_get",
+    "scenegraph_nearest",
+    "scenegraph_query_region",
     "scenegraph_search",
+    "scenegraph_within_radius",
+    "transform_many",
     "transform_object",
     "dispatch_tool",
     "build_response",
@@ -43,9 +55,15 @@ def dispatch_tool(tool: str, args: Dict[str, Any], request_id: str) -> Dict[str,
         "scene.snapshot": capture_snapshot,
         "scenegraph.search": scenegraph_search,
         "scenegraph.get": scenegraph_get,
+        "scenegraph.query_region": scenegraph_query_region,
+        "scenegraph.nearest": scenegraph_nearest,
+        "scenegraph.within_radius": scenegraph_within_radius,
         "object.create_cube": create_cube,
         "object.transform": transform_object,
+        "object.transform_many": transform_many,
         "object.delete": delete_object,
+        "object.delete_many": delete_many,
+        "mesh.from_buffers": mesh_from_buffers,
         "material.assign_simple": assign_material_simple,
     }
     func = mapping.get(tool)
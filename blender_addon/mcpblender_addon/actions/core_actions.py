@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Dict
+from array import array
+from typing import Any, Dict, Generator, List, Optional, Sequence, Tuple
 
 try:  # pragma: no cover - Blender runtime only
     import bpy
@@ -17,6 +18,54 @@ except ImportError:  # pragma: no cover - Blender runtime only
     Vector = None
     HAS_BPY = False
 
+from ..index import (
+    REVISIONS,
+    NameIndex,
+    StaleCursorError,
+    decode_cursor,
+    encode_cursor,
+    ensure_name_index,
+    ensure_spatial_index,
+    object_key,
+    resolve_indexed,
+    track_added,
+    track_changed,
+    track_moved,
+    track_removed,
+)
+from ..snapshot.fields import FieldRegistry, Plan
+from ..snapshot.fragments import FRAGMENT_CACHE, EncodedObjects, encode_fragment
+from ..snapshot.levels import DEFAULT_MIN_LEVEL, LEVELS, SNAPSHOT_COSTS, SnapshotSummary, level_plan, parse_level
+from ..snapshot.light_snapshot import SNAPSHOT_SCHEMA_VERSION, _bbox_world
+from .deadline import check_deadline, current_deadline, deadline_scope
+from .deadline import expired as deadline_expired
+from .deadline import remaining as deadline_remaining
+from .mesh_buffers import build_mesh
+from .mesh_templates import acquire_mesh
+from .orphans import remove_orphans
+from .steps import Steps, run_to_completion
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 5000
+DEFAULT_SEARCH_LIMIT = 100
+MAX_SEARCH_LIMIT = 1000
+DEFAULT_SPATIAL_LIMIT = 1000
+# Under a request deadline delete_many removes objects in batches of this size and
+# checks the deadline between them; without one it is a single batch_remove.
+DEADLINE_DELETE_CHUNK = 5000
+# Long scans poll the request deadline every this many entries.
+DEADLINE_POLL_EVERY = 256
+
+# Bulk transforms go through collection-wide foreach_get/foreach_set once the batch
+# covers at least this fraction of bpy.data.objects; smaller batches write per object.
+FOREACH_MIN_FRACTION = 0.25
+_TRANSFORM_COLUMNS = (
+    ("location", "locations"),
+    ("rotation_euler", "rotations"),
+    ("scale", "scales"),
+)
+Rows = Sequence[Tuple[float, float, float]]
+
 
 def _require_bpy() -> None:
     if not HAS_BPY:
@@ -32,39 +81,399 @@ def blender_health() -> Dict[str, Any]:
     }
 
 
-def _object_payload(obj) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
-    return {
-        "id": getattr(obj, "name_full", obj.name),
-        "name": obj.name,
-        "type": obj.type,
-        "location": tuple(round(v, 6) for v in obj.location[:]),
-        "rotation": tuple(round(v, 6) for v in obj.rotation_euler[:]),
-        "scale": tuple(round(v, 6) for v in obj.scale[:]),
-    }
+PAYLOAD_FIELDS = FieldRegistry()
+
+
+@PAYLOAD_FIELDS.field("id")
+def _field_id(obj) -> str:
+    return getattr(obj, "name_full", obj.name)
+
+
+@PAYLOAD_FIELDS.field("name")
+def _field_name(obj) -> str:
+    return obj.name
+
+
+@PAYLOAD_FIELDS.field("type")
+def _field_type(obj) -> str:
+    return obj.type
+
+
+@PAYLOAD_FIELDS.field("location")
+def _field_location(obj) -> Tuple[float, ...]:
+    return tuple(round(v, 6) for v in obj.location[:])
+
+
+@PAYLOAD_FIELDS.field("rotation")
+def _field_rotation(obj) -> Tuple[float, ...]:
+    return tuple(round(v, 6) for v in obj.rotation_euler[:])
+
+
+@PAYLOAD_FIELDS.field("scale")
+def _field_scale(obj) -> Tuple[float, ...]:
+    return tuple(round(v, 6) for v in obj.scale[:])
+
+
+def _object_payload(obj, plan: Optional[Plan] = None) -> Dict[str, Any]:
+    return FieldRegistry.extract(obj, plan if plan is not None else PAYLOAD_FIELDS.plan())
+
 
+_scene_members_cache: Dict[str, Any] = {"scene": None, "revision": -1, "keys": frozenset()}
 
-def capture_snapshot(args: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
+
+def _scene_members(scene, index: NameIndex) -> frozenset:
+    """Keys of objects in the scene, re-walked only when scene structure changes."""
+    cache = _scene_members_cache
+    scene_key = str(scene.as_pointer())
+    if cache["scene"] != scene_key or cache["revision"] != REVISIONS.structure_revision:
+        keys = frozenset(object_key(obj) for obj in scene.objects)
+        if cache["scene"] == scene_key:
+            # Objects linked into or out of the scene move snapshot pages like adds/removes.
+            index.mark(sorted(keys ^ cache["keys"]))
+        cache["keys"] = keys
+        cache["scene"] = scene_key
+        cache["revision"] = REVISIONS.structure_revision
+    return cache["keys"]
+
+
+def _snapshot_level(
+    args: Dict[str, Any], page_size: int, total: int, budget_ms: Optional[float]
+) -> Tuple[Optional[str], Optional[str]]:
+    """(requested level, level to capture); a budget may step the level down, never below `min_level`."""
+    if args.get("level") is None:
+        return None, None
+    requested = parse_level(args["level"])
+    if budget_ms is None:
+        return requested, requested
+    min_level = parse_level(args.get("min_level", DEFAULT_MIN_LEVEL), "min_level")
+    if LEVELS.index(min_level) > LEVELS.index(requested):
+        min_level = requested
+    count = total if requested == "summary" else min(page_size, total)
+    return requested, SNAPSHOT_COSTS.choose(requested, min_level, count, budget_ms)
+
+
+def _snapshot_budget(args: Dict[str, Any]) -> Optional[float]:
+    """`budget_ms`, capped by the request deadline when there is one."""
+    budget_ms = float(args["budget_ms"]) if args.get("budget_ms") is not None else None
+    left = deadline_remaining()
+    if left is not None:
+        budget_ms = left * 1000.0 if budget_ms is None else min(budget_ms, left * 1000.0)
+    return budget_ms
+
+
+def capture_snapshot(args: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    One page of the scene's objects in stable name order. `page_size` (legacy alias
+    `limit`) bounds the page; `next_cursor` continues it and `complete` says whether
+    this was the last page. With the default `consistency: "strict"` a cursor raises
+    StaleCursorError once an object at or before its position was added, removed,
+    renamed or relinked (later pages would skip or repeat objects); edits that keep
+    the order, such as transforms, do not invalidate it. "relaxed" always keeps
+    paging after the last returned name. Object payloads come from FRAGMENT_CACHE,
+    so only objects whose revision moved are extracted and encoded again.
+
+    `level` selects summary/light/full detail (see snapshot.levels); without it objects
+    carry the compact PAYLOAD_FIELDS. With `budget_ms` the level steps down when the
+    cost model says the page will not fit, and capture stops at the budget with
+    `truncated` set and a cursor for the rest. A request deadline acts as a budget.
+    Cursors carry the level they were captured at and later pages keep it.
+    """
     _require_bpy()
-    limit = int(args.get("limit", 100))
+    started = time.perf_counter()
     scene = bpy.context.scene
-    objects = list(scene.objects)[:limit]
-    return {
+    page_size = int(args.get("page_size", args.get("limit", DEFAULT_PAGE_SIZE)))
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+    strict = args.get("consistency", "strict") != "relaxed"
+    index = ensure_name_index()
+    members = _scene_members(scene, index)
+    revision = REVISIONS.revision
+    budget_ms = _snapshot_budget(args)
+    state = decode_cursor(str(args["cursor"])) if args.get("cursor") else None
+    if state is not None and state.get("s") != scene.name:
+        raise ValueError("cursor belongs to another scene")
+    if state is not None and state.get("l") is not None and args.get("level") is not None:
+        # A cursor continues at the level its sequence started with; the budget only truncates.
+        requested = parse_level(args["level"])
+        level = parse_level(state["l"])
+    else:
+        requested, level = _snapshot_level(args, page_size, len(members), None if state is not None else budget_ms)
+    if level is None:
+        plan = PAYLOAD_FIELDS.plan(args.get("fields"))
+    elif level != "summary":
+        plan = level_plan(level, args.get("fields"))
+    deadline = started + budget_ms / 1000.0 if budget_ms is not None else None
+
+    after = None
+    if state is not None:
+        if (state.get("l") == "summary") != (level == "summary"):
+            raise ValueError("cursor belongs to another snapshot level")
+        if strict and (not isinstance(state.get("r"), int) or index.changed_up_to(state.get("a") or (), state["r"])):
+            raise StaleCursorError("objects already paged past were added, removed or renamed; restart the snapshot")
+        after = state.get("a")
+
+    summary = SnapshotSummary() if level == "summary" else None
+    plan_names = () if summary is not None else tuple(name for name, _, _ in plan)
+    objects = EncodedObjects()
+    emitted = 0
+    last = None
+    has_more = truncated = False
+    for position in index.iter_from(after):
+        key = position[1]
+        if key not in members:
+            continue
+        if summary is None and emitted == page_size:
+            has_more = True
+            break
+        if deadline is not None and emitted and time.perf_counter() > deadline:
+            has_more = truncated = True
+            break
+        if summary is not None:
+            obj = resolve_indexed(key)
+            if obj is None:
+                continue
+            summary.add(
+                index.type_of(key) or obj.type,
+                [c.name for c in getattr(obj, "users_collection", ())],
+                _bbox_world(obj),
+            )
+        else:
+            cache_key = (key, level or "compact", plan_names)
+            validator = (REVISIONS.generation, REVISIONS.of(key), index.name_of(key))
+            fragment = FRAGMENT_CACHE.get(cache_key, validator)
+            if fragment is None:
+                obj = resolve_indexed(key)
+                if obj is None:
+                    continue
+                fragment = encode_fragment(_object_payload(obj, plan))
+                FRAGMENT_CACHE.put(cache_key, validator, fragment)
+            objects.append(fragment)
+        emitted += 1
+        last = position
+
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    SNAPSHOT_COSTS.observe(level or "compact", emitted, elapsed_ms)
+
+    result: Dict[str, Any] = {
         "version": "1",
         "scene": scene.name,
         "timestamp": time.time(),
-        "objects": [_object_payload(obj) for obj in objects],
+        "total": len(members),
+        "revision": revision,
     }
+    if summary is not None:
+        result.update(summary.payload())
+    else:
+        result["objects"] = objects
+    if level is not None:
+        result["level"] = level
+        if level != requested:
+            result["requested_level"] = requested
+        if level != "summary":
+            result["schema_version"] = SNAPSHOT_SCHEMA_VERSION
+    result.update({"complete": not has_more, "truncated": truncated, "next_cursor": None})
+    if budget_ms is not None:
+        result["budget"] = {"budget_ms": round(budget_ms, 3), "elapsed_ms": round(elapsed_ms, 3)}
+    if has_more and last is not None:
+        state = {"s": scene.name, "r": index.revision, "a": list(last)}
+        if level is not None:
+            state["l"] = level
+        result["next_cursor"] = encode_cursor(state)
+    return result
+
+
+def iter_capture_snapshot(args: Dict[str, Any], chunk_size: int) -> Steps:
+    """
+    capture_snapshot as a step generator: the requested page is captured
+    `chunk_size` objects per step, each step continuing from the previous one's
+    cursor, and returned as one page. The level and the budget deadline are settled
+    when the job starts and hold for every step. A summary takes one step.
+    """
+    _require_bpy()
+    started = time.perf_counter()
+    page_size = int(args.get("page_size", args.get("limit", DEFAULT_PAGE_SIZE)))
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+    budget_ms = _snapshot_budget(args)
+    total = len(_scene_members(bpy.context.scene, ensure_name_index()))
+    # A cursor keeps its own level (see capture_snapshot), so only a fresh capture steps down.
+    requested, level = _snapshot_level(args, page_size, total, None if args.get("cursor") else budget_ms)
+    deadline = time.monotonic() + budget_ms / 1000.0 if budget_ms is not None else None
+    chunk_args = {key: value for key, value in args.items() if key not in ("limit", "budget_ms", "min_level")}
+    if level is not None:
+        chunk_args.update(level=level, min_level=level)
+
+    if level == "summary":
+        with deadline_scope(deadline):
+            page = capture_snapshot(chunk_args)
+        yield 1, 1
+    else:
+        step = max(1, int(chunk_size))
+        objects = EncodedObjects()
+        while True:
+            with deadline_scope(deadline):
+                page = capture_snapshot({**chunk_args, "page_size": min(step, page_size - len(objects))})
+            objects.fragments.extend(page["objects"].fragments)
+            if page["complete"] or page["truncated"] or len(objects) >= page_size:
+                break
+            chunk_args["cursor"] = page["next_cursor"]
+            yield len(objects), min(page_size, page["total"])
+        page["objects"] = objects
+    if level != requested:
+        page["requested_level"] = requested
+    if budget_ms is not None:
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        page["budget"] = {"budget_ms": round(budget_ms, 3), "elapsed_ms": round(elapsed_ms, 3)}
+    return page
+
+
+def _matches_filters(obj, collection: Optional[str], parent: Optional[str]) -> bool:
+    if collection is not None and collection not in {c.name for c in obj.users_collection}:
+        return False
+    if parent is not None:
+        owner = obj.parent
+        if owner is None or parent not in (owner.name, str(owner.as_pointer())):
+            return False
+    return True
+
+
+def scenegraph_search(args: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Name search backed by the incremental name index. Supports `match`
+    (substring/prefix), `type`/`collection`/`parent` filters and `limit` + opaque
+    `cursor` pagination. `count` is the total number of matches; payloads are only
+    built for the returned page. When the request deadline stops the scan, the page
+    is `truncated`: `count` then covers only the names scanned, and cursors from
+    such pages skip (rather than re-count) everything before them.
+    """
+    _require_bpy()
+    index = ensure_name_index()
+    query = str(args.get("query", ""))
+    match = args.get("match", "substring")
+    obj_type = str(args["type"]).upper() if args.get("type") else None
+    collection = args.get("collection")
+    parent = args.get("parent")
+    limit = max(1, min(int(args.get("limit", DEFAULT_SEARCH_LIMIT)), MAX_SEARCH_LIMIT))
+    plan = PAYLOAD_FIELDS.plan(args.get("fields"))
+    fingerprint = [query, match, obj_type, collection, parent]
+
+    after = None
+    partial = False
+    if args.get("cursor"):
+        state = decode_cursor(str(args["cursor"]))
+        if state.get("q") != fingerprint:
+            raise ValueError("cursor does not belong to this query")
+        after = tuple(state.get("a") or ())
+        partial = bool(state.get("t"))
+
+    needs_object = collection is not None or parent is not None
+    total = 0
+    page: List[Any] = []
+    last = None
+    has_more = truncated = False
+    position_before = after
+    looked = 0
+    for position in index.iter_matches(query, match):
+        if partial and after is not None and position <= after:
+            continue
+        if looked and looked % DEADLINE_POLL_EVERY == 0 and deadline_expired():
+            # Stop here; the cursor resumes after the last position looked at (never before `after`).
+            truncated = has_more = True
+            if len(page) < limit:
+                last = position_before if after is None or position_before > after else after
+            break
+        looked += 1
+        position_before = position
+        key = position[1]
+        if obj_type is not None and index.type_of(key) != obj_type:
+            continue
+        obj = None
+        if needs_object:
+            obj = resolve_indexed(key)
+            if obj is None or not _matches_filters(obj, collection, parent):
+                continue
+        total += 1
+        if after is not None and position <= after:
+            continue
+        if len(page) < limit:
+            page.append(obj if obj is not None else key)
+            last = position
+        else:
+            has_more = True
+
+    objects = []
+    for entry in page:
+        obj = resolve_indexed(entry) if isinstance(entry, str) else entry
+        if obj is not None:
+            objects.append(_object_payload(obj, plan))
+    result: Dict[str, Any] = {"count": total, "objects": objects, "next_cursor": None}
+    if truncated or partial:
+        result["truncated"] = True
+    if has_more and last is not None:
+        state = {"q": fingerprint, "a": list(last)}
+        if truncated or partial:
+            state["t"] = 1
+        result["next_cursor"] = encode_cursor(state)
+    return result
+
+
+def _vec3(value: Any, field: str) -> Tuple[float, float, float]:
+    if value is None or len(value) != 3:
+        raise ValueError(f"{field} must have 3 components")
+    return (float(value[0]), float(value[1]), float(value[2]))
+
+
+def _spatial_rows(hits: Sequence[Tuple[Optional[float], str]], limit: int) -> Dict[str, Any]:
+    """Compact rows built from index data only (no bpy access per hit)."""
+    index = ensure_spatial_index()
+    names = ensure_name_index()
+    rows = []
+    for distance, key in hits[:limit]:
+        lo, hi = index.box_of(key)
+        row: Dict[str, Any] = {
+            "id": key,
+            "name": names.name_of(key),
+            "type": names.type_of(key),
+            "bbox_world": {"min": list(lo), "max": list(hi)},
+        }
+        if distance is not None:
+            row["distance"] = round(distance, 6)
+        rows.append(row)
+    return {"count": len(hits), "objects": rows}
+
+
+def _spatial_limit(args: Dict[str, Any]) -> int:
+    return max(1, int(args.get("limit", DEFAULT_SPATIAL_LIMIT)))
+
+
+def scenegraph_query_region(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Objects whose world bbox overlaps (or with `contained`, lies inside) min/max."""
+    _require_bpy()
+    lo = _vec3(args.get("min"), "min")
+    hi = _vec3(args.get("max"), "max")
+    keys = ensure_spatial_index().query_region(lo, hi, contained=bool(args.get("contained", False)))
+    return _spatial_rows([(None, key) for key in keys], _spatial_limit(args))
 
 
-def scenegraph_search(args: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
+def scenegraph_nearest(args: Dict[str, Any]) -> Dict[str, Any]:
+    """The k objects whose world bbox is closest to `point`, nearest first."""
     _require_bpy()
-    query = str(args.get("query", "")).lower()
-    matches = []
-    for obj in bpy.data.objects:
-        if query and query not in obj.name.lower():
-            continue
-        matches.append(_object_payload(obj))
-    return {"count": len(matches), "objects": matches}
+    point = _vec3(args.get("point"), "point")
+    k = int(args.get("k", 1))
+    if k < 1:
+        raise ValueError("k must be >= 1")
+    max_distance = args.get("max_distance")
+    hits = ensure_spatial_index().nearest(point, k, None if max_distance is None else float(max_distance))
+    return _spatial_rows(hits, k)
+
+
+def scenegraph_within_radius(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Objects whose world bbox lies within `radius` of `point`, nearest first."""
+    _require_bpy()
+    point = _vec3(args.get("point"), "point")
+    radius = float(args.get("radius", 0.0))
+    if radius < 0:
+        raise ValueError("radius must be >= 0")
+    hits = ensure_spatial_index().within_radius(point, radius)
+    return _spatial_rows(hits, _spatial_limit(args))
 
 
 def scenegraph_get(args: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
@@ -72,6 +481,7 @@ def scenegraph_get(args: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover
     identifier = args.get("id") or args.get("name")
     if not identifier:
         raise ValueError("id or name is required")
+    plan = PAYLOAD_FIELDS.plan(args.get("fields"))
     obj = bpy.data.objects.get(identifier)
     if obj is None:
         obj = bpy.context.scene.objects.get(identifier) if hasattr(bpy.context, "scene") else None
@@ -79,7 +489,7 @@ def scenegraph_get(args: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover
         obj = bpy.data.objects.get(str(identifier))
     if obj is None:
         raise LookupError(f"Object {identifier} not found")
-    return _object_payload(obj)
+    return _object_payload(obj, plan)
 
 
 def create_cube(args: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
@@ -90,11 +500,13 @@ def create_cube(args: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - B
     rotation = args.get("rotation", (0.0, 0.0, 0.0))
     scale = args.get("scale", (1.0, 1.0, 1.0))
 
-    mesh = bpy.data.meshes.new(f"{name}_mesh")
-    bm = bmesh.new()
-    bmesh.ops.create_cube(bm, size=size)
-    bm.to_mesh(mesh)
-    bm.free()
+    mesh = acquire_mesh(
+        "cube",
+        {"size": size},
+        lambda bm: bmesh.ops.create_cube(bm, size=size),
+        f"{name}_mesh",
+        share=bool(args.get("share_mesh", False)),
+    )
 
     obj = bpy.data.objects.new(name, mesh)
     scene = bpy.context.scene
@@ -104,10 +516,26 @@ def create_cube(args: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - B
     obj.rotation_euler = Euler(rotation)
     obj.scale = Vector(scale)
 
+    track_added(obj)
     _update_view_layer()
     return _object_payload(obj)
 
 
+def mesh_from_buffers(args: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
+    """Create a mesh object from packed vertex/index buffers (see mesh_buffers.build_mesh)."""
+    _require_bpy()
+    name = args.get("name") or "MCP_Mesh"
+    mesh = build_mesh(f"{name}_mesh", args)
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    if args.get("location") is not None:
+        obj.location = Vector(_vec3(args["location"], "location"))
+
+    track_added(obj)
+    _update_view_layer()
+    return {**_object_payload(obj), "vertex_count": len(mesh.vertices), "face_count": len(mesh.polygons)}
+
+
 def _target_object(args: Dict[str, Any]):  # pragma: no cover - Blender runtime only
     identifier = args.get("id") or args.get("name")
     if not identifier:
@@ -125,16 +553,26 @@ def transform_object(args: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cove
     obj = _target_object(args)
     space = args.get("space", "world")
     location = args.get("location")
+    delta = args.get("delta")
     rotation = args.get("rotation")
     scale = args.get("scale")
 
+    # World-space moves go through matrix_world only; Blender derives the local
+    # location from it, so a parent's offset is not counted twice.
     if location is not None:
         vec = Vector(location)
         if space == "world":
-            obj.matrix_world.translation = vec
-            obj.location = vec
+            world = obj.matrix_world.copy()
+            world.translation = vec
+            obj.matrix_world = world
         else:
             obj.location = vec
+    if delta is not None:
+        offset = Vector(delta)
+        if space == "world":
+            obj.matrix_world = Matrix.Translation(offset) @ obj.matrix_world
+        else:
+            obj.location = Vector(obj.location) + offset
     if rotation is not None:
         eul = Euler(rotation)
         if space == "world":
@@ -148,10 +586,192 @@ def transform_object(args: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cove
         scl = Vector(scale)
         obj.scale = scl
 
+    track_moved([obj])
     _update_view_layer()
     return _object_payload(obj)
 
 
+class _PackedRows:
+    """3-vector rows read in place from a flat array.array, as the streaming body reader packs them."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values: array) -> None:
+        self._values = values
+
+    def __len__(self) -> int:
+        return len(self._values) // 3
+
+    def __getitem__(self, index: int) -> Tuple[float, float, float]:
+        base = index * 3
+        values = self._values
+        return (float(values[base]), float(values[base + 1]), float(values[base + 2]))
+
+
+def _vector_rows(values: Any, count: int, field: str) -> Optional[Rows]:
+    """Accept either a list of 3-vectors or a flat list (or packed array) of 3*count floats."""
+    if values is None:
+        return None
+    if isinstance(values, array):
+        if len(values) != count * 3:
+            raise ValueError(f"{field} must hold {count * 3} floats")
+        return _PackedRows(values)
+    values = list(values)
+    if values and not isinstance(values[0], (list, tuple)):
+        if len(values) != count * 3:
+            raise ValueError(f"{field} must hold {count * 3} floats")
+        values = [values[i : i + 3] for i in range(0, len(values), 3)]
+    if len(values) != count:
+        raise ValueError(f"{field} must have {count} entries")
+    rows = []
+    for row in values:
+        if len(row) != 3:
+            raise ValueError(f"{field} entries must have 3 components")
+        rows.append((float(row[0]), float(row[1]), float(row[2])))
+    return rows
+
+
+def _resolve_many(identifiers: Sequence[Any]) -> Tuple[List[Any], List[str]]:  # pragma: no cover - Blender runtime only
+    objects = bpy.data.objects
+    resolved: List[Any] = []
+    missing: List[str] = []
+    by_pointer: Optional[Dict[str, Any]] = None
+    for identifier in identifiers:
+        key = str(identifier)
+        obj = objects.get(key)
+        if obj is None:
+            if by_pointer is None:
+                by_pointer = {str(o.as_pointer()): o for o in objects}
+            obj = by_pointer.get(key)
+        if obj is None:
+            missing.append(key)
+        resolved.append(obj)
+    return resolved, missing
+
+
+def _combine(current: Sequence[float], row: Tuple[float, float, float], delta: bool) -> Tuple[float, float, float]:
+    if delta:
+        return (current[0] + row[0], current[1] + row[1], current[2] + row[2])
+    return row
+
+
+def _apply_foreach(targets: List[Tuple[Any, int]], columns: Dict[str, Rows], delta: bool) -> None:
+    """Patch whole-collection float buffers and write them back in one call per attribute."""
+    objects = bpy.data.objects
+    positions = {name: i for i, name in enumerate(objects.keys())}
+    for attr, rows in columns.items():
+        buf = array("f", bytes(4 * 3 * len(positions)))
+        objects.foreach_get(attr, buf)
+        for obj, row_index in targets:
+            base = positions[obj.name] * 3
+            value = _combine(buf[base : base + 3], rows[row_index], delta)
+            buf[base : base + 3] = array("f", value)
+        objects.foreach_set(attr, buf)
+    # foreach_set skips RNA updates; tag the touched objects so the depsgraph re-evaluates.
+    for obj, _ in targets:
+        obj.update_tag(refresh={"OBJECT"})
+
+
+def _apply_per_object(targets: List[Tuple[Any, int]], columns: Dict[str, Rows], delta: bool) -> None:
+    for obj, row_index in targets:
+        for attr, rows in columns.items():
+            setattr(obj, attr, _combine(getattr(obj, attr), rows[row_index], delta))
+
+
+def _apply_world_parented(obj, columns: Dict[str, Rows], row_index: int, delta: bool) -> None:  # pragma: no cover - Blender runtime only
+    translation, quat, world_scale = obj.matrix_world.decompose()
+    euler = quat.to_euler()
+    if "location" in columns:
+        translation = Vector(_combine(translation, columns["location"][row_index], delta))
+    if "rotation_euler" in columns:
+        euler = Euler(_combine(euler, columns["rotation_euler"][row_index], delta))
+    if "location" in columns or "rotation_euler" in columns:
+        obj.matrix_world = Matrix.LocRotScale(translation, euler, world_scale)
+    if "scale" in columns:
+        obj.scale = _combine(obj.scale, columns["scale"][row_index], delta)
+
+
+def _parent_depth(obj) -> int:
+    depth = 0
+    parent = obj.parent
+    while parent is not None:
+        depth += 1
+        parent = parent.parent
+    return depth
+
+
+def _compact_transform(obj) -> Dict[str, Any]:
+    return {
+        "id": getattr(obj, "name_full", obj.name),
+        "location": [round(v, 6) for v in obj.location[:]],
+        "rotation": [round(v, 6) for v in obj.rotation_euler[:]],
+        "scale": [round(v, 6) for v in obj.scale[:]],
+    }
+
+
+def transform_many(args: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Bulk transform: parallel arrays of ids and location/rotation/scale rows, one
+    view-layer update for the whole batch (plus one per parent level for world
+    rows of parented objects).
+    """
+    _require_bpy()
+    identifiers = args.get("ids") or args.get("names")
+    if not identifiers:
+        raise ValueError("ids is required")
+    space = args.get("space", "world")
+    if space not in ("world", "local"):
+        raise ValueError("space must be 'world' or 'local'")
+    mode = args.get("mode", "absolute")
+    if mode not in ("absolute", "delta"):
+        raise ValueError("mode must be 'absolute' or 'delta'")
+    delta = mode == "delta"
+
+    count = len(identifiers)
+    columns: Dict[str, Rows] = {}
+    for attr, field in _TRANSFORM_COLUMNS:
+        rows = _vector_rows(args.get(field), count, field)
+        if rows is not None:
+            columns[attr] = rows
+    if not columns:
+        raise ValueError("at least one of locations, rotations, scales is required")
+
+    objects, missing = _resolve_many(identifiers)
+    check_deadline("object.transform_many")  # nothing has been written yet
+    direct: List[Tuple[Any, int]] = []
+    parented: Dict[int, List[Tuple[Any, int]]] = {}
+    for row_index, obj in enumerate(objects):
+        if obj is None:
+            continue
+        if space == "world" and obj.parent is not None:
+            parented.setdefault(_parent_depth(obj), []).append((obj, row_index))
+        else:
+            direct.append((obj, row_index))
+
+    if direct:
+        if len(direct) >= FOREACH_MIN_FRACTION * len(bpy.data.objects):
+            _apply_foreach(direct, columns, delta)
+        else:
+            _apply_per_object(direct, columns, delta)
+    # World rows of parented objects are relative to their parents' evaluated matrices, so
+    # they go one depth level at a time, parents first, with the view layer updated in
+    # between to pick up parents moved earlier in this batch.
+    written = bool(direct)
+    for depth in sorted(parented):
+        if written:
+            _update_view_layer()
+        for obj, row_index in parented[depth]:
+            _apply_world_parented(obj, columns, row_index, delta)
+        written = True
+
+    track_moved(obj for obj in objects if obj is not None)
+    _update_view_layer()
+    result: Dict[str, Any] = {"count": count - len(missing), "missing": missing}
+    if args.get("result") == "objects":
+        result["objects"] = [_compact_transform(obj) for obj in objects if obj is not None]
+    return result
+
+
 def delete_object(args: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
     _require_bpy()
     name = args.get("name") or args.get("object")
@@ -160,11 +780,122 @@ def delete_object(args: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover -
     obj = bpy.data.objects.get(name)
     if obj is None:
         raise LookupError(f"Object {name} not found")
+    key = object_key(obj)
     bpy.data.objects.remove(obj, do_unlink=True)
+    track_removed([key])
     _update_view_layer()
     return {"deleted": name}
 
 
+def _filter_objects(args: Dict[str, Any]) -> Tuple[List[Any], List[str]]:
+    identifiers = args.get("ids") or args.get("names")
+    collection_name = args.get("collection")
+    obj_type = args.get("type")
+    prefix = args.get("name_prefix")
+    if not (identifiers or collection_name or obj_type or prefix or args.get("all")):
+        raise ValueError("ids, names, collection, type, name_prefix or all=true is required")
+
+    missing: List[str] = []
+    if identifiers:
+        resolved, missing = _resolve_many(identifiers)
+        candidates = [obj for obj in resolved if obj is not None]
+    elif collection_name:
+        scene = bpy.context.scene
+        if scene is not None and scene.collection.name == collection_name:
+            collection = scene.collection
+        else:
+            collection = bpy.data.collections.get(collection_name)
+        if collection is None:
+            raise LookupError(f"Collection {collection_name} not found")
+        candidates = list(collection.all_objects)
+    else:
+        candidates = list(bpy.data.objects)
+
+    if obj_type:
+        wanted = str(obj_type).upper()
+        candidates = [obj for obj in candidates if obj.type == wanted]
+    if prefix:
+        candidates = [obj for obj in candidates if obj.name.startswith(prefix)]
+
+    unique: Dict[int, Any] = {}
+    for obj in candidates:
+        unique.setdefault(obj.as_pointer(), obj)
+    return list(unique.values()), missing
+
+
+def _owned_datablocks(objects: Sequence[Any]) -> List[Any]:
+    """Object data and materials that may become orphaned once the objects go away."""
+    owned: Dict[int, Any] = {}
+    for obj in objects:
+        data = obj.data
+        if data is not None:
+            owned.setdefault(data.as_pointer(), data)
+            for mat in getattr(data, "materials", None) or ():
+                if mat is not None:
+                    owned.setdefault(mat.as_pointer(), mat)
+        for slot in obj.material_slots:
+            if slot.material is not None:
+                owned.setdefault(slot.material.as_pointer(), slot.material)
+    return list(owned.values())
+
+
+def _alive(block) -> bool:
+    try:
+        block.as_pointer()
+    except ReferenceError:
+        return False
+    return True
+
+
+def iter_delete_many(args: Dict[str, Any], chunk_size: Optional[int] = None) -> Generator[Tuple[int, int], None, Dict[str, Any]]:
+    """
+    delete_many as a generator: removes `chunk_size` objects per step (all at once
+    when None), yields (deleted, total) after each batch and returns the result.
+    Objects removed by someone else between steps are skipped.
+    """
+    _require_bpy()
+    objects, missing = _filter_objects(args)
+    purge = bool(args.get("purge_orphans", False))
+    owned = _owned_datablocks(objects) if purge else []
+    total = len(objects)
+    step = max(1, int(chunk_size)) if chunk_size else max(total, 1)
+    names: List[str] = []
+    processed = 0
+
+    for start in range(0, total, step):
+        if start and deadline_expired():
+            break
+        chunk = [obj for obj in objects[start : start + step] if _alive(obj)]
+        keys = [object_key(obj) for obj in chunk]
+        names.extend(obj.name for obj in chunk)
+        if chunk:
+            bpy.data.batch_remove(ids=chunk)
+        track_removed(keys)
+        processed = start + len(objects[start : start + step])
+        yield processed, total
+
+    freed = remove_orphans([block for block in owned if _alive(block)]) if purge else {}
+    _update_view_layer()
+    result: Dict[str, Any] = {"deleted": len(names), "missing": missing, "freed": freed}
+    if processed < total:
+        result["truncated"] = True
+        result["remaining"] = total - processed
+    if args.get("result") == "names":
+        result["names"] = names
+    return result
+
+
+def delete_many(args: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Delete objects by ids/names or by collection/type/name_prefix filters in a single
+    bpy.data.batch_remove pass; purge_orphans also drops their now-unused data. Under a
+    request deadline it works in DEADLINE_DELETE_CHUNK batches and stops between them
+    once the deadline passes, reporting `truncated` and how many matches `remaining`.
+    """
+    chunk = DEADLINE_DELETE_CHUNK if current_deadline() is not None else None
+    return run_to_completion(iter_delete_many(args, chunk_size=chunk))
+
+
 def assign_material_simple(args: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
     _require_bpy()
     target_name = args.get("object") or args.get("name")
@@ -213,6 +944,7 @@ def assign_material_simple(args: Dict[str, Any]) -> Dict[str, Any]:  # pragma: n
     else:
         slots[0] = mat
 
+    track_changed([obj], kind="material.changed")
     _update_view_layer()
     return {"material_name": mat.name, "object": obj.name}
 
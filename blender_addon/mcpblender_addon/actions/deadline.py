@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+"""
+Request deadlines for long-running actions.
+
+The bridge runs each RPC inside deadline_scope() with the caller's absolute
+deadline (time.monotonic() based). Handlers poll remaining()/expired() between
+units of work and stop early: read-only ones return what they have as a partial
+result, mutations call check_deadline() before they start changing data, so a
+DeadlineExceeded never leaves a half-applied batch. Outside a scope (jobs, tests,
+direct calls) there is no deadline and every check passes.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+_local = threading.local()
+
+
+class DeadlineExceeded(Exception):
+    """The caller's deadline passed before the action could finish."""
+
+
+def current_deadline() -> Optional[float]:
+    return getattr(_local, "deadline", None)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left (may be negative), or None without a deadline."""
+    deadline = current_deadline()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def check_deadline(what: str = "operation") -> None:
+    if expired():
+        raise DeadlineExceeded(f"{what} exceeded its deadline")
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[float]) -> Iterator[None]:
+    """Make `deadline` current for this thread; nested scopes keep the earlier one."""
+    previous = current_deadline()
+    if previous is not None and deadline is not None:
+        deadline = min(previous, deadline)
+    _local.deadline = deadline if deadline is not None else previous
+    try:
+        yield
+    finally:
+        _local.deadline = previous
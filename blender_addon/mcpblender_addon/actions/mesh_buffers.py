@@ -0,0 +1,431 @@
+from __future__ import annotations
+
+"""
+Binary mesh geometry transport.
+
+Geometry is read with foreach_get straight into typed arrays and shipped as a frame:
+
+    b"MCPM" | u16 version | u16 reserved | u32 header_len | JSON header | sections
+
+The JSON header is space-padded so every section starts 8-byte aligned; each entry
+in header["sections"] gives name, dtype (f32/u32/u16/u8), components, count and the
+byte offset/length relative to the start of the section block. All section data is
+little-endian. Frames are cached per mesh datablock revision. The same frame format
+carries uploads for mesh.from_buffers, whose header holds the RPC method and params.
+"""
+
+import base64
+import binascii
+import json
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - Blender runtime only
+    import bpy
+
+    HAS_BPY = True
+except ImportError:  # pragma: no cover - Blender runtime only
+    bpy = None
+    HAS_BPY = False
+
+try:  # pragma: no cover - bundled with Blender, optional elsewhere
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - bundled with Blender, optional elsewhere
+    np = None
+    HAS_NUMPY = False
+
+from ..index import REVISIONS, data_key, object_key
+from .steps import Steps, run_to_completion
+
+FRAME_MAGIC = b"MCPM"
+FRAME_VERSION = 1
+_PREAMBLE = struct.Struct("<4sHHI")
+_ALIGN = 8
+FRAME_CONTENT_TYPE = "application/vnd.mcpblender.frame"
+
+# dtype tag -> array typecode. Indices are read into int32 buffers (what foreach_get
+# accepts for int properties); they are never negative, so the bytes are valid u32.
+DTYPES = {"f32": "f", "u32": "i", "u16": "H", "u8": "B"}
+QUANTIZE_BITS = (8, 16)
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+Section = Tuple[str, str, int, array]
+
+
+def _le_bytes(buf: array) -> bytes:
+    if sys.byteorder == "little":
+        return buf.tobytes()
+    swapped = array(buf.typecode, buf)  # pragma: no cover - big-endian hosts
+    swapped.byteswap()  # pragma: no cover - big-endian hosts
+    return swapped.tobytes()  # pragma: no cover - big-endian hosts
+
+
+def _padding(length: int) -> int:
+    return -length % _ALIGN
+
+
+def encode_frame(header: Dict[str, Any], sections: Sequence[Section]) -> bytes:
+    """Pack (name, dtype, components, buffer) sections behind a JSON header."""
+    chunks: List[bytes] = []
+    entries = []
+    offset = 0
+    for name, dtype, components, buf in sections:
+        data = _le_bytes(buf)
+        entries.append(
+            {
+                "name": name,
+                "dtype": dtype,
+                "components": components,
+                "count": len(buf) // components if components else 0,
+                "offset": offset,
+                "length": len(data),
+            }
+        )
+        chunks.append(data)
+        pad = _padding(len(data))
+        if pad:
+            chunks.append(b"\0" * pad)
+        offset += len(data) + pad
+    header_bytes = json.dumps({**header, "sections": entries}, separators=(",", ":")).encode("utf-8")
+    header_bytes += b" " * _padding(_PREAMBLE.size + len(header_bytes))
+    return b"".join([_PREAMBLE.pack(FRAME_MAGIC, FRAME_VERSION, 0, len(header_bytes)), header_bytes, *chunks])
+
+
+def read_frame_header(frame: bytes) -> Tuple[Dict[str, Any], int]:
+    """Parse the JSON header; returns it with the byte offset of the section block."""
+    if len(frame) < _PREAMBLE.size:
+        raise ValueError("frame too short")
+    magic, version, _, header_len = _PREAMBLE.unpack_from(frame)
+    if magic != FRAME_MAGIC:
+        raise ValueError("not a mesh frame")
+    if version != FRAME_VERSION:
+        raise ValueError(f"unsupported frame version {version}")
+    start = _PREAMBLE.size + header_len
+    if len(frame) < start:
+        raise ValueError("truncated frame header")
+    return json.loads(bytes(frame[_PREAMBLE.size : start]).decode("utf-8")), start
+
+
+def decode_frame(frame: bytes) -> Tuple[Dict[str, Any], Dict[str, array]]:
+    """Inverse of encode_frame: header plus one typed array per section."""
+    header, start = read_frame_header(frame)
+    view = memoryview(frame)
+    sections: Dict[str, array] = {}
+    for entry in header.get("sections", ()):
+        typecode = DTYPES.get(entry["dtype"])
+        if typecode is None:
+            raise ValueError(f"unknown dtype {entry['dtype']!r}")
+        begin = start + int(entry["offset"])
+        end = begin + int(entry["length"])
+        if end > len(frame):
+            raise ValueError(f"section {entry['name']!r} runs past the frame")
+        buf = array(typecode)
+        buf.frombytes(view[begin:end])
+        if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+            buf.byteswap()
+        sections[entry["name"]] = buf
+    return header, sections
+
+
+def quantize_positions(positions: array, bits: int) -> Tuple[array, Dict[str, Any]]:
+    """
+    Map xyz floats onto unsigned ints over the mesh bounds, per axis. Decode with
+    min + q * (max - min) / (2**bits - 1).
+    """
+    if bits not in QUANTIZE_BITS:
+        raise ValueError(f"quantize must be one of {QUANTIZE_BITS}")
+    levels = (1 << bits) - 1
+    typecode = "B" if bits == 8 else "H"
+    count = len(positions) // 3
+    lows, highs = [], []
+    for axis in range(3):
+        column = positions[axis::3]
+        lows.append(min(column) if count else 0.0)
+        highs.append(max(column) if count else 0.0)
+    meta = {"bits": bits, "min": lows, "max": highs}
+    if HAS_NUMPY:  # pragma: no cover - numpy optional
+        grid = np.frombuffer(positions, dtype=np.float32).reshape(-1, 3)
+        span = np.maximum(np.array(highs) - np.array(lows), 1e-12)
+        codes = np.rint((grid - np.array(lows)) * (levels / span))
+        out = array(typecode)
+        out.frombytes(codes.astype(np.uint8 if bits == 8 else np.uint16).tobytes())
+        return out, meta
+    out = array(typecode, bytes(len(positions) * array(typecode).itemsize))
+    for axis in range(3):
+        lo = lows[axis]
+        span = highs[axis] - lo
+        scale = levels / span if span > 0 else 0.0
+        out[axis::3] = array(typecode, [int((v - lo) * scale + 0.5) for v in positions[axis::3]])
+    return out, meta
+
+
+def _read(collection, attr: str, typecode: str, size: int) -> array:
+    buf = array(typecode, bytes(size * array(typecode).itemsize))
+    if size:
+        collection.foreach_get(attr, buf)
+    return buf
+
+
+def iter_mesh_sections(mesh, normals: bool = True, uvs: bool = False, quantize: Optional[int] = None) -> Steps:
+    """mesh_sections as a step generator: one section read per step; returns (header, sections)."""
+    mesh.calc_loop_triangles()
+    vertex_count = len(mesh.vertices)
+    triangle_count = len(mesh.loop_triangles)
+    header: Dict[str, Any] = {"vertex_count": vertex_count, "triangle_count": triangle_count}
+    sections: List[Section] = []
+    layer = mesh.uv_layers.active if uvs else None
+    total = 2 + int(normals) + (2 if layer is not None else 0)
+
+    positions = _read(mesh.vertices, "co", "f", vertex_count * 3)
+    if quantize:
+        codes, header["quantization"] = quantize_positions(positions, int(quantize))
+        sections.append(("positions", "u8" if quantize == 8 else "u16", 3, codes))
+    else:
+        sections.append(("positions", "f32", 3, positions))
+    yield len(sections), total
+    sections.append(("triangles", "u32", 3, _read(mesh.loop_triangles, "vertices", "i", triangle_count * 3)))
+    yield len(sections), total
+    if normals:
+        sections.append(("normals", "f32", 3, _read(mesh.vertices, "normal", "f", vertex_count * 3)))
+        yield len(sections), total
+    if layer is not None:
+        header["uv_layer"] = layer.name
+        sections.append(("uvs", "f32", 2, _read(layer.data, "uv", "f", len(mesh.loops) * 2)))
+        yield len(sections), total
+        sections.append(("triangle_loops", "u32", 3, _read(mesh.loop_triangles, "loops", "i", triangle_count * 3)))
+        yield len(sections), total
+    return header, sections
+
+
+def mesh_sections(mesh, normals: bool = True, uvs: bool = False, quantize: Optional[int] = None) -> Tuple[Dict[str, Any], List[Section]]:
+    """Read positions, triangles and optional normals/UVs from a mesh without per-vertex objects."""
+    return run_to_completion(iter_mesh_sections(mesh, normals, uvs, quantize))
+
+
+class MeshFrameCache:
+    """LRU of encoded frames, bounded by total bytes and validated by revision."""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES) -> None:
+        self.max_bytes = int(max_bytes)
+        self._frames: "OrderedDict[Tuple[Any, ...], Tuple[Tuple[Any, ...], Dict[str, Any], bytes]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def get(self, key: Tuple[Any, ...], validator: Tuple[Any, ...]) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        entry = self._frames.get(key)
+        if entry is None or entry[0] != validator:
+            self.misses += 1
+            return None
+        self._frames.move_to_end(key)
+        self.hits += 1
+        return entry[1], entry[2]
+
+    def put(self, key: Tuple[Any, ...], validator: Tuple[Any, ...], header: Dict[str, Any], frame: bytes) -> None:
+        self._drop(key)
+        if len(frame) > self.max_bytes:
+            return
+        self._frames[key] = (validator, header, frame)
+        self._bytes += len(frame)
+        while self._bytes > self.max_bytes:
+            self._drop(next(iter(self._frames)))
+
+    def clear(self) -> None:
+        self._frames.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {"frames": len(self._frames), "bytes": self._bytes, "max_bytes": self.max_bytes, "hits": self.hits, "misses": self.misses}
+
+    def _drop(self, key: Tuple[Any, ...]) -> None:
+        entry = self._frames.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[2])
+
+
+FRAME_CACHE = MeshFrameCache()
+
+
+def _target(args: Dict[str, Any]):
+    identifier = args.get("id") or args.get("name")
+    if not identifier:
+        raise ValueError("id or name is required")
+    obj = bpy.data.objects.get(str(identifier))
+    if obj is None:
+        raise LookupError(f"Object {identifier} not found")
+    return obj
+
+
+def _options(args: Dict[str, Any]) -> Tuple[bool, bool, bool, Optional[int]]:
+    quantize = args.get("quantize")
+    if quantize in (None, False, 0):
+        quantize = None
+    elif int(quantize) not in QUANTIZE_BITS:
+        raise ValueError(f"quantize must be one of {QUANTIZE_BITS}")
+    else:
+        quantize = int(quantize)
+    return bool(args.get("evaluated", False)), bool(args.get("normals", True)), bool(args.get("uvs", False)), quantize
+
+
+def _original_validator(mesh) -> Tuple[Any, ...]:
+    return (mesh.name_full, len(mesh.vertices), len(mesh.loops), REVISIONS.of(data_key(mesh)))
+
+
+def iter_get_mesh(args: Dict[str, Any]) -> Steps:
+    """
+    get_mesh as a step generator: original meshes are read one section per step.
+    If the mesh changes (or goes away) between steps, the sections are read again
+    in a single step so the frame never mixes two versions. Evaluated meshes only
+    live until to_mesh_clear() and are always read in one step.
+    """
+    if not HAS_BPY:
+        raise RuntimeError("Blender bpy module not available")
+    obj = _target(args)
+    evaluated, normals, uvs, quantize = _options(args)
+    if not evaluated and obj.type != "MESH":
+        raise ValueError(f"Object {obj.name} has no mesh data (use evaluated for {obj.type})")
+
+    # Evaluated geometry depends on the object (modifiers, constraints); original
+    # geometry only on the mesh datablock, which may be shared between objects.
+    if evaluated:
+        key = ("evaluated", object_key(obj), normals, uvs, quantize)
+        validator: Tuple[Any, ...] = (obj.name_full, REVISIONS.of(object_key(obj)))
+        if obj.data is not None:
+            validator += (REVISIONS.of(data_key(obj.data)),)
+    else:
+        mesh = obj.data
+        key = ("original", data_key(mesh), normals, uvs, quantize)
+        validator = _original_validator(mesh)
+
+    cached = FRAME_CACHE.get(key, validator)
+    if cached is not None:
+        return cached
+
+    if evaluated:
+        source = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+        mesh = source.to_mesh()
+        try:
+            header, sections = mesh_sections(mesh, normals, uvs, quantize)
+        finally:
+            source.to_mesh_clear()
+    else:
+        header, sections = yield from iter_mesh_sections(mesh, normals, uvs, quantize)
+        try:
+            changed = _original_validator(mesh) != validator
+        except ReferenceError:
+            changed = True
+        if changed:
+            obj = _target(args)
+            if obj.type != "MESH":
+                raise ValueError(f"Object {obj.name} has no mesh data (use evaluated for {obj.type})")
+            mesh = obj.data
+            key = ("original", data_key(mesh), normals, uvs, quantize)
+            validator = _original_validator(mesh)
+            header, sections = mesh_sections(mesh, normals, uvs, quantize)
+
+    header = {"object": obj.name_full, "mesh": obj.data.name_full if obj.data is not None else None, "evaluated": evaluated, **header}
+    frame = encode_frame(header, sections)
+    header, _ = read_frame_header(frame)
+    FRAME_CACHE.put(key, validator, header, frame)
+    return header, frame
+
+
+def get_mesh(args: Dict[str, Any]) -> Tuple[Dict[str, Any], bytes]:
+    """
+    Encode an object's mesh as a binary frame. `evaluated: true` reads the
+    post-modifier mesh; `normals` (default on), `uvs` and `quantize` (8 or 16 bits
+    for positions) select sections. Returns (header, frame).
+    """
+    return run_to_completion(iter_get_mesh(args))
+
+
+def upload_buffer(args: Dict[str, Any], name: str, typecode: str, required: bool = False) -> Optional[array]:
+    """
+    One input buffer for mesh uploads: a decoded frame section (args["buffers"]),
+    a base64 string of little-endian values, or a plain list for small meshes.
+    """
+    value = (args.get("buffers") or {}).get(name)
+    if value is None:
+        value = args.get(name)
+    if value is None:
+        if required:
+            raise ValueError(f"{name} is required")
+        return None
+    if isinstance(value, array):
+        return value if value.typecode == typecode else array(typecode, value)
+    if isinstance(value, str):
+        try:
+            raw = base64.b64decode(value, validate=True)
+        except (binascii.Error, ValueError) as exc:
+            raise ValueError(f"{name} is not valid base64") from exc
+        buf = array(typecode)
+        if len(raw) % buf.itemsize:
+            raise ValueError(f"{name} length is not a multiple of {buf.itemsize} bytes")
+        buf.frombytes(raw)
+        if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+            buf.byteswap()
+        return buf
+    return array(typecode, value)
+
+
+def _face_layout(indices: array, face_sizes: Optional[array], face_size: int) -> Tuple[array, array]:
+    """Per-polygon loop_start and loop_total arrays."""
+    if face_sizes is None:
+        if face_size < 3:
+            raise ValueError("face_size must be >= 3")
+        if len(indices) % face_size:
+            raise ValueError(f"indices length is not a multiple of face_size {face_size}")
+        count = len(indices) // face_size
+        return array("i", range(0, len(indices), face_size)), array("i", [face_size]) * count
+    if face_sizes and min(face_sizes) < 3:
+        raise ValueError("every face needs at least 3 vertices")
+    starts = array("i", [0])
+    starts.extend(accumulate(face_sizes))
+    if starts.pop() != len(indices):
+        raise ValueError("face_sizes do not add up to the number of indices")
+    return starts, face_sizes
+
+
+def build_mesh(name: str, args: Dict[str, Any]):
+    """
+    Create a mesh datablock from packed buffers with foreach_set (no bmesh):
+    `positions` f32 xyz, `indices` i32 polygon corners, then either `face_sizes`
+    (i32 per polygon) or a uniform `face_size` (default 3); optional per-corner `uvs`.
+    """
+    positions = upload_buffer(args, "positions", "f", required=True)
+    indices = upload_buffer(args, "indices", "i", required=True)
+    face_sizes = upload_buffer(args, "face_sizes", "i")
+    uvs = upload_buffer(args, "uvs", "f")
+    if len(positions) % 3:
+        raise ValueError("positions length must be a multiple of 3")
+    vertex_count = len(positions) // 3
+    if indices and (min(indices) < 0 or max(indices) >= vertex_count):
+        raise ValueError("indices reference vertices outside positions")
+    starts, sizes = _face_layout(indices, face_sizes, int(args.get("face_size", 3)))
+    if uvs is not None and len(uvs) != len(indices) * 2:
+        raise ValueError("uvs needs one (u, v) pair per face corner")
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(vertex_count)
+    mesh.vertices.foreach_set("co", positions)
+    mesh.loops.add(len(indices))
+    mesh.loops.foreach_set("vertex_index", indices)
+    mesh.polygons.add(len(starts))
+    mesh.polygons.foreach_set("loop_start", starts)
+    try:
+        mesh.polygons.foreach_set("loop_total", sizes)
+    except (AttributeError, TypeError, RuntimeError):  # pragma: no cover - read-only since Blender 4.0
+        pass
+    if uvs is not None:
+        mesh.uv_layers.new(name="UVMap").data.foreach_set("uv", uvs)
+    mesh.update(calc_edges=True)
+    return mesh
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+"""
+Primitive mesh template cache.
+
+Each primitive is built with bmesh once per parameter set; later objects get a
+datablock copy (C-level, no bmesh) or, with share=True, one linked mesh per
+parameter set that is itself a copy. Templates are hidden (dot-prefixed) meshes
+without users that are never handed out, so edits to an object's mesh (materials,
+geometry) never leak into later copies. They are evicted LRU and dropped lazily
+when something else (a purge, the user) removes the datablock.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+try:  # pragma: no cover - Blender runtime only
+    import bpy
+    import bmesh
+
+    HAS_BPY = True
+except ImportError:  # pragma: no cover - Blender runtime only
+    bpy = None
+    bmesh = None
+    HAS_BPY = False
+
+TEMPLATE_PREFIX = ".mcp_tpl_"
+DEFAULT_CAPACITY = 32
+
+TemplateKey = Tuple[Hashable, ...]
+
+
+def template_key(kind: str, **params: Any) -> TemplateKey:
+    """Normalize primitive parameters so equal shapes share one template."""
+    items = []
+    for key in sorted(params):
+        value = params[key]
+        if isinstance(value, float):
+            value = round(value, 6)
+        items.append((key, value))
+    return (kind, *items)
+
+
+def _is_alive(mesh) -> bool:
+    try:
+        return bpy.data.meshes.get(mesh.name) == mesh
+    except ReferenceError:
+        return False
+    except Exception:  # pragma: no cover - defensive
+        return False
+
+
+class MeshTemplateCache:
+    """LRU cache of template meshes keyed by primitive parameters."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.capacity = max(1, int(capacity))
+        self._templates: "OrderedDict[TemplateKey, Any]" = OrderedDict()
+        self._shared: Dict[TemplateKey, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def acquire(self, key: TemplateKey, builder: Callable[[Any], None], name: str, share: bool = False):
+        """
+        Return a mesh for a new object: a copy of the template named `name`. With
+        share=True every caller gets the same copy for this key (linked duplicate
+        semantics); it is made on first use and remade once it has been removed.
+        """
+        template = self._lookup(key)
+        if template is None:
+            self.misses += 1
+            template = self._build(key, builder)
+            self._templates[key] = template
+            self._evict()
+        else:
+            self.hits += 1
+        if share:
+            shared = self._shared.get(key)
+            if shared is not None and _is_alive(shared):
+                return shared
+        mesh = template.copy()
+        mesh.name = name
+        if share:
+            self._shared[key] = mesh
+        return mesh
+
+    def acquire_primitive(
+        self, kind: str, params: Dict[str, Any], builder: Callable[[Any], None], name: str, share: bool = False
+    ) -> Any:
+        """acquire() keyed by template_key(kind, **params)."""
+        return self.acquire(template_key(kind, **params), builder, name, share=share)
+
+    def is_template(self, mesh) -> bool:
+        return any(template == mesh for template in self._templates.values())
+
+    def template_names(self) -> set:
+        names = set()
+        for template in list(self._templates.values()):
+            try:
+                names.add(template.name)
+            except ReferenceError:
+                continue
+        return names
+
+    def prune(self) -> int:
+        """Forget templates whose datablocks were removed behind our back."""
+        dead = [key for key, template in self._templates.items() if not _is_alive(template)]
+        for key in dead:
+            del self._templates[key]
+        for key in [key for key, shared in self._shared.items() if not _is_alive(shared)]:
+            del self._shared[key]
+        return len(dead)
+
+    def clear(self) -> None:
+        self._shared.clear()
+        while self._templates:
+            _, template = self._templates.popitem(last=False)
+            self._release(template)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"templates": len(self._templates), "capacity": self.capacity, "hits": self.hits, "misses": self.misses}
+
+    def _lookup(self, key: TemplateKey):
+        template = self._templates.get(key)
+        if template is None:
+            return None
+        if not _is_alive(template):
+            del self._templates[key]
+            self._shared.pop(key, None)
+            return None
+        self._templates.move_to_end(key)
+        return template
+
+    def _build(self, key: TemplateKey, builder: Callable[[Any], None]):
+        mesh = bpy.data.meshes.new(f"{TEMPLATE_PREFIX}{key[0]}")
+        bm = bmesh.new()
+        try:
+            builder(bm)
+            bm.to_mesh(mesh)
+        finally:
+            bm.free()
+        return mesh
+
+    def _evict(self) -> None:
+        while len(self._templates) > self.capacity:
+            key, template = self._templates.popitem(last=False)
+            self._shared.pop(key, None)  # a user mesh; the orphan purge owns it from here
+            self._release(template)
+
+    @staticmethod
+    def _release(template) -> None:
+        # Templates have no users unless someone linked one by hand; leave those alone.
+        if not _is_alive(template):
+            return
+        if getattr(template, "users", 0) == 0:
+            bpy.data.meshes.remove(template)
+
+
+TEMPLATE_CACHE = MeshTemplateCache()
+
+
+def acquire_mesh(
+    kind: str, params: Dict[str, Any], builder: Callable[[Any], None], name: str, share: bool = False
+) -> Any:
+    return TEMPLATE_CACHE.acquire_primitive(kind, params, builder, name, share=share)
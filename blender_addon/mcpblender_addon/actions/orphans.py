@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+"""
+Orphan datablock cleanup.
+
+Deleting objects leaves their meshes and materials behind with zero users; long-running
+bridge sessions accumulate them. These helpers find and batch-remove such blocks,
+repeating until removal no longer orphans anything new (mesh -> material chains).
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+try:  # pragma: no cover - Blender runtime only
+    import bpy
+
+    HAS_BPY = True
+except ImportError:  # pragma: no cover - Blender runtime only
+    bpy = None
+    HAS_BPY = False
+
+from .mesh_templates import TEMPLATE_CACHE
+from .steps import Steps, run_to_completion
+
+# bpy.data collections scanned by purge_orphans, in dependency order (users first).
+ORPHAN_COLLECTIONS = (
+    "meshes",
+    "curves",
+    "lights",
+    "cameras",
+    "materials",
+    "node_groups",
+    "textures",
+    "images",
+    "actions",
+)
+
+
+def _is_orphan(block) -> bool:
+    return (
+        block.users == 0
+        and not block.use_fake_user
+        and getattr(block, "library", None) is None
+        and not TEMPLATE_CACHE.is_template(block)
+    )
+
+
+def remove_orphans(candidates: Sequence[Any], dry_run: bool = False) -> Dict[str, int]:
+    """Batch-remove candidates without users; returns freed counts keyed by id_type."""
+    freed: Dict[str, int] = {}
+    pending = list(candidates)
+    while pending:
+        orphans = [block for block in pending if _is_orphan(block)]
+        if not orphans:
+            break
+        for block in orphans:
+            kind = getattr(block, "id_type", "UNKNOWN")
+            freed[kind] = freed.get(kind, 0) + 1
+        if dry_run:
+            break
+        removed = {block.as_pointer() for block in orphans}
+        pending = [block for block in pending if block.as_pointer() not in removed]
+        bpy.data.batch_remove(ids=orphans)
+    return freed
+
+
+def _collections(types: Optional[Iterable[str]]) -> List[str]:
+    if not types:
+        return list(ORPHAN_COLLECTIONS)
+    wanted = {str(name) for name in types}
+    unknown = wanted - set(ORPHAN_COLLECTIONS)
+    if unknown:
+        raise ValueError(f"unsupported datablock types: {sorted(unknown)}")
+    return [name for name in ORPHAN_COLLECTIONS if name in wanted]
+
+
+def datablock_count() -> int:
+    if not HAS_BPY:
+        return 0
+    return sum(len(getattr(bpy.data, name, ())) for name in ORPHAN_COLLECTIONS)
+
+
+def iter_purge_orphans(args: Dict[str, Any]) -> Steps:
+    """
+    purge_orphans as a step generator: one datablock collection per step, in
+    ORPHAN_COLLECTIONS order, so blocks orphaned by an earlier step (a deleted mesh's
+    materials) are still caught by a later one.
+    """
+    if not HAS_BPY:
+        raise RuntimeError("Blender bpy module not available")
+    names = _collections(args.get("types"))
+    dry_run = bool(args.get("dry_run", False))
+    freed: Dict[str, int] = {}
+    for done, name in enumerate(names, start=1):
+        for kind, count in remove_orphans(list(getattr(bpy.data, name, ())), dry_run=dry_run).items():
+            freed[kind] = freed.get(kind, 0) + count
+        yield done, len(names)
+    TEMPLATE_CACHE.prune()
+    return {
+        "freed": freed,
+        "total": sum(freed.values()),
+        "dry_run": dry_run,
+        "remaining_datablocks": datablock_count(),
+    }
+
+
+def purge_orphans(args: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Remove every local datablock without users from the scanned collections.
+    `types` narrows the collections; `dry_run` only reports what would go.
+    """
+    return run_to_completion(iter_purge_orphans(args))
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+"""
+Step generators for actions that can run in chunks.
+
+A step generator yields (done, total) progress between units of work and returns
+its result. jobs.submit advances one from the main thread and releases BPY_LOCK at
+each yield; synchronous callers drive it to the end with run_to_completion().
+"""
+
+from typing import Any, Generator, Tuple
+
+Steps = Generator[Tuple[int, int], None, Any]
+
+
+def run_to_completion(steps: Generator[Any, None, Any]) -> Any:
+    """Drive a step generator to its end and return its result."""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
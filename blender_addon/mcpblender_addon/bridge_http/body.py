@@ -0,0 +1,465 @@
+from __future__ import annotations
+
+"""
+Request bodies: size limits per route and per method, chunked transfer decoding
+and an incremental JSON reader.
+
+BodyStream reads a body from the handler's rfile (Content-Length or
+`Transfer-Encoding: chunked`) and raises PayloadTooLarge as soon as the running
+total passes its limit, so an oversized upload is cut off instead of buffered.
+
+read_json() parses a JSON document from a BodyStream in 64 KB slices. Selected
+numeric arrays (e.g. mesh.from_buffers `positions`, object.transform_many
+`locations`) are decoded straight into array.array buffers, so a large batch is
+held once as packed values instead of as body bytes, a decoded str and a list of
+float objects. Arrays that do not fit the numeric fast path (nulls, ragged rows)
+fall back to ordinary lists; values packed before the fallback come back as
+floats, which the numeric handlers accept anyway.
+"""
+
+import codecs
+import json
+import re
+from array import array
+from typing import Any, BinaryIO, Callable, Dict, List, Mapping, Optional, Tuple
+
+DEFAULT_JSON_BYTES = 1_048_576  # 1 MB
+DEFAULT_FRAME_BYTES = 256 * 1_048_576
+STREAM_CHUNK_BYTES = 64 * 1024
+MAX_DEPTH = 256
+
+# field -> (array typecode, row width); rows of `width` numbers are flattened.
+ArraySpec = Tuple[str, int]
+ArrayFields = Callable[[Optional[str]], Mapping[str, ArraySpec]]
+MethodLimit = Callable[[str], int]
+
+
+class PayloadTooLarge(Exception):
+    def __init__(self, limit: int) -> None:
+        super().__init__(f"payload exceeds limit of {limit} bytes")
+        self.limit = limit
+
+
+class BodyLimits:
+    """
+    Byte caps for request bodies. JSON bodies are capped per route (default
+    `json_bytes`) and per RPC method; binary frames by `frame_bytes`. The method is
+    named inside the body, so reading starts capped by for_route() (the largest
+    limit any method on the route may use) and drops to for_method() as soon as
+    the streaming reader has parsed `method`.
+    """
+
+    def __init__(
+        self,
+        json_bytes: int = DEFAULT_JSON_BYTES,
+        frame_bytes: int = DEFAULT_FRAME_BYTES,
+        routes: Optional[Mapping[str, int]] = None,
+        methods: Optional[Mapping[str, int]] = None,
+    ) -> None:
+        self.json_bytes = int(json_bytes)
+        self.frame_bytes = int(frame_bytes)
+        self.routes: Dict[str, int] = dict(routes or {})
+        self.methods: Dict[str, int] = dict(methods or {})
+
+    def configure(
+        self,
+        json_bytes: Optional[int] = None,
+        frame_bytes: Optional[int] = None,
+        routes: Optional[Mapping[str, int]] = None,
+        methods: Optional[Mapping[str, int]] = None,
+    ) -> None:
+        if json_bytes is not None:
+            self.json_bytes = int(json_bytes)
+        if frame_bytes is not None:
+            self.frame_bytes = int(frame_bytes)
+        if routes:
+            self.routes.update({path: int(limit) for path, limit in routes.items()})
+        if methods:
+            self.methods.update({method: int(limit) for method, limit in methods.items()})
+
+    def for_route(self, path: str, frame: bool = False) -> int:
+        if frame:
+            return self.frame_bytes
+        return max([self.routes.get(path, self.json_bytes), *self.methods.values()])
+
+    def for_method(self, path: str, method: Any, frame: bool = False) -> int:
+        if frame:
+            return self.frame_bytes
+        route = self.routes.get(path, self.json_bytes)
+        return self.methods.get(method, route) if isinstance(method, str) else route
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "json_bytes": self.json_bytes,
+            "frame_bytes": self.frame_bytes,
+            "routes": dict(self.routes),
+            "methods": dict(self.methods),
+        }
+
+
+class BodyStream:
+    """A request body read from `rfile`, never more than `limit` bytes."""
+
+    def __init__(self, rfile: BinaryIO, length: Optional[int], limit: int) -> None:
+        self.rfile = rfile
+        self.length = length  # None: chunked
+        self.limit = limit
+        self.consumed = 0
+        self._chunk_left = 0
+        self._finished = length == 0
+
+    @classmethod
+    def from_headers(cls, rfile: BinaryIO, headers: Mapping[str, str], limit: int) -> "BodyStream":
+        """Raises PayloadTooLarge for a declared length over `limit`, ValueError for bad framing headers."""
+        if "chunked" in (headers.get("Transfer-Encoding") or "").lower():
+            return cls(rfile, None, limit)
+        raw = headers.get("Content-Length")
+        length = int(raw) if raw else 0
+        if length < 0:
+            raise ValueError("negative Content-Length")
+        if length > limit:
+            raise PayloadTooLarge(limit)
+        return cls(rfile, length, limit)
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def restrict(self, limit: int) -> None:
+        """Lower the cap mid-body; raises PayloadTooLarge if the body already passes it."""
+        self.limit = min(self.limit, limit)
+        if max(self.consumed, self.length or 0) > self.limit:
+            raise PayloadTooLarge(self.limit)
+
+    def read(self, size: int = -1) -> bytes:
+        if self._finished:
+            return b""
+        if self.length is not None:
+            remaining = self.length - self.consumed
+            data = self.rfile.read(remaining if size < 0 else min(size, remaining))
+            if not data:
+                raise ValueError("request body ended early")
+            self.consumed += len(data)
+            self._finished = self.consumed >= self.length
+            return data
+        return self._read_chunked(size)
+
+    def read_all(self) -> bytes:
+        parts: List[bytes] = []
+        while not self._finished:
+            parts.append(self.read(STREAM_CHUNK_BYTES if self.length is None else -1))
+        return b"".join(parts)
+
+    def _read_chunked(self, size: int) -> bytes:
+        parts: List[bytes] = []
+        wanted = size
+        while wanted and not self._finished:
+            if self._chunk_left == 0:
+                line = self.rfile.readline(1026)
+                if not line.endswith(b"\n"):
+                    raise ValueError("malformed chunk size line")
+                try:
+                    chunk = int(line.split(b";", 1)[0].strip(), 16)
+                except ValueError:
+                    raise ValueError("malformed chunk size") from None
+                if chunk == 0:
+                    while self.rfile.readline(65537) not in (b"\r\n", b"\n", b""):
+                        pass  # trailers are ignored
+                    self._finished = True
+                    break
+                if self.consumed + chunk > self.limit:
+                    raise PayloadTooLarge(self.limit)
+                self._chunk_left = chunk
+            take = self._chunk_left if wanted < 0 else min(wanted, self._chunk_left)
+            data = self.rfile.read(take)
+            if len(data) < take:
+                raise ValueError("request body ended early")
+            self._chunk_left -= take
+            self.consumed += take
+            if self._chunk_left == 0 and self.rfile.readline(3) not in (b"\r\n", b"\n"):
+                raise ValueError("missing chunk terminator")
+            parts.append(data)
+            if wanted > 0:
+                wanted -= take
+        return b"".join(parts)
+
+
+_NUMBER = r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?"
+_NUMBER_RE = re.compile(_NUMBER)
+_NUMBER_CHARS_RE = re.compile(r"[-+0-9.eE]*")
+_WS_RE = re.compile(r"[ \t\n\r]*")
+_FLAT_RE = re.compile(rf"[ \t\n\r]*{_NUMBER}[ \t\n\r]*(?:,[ \t\n\r]*{_NUMBER}[ \t\n\r]*)*")
+_LITERALS = {"true": True, "false": False, "null": None}
+_DECODER = json.JSONDecoder()
+_scanstring = json.decoder.scanstring
+
+
+def _rows_re(width: int) -> "re.Pattern[str]":
+    ws = r"[ \t\n\r]*"
+    row = rf"\[{ws}{_NUMBER}{ws}(?:,{ws}{_NUMBER}{ws}){{{width - 1}}}\]"
+    return re.compile(rf"{ws}{row}(?:{ws},{ws}{row})*")
+
+
+class _Fallback(Exception):
+    """A typed array met a value it cannot pack; parse the rest as a list."""
+
+
+class JsonStreamReader:
+    def __init__(
+        self, stream: BodyStream, array_fields: Optional[ArrayFields] = None, method_limit: Optional[MethodLimit] = None
+    ) -> None:
+        self._stream = stream
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._array_fields = array_fields
+        self._method_limit = method_limit
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._depth = 0
+        self.method: Optional[str] = None
+        self._rows: Dict[int, "re.Pattern[str]"] = {}
+
+    # ---- buffer ------------------------------------------------------------
+
+    def _fill(self, size: int = 0) -> bool:
+        """Append the next slice of the body; the unconsumed tail keeps its offset from _pos."""
+        if self._eof:
+            return False
+        data = self._stream.read(max(size, STREAM_CHUNK_BYTES))
+        self._buf = self._buf[self._pos :]
+        self._pos = 0
+        if not data:
+            self._eof = True
+            self._buf += self._decoder.decode(b"", final=True)
+            return False
+        self._buf += self._decoder.decode(data)
+        return True
+
+    def _peek(self) -> str:
+        if self._pos < len(self._buf) and self._buf[self._pos] not in " \t\n\r":
+            return self._buf[self._pos]
+        while True:
+            self._pos = _WS_RE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise ValueError(f"expected {char!r} at offset {self._stream.consumed}")
+        self._pos += 1
+
+    # ---- values ------------------------------------------------------------
+
+    def document(self) -> Any:
+        if self._peek() == "":
+            return {}
+        value = self._value(())
+        if self._peek() != "":
+            raise ValueError("extra data after JSON document")
+        return value
+
+    def _value(self, path: Tuple[str, ...]) -> Any:
+        char = self._peek()
+        if char == "{":
+            if len(path) > 1:
+                return self._buffered()
+            return self._nested(self._object, path)
+        if char == "[":
+            spec = self._array_spec(path)
+            if spec is not None:
+                return self._typed_array(*spec, path)
+            if len(path) > 1:
+                return self._buffered()
+            self._pos += 1
+            return self._nested(self._array, path, [])
+        if char == '"':
+            return self._string()
+        if char == "":
+            raise ValueError("unexpected end of JSON body")
+        return self._scalar()
+
+    def _nested(self, parse: Callable[..., Any], *args: Any) -> Any:
+        self._depth += 1
+        if self._depth > MAX_DEPTH:
+            raise ValueError("JSON nesting too deep")
+        try:
+            return parse(*args)
+        finally:
+            self._depth -= 1
+
+    def _object(self, path: Tuple[str, ...]) -> Dict[str, Any]:
+        self._pos += 1
+        result: Dict[str, Any] = {}
+        if self._peek() == "}":
+            self._pos += 1
+            return result
+        while True:
+            if self._peek() != '"':
+                raise ValueError("expected property name")
+            key = self._string()
+            self._expect(":")
+            result[key] = self._value(path + (key,))
+            if not path and key == "method" and isinstance(result[key], str):
+                self.method = result[key]
+                if self._method_limit is not None:
+                    self._stream.restrict(self._method_limit(self.method))
+            char = self._peek()
+            self._pos += 1
+            if char == "}":
+                return result
+            if char != ",":
+                raise ValueError("expected ',' or '}' in object")
+
+    def _array(self, path: Tuple[str, ...], items: List[Any]) -> List[Any]:
+        """Items from the current position (just after '[' or a ',') to the closing ']'."""
+        if not items and self._peek() == "]":
+            self._pos += 1
+            return items
+        while True:
+            items.append(self._value(path + ("[]",)))
+            char = self._peek()
+            self._pos += 1
+            if char == "]":
+                return items
+            if char != ",":
+                raise ValueError("expected ',' or ']' in array")
+
+    def _string(self) -> str:
+        start = self._pos
+        scan = start + 1
+        while True:
+            end = self._buf.find('"', scan)
+            if end < 0:
+                offset = scan - self._pos
+                if not self._fill():
+                    raise ValueError("unterminated string")
+                start, scan = self._pos, self._pos + offset
+                continue
+            slashes = 0
+            while self._buf[end - 1 - slashes] == "\\":
+                slashes += 1
+            if slashes % 2:
+                scan = end + 1
+                continue
+            value, self._pos = _scanstring(self._buf, start + 1)
+            return value
+
+    def _buffered(self) -> Any:
+        """
+        A container below the typed-array fields, decoded whole by the C decoder.
+        Nothing under it is packed, so it is read ahead (doubling) until it parses.
+        """
+        while True:
+            try:
+                value, self._pos = _DECODER.raw_decode(self._buf, self._pos)
+                return value
+            except json.JSONDecodeError as exc:
+                if not self._fill(len(self._buf) - self._pos):
+                    raise ValueError(str(exc)) from None
+            except RecursionError:
+                raise ValueError("JSON nesting too deep") from None
+
+    def _scalar(self) -> Any:
+        while True:
+            # A number is complete once a non-number character follows it; literals need 5 chars ("false").
+            if _NUMBER_CHARS_RE.match(self._buf, self._pos).end() < len(self._buf) and len(self._buf) - self._pos >= 5:
+                match = _NUMBER_RE.match(self._buf, self._pos)
+                break
+            if not self._fill():
+                match = _NUMBER_RE.match(self._buf, self._pos)
+                break
+        if match is not None:
+            self._pos = match.end()
+            token = match.group()
+            return float(token) if any(c in token for c in ".eE") else int(token)
+        for word, value in _LITERALS.items():
+            if self._buf.startswith(word, self._pos):
+                self._pos += len(word)
+                return value
+        raise ValueError(f"invalid JSON value at offset {self._stream.consumed}")
+
+    # ---- typed arrays --------------------------------------------------------
+
+    def _array_spec(self, path: Tuple[str, ...]) -> Optional[ArraySpec]:
+        if self._array_fields is None or len(path) != 2 or path[0] != "params":
+            return None
+        return self._array_fields(self.method).get(path[1])
+
+    def _typed_array(self, typecode: str, width: int, path: Tuple[str, ...]) -> Any:
+        self._pos += 1
+        out = array(typecode)
+        convert = float if typecode in "fd" else int
+        if self._peek() == "]":
+            self._pos += 1
+            return out
+        rows = width > 1 and self._peek() == "["
+        try:
+            if rows:
+                self._pack_rows(out, convert, width)
+            else:
+                self._pack_flat(out, convert)
+            return out
+        except _Fallback:
+            if rows:
+                items: List[Any] = [list(out[i : i + width]) for i in range(0, len(out), width)]
+            else:
+                items = out.tolist()
+            return self._nested(self._array, path, items)
+
+    @staticmethod
+    def _extend(out: array, convert: Callable[[str], Any], numbers: List[str]) -> None:
+        try:
+            out.extend(array(out.typecode, map(convert, numbers)))
+        except (ValueError, OverflowError, TypeError):
+            raise _Fallback() from None
+
+    def _pack_flat(self, out: array, convert: Callable[[str], Any]) -> None:
+        # Segments end at the closing ']' or at the last ',' buffered, so no number is cut.
+        while True:
+            close = self._buf.find("]", self._pos)
+            end = close if close >= 0 else self._buf.rfind(",", self._pos)
+            if end < 0:
+                if not self._fill():
+                    raise ValueError("unterminated array")
+                continue
+            segment = self._buf[self._pos : end]
+            if not _FLAT_RE.fullmatch(segment):
+                raise _Fallback()
+            self._extend(out, convert, segment.split(","))
+            self._pos = end + 1
+            if close >= 0:
+                return
+
+    def _pack_rows(self, out: array, convert: Callable[[str], Any], width: int) -> None:
+        pattern = self._rows.get(width) or self._rows.setdefault(width, _rows_re(width))
+        expect_row = True
+        while True:
+            if expect_row:
+                match = pattern.match(self._buf, self._pos)
+                if match is None:
+                    if self._buf.find("]", self._pos) < 0 and self._fill():
+                        continue  # row not fully buffered yet
+                    raise _Fallback()
+                # float()/int() skip surrounding whitespace, so only the brackets need dropping.
+                self._extend(out, convert, match.group().replace("[", "").replace("]", "").split(","))
+                self._pos = match.end()
+                expect_row = False
+            char = self._peek()
+            self._pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError("expected ',' or ']' in array")
+            expect_row = True
+
+
+def read_json(
+    stream: BodyStream, array_fields: Optional[ArrayFields] = None, method_limit: Optional[MethodLimit] = None
+) -> Any:
+    """
+    Parse the JSON document in `stream`; an empty body is {}. Raises ValueError on
+    bad JSON, and PayloadTooLarge once the body passes `method_limit(method)`.
+    """
+    return JsonStreamReader(stream, array_fields, method_limit).document()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+"""
+Write coalescing for high-frequency single-object transforms.
+
+Drag-like tools send object.move_object / object.transform for the same object
+30-60 times a second, and only the latest state matters. With coalescing on, the
+first pending request for an (object, space) pair opens a batch and queues for
+the lock as usual. Requests that arrive before that batch starts running, and
+whose deadline is no earlier than the batch's, are merged into it and do not
+queue themselves (a request with an earlier deadline runs on its own, so no
+caller ever waits past its own deadline):
+  location, rotation, scale  last writer wins
+  delta (move_object)        summed; an absolute location after it replaces it
+When the batch gets the lock it is closed and applied once, and every merged
+caller receives that one result, with `coalesced` giving how many requests it
+covers. Requests that arrive after the batch started open the next batch, so at
+most one write per object is running and one is waiting at any time.
+"""
+
+import threading
+from numbers import Real
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+COALESCED_METHODS = frozenset({"object.move_object", "object.transform"})
+_VECTOR_FIELDS = ("location", "delta", "rotation", "scale")
+_MERGEABLE_KEYS = frozenset({"id", "name", "space", *_VECTOR_FIELDS})
+
+
+def _vector(value: Any) -> Optional[List[float]]:
+    if not isinstance(value, (list, tuple)) or len(value) != 3:
+        return None
+    if not all(isinstance(v, Real) and not isinstance(v, bool) for v in value):
+        return None
+    return [float(v) for v in value]
+
+
+def coalesce_key(params: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """(object, space) for requests that can be merged; None runs the request on its own."""
+    if not isinstance(params, dict) or not params.keys() <= _MERGEABLE_KEYS:
+        return None
+    identifier = params.get("id") or params.get("name")
+    if not isinstance(identifier, str) or not identifier:
+        return None
+    for field in _VECTOR_FIELDS:
+        if params.get(field) is not None and _vector(params[field]) is None:
+            return None  # malformed; the handler reports the error for this request alone
+    return identifier, str(params.get("space") or "world")
+
+
+class Batch:
+    """Merged transform state for one (object, space), shared by every request in it."""
+
+    def __init__(
+        self, key: Tuple[str, str], method: str, params: Dict[str, Any], deadline: Optional[float] = None
+    ) -> None:
+        self.key = key
+        self.method = method
+        self.deadline = deadline
+        self.target = {name: params[name] for name in ("id", "name") if params.get(name)}
+        self.location: Optional[List[float]] = None
+        self.delta: Optional[List[float]] = None
+        self.rotation: Optional[List[float]] = None
+        self.scale: Optional[List[float]] = None
+        self.members = 0
+        self.result: Optional[Dict[str, Any]] = None
+        self._done = threading.Event()
+        self.merge(params)
+
+    def admits(self, deadline: Optional[float]) -> bool:
+        """Whether a caller with `deadline` may wait on this batch: it resolves by the batch's deadline."""
+        if deadline is None:
+            return True
+        return self.deadline is not None and deadline >= self.deadline
+
+    def merge(self, params: Dict[str, Any]) -> None:
+        self.members += 1
+        location = _vector(params.get("location"))
+        delta = _vector(params.get("delta"))
+        if location is not None:
+            self.location, self.delta = location, None
+        if delta is not None:
+            current = self.delta or [0.0, 0.0, 0.0]
+            self.delta = [a + b for a, b in zip(current, delta)]
+        for field in ("rotation", "scale"):
+            value = _vector(params.get(field))
+            if value is not None:
+                setattr(self, field, value)
+
+    def params(self) -> Dict[str, Any]:
+        """Handler params equivalent to applying every merged request in order."""
+        merged: Dict[str, Any] = {**self.target, "space": self.key[1]}
+        if self.location is not None:
+            offset = self.delta or [0.0, 0.0, 0.0]
+            merged["location"] = [a + b for a, b in zip(self.location, offset)]
+        elif self.delta is not None:
+            merged["delta"] = self.delta
+        if self.rotation is not None:
+            merged["rotation"] = self.rotation
+        if self.scale is not None:
+            merged["scale"] = self.scale
+        return merged
+
+    def resolve(self, result: Dict[str, Any]) -> None:
+        if result.get("ok") and isinstance(result.get("data"), dict):
+            result = {**result, "data": {**result["data"], "coalesced": self.members}}
+        self.result = result
+        self._done.set()
+
+    def wait(self) -> Dict[str, Any]:
+        self._done.wait()
+        return self.result  # type: ignore[return-value]
+
+
+class TransformCoalescer:
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[str, str], Batch] = {}
+        self.batches = 0
+        self.merged = 0
+
+    def configure(self, enabled: Optional[bool] = None) -> None:
+        if enabled is not None:
+            self.enabled = bool(enabled)
+
+    def submit(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        handler: Callable[[], Dict[str, Any]],
+        run: Callable[[Callable[[], Dict[str, Any]]], Dict[str, Any]],
+        handler_for: Callable[[str, Dict[str, Any]], Callable[[], Dict[str, Any]]],
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Merge the request into its object's pending batch, or open one and lead it.
+        Requests that cannot be merged, or whose `deadline` (time.monotonic()) is
+        earlier than the pending batch's, go straight to `run(handler)`, the usual
+        scheduled, locked dispatch. A leader runs a handler instead that closes the
+        batch once it holds the lock and applies the merged params through
+        `handler_for(method, params)`.
+        """
+        key = coalesce_key(params) if self.enabled and method in COALESCED_METHODS else None
+        if key is None:
+            return run(handler)
+        with self._lock:
+            batch = self._pending.get(key)
+            leading = batch is None
+            if batch is None:
+                batch = self._pending[key] = Batch(key, method, params, deadline)
+                self.batches += 1
+            elif batch.admits(deadline):
+                batch.merge(params)
+                self.merged += 1
+            else:
+                batch = None
+        if batch is None:
+            return run(handler)
+        if not leading:
+            return batch.wait()
+        result: Dict[str, Any] = {"ok": False, "error": {"code": "internal_error", "message": "batch did not run"}}
+        try:
+            result = run(lambda: handler_for(batch.method, self._start(batch))())
+        finally:
+            self._finish(batch, result)
+        return batch.result  # type: ignore[return-value]
+
+    def _start(self, batch: Batch) -> Dict[str, Any]:
+        with self._lock:
+            if self._pending.get(batch.key) is batch:
+                del self._pending[batch.key]
+            return batch.params()
+
+    def _finish(self, batch: Batch, result: Dict[str, Any]) -> None:
+        with self._lock:
+            if self._pending.get(batch.key) is batch:
+                del self._pending[batch.key]  # never started (deadline passed while queued)
+            batch.resolve(result)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "batches": self.batches,
+                "merged": self.merged,
+                "pending": len(self._pending),
+            }
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+"""
+Change feed behind the bridge's GET /events (Server-Sent Events).
+
+The scene index reports every change it observes (bridge RPCs and
+depsgraph_update_post alike) to EVENTS.on_change. Events for the same object and
+kind arriving within `coalesce_seconds` are merged into one, so a drag in the
+viewport or a transform_many over a thousand objects does not flood subscribers.
+Published events get increasing ids and stay in a bounded ring buffer; a client
+resuming with Last-Event-ID receives everything after that id, or a
+"stream.reset" event when the id has already fallen out of the buffer (re-read
+the scene, then carry on).
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+RESET_KIND = "stream.reset"
+
+
+class Event:
+    __slots__ = ("id", "kind", "key", "data", "ts")
+
+    def __init__(self, event_id: int, kind: str, key: Optional[str], data: Dict[str, Any], ts: float) -> None:
+        self.id = event_id
+        self.kind = kind
+        self.key = key
+        self.data = data
+        self.ts = ts
+
+    def payload(self) -> Dict[str, Any]:
+        return {"id": self.id, "kind": self.kind, "key": self.key, "ts": round(self.ts, 3), **self.data}
+
+    def to_sse(self) -> bytes:
+        data = json.dumps(self.payload(), separators=(",", ":"))
+        return f"id: {self.id}\nevent: {self.kind}\ndata: {data}\n\n".encode("utf-8")
+
+
+class EventFilter:
+    """Server-side subscription filter built from ?objects=&types=&kinds= (comma separated)."""
+
+    def __init__(
+        self,
+        objects: Iterable[str] = (),
+        types: Iterable[str] = (),
+        kinds: Iterable[str] = (),
+    ) -> None:
+        self.objects = frozenset(objects)
+        self.types = frozenset(t.upper() for t in types)
+        self.kinds = tuple(kinds)
+
+    @classmethod
+    def from_query(cls, query: Dict[str, List[str]]) -> "EventFilter":
+        def values(name: str) -> List[str]:
+            return [part for raw in query.get(name, []) for part in raw.split(",") if part]
+
+        return cls(values("objects"), values("types"), values("kinds"))
+
+    def matches(self, event: Event) -> bool:
+        if event.kind == RESET_KIND:
+            return True
+        # "object" selects every object.* kind; "object.added" only that one.
+        if self.kinds and not any(event.kind == k or event.kind.startswith(k + ".") for k in self.kinds):
+            return False
+        if event.key is None or event.kind.startswith(("scene.", "frame.")):
+            return True  # scene-wide events are not tied to one object
+        if self.objects:
+            names = {event.key, event.data.get("name"), event.data.get("previous")}
+            if not self.objects & names:
+                return False
+        if self.types and str(event.data.get("type", "")).upper() not in self.types:
+            return False
+        return True
+
+
+class EventBus:
+    def __init__(
+        self,
+        capacity: int = 4096,
+        coalesce_seconds: float = 0.05,
+        max_subscribers: int = 32,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = capacity
+        self.coalesce_seconds = coalesce_seconds
+        self.max_subscribers = max_subscribers
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._log: Deque[Event] = deque(maxlen=capacity)
+        # (kind, key) -> [due, data]; insertion order is publication order.
+        self._pending: "OrderedDict[Tuple[str, Optional[str]], List[Any]]" = OrderedDict()
+        self._last_id = 0
+        self._subscribers = 0
+        self.published = 0
+        self.coalesced = 0
+
+    @property
+    def last_id(self) -> int:
+        with self._cond:
+            self._flush_due()
+            return self._last_id
+
+    def publish(self, kind: str, key: Optional[str] = None, **data: Any) -> None:
+        with self._cond:
+            slot = (kind, key)
+            pending = self._pending.get(slot)
+            if pending is not None:
+                merged = {**pending[1], **data}
+                if "previous" in pending[1]:
+                    merged["previous"] = pending[1]["previous"]  # a rename chain keeps its first name
+                pending[1] = merged
+                self.coalesced += 1
+            else:
+                self._pending[slot] = [self._clock() + self.coalesce_seconds, dict(data)]
+            self._cond.notify_all()
+
+    def on_change(self, kind: str, key: Optional[str], info: Dict[str, Any]) -> None:
+        """Scene index change listener."""
+        self.publish(kind, key, **info)
+
+    def flush(self) -> None:
+        """Publish everything still inside its coalescing window."""
+        with self._cond:
+            self._flush_due(everything=True)
+            self._cond.notify_all()
+
+    def read(self, after_id: int, timeout: float) -> Tuple[List[Event], bool]:
+        """
+        Events with id > after_id, waiting up to `timeout` seconds for one. The flag
+        is True when events after `after_id` were lost (ring overflow, or an id from
+        an earlier bridge process); the list then holds nothing and the caller should
+        continue from `last_id`.
+        """
+        deadline = self._clock() + timeout
+        with self._cond:
+            while True:
+                self._flush_due()
+                if after_id > self._last_id or (self._log and after_id < self._log[0].id - 1):
+                    return [], True
+                if self._last_id > after_id:
+                    skip = len(self._log) - (self._last_id - after_id)
+                    return [event for i, event in enumerate(self._log) if i >= skip], False
+                now = self._clock()
+                if now >= deadline:
+                    return [], False
+                wake = deadline
+                if self._pending:
+                    wake = min(wake, next(iter(self._pending.values()))[0])
+                self._cond.wait(max(0.0, wake - now))
+
+    def subscribe(self) -> bool:
+        with self._cond:
+            if self._subscribers >= self.max_subscribers:
+                return False
+            self._subscribers += 1
+            return True
+
+    def unsubscribe(self) -> None:
+        with self._cond:
+            self._subscribers = max(0, self._subscribers - 1)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "last_id": self._last_id,
+                "buffered": len(self._log),
+                "pending": len(self._pending),
+                "subscribers": self._subscribers,
+                "published": self.published,
+                "coalesced": self.coalesced,
+            }
+
+    def _flush_due(self, everything: bool = False) -> None:
+        now = self._clock()
+        while self._pending:
+            slot, (due, data) = next(iter(self._pending.items()))
+            if due > now and not everything:
+                break
+            del self._pending[slot]
+            self._last_id += 1
+            self._log.append(Event(self._last_id, slot[0], slot[1], data, time.time()))
+            self.published += 1
+
+
+EVENTS = EventBus()
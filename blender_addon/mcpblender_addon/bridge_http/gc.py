@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+"""
+Automatic orphan purge policy for long-running bridge sessions.
+
+Deletes and datablock growth are counted as RPCs complete; once a threshold is crossed
+a purge is scheduled on Blender's main thread (bpy.app.timers, or MAIN_TIMERS in a
+headless bridge) and only runs when the bridge has been idle for `idle_seconds` and
+BPY_LOCK is free, so it never adds to request latency.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:  # pragma: no cover - Blender runtime only
+    import bpy
+
+    HAS_BPY = True
+except ImportError:  # pragma: no cover - Blender runtime only
+    bpy = None
+    HAS_BPY = False
+
+Scheduler = Callable[[Callable[[], Optional[float]], float], None]
+
+
+class MainThreadTimers:
+    """
+    bpy.app.timers for a headless bridge. Blender runs no event loop under
+    --background, so registered timers never fire; while `active`, _timer_schedule
+    queues callbacks here instead and the bridge's main() runs them on the main thread.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[float, int, Callable[[], Optional[float]]]] = []
+        self._order = itertools.count()
+        self.active = False
+
+    def schedule(self, callback: Callable[[], Optional[float]], delay: float) -> None:
+        with self._cond:
+            heapq.heappush(self._heap, (self._clock() + delay, next(self._order), callback))
+            self._cond.notify()
+
+    def run_due(self) -> None:
+        """Run every callback that is due, rescheduling those that return a delay."""
+        while True:
+            with self._cond:
+                if not self._heap or self._heap[0][0] > self._clock():
+                    return
+                _, _, callback = heapq.heappop(self._heap)
+            try:
+                again = callback()
+            except Exception:  # pragma: no cover - a failing timer is dropped, as bpy.app.timers does
+                again = None
+            if again is not None:
+                self.schedule(callback, again)
+
+    def run_forever(self, stop: threading.Event, poll: float = 0.25) -> None:
+        while not stop.is_set():
+            self.run_due()
+            with self._cond:
+                wait = self._heap[0][0] - self._clock() if self._heap else poll
+                if wait > 0:
+                    self._cond.wait(min(wait, poll))
+
+
+MAIN_TIMERS = MainThreadTimers()
+
+
+def _timer_schedule(callback: Callable[[], Optional[float]], delay: float) -> None:
+    """Run callback after delay; a float return value reschedules it (bpy.app.timers semantics)."""
+    if MAIN_TIMERS.active:
+        MAIN_TIMERS.schedule(callback, delay)
+        return
+    if HAS_BPY:  # pragma: no cover - Blender runtime only
+        bpy.app.timers.register(callback, first_interval=delay, persistent=True)
+        return
+
+    def fire() -> None:
+        again = callback()
+        if again is not None:
+            _timer_schedule(callback, again)
+
+    timer = threading.Timer(delay, fire)
+    timer.daemon = True
+    timer.start()
+
+
+class OrphanGCPolicy:
+    """Decides when to purge orphans and runs the purge at idle time."""
+
+    def __init__(
+        self,
+        purge: Callable[[Dict[str, Any]], Dict[str, Any]],
+        count_datablocks: Callable[[], int],
+        lock: Any,
+        delete_threshold: int = 200,
+        datablock_threshold: int = 50_000,
+        idle_seconds: float = 2.0,
+        schedule: Scheduler = _timer_schedule,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._purge = purge
+        self._count_datablocks = count_datablocks
+        self._lock = lock
+        self._schedule = schedule
+        self._clock = clock
+        self.delete_threshold = delete_threshold
+        self.datablock_threshold = datablock_threshold
+        self.idle_seconds = idle_seconds
+        self.enabled = True
+        self._state_lock = threading.Lock()
+        self._deletes_since_purge = 0
+        self._datablocks_after_purge = 0
+        self._scheduled = False
+        self._last_activity = clock()
+        self.runs = 0
+        self.last_result: Optional[Dict[str, Any]] = None
+
+    def configure(self, **settings: Any) -> None:
+        for key in ("delete_threshold", "datablock_threshold", "idle_seconds", "enabled"):
+            if key in settings and settings[key] is not None:
+                setattr(self, key, settings[key])
+
+    def touch(self) -> None:
+        """Mark request activity; purges wait for a quiet period after the last one."""
+        self._last_activity = self._clock()
+
+    def note_mutation(self, deleted: int = 0) -> None:
+        with self._state_lock:
+            self._deletes_since_purge += max(0, int(deleted))
+            due = self._due()
+            if not due or self._scheduled or not self.enabled:
+                return
+            self._scheduled = True
+        self._schedule(self._run_when_idle, self.idle_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "deletes_since_purge": self._deletes_since_purge,
+            "delete_threshold": self.delete_threshold,
+            "datablock_threshold": self.datablock_threshold,
+            "scheduled": self._scheduled,
+            "runs": self.runs,
+            "last_result": self.last_result,
+        }
+
+    def record_manual_purge(self, result: Dict[str, Any]) -> None:
+        with self._state_lock:
+            self._record(result)
+
+    def _record(self, result: Dict[str, Any]) -> None:
+        self.last_result = result
+        self._deletes_since_purge = 0
+        self._datablocks_after_purge = int(result.get("remaining_datablocks", 0) or 0)
+
+    def _due(self) -> bool:
+        if self._deletes_since_purge >= self.delete_threshold:
+            return True
+        # Datablocks that survived the last purge are live; don't re-trigger on them alone.
+        floor = max(self.datablock_threshold, self._datablocks_after_purge + self.delete_threshold)
+        try:
+            return self._count_datablocks() >= floor
+        except Exception:  # pragma: no cover - defensive
+            return False
+
+    def _run_when_idle(self) -> Optional[float]:
+        quiet_for = self._clock() - self._last_activity
+        if quiet_for < self.idle_seconds:
+            return self.idle_seconds - quiet_for
+        if not self._lock.acquire(blocking=False):
+            return self.idle_seconds
+        try:
+            result = self._purge({})
+            with self._state_lock:
+                self.runs += 1
+                self._record(result)
+        except Exception as exc:  # pragma: no cover - defensive
+            self.last_result = {"error": str(exc)}
+        finally:
+            self._lock.release()
+            self._scheduled = False
+        return None
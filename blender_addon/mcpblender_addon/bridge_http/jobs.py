@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+"""
+Asynchronous jobs for long-running bridge operations.
+
+`jobs.submit` turns an RPC into a job and returns immediately. Each job is a
+generator that yields (done, total) progress between chunks of work; the manager
+advances it from Blender's main thread (bpy.app.timers, or MAIN_TIMERS when the
+bridge runs headless), taking BPY_LOCK only for one time slice at a time so
+ordinary RPCs interleave with the job. Cancellation is cooperative: a cancelled job stops at the next chunk boundary. Finished jobs keep
+their result envelope in a bounded store (oldest evicted first, expired after
+`result_ttl` seconds).
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generator, Optional, Tuple
+
+from mcpblender_addon.bridge_http.gc import Scheduler, _timer_schedule
+
+Envelope = Dict[str, Any]
+JobRunner = Generator[Tuple[int, int], None, Envelope]
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = frozenset({DONE, FAILED, CANCELLED})
+
+
+def _error(code: str, message: str) -> Envelope:
+    return {"ok": False, "error": {"code": code, "message": message}}
+
+
+class Job:
+    def __init__(self, job_id: str, method: str, runner: JobRunner) -> None:
+        self.id = job_id
+        self.method = method
+        self.runner = runner
+        self.state = QUEUED
+        self.done = 0
+        self.total = 0
+        self.cancel_requested = False
+        self.result: Optional[Envelope] = None
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.finished_mono: Optional[float] = None
+
+    def status(self) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "job_id": self.id,
+            "method": self.method,
+            "state": self.state,
+            "progress": {
+                "done": self.done,
+                "total": self.total,
+                "fraction": round(self.done / self.total, 4) if self.total else (1.0 if self.state == DONE else 0.0),
+            },
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if self.state == FAILED and self.result is not None:
+            payload["error"] = self.result.get("error")
+        return payload
+
+
+class JobManager:
+    """Runs job generators in lock-holding time slices on the main thread."""
+
+    def __init__(
+        self,
+        lock: Any,
+        slice_seconds: float = 0.02,
+        max_finished: int = 256,
+        result_ttl: float = 600.0,
+        schedule: Scheduler = _timer_schedule,
+        clock: Callable[[], float] = time.monotonic,
+        on_complete: Optional[Callable[[str, Envelope], None]] = None,
+    ) -> None:
+        self._lock = lock
+        self.slice_seconds = slice_seconds
+        self.max_finished = max_finished
+        self.result_ttl = result_ttl
+        self._schedule = schedule
+        self._clock = clock
+        self._on_complete = on_complete
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._finished: "OrderedDict[str, None]" = OrderedDict()
+        self._state_lock = threading.Lock()
+
+    def submit(self, method: str, runner: JobRunner) -> Job:
+        self._evict()
+        job = Job(uuid.uuid4().hex[:16], method, runner)
+        with self._state_lock:
+            self._jobs[job.id] = job
+        self._schedule(lambda: self._step(job), 0.0)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._state_lock:
+            return self._jobs.get(str(job_id))
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        job = self.get(job_id)
+        if job is not None and job.state not in FINISHED_STATES:
+            job.cancel_requested = True
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        with self._state_lock:
+            states: Dict[str, int] = {}
+            for job in self._jobs.values():
+                states[job.state] = states.get(job.state, 0) + 1
+        return {"jobs": states, "max_finished": self.max_finished}
+
+    def _step(self, job: Job) -> Optional[float]:
+        if not self._lock.acquire(blocking=False):
+            return self.slice_seconds  # an RPC holds the lock; try again shortly
+        try:
+            if job.cancel_requested:
+                job.runner.close()
+                self._finish(job, CANCELLED, _error("cancelled", "job was cancelled"))
+                return None
+            if job.state == QUEUED:
+                job.state = RUNNING
+                job.started_at = time.time()
+            deadline = self._clock() + self.slice_seconds
+            while True:
+                job.done, job.total = next(job.runner)
+                if job.cancel_requested or self._clock() >= deadline:
+                    return 0.0
+        except StopIteration as stop:
+            envelope = stop.value if isinstance(stop.value, dict) else _error("job_error", "job returned no result")
+            self._finish(job, DONE if envelope.get("ok") else FAILED, envelope)
+            return None
+        except Exception as exc:
+            self._finish(job, FAILED, _error("job_error", str(exc)))
+            return None
+        finally:
+            self._lock.release()
+
+    def _finish(self, job: Job, state: str, envelope: Envelope) -> None:
+        job.state = state
+        job.result = envelope
+        job.finished_at = time.time()
+        job.finished_mono = self._clock()
+        if state == DONE and job.total:
+            job.done = job.total
+        with self._state_lock:
+            self._finished[job.id] = None
+        self._evict()
+        if self._on_complete is not None and state == DONE:
+            self._on_complete(job.method, envelope)
+
+    def _evict(self) -> None:
+        now = self._clock()
+        with self._state_lock:
+            while self._finished:
+                oldest = next(iter(self._finished))
+                job = self._jobs[oldest]
+                expired = job.finished_mono is not None and now - job.finished_mono > self.result_ttl
+                if len(self._finished) <= self.max_finished and not expired:
+                    break
+                del self._finished[oldest]
+                del self._jobs[oldest]
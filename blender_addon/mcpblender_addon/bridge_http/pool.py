@@ -0,0 +1,441 @@
+from __future__ import annotations
+
+"""
+Bounded serving for the bridge: a fixed worker pool instead of a thread per connection.
+
+PooledServerMixIn takes the place of socketserver.ThreadingMixIn. The accept loop
+puts new connections on a bounded queue drained by `pool_size` worker threads. A
+worker serves the requests a connection has ready and then parks it, so an idle
+keep-alive client costs a selector registration rather than a blocked thread. The
+parker thread queues a parked connection again when its next request arrives and
+closes it once it has been idle for `idle_timeout` seconds.
+
+Overload is refused up front instead of queued without bound:
+  503 + Retry-After  `max_connections` sockets are already open
+  429 + Retry-After  the work queue already holds `queue_size` items
+Long-lived streams (GET /events) detach from the pool onto a thread of their own;
+the event bus limits how many of those exist.
+"""
+
+import json
+import queue
+import selectors
+import socket
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+DEFAULT_POOL_SIZE = 8
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_MAX_CONNECTIONS = 128
+DEFAULT_IDLE_TIMEOUT = 30.0
+DEFAULT_RETRY_AFTER = 1
+_REASONS = {429: "Too Many Requests", 503: "Service Unavailable"}
+_DRAIN_BYTES = 64 * 1024
+
+
+class ParkingHandlerMixIn:
+    """Request handler side of the pool: hands the worker back between keep-alive requests."""
+
+    parked = False
+    detached = False
+
+    def setup(self) -> None:
+        if self.timeout is None:
+            # A client that stalls halfway through a request must not hold a worker forever.
+            self.timeout = getattr(self.server, "idle_timeout", None)
+        super().setup()
+
+    def handle(self) -> None:
+        if not isinstance(self.server, PooledServerMixIn):
+            super().handle()
+            return
+        self.parked = False
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection and not self.detached:
+            if not self._input_ready():
+                self.parked = not self.close_connection
+                return
+            self.handle_one_request()  # pipelined request already in the buffer
+
+    def resume(self) -> None:
+        """Serve a parked connection whose next request has arrived."""
+        try:
+            self.handle()
+        finally:
+            self.finish()
+
+    def finish(self) -> None:
+        if self.parked or self.detached:
+            return  # the connection lives on; release() closes it later
+        super().finish()
+
+    def release(self) -> None:
+        """Flush and close the streams of a parked or detached connection."""
+        self.parked = False
+        try:
+            super().finish()
+        except Exception:
+            pass
+
+    def detach(self, serve: Callable[[], None]) -> None:
+        """Run `serve` on a thread of its own and give the worker back to the pool."""
+        self.close_connection = True
+        if not isinstance(self.server, PooledServerMixIn):
+            serve()
+            return
+        self.detached = True
+        server = self.server
+
+        def run() -> None:
+            try:
+                serve()
+            finally:
+                server.discard(self)
+
+        threading.Thread(target=run, name="mcpb-bridge-stream", daemon=True).start()
+
+    def _input_ready(self) -> bool:
+        """True when the next request is already buffered; never blocks."""
+        try:
+            self.connection.settimeout(0)
+            return bool(self.rfile.peek(1))
+        except OSError:
+            self.close_connection = True
+            return False
+        finally:
+            try:
+                self.connection.settimeout(self.timeout)
+            except OSError:
+                pass
+
+
+class PooledServerMixIn:
+    """socketserver mix-in: fixed worker pool, bounded queue, connection cap, idle reaping."""
+
+    pool_size = DEFAULT_POOL_SIZE
+    queue_size = DEFAULT_QUEUE_SIZE
+    max_connections = DEFAULT_MAX_CONNECTIONS
+    idle_timeout = DEFAULT_IDLE_TIMEOUT
+    retry_after = DEFAULT_RETRY_AFTER
+    # Listen backlog: let bursts reach accept() so they get an answer instead of a stalled SYN.
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        *args: Any,
+        pool_size: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        retry_after: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
+        settings = {
+            "pool_size": pool_size,
+            "queue_size": queue_size,
+            "max_connections": max_connections,
+            "idle_timeout": idle_timeout,
+            "retry_after": retry_after,
+        }
+        for name, value in settings.items():
+            if value is not None:
+                if value <= 0:
+                    raise ValueError(f"{name} must be positive")
+                setattr(self, name, value)
+        self._work: "queue.Queue[Any]" = queue.Queue(self.queue_size)
+        self._count_lock = threading.Lock()
+        self._open = 0
+        self._busy = 0
+        self.served = 0
+        self.rejected = {429: 0, 503: 0}
+        self._workers: List[threading.Thread] = []
+        self._parker: Optional[_Parker] = None
+        self._stopping = threading.Event()
+        super().__init__(*args, **kwargs)
+
+    # -- lifecycle --
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        self._start_pool()
+        super().serve_forever(poll_interval)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._stop_pool()
+
+    def _start_pool(self) -> None:
+        with self._count_lock:
+            if self._workers or self._stopping.is_set():
+                return
+            self._parker = _Parker(self)
+            self._workers = [
+                threading.Thread(target=self._work_loop, name=f"mcpb-bridge-worker-{n}", daemon=True)
+                for n in range(self.pool_size)
+            ]
+        self._parker.start()
+        for worker in self._workers:
+            worker.start()
+
+    def _stop_pool(self) -> None:
+        self._stopping.set()
+        if self._parker is not None:
+            self._parker.stop()
+        while True:
+            try:
+                item = self._work.get_nowait()
+            except queue.Empty:
+                break
+            self._drop(item)
+        for worker in self._workers:
+            worker.join(timeout=1)
+
+    # -- accept side --
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        with self._count_lock:
+            full = self._open >= self.max_connections
+            if not full:
+                self._open += 1
+        if full:
+            self._refuse(request, 503, "too_many_connections", "connection limit reached")
+            return
+        try:
+            self._work.put_nowait((request, client_address))
+        except queue.Full:
+            self._refuse(request, 429, "server_busy", "request queue is full")
+            self._forget()
+
+    def requeue(self, handler: Any) -> None:
+        """Queue a parked connection whose next request has arrived (parker thread)."""
+        try:
+            self._work.put_nowait(handler)
+        except queue.Full:
+            handler.release()
+            self._refuse(handler.request, 429, "server_busy", "request queue is full")
+            self._forget()
+
+    def _refuse(self, sock: Any, status: int, code: str, message: str) -> None:
+        body = json.dumps({"ok": False, "error": {"code": code, "message": message}}).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Retry-After: {self.retry_after}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        with self._count_lock:
+            self.rejected[status] += 1
+        try:
+            sock.setblocking(False)
+            # Read what the client already sent so closing does not reset the connection under the reply.
+            drained = 0
+            while drained < _DRAIN_BYTES:
+                chunk = sock.recv(_DRAIN_BYTES)
+                if not chunk:
+                    break
+                drained += len(chunk)
+        except OSError:
+            pass
+        try:
+            sock.settimeout(1.0)
+            sock.sendall(head.encode("ascii") + body)
+        except OSError:
+            pass
+        self.shutdown_request(sock)
+
+    # -- workers --
+
+    def _work_loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                item = self._work.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            with self._count_lock:
+                self._busy += 1
+            try:
+                self._serve(item)
+            finally:
+                with self._count_lock:
+                    self._busy -= 1
+                    self.served += 1
+
+    def _serve(self, item: Any) -> None:
+        if isinstance(item, tuple):
+            request, client_address = item
+            try:
+                handler = self.RequestHandlerClass(request, client_address, self)
+            except Exception:
+                self.handle_error(request, client_address)
+                self._close(request)
+                return
+        else:
+            handler = item
+            try:
+                handler.resume()
+            except ConnectionError:
+                self.discard(handler)  # the client went away while parked
+                return
+            except Exception:
+                self.handle_error(handler.request, handler.client_address)
+                self.discard(handler)
+                return
+        if getattr(handler, "detached", False):
+            return  # the stream thread calls discard() when it is done
+        if getattr(handler, "parked", False) and self._parker is not None:
+            self._parker.park(handler)
+            return
+        self._close(handler.request)
+
+    def _drop(self, item: Any) -> None:
+        if isinstance(item, tuple):
+            self._close(item[0])
+        else:
+            self.discard(item)
+
+    def discard(self, handler: Any) -> None:
+        """Close a parked or detached connection for good."""
+        handler.release()
+        self._close(handler.request)
+
+    def _close(self, request: Any) -> None:
+        self.shutdown_request(request)
+        self._forget()
+
+    def _forget(self) -> None:
+        with self._count_lock:
+            self._open = max(0, self._open - 1)
+
+    def pool_stats(self) -> Dict[str, Any]:
+        parker = self._parker
+        with self._count_lock:
+            return {
+                "pool_size": self.pool_size,
+                "busy": self._busy,
+                "queued": self._work.qsize(),
+                "queue_size": self.queue_size,
+                "open": self._open,
+                "max_connections": self.max_connections,
+                "parked": parker.parked if parker is not None else 0,
+                "idle_timeout": self.idle_timeout,
+                "served": self.served,
+                "reaped": parker.reaped if parker is not None else 0,
+                "rejected": {str(status): count for status, count in self.rejected.items()},
+            }
+
+
+class _Parker:
+    """Selector thread holding idle keep-alive connections between requests."""
+
+    def __init__(self, server: PooledServerMixIn) -> None:
+        self._server = server
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        self._incoming: Deque[Any] = deque()
+        self._parked: Dict[Any, float] = {}  # handler -> parked at; insertion order is idle order
+        self._lock = threading.Lock()
+        self._stopped = False
+        self.reaped = 0
+        self._thread = threading.Thread(target=self._run, name="mcpb-bridge-parker", daemon=True)
+
+    @property
+    def parked(self) -> int:
+        return len(self._parked) + len(self._incoming)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stopped = True
+        self._wake()
+        self._thread.join(timeout=2)
+
+    def park(self, handler: Any) -> None:
+        with self._lock:
+            if not self._stopped:
+                self._incoming.append(handler)
+                handler = None
+        if handler is not None:
+            self._server.discard(handler)
+            return
+        self._wake()
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._lock:
+                    if self._stopped:
+                        break
+                for key, _ in self._selector.select(self._next_timeout()):
+                    if key.data is None:
+                        self._drain_wake()
+                        continue
+                    self._unpark(key.data)
+                    self._server.requeue(key.data)
+                self._adopt()
+                self._reap(time.monotonic())
+        finally:
+            with self._lock:
+                self._stopped = True
+            self._adopt()
+            for handler in list(self._parked):
+                self._unpark(handler)
+                self._server.discard(handler)
+            self._selector.close()
+            self._wake_r.close()
+            self._wake_w.close()
+
+    def _adopt(self) -> None:
+        while True:
+            with self._lock:
+                if not self._incoming:
+                    return
+                handler = self._incoming.popleft()
+            try:
+                self._selector.register(handler.connection, selectors.EVENT_READ, handler)
+            except (ValueError, KeyError, OSError):
+                self._server.discard(handler)
+                continue
+            self._parked[handler] = time.monotonic()
+
+    def _unpark(self, handler: Any) -> None:
+        self._parked.pop(handler, None)
+        try:
+            self._selector.unregister(handler.connection)
+        except (ValueError, KeyError, OSError):
+            pass
+
+    def _reap(self, now: float) -> None:
+        limit = self._server.idle_timeout
+        for handler, since in list(self._parked.items()):
+            if now - since < limit:
+                break
+            self._unpark(handler)
+            self.reaped += 1
+            self._server.discard(handler)
+
+    def _next_timeout(self) -> float:
+        if not self._parked:
+            return 0.5
+        oldest = next(iter(self._parked.values()))
+        return max(0.0, min(0.5, oldest + self._server.idle_timeout - time.monotonic()))
+
+    def _wake(self) -> None:
+        try:
+            self._wake_w.send(b"\0")
+        except OSError:
+            pass
+
+    def _drain_wake(self) -> None:
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
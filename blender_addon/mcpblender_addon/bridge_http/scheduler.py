@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+"""
+Weighted fair scheduling of RPCs for BPY_LOCK.
+
+Every locked RPC waits in a queue keyed by (client, cost class), and FairScheduler
+hands out one turn at a time. The turn goes to the waiting queue that has been
+charged the least time so far. After a turn, its queue is charged the time the
+handler held the lock, divided by the queue's weight (client weight times class
+weight). So an agent issuing back-to-back full snapshots runs once per round
+instead of whenever it wakes first. A queue that goes idle and comes back starts
+at the current virtual time, not with the credit it would otherwise have built up.
+
+Clients are named by the X-MCP-Client header, falling back to the connection.
+Cost classes split cheap single-object edits from expensive reads and bulk calls.
+stats() shows, per client, the queue lengths, waits and service time, so a client
+that is starved or hogging the bridge can be spotted.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+CHEAP = "cheap"
+EXPENSIVE = "expensive"
+DEFAULT_CLASS_WEIGHTS = {CHEAP: 4.0, EXPENSIVE: 1.0}
+EXPENSIVE_METHODS = frozenset(
+    {
+        "scene.snapshot",
+        "scenegraph.search",
+        "scenegraph.query_region",
+        "scenegraph.nearest",
+        "scenegraph.within_radius",
+        "scenegraph.get_mesh",
+        "object.transform_many",
+        "object.delete_many",
+        "mesh.from_buffers",
+        "scene.purge_orphans",
+    }
+)
+ANONYMOUS_CLIENT = "anonymous"
+# Idle queues are forgotten after this long, or sooner when there are too many of them.
+FLOW_TTL_SECONDS = 300.0
+MAX_FLOWS = 512
+PRUNE_INTERVAL_SECONDS = 10.0
+# A turn is charged at least this much, so instant handlers still count.
+MIN_CHARGE_SECONDS = 1e-4
+
+
+def cost_class(method: str) -> str:
+    return EXPENSIVE if method in EXPENSIVE_METHODS else CHEAP
+
+
+class _Ticket:
+    __slots__ = ("flow", "enqueued", "granted", "started")
+
+    def __init__(self, flow: "_Flow", now: float) -> None:
+        self.flow = flow
+        self.enqueued = now
+        self.granted = False
+        self.started = 0.0
+
+
+class _Flow:
+    """One (client, cost class) queue and its accounting."""
+
+    def __init__(self, client: str, cost: str, now: float) -> None:
+        self.client = client
+        self.cost = cost
+        self.waiting: Deque[_Ticket] = deque()
+        self.vruntime = 0.0
+        self.last_active = now
+        self.served = 0
+        self.dropped = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.service_total = 0.0
+
+
+class FairScheduler:
+    def __init__(
+        self,
+        class_weights: Optional[Dict[str, float]] = None,
+        client_weights: Optional[Dict[str, float]] = None,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.class_weights = dict(DEFAULT_CLASS_WEIGHTS)
+        self.client_weights: Dict[str, float] = {}
+        self.enabled = enabled
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._flows: Dict[Tuple[str, str], _Flow] = {}
+        self._running: Optional[_Ticket] = None
+        self._vtime = 0.0
+        self._pruned_at = clock()
+        self.configure(class_weights=class_weights, client_weights=client_weights)
+
+    def configure(
+        self,
+        class_weights: Optional[Dict[str, float]] = None,
+        client_weights: Optional[Dict[str, float]] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        for name, weight in {**(class_weights or {}), **(client_weights or {})}.items():
+            if float(weight) <= 0:
+                raise ValueError(f"weight for {name!r} must be positive")
+        with self._cond:
+            for name, weight in (class_weights or {}).items():
+                if name not in self.class_weights:
+                    raise ValueError(f"unknown cost class {name!r}; expected one of {sorted(self.class_weights)}")
+                self.class_weights[name] = float(weight)
+            self.client_weights.update({name: float(weight) for name, weight in (client_weights or {}).items()})
+            if enabled is not None:
+                self.enabled = bool(enabled)
+
+    def weight(self, client: str, cost: str) -> float:
+        return self.client_weights.get(client, 1.0) * self.class_weights.get(cost, 1.0)
+
+    def acquire(self, client: Optional[str], method: str, timeout: float) -> Optional[_Ticket]:
+        """
+        Wait for this request's turn. Returns the ticket to pass to release(), or
+        None if `timeout` seconds passed first (the request never ran).
+        """
+        client = client or ANONYMOUS_CLIENT
+        with self._cond:
+            now = self._clock()
+            flow = self._flow(client, cost_class(method), now)
+            if not flow.waiting:
+                flow.vruntime = max(flow.vruntime, self._vtime)  # no credit for idle time
+            ticket = _Ticket(flow, now)
+            flow.waiting.append(ticket)
+            self._grant()
+            end = now + timeout
+            while not ticket.granted:
+                left = end - self._clock()
+                if left <= 0:
+                    flow.waiting.remove(ticket)
+                    flow.dropped += 1
+                    return None
+                self._cond.wait(left)
+            return ticket
+
+    def release(self, ticket: _Ticket) -> None:
+        with self._cond:
+            now = self._clock()
+            flow = ticket.flow
+            held = max(MIN_CHARGE_SECONDS, now - ticket.started)
+            flow.service_total += held
+            flow.vruntime += held / self.weight(flow.client, flow.cost)
+            flow.last_active = now
+            if self._running is ticket:
+                self._running = None
+            self._grant()
+
+    def _grant(self) -> None:
+        """Give the free turn to the head of the least-charged queue (caller holds _cond)."""
+        if self._running is not None:
+            return
+        best: Optional[_Flow] = None
+        for flow in self._flows.values():
+            if not flow.waiting:
+                continue
+            if not self.enabled:
+                # FIFO across everything: oldest ticket first.
+                if best is None or flow.waiting[0].enqueued < best.waiting[0].enqueued:
+                    best = flow
+            elif best is None or (flow.vruntime, flow.waiting[0].enqueued) < (best.vruntime, best.waiting[0].enqueued):
+                best = flow
+        if best is None:
+            return
+        ticket = best.waiting.popleft()
+        now = self._clock()
+        wait = now - ticket.enqueued
+        best.served += 1
+        best.wait_total += wait
+        best.wait_max = max(best.wait_max, wait)
+        best.last_active = now
+        self._vtime = max(self._vtime, best.vruntime)
+        ticket.granted = True
+        ticket.started = now
+        self._running = ticket
+        self._cond.notify_all()
+
+    def _flow(self, client: str, cost: str, now: float) -> _Flow:
+        flow = self._flows.get((client, cost))
+        if flow is None:
+            full = len(self._flows) >= MAX_FLOWS
+            if full or now - self._pruned_at > PRUNE_INTERVAL_SECONDS:
+                self._prune(now, force=full)
+            flow = self._flows[(client, cost)] = _Flow(client, cost, now)
+        return flow
+
+    def _prune(self, now: float, force: bool = False) -> None:
+        """Forget idle queues past FLOW_TTL_SECONDS; `force` also drops the oldest quarter."""
+        self._pruned_at = now
+        running = self._running.flow if self._running is not None else None
+        idle = sorted(
+            (flow.last_active, key) for key, flow in self._flows.items() if not flow.waiting and flow is not running
+        )
+        for position, (last_active, key) in enumerate(idle):
+            if now - last_active > FLOW_TTL_SECONDS or (force and position < max(1, len(idle) // 4)):
+                del self._flows[key]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            now = self._clock()
+            clients: Dict[str, Dict[str, Any]] = {}
+            for flow in self._flows.values():
+                entry = clients.setdefault(
+                    flow.client,
+                    {
+                        "weight": self.client_weights.get(flow.client, 1.0),
+                        "queued": {},
+                        "served": 0,
+                        "dropped": 0,
+                        "oldest_wait_ms": 0.0,
+                        "max_wait_ms": 0.0,
+                        "avg_wait_ms": 0.0,
+                        "service_ms": 0.0,
+                    },
+                )
+                entry["queued"][flow.cost] = len(flow.waiting)
+                entry["served"] += flow.served
+                entry["dropped"] += flow.dropped
+                entry["avg_wait_ms"] += flow.wait_total * 1000.0  # summed here, divided below
+                entry["max_wait_ms"] = max(entry["max_wait_ms"], round(flow.wait_max * 1000.0, 3))
+                entry["service_ms"] = round(entry["service_ms"] + flow.service_total * 1000.0, 3)
+                if flow.waiting:
+                    oldest = round((now - flow.waiting[0].enqueued) * 1000.0, 3)
+                    entry["oldest_wait_ms"] = max(entry["oldest_wait_ms"], oldest)
+            for entry in clients.values():
+                entry["avg_wait_ms"] = round(entry["avg_wait_ms"] / entry["served"], 3) if entry["served"] else 0.0
+            return {
+                "enabled": self.enabled,
+                "class_weights": dict(self.class_weights),
+                "running": self._running.flow.client if self._running is not None else None,
+                "queued": sum(len(flow.waiting) for flow in self._flows.values()),
+                "clients": clients,
+            }
@@ -1,20 +1,58 @@
 from __future__ import annotations
 
+import argparse
+import base64
 import json
+import os
+import socket
+import socketserver
+import stat
+import sys
 import threading
 import time
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import Any, Callable, Dict, Optional
 
 from mcpblender_addon.actions.core_actions import (
     assign_material_simple,
     capture_snapshot,
     create_cube,
+    delete_many,
     delete_object,
+    iter_capture_snapshot,
+    iter_delete_many,
+    mesh_from_buffers,
     scenegraph_get,
+    scenegraph_nearest,
+    scenegraph_query_region,
     scenegraph_search,
+    scenegraph_within_radius,
+    transform_many,
     transform_object,
 )
+from mcpblender_addon.actions.deadline import DeadlineExceeded, deadline_scope
+from mcpblender_addon.actions.mesh_buffers import FRAME_CONTENT_TYPE, decode_frame, get_mesh, iter_get_mesh
+from mcpblender_addon.actions.orphans import datablock_count, iter_purge_orphans, purge_orphans
+from mcpblender_addon.bridge_http.body import (
+    DEFAULT_FRAME_BYTES,
+    DEFAULT_JSON_BYTES,
+    ArraySpec,
+    BodyLimits,
+    BodyStream,
+    PayloadTooLarge,
+    read_json,
+)
+from mcpblender_addon.bridge_http.coalesce import TransformCoalescer
+from mcpblender_addon.bridge_http.events import EVENTS, RESET_KIND, Event, EventFilter
+from mcpblender_addon.bridge_http.gc import MAIN_TIMERS, OrphanGCPolicy
+from mcpblender_addon.bridge_http.jobs import FINISHED_STATES, JobManager, JobRunner
+from mcpblender_addon.bridge_http.pool import ParkingHandlerMixIn, PooledServerMixIn
+from mcpblender_addon.bridge_http.scheduler import FairScheduler
+from mcpblender_addon.bridge_http.shm import SHM_HEADER, SHM_STORE, client_accepts_shm
+from mcpblender_addon.index import StaleCursorError, add_change_listener, install_handlers
+from mcpblender_addon.snapshot.fragments import FRAGMENT_CACHE, encode_json
+from mcpblender_addon.snapshot.levels import SNAPSHOT_COSTS
 from mcpblender_addon.snapshot.light_snapshot import make_light_snapshot
 
 try:  # pragma: no cover - Blender runtime only
@@ -30,10 +68,51 @@ except ImportError:  # pragma: no cover - Blender runtime only
     HAS_BPY = False
 
 BRIDGE_VERSION = "1.0.3"
-MAX_BODY_BYTES = 1_048_576  # 1 MB
+MAX_BODY_BYTES = DEFAULT_JSON_BYTES
+# Binary frame uploads (mesh.from_buffers) carry raw geometry and get a larger cap.
+MAX_FRAME_BYTES = DEFAULT_FRAME_BYTES
+FRAME_METHODS = frozenset({"mesh.from_buffers"})
+# Bulk methods may send larger JSON bodies than the 1 MB default.
+BODY_LIMITS = BodyLimits(
+    MAX_BODY_BYTES,
+    MAX_FRAME_BYTES,
+    methods={"object.transform_many": 64 * 1_048_576, "object.delete_many": 16 * 1_048_576, "mesh.from_buffers": 64 * 1_048_576},
+)
+# Numeric params decoded straight into typed arrays when a body is streamed.
+STREAM_ARRAYS: Dict[str, Dict[str, ArraySpec]] = {
+    "mesh.from_buffers": {"positions": ("f", 1), "uvs": ("f", 1), "indices": ("i", 1), "face_sizes": ("i", 1)},
+    "object.transform_many": {"locations": ("d", 3), "rotations": ("d", 3), "scales": ("d", 3)},
+}
+ANY_STREAM_ARRAYS: Dict[str, ArraySpec] = {field: spec for fields in STREAM_ARRAYS.values() for field, spec in fields.items()}
+# Bodies up to this size are read whole and parsed by json.loads; larger ones are streamed.
+STREAM_THRESHOLD_BYTES = 256 * 1024
 TIMEOUT_SECONDS = 2.5
+# Per-method caps on how long a request may take, counted from its arrival; a
+# client deadline (DEADLINE_HEADER) can only shorten them.
+METHOD_TIMEOUTS: Dict[str, float] = {
+    "scene.snapshot": 5.0,
+    "scenegraph.get_mesh": 10.0,
+    "object.transform_many": 10.0,
+    "object.delete_many": 10.0,
+    "mesh.from_buffers": 15.0,
+    "scene.purge_orphans": 10.0,
+}
+# Absolute deadline of the caller, Unix time in seconds (e.g. "1767225600.250").
+DEADLINE_HEADER = "X-MCP-Deadline"
+# Handlers stop this much before the deadline so the reply can still reach the caller.
+RESPONSE_RESERVE_SECONDS = 0.05
 START_TIME = time.monotonic()
 BPY_LOCK = threading.RLock()
+# Decides whose request takes BPY_LOCK next; clients name themselves with CLIENT_HEADER.
+SCHEDULER = FairScheduler()
+CLIENT_HEADER = "X-MCP-Client"
+# Merges queued move/transform requests for the same object (off unless launch_server enables it).
+COALESCER = TransformCoalescer()
+ORPHAN_GC = OrphanGCPolicy(purge=purge_orphans, count_datablocks=datablock_count, lock=BPY_LOCK)
+JOBS = JobManager(lock=BPY_LOCK, on_complete=lambda method, result: _note_mutation(method, result))
+DEFAULT_DELETE_CHUNK = 500
+DEFAULT_SNAPSHOT_CHUNK = 500
+EVENTS_KEEPALIVE_SECONDS = 15.0
 
 
 def _safe(fn, default=None):
@@ -67,10 +146,12 @@ def _resolve_object(params: Dict[str, Any]):
     return None
 
 
-def _rpc_scene_snapshot() -> Dict[str, Any]:
+def _rpc_scene_snapshot(params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     try:
-        snapshot = capture_snapshot({})
+        snapshot = capture_snapshot(params or {})
         return {"ok": True, "data": snapshot}
+    except StaleCursorError as exc:
+        return _make_error("stale_cursor", str(exc))
     except Exception as exc:  # pragma: no cover - defensive
         return _make_error("snapshot_error", str(exc))
 
@@ -91,6 +172,28 @@ def _rpc_scenegraph_get(params: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no
         return _make_error("scenegraph_error", str(exc))
 
 
+def _rpc_scenegraph_spatial(fn: Callable[[Dict[str, Any]], Dict[str, Any]], params: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
+    try:
+        result = fn(params or {})
+        return {"ok": True, "data": result}
+    except ValueError as exc:
+        return _make_error("invalid_params", str(exc))
+    except Exception as exc:
+        return _make_error("scenegraph_error", str(exc))
+
+
+def _rpc_scenegraph_get_mesh(params: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
+    try:
+        header, frame = get_mesh(params or {})
+        return {"ok": True, "data": header, "binary": frame}
+    except LookupError as exc:
+        return _make_error("not_found", str(exc))
+    except ValueError as exc:
+        return _make_error("invalid_params", str(exc))
+    except Exception as exc:
+        return _make_error("scenegraph_error", str(exc))
+
+
 def _rpc_object_create_cube(params: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
     try:
         result = create_cube(params or {})
@@ -120,51 +223,318 @@ def _rpc_object_transform(params: Dict[str, Any]) -> Dict[str, Any]:  # pragma:
         return _make_error("transform_error", str(exc))
 
 
+def _rpc_object_transform_many(params: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
+    try:
+        result = transform_many(params or {})
+        return {"ok": True, "data": result}
+    except DeadlineExceeded:
+        raise
+    except Exception as exc:
+        return _make_error("transform_error", str(exc))
+
+
+def _rpc_mesh_from_buffers(params: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
+    try:
+        result = mesh_from_buffers(params or {})
+        return {"ok": True, "data": result}
+    except ValueError as exc:
+        return _make_error("invalid_params", str(exc))
+    except Exception as exc:
+        return _make_error("mesh_error", str(exc))
+
+
+def _rpc_scene_purge_orphans(params: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
+    try:
+        result = purge_orphans(params or {})
+        if not result.get("dry_run"):
+            ORPHAN_GC.record_manual_purge(result)
+        return {"ok": True, "data": {**result, "policy": ORPHAN_GC.stats()}}
+    except ValueError as exc:
+        return _make_error("invalid_params", str(exc))
+    except Exception as exc:
+        return _make_error("purge_error", str(exc))
+
+
+def _delete_job(params: Dict[str, Any], chunk_size: int) -> JobRunner:
+    try:
+        result = yield from iter_delete_many(params, chunk_size=chunk_size)
+    except LookupError as exc:
+        return _make_error("not_found", str(exc))
+    except ValueError as exc:
+        return _make_error("invalid_params", str(exc))
+    return {"ok": True, "data": result}
+
+
+def _snapshot_job(params: Dict[str, Any], chunk_size: int) -> JobRunner:
+    try:
+        snapshot = yield from iter_capture_snapshot(params, chunk_size)
+    except StaleCursorError as exc:
+        return _make_error("stale_cursor", str(exc))
+    except Exception as exc:  # pragma: no cover - defensive
+        return _make_error("snapshot_error", str(exc))
+    return {"ok": True, "data": snapshot}
+
+
+def _get_mesh_job(params: Dict[str, Any]) -> JobRunner:
+    try:
+        header, frame = yield from iter_get_mesh(params)
+    except LookupError as exc:
+        return _make_error("not_found", str(exc))
+    except ValueError as exc:
+        return _make_error("invalid_params", str(exc))
+    except Exception as exc:
+        return _make_error("scenegraph_error", str(exc))
+    return {"ok": True, "data": header, "binary": frame}
+
+
+def _purge_job(params: Dict[str, Any]) -> JobRunner:
+    try:
+        result = yield from iter_purge_orphans(params)
+    except ValueError as exc:
+        return _make_error("invalid_params", str(exc))
+    except Exception as exc:
+        return _make_error("purge_error", str(exc))
+    if not result.get("dry_run"):
+        ORPHAN_GC.record_manual_purge(result)
+    return {"ok": True, "data": {**result, "policy": ORPHAN_GC.stats()}}
+
+
+def _single_step_job(handler: Callable[[], Dict[str, Any]]) -> JobRunner:
+    yield 0, 1
+    return handler()
+
+
+def _job_steps(method: str, params: Dict[str, Any], chunk_size: Optional[int] = None) -> Optional[JobRunner]:
+    """
+    Chunked runner for methods that support it; any other RPC runs as one step.
+    delete_many and snapshot work `chunk_size` objects per step, get_mesh one
+    geometry section per step and purge_orphans one datablock type per step.
+    """
+    if method == "object.delete_many":
+        return _delete_job(params, chunk_size or DEFAULT_DELETE_CHUNK)
+    if method == "scene.snapshot":
+        return _snapshot_job(params, chunk_size or DEFAULT_SNAPSHOT_CHUNK)
+    if method == "scenegraph.get_mesh":
+        return _get_mesh_job(params)
+    if method == "scene.purge_orphans":
+        return _purge_job(params)
+    handler = _handler_map(params).get(method)
+    if handler is None or method in LOCK_FREE_METHODS:
+        return None
+    return _single_step_job(handler)
+
+
+def _rpc_jobs_submit(params: Dict[str, Any]) -> Dict[str, Any]:
+    method = params.get("method")
+    job_params = params.get("params") or {}
+    if not isinstance(method, str) or not isinstance(job_params, dict):
+        return _make_error("invalid_params", "method (string) and params (object) are required")
+    chunk_size = params.get("chunk_size") or job_params.get("chunk_size")
+    runner = _job_steps(method, job_params, int(chunk_size) if chunk_size else None)
+    if runner is None:
+        return _make_error("tool_not_found", f"{method} cannot run as a job")
+    return {"ok": True, "data": JOBS.submit(method, runner).status()}
+
+
+def _rpc_jobs_status(params: Dict[str, Any]) -> Dict[str, Any]:
+    job = JOBS.get(params.get("job_id"))
+    if job is None:
+        return _make_error("not_found", "Unknown or expired job")
+    return {"ok": True, "data": job.status()}
+
+
+def _rpc_jobs_result(params: Dict[str, Any]) -> Dict[str, Any]:
+    job = JOBS.get(params.get("job_id"))
+    if job is None:
+        return _make_error("not_found", "Unknown or expired job")
+    if job.state not in FINISHED_STATES:
+        return _make_error("job_pending", f"job is {job.state}")
+    return job.result
+
+
+def _rpc_jobs_cancel(params: Dict[str, Any]) -> Dict[str, Any]:
+    job = JOBS.cancel(params.get("job_id"))
+    if job is None:
+        return _make_error("not_found", "Unknown or expired job")
+    return {"ok": True, "data": job.status()}
+
+
 def _handler_map(params: Dict[str, Any]) -> Dict[str, Callable[[], Dict[str, Any]]]:
     return {
-        "scene.snapshot": _rpc_scene_snapshot,
+        "scene.snapshot": lambda: _rpc_scene_snapshot(params),
         "object.create_cube": lambda: _rpc_object_create_cube(params),
         "object.move_object": lambda: _rpc_object_move(params),
         "object.transform": lambda: _rpc_object_transform(params),
+        "object.transform_many": lambda: _rpc_object_transform_many(params),
         "object.delete": lambda: _rpc_object_delete(params),
+        "object.delete_many": lambda: _rpc_object_delete_many(params),
         "material.assign_simple": lambda: _rpc_material_assign(params),
+        "mesh.from_buffers": lambda: _rpc_mesh_from_buffers(params),
         "scenegraph.search": lambda: _rpc_scenegraph_search(params),
         "scenegraph.get": lambda: _rpc_scenegraph_get(params),
+        "scenegraph.query_region": lambda: _rpc_scenegraph_spatial(scenegraph_query_region, params),
+        "scenegraph.nearest": lambda: _rpc_scenegraph_spatial(scenegraph_nearest, params),
+        "scenegraph.within_radius": lambda: _rpc_scenegraph_spatial(scenegraph_within_radius, params),
+        "scenegraph.get_mesh": lambda: _rpc_scenegraph_get_mesh(params),
+        "scene.purge_orphans": lambda: _rpc_scene_purge_orphans(params),
+        "jobs.submit": lambda: _rpc_jobs_submit(params),
+        "jobs.status": lambda: _rpc_jobs_status(params),
+        "jobs.result": lambda: _rpc_jobs_result(params),
+        "jobs.cancel": lambda: _rpc_jobs_cancel(params),
     }
 
 
-def dispatch_rpc(method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+# Methods that change scene data; completing one feeds the orphan GC policy.
+MUTATING_METHODS = frozenset(
+    {
+        "object.create_cube",
+        "object.move_object",
+        "object.transform",
+        "object.transform_many",
+        "object.delete",
+        "object.delete_many",
+        "material.assign_simple",
+        "mesh.from_buffers",
+    }
+)
+
+
+# Job bookkeeping never touches bpy, so it neither takes BPY_LOCK nor counts toward the timeout.
+LOCK_FREE_METHODS = frozenset({"jobs.submit", "jobs.status", "jobs.result", "jobs.cancel"})
+
+
+def _deleted_count(method: str, result: Dict[str, Any]) -> int:
+    if method == "object.delete":
+        return 1
+    if method == "object.delete_many":
+        return int((result.get("data") or {}).get("deleted", 0))
+    return 0
+
+
+def _note_mutation(method: str, result: Dict[str, Any]) -> None:
+    if result.get("ok") and method in MUTATING_METHODS:
+        ORPHAN_GC.note_mutation(deleted=_deleted_count(method, result))
+
+
+def method_timeout(method: str) -> float:
+    return METHOD_TIMEOUTS.get(method, TIMEOUT_SECONDS)
+
+
+def parse_deadline(value: Optional[str]) -> Optional[float]:
+    """DEADLINE_HEADER value -> time.monotonic() deadline; malformed values are ignored."""
+    if not value:
+        return None
+    try:
+        return time.monotonic() + (float(value) - time.time())
+    except ValueError:
+        return None
+
+
+def _expired_error(stage: str) -> Dict[str, Any]:
+    # Neither stage leaves partial changes: queued requests never ran and handlers
+    # only raise DeadlineExceeded before they start writing.
+    error = _make_error("timeout", f"deadline exceeded while {stage}")
+    error["error"]["details"] = {"stage": stage}
+    return error
+
+
+def dispatch_rpc(
+    method: str, params: Dict[str, Any], deadline: Optional[float] = None, client: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run one RPC under BPY_LOCK, once SCHEDULER gives `client` its turn. `deadline`
+    (time.monotonic()) is the caller's, capped by method_timeout(); requests still
+    waiting for their turn or the lock when it passes are dropped, and handlers see
+    it through actions.deadline for cooperative checks. With COALESCER enabled,
+    queued transforms of one object are merged and run as one.
+    """
     handlers = _handler_map(params or {})
     handler = handlers.get(method)
     if handler is None:
         return _make_error("tool_not_found", "Unsupported method")
 
+    if method in LOCK_FREE_METHODS:
+        try:
+            return handler()
+        except Exception as exc:  # pragma: no cover - defensive
+            return _make_error("internal_error", str(exc))
+
+    limit = time.monotonic() + method_timeout(method)
+    return COALESCER.submit(
+        method,
+        params or {},
+        handler,
+        lambda call: _run_locked(method, call, deadline, client),
+        lambda name, merged: _handler_map(merged)[name],
+        deadline=limit if deadline is None else min(deadline, limit),
+    )
+
+
+def _run_locked(
+    method: str, handler: Callable[[], Dict[str, Any]], deadline: Optional[float], client: Optional[str]
+) -> Dict[str, Any]:
+    ORPHAN_GC.touch()
     start = time.monotonic()
+    limit = start + method_timeout(method)
+    deadline = limit if deadline is None else min(deadline, limit)
+    wait = deadline - start
+    turn = SCHEDULER.acquire(client, method, wait) if wait > 0 else None
+    if turn is None:
+        return _expired_error("queued")
     try:
-        with BPY_LOCK:
-            result = handler()
-    except Exception as exc:  # pragma: no cover - defensive
-        return _make_error("internal_error", str(exc))
-
-    duration = time.monotonic() - start
-    if duration > TIMEOUT_SECONDS:
-        return _make_error("timeout", "operation exceeded timeout")
+        # Jobs and the orphan GC take BPY_LOCK outside the scheduler.
+        wait = deadline - time.monotonic()
+        if wait <= 0 or not BPY_LOCK.acquire(timeout=wait):
+            return _expired_error("queued")
+        try:
+            if time.monotonic() >= deadline:
+                return _expired_error("queued")
+            with deadline_scope(deadline - RESPONSE_RESERVE_SECONDS):
+                result = handler()
+            if isinstance(result, dict):
+                _note_mutation(method, result)  # the GC policy counts datablocks: read bpy.data under the lock
+        except DeadlineExceeded:
+            return _expired_error("running")
+        except Exception as exc:  # pragma: no cover - defensive
+            return _make_error("internal_error", str(exc))
+        finally:
+            BPY_LOCK.release()
+    finally:
+        SCHEDULER.release(turn)
+    ORPHAN_GC.touch()
 
     if not isinstance(result, dict) or "ok" not in result:
         return _make_error("internal_error", "handler returned invalid payload")
-
     return result
 
 
-def handle_rpc_bytes(body: bytes) -> Dict[str, Any]:
-    if len(body) > MAX_BODY_BYTES:
+def body_limit(content_type: str, path: str = "/rpc") -> int:
+    return BODY_LIMITS.for_route(path, frame=content_type.startswith(FRAME_CONTENT_TYPE))
+
+
+def handle_rpc_frame(body: bytes, deadline: Optional[float] = None, client: Optional[str] = None) -> Dict[str, Any]:
+    """Binary RPC: the frame header names method/params, its sections become params["buffers"]."""
+    if len(body) > BODY_LIMITS.frame_bytes:
         return _make_error("payload_too_large", "payload exceeds limit")
 
     try:
-        payload = json.loads(body.decode("utf-8")) if body else {}
-    except Exception:
-        return _make_error("invalid_payload", "Body must be JSON object")
+        header, sections = decode_frame(body)
+    except Exception as exc:
+        return _make_error("invalid_payload", f"Body must be a binary frame: {exc}")
 
+    method = header.get("method")
+    params = header.get("params") or {}
+    if not isinstance(params, dict):
+        return _make_error("invalid_payload", "params must be an object")
+    if method not in FRAME_METHODS:
+        return _make_error("invalid_payload", f"{method} does not accept binary frames")
+
+    return dispatch_rpc(method, {**params, "buffers": sections}, deadline, client)
+
+
+def _dispatch_payload(
+    payload: Any, size: int, path: str, deadline: Optional[float] = None, client: Optional[str] = None
+) -> Dict[str, Any]:
     if not isinstance(payload, dict):
         return _make_error("invalid_payload", "Body must be JSON object")
 
@@ -173,8 +543,79 @@ def handle_rpc_bytes(body: bytes) -> Dict[str, Any]:
 
     if not isinstance(params, dict):
         return _make_error("invalid_payload", "params must be an object")
+    if size > BODY_LIMITS.for_method(path, method):
+        return _make_error("payload_too_large", "payload exceeds limit")
+
+    return dispatch_rpc(method, params, deadline, client)
+
+
+def handle_rpc_bytes(
+    body: bytes,
+    content_type: str = "application/json",
+    path: str = "/rpc",
+    deadline: Optional[float] = None,
+    client: Optional[str] = None,
+) -> Dict[str, Any]:
+    if content_type.startswith(FRAME_CONTENT_TYPE):
+        return handle_rpc_frame(body, deadline, client)
+
+    if len(body) > BODY_LIMITS.for_route(path):
+        return _make_error("payload_too_large", "payload exceeds limit")
+
+    try:
+        payload = json.loads(body.decode("utf-8")) if body else {}
+    except Exception:
+        if len(body) > BODY_LIMITS.for_method(path, None):
+            return _make_error("payload_too_large", "payload exceeds limit")  # no method raises its limit
+        return _make_error("invalid_payload", "Body must be JSON object")
+
+    return _dispatch_payload(payload, len(body), path, deadline, client)
+
+
+def _stream_arrays(method: Optional[str]) -> Dict[str, ArraySpec]:
+    # "params" may precede "method" in the body; then any streamable field is packed.
+    return STREAM_ARRAYS.get(method, {}) if method is not None else ANY_STREAM_ARRAYS
+
 
-    return dispatch_rpc(method, params)
+def handle_rpc_stream(
+    stream: BodyStream,
+    content_type: str = "application/json",
+    path: str = "/rpc",
+    deadline: Optional[float] = None,
+    client: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Like handle_rpc_bytes, reading the body from `stream`: frames are read whole,
+    small JSON bodies go through json.loads and larger or chunked ones are parsed
+    incrementally with STREAM_ARRAYS packed into typed arrays.
+    """
+    try:
+        if content_type.startswith(FRAME_CONTENT_TYPE):
+            return handle_rpc_frame(stream.read_all(), deadline, client)
+        if stream.length is not None and stream.length <= STREAM_THRESHOLD_BYTES:
+            return handle_rpc_bytes(stream.read_all(), content_type, path, deadline, client)
+        payload = read_json(stream, _stream_arrays, lambda method: BODY_LIMITS.for_method(path, method))
+    except PayloadTooLarge:
+        return _make_error("payload_too_large", "payload exceeds limit")
+    except ValueError:
+        return _make_error("invalid_payload", "Body must be JSON object")
+    return _dispatch_payload(payload, stream.consumed, path, deadline, client)
+
+
+def wants_binary(accept: str) -> bool:
+    return FRAME_CONTENT_TYPE in accept or "application/octet-stream" in accept
+
+
+def inline_binary(result: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON form of a binary result: the frame travels base64-encoded next to its header."""
+    frame = result.get("binary")
+    if frame is None:
+        return result
+    data = dict(result.get("data") or {})
+    data["frame_base64"] = base64.b64encode(frame).decode("ascii")
+    inlined = {key: value for key, value in result.items() if key != "binary"}
+    inlined["data"] = data
+    return inlined
 
 
 def health_payload() -> Dict[str, Any]:
@@ -186,6 +627,12 @@ def health_payload() -> Dict[str, Any]:
         "uptime_seconds": round(uptime, 3),
         "blender_version": _safe(lambda: bpy.app.version_string, "unavailable"),
         "ready": bool(HAS_BPY),
+        "events": EVENTS.stats(),
+        "fragment_cache": FRAGMENT_CACHE.stats(),
+        "snapshot_costs": SNAPSHOT_COSTS.stats(),
+        "body_limits": BODY_LIMITS.stats(),
+        "scheduler": SCHEDULER.stats(),
+        "coalescing": COALESCER.stats(),
     }
 
 
@@ -207,17 +654,31 @@ def _rpc_object_delete(params: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no
         return _make_error("delete_error", str(exc))
 
 
-class _Handler(BaseHTTPRequestHandler):
+def _rpc_object_delete_many(params: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
+    try:
+        result = delete_many(params or {})
+        return {"ok": True, "data": result}
+    except LookupError as exc:
+        return _make_error("not_found", str(exc))
+    except Exception as exc:
+        return _make_error("delete_error", str(exc))
+
+
+class _Handler(ParkingHandlerMixIn, BaseHTTPRequestHandler):
     server_version = "MCPBlenderBridge/1.0"
     protocol_version = "HTTP/1.1"
 
-    def _send_json(self, payload: Dict[str, Any], status: int = 200) -> None:
-        try:
-            body = json.dumps(payload).encode("utf-8")
-        except Exception:
-            body = b'{"ok": false, "error": {"code": "serialization_error"}}'
+    def _send_body(self, body: bytes, content_type: str, status: int = 200) -> None:
+        # Same-host clients that opted in get large bodies through shared memory.
+        if status == 200 and client_accepts_shm(self.headers.get(SHM_HEADER)) and SHM_STORE.accepts(len(body)):
+            try:
+                handle = SHM_STORE.put(body, content_type)
+                body = json.dumps({"ok": True, "shm": handle}).encode("utf-8")
+                content_type = "application/json"
+            except OSError:
+                pass
         self.send_response(status)
-        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Type", content_type)
         self.send_header("Content-Length", str(len(body)))
         self.end_headers()
         try:
@@ -225,47 +686,201 @@ class _Handler(BaseHTTPRequestHandler):
         except Exception:
             pass
 
+    def _send_json(self, payload: Dict[str, Any], status: int = 200) -> None:
+        try:
+            body = encode_json(payload)
+        except Exception:
+            body = b'{"ok": false, "error": {"code": "serialization_error"}}'
+        self._send_body(body, "application/json", status)
+
+    def _send_frame(self, frame: bytes) -> None:
+        self._send_body(frame, FRAME_CONTENT_TYPE)
+
     def log_message(self, fmt: str, *args: Any) -> None:  # pragma: no cover - quiet handler
         return
 
+    def client_id(self) -> str:
+        """Scheduling identity: CLIENT_HEADER when sent, else this connection."""
+        named = (self.headers.get(CLIENT_HEADER) or "").strip()
+        return named[:128] if named else self._connection_id()
+
+    def _connection_id(self) -> str:
+        host, port = self.client_address[:2]
+        return f"{host}:{port}"
+
     def do_GET(self):  # noqa: N802
+        parts = urllib.parse.urlsplit(self.path)
+        if parts.path == "/events":
+            self._serve_events(urllib.parse.parse_qs(parts.query))
+            return
         try:
             if self.path != "/health":
                 self._send_json(_make_error("not_found", "Unknown path"), status=404)
                 return
-            self._send_json(health_payload())
+            payload = health_payload()
+            payload["pool"] = self.server.pool_stats() if isinstance(self.server, PooledServerMixIn) else None
+            self._send_json(payload)
         except Exception:
             self._send_json(_make_error("internal_error", "GET failed"), status=500)
 
+    def _serve_events(self, query: Dict[str, list]) -> None:
+        # Resume point: Last-Event-ID (set by EventSource on reconnect), else ?since=; new streams start now.
+        resume = self.headers.get("Last-Event-ID") or (query.get("since") or [None])[0]
+        after = _safe(lambda: int(resume), None) if resume is not None else None
+        if not EVENTS.subscribe():
+            self._send_json(_make_error("too_many_subscribers", "event stream limit reached"), status=503)
+            return
+        # The stream can last for hours; it gets its own thread instead of a pool worker.
+        self.detach(lambda: self._stream_events(query, after))
+
+    def _stream_events(self, query: Dict[str, list], after: Optional[int]) -> None:
+        try:
+            event_filter = EventFilter.from_query(query)
+            if after is None:
+                after = EVENTS.last_id
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.write(b"retry: 2000\n\n")
+            self.wfile.flush()
+            while True:
+                events, reset = EVENTS.read(after, timeout=EVENTS_KEEPALIVE_SECONDS)
+                chunks = []
+                if reset:
+                    after = EVENTS.last_id
+                    chunks.append(Event(after, RESET_KIND, None, {}, time.time()).to_sse())
+                for event in events:
+                    after = event.id
+                    if event_filter.matches(event):
+                        chunks.append(event.to_sse())
+                if not chunks and not events:
+                    chunks.append(b": keepalive\n\n")
+                if chunks:
+                    self.wfile.write(b"".join(chunks))
+                    self.wfile.flush()
+        except OSError:
+            pass  # subscriber went away
+        finally:
+            EVENTS.unsubscribe()
+
     def do_POST(self):  # noqa: N802
         if self.path != "/rpc":
             self._send_json(_make_error("not_found", "Unknown path"), status=404)
             return
 
-        length = _safe(lambda: int(self.headers.get("Content-Length", "0")), 0)
-        if length > MAX_BODY_BYTES:
+        content_type = self.headers.get("Content-Type", "application/json")
+        try:
+            stream = BodyStream.from_headers(self.rfile, self.headers, body_limit(content_type, self.path))
+        except PayloadTooLarge:
+            self.close_connection = True
             self._send_json(_make_error("payload_too_large", "payload exceeds limit"), status=413)
             return
+        except ValueError:
+            self.close_connection = True
+            self._send_json(_make_error("invalid_payload", "invalid Content-Length"), status=400)
+            return
 
-        body = self.rfile.read(length) if length > 0 else b""
-        result = handle_rpc_bytes(body)
+        deadline = parse_deadline(self.headers.get(DEADLINE_HEADER))
+        result = handle_rpc_stream(stream, content_type, self.path, deadline, self.client_id())
+        if not stream.finished:
+            self.close_connection = True  # the rest of the body is still on the socket
+        if result.get("ok") and "binary" in result:
+            if wants_binary(self.headers.get("Accept", "")):
+                self._send_frame(result["binary"])
+                return
+            result = inline_binary(result)
         status = 200 if result.get("ok") else 400
         error_code = result.get("error", {}).get("code")
         if error_code == "internal_error":
             status = 500
         elif error_code == "timeout":
             status = 504
+        elif error_code == "job_pending":
+            status = 202
         elif error_code == "payload_too_large":
             status = 413
         self._send_json(result, status=status)
 
 
+class PooledHTTPServer(PooledServerMixIn, HTTPServer):
+    """HTTP over TCP, served by the bounded worker pool."""
+
+
+class UnixHTTPServer(PooledServerMixIn, socketserver.UnixStreamServer):
+    """HTTP over a Unix domain socket: same handler, no TCP port to allocate."""
+
+    def server_bind(self) -> None:
+        _remove_stale_socket(self.server_address)
+        super().server_bind()
+        os.chmod(self.server_address, 0o600)
+        self.server_name = "localhost"
+        self.server_port = 0
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Unlink a socket file left by a dead bridge; refuse to steal a live one."""
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise OSError(f"{path} exists and is not a socket")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+    raise OSError(f"another bridge is listening on {path}")
+
+
+class _UnixHandler(_Handler):
+    def address_string(self) -> str:
+        return "unix"
+
+    def _connection_id(self) -> str:
+        return f"unix:{id(self.connection):x}"
+
+
 class BridgeServer:
-    def __init__(self, host: str = "127.0.0.1", port: int = 9876) -> None:
-        self.address = (host, port)
-        self._server = ThreadingHTTPServer(self.address, _Handler)
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 9876,
+        unix_socket: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        retry_after: Optional[int] = None,
+    ) -> None:
+        self.unix_socket = unix_socket
+        limits = {
+            "pool_size": pool_size,
+            "queue_size": queue_size,
+            "max_connections": max_connections,
+            "idle_timeout": idle_timeout,
+            "retry_after": retry_after,
+        }
+        if unix_socket:
+            self.address = unix_socket
+            self._server = UnixHTTPServer(unix_socket, _UnixHandler, **limits)
+        else:
+            self.address = (host, port)
+            self._server = PooledHTTPServer(self.address, _Handler, **limits)
         self._thread: Optional[threading.Thread] = None
 
+    @property
+    def url(self) -> str:
+        if self.unix_socket:
+            return f"unix://{self.unix_socket}"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
             return
@@ -275,25 +890,186 @@ class BridgeServer:
     def stop(self) -> None:
         try:
             self._server.shutdown()
+            self._server.server_close()
         except Exception:
             pass
         if self._thread is not None:
             self._thread.join(timeout=1)
-
-
-def launch_server(host: str = "127.0.0.1", port: int = 9876) -> BridgeServer:
-    server = BridgeServer(host=host, port=port)
+        if self.unix_socket:
+            try:
+                os.unlink(self.unix_socket)
+            except OSError:
+                pass
+
+
+def launch_server(
+    host: str = "127.0.0.1",
+    port: int = 9876,
+    gc_delete_threshold: Optional[int] = None,
+    gc_datablock_threshold: Optional[int] = None,
+    gc_idle_seconds: Optional[float] = None,
+    shm_min_bytes: Optional[int] = None,
+    shm_enabled: Optional[bool] = None,
+    unix_socket: Optional[str] = None,
+    max_body_bytes: Optional[int] = None,
+    max_frame_bytes: Optional[int] = None,
+    route_body_limits: Optional[Dict[str, int]] = None,
+    method_body_limits: Optional[Dict[str, int]] = None,
+    timeout_seconds: Optional[float] = None,
+    method_timeouts: Optional[Dict[str, float]] = None,
+    pool_size: Optional[int] = None,
+    queue_size: Optional[int] = None,
+    max_connections: Optional[int] = None,
+    idle_timeout: Optional[float] = None,
+    retry_after: Optional[int] = None,
+    class_weights: Optional[Dict[str, float]] = None,
+    client_weights: Optional[Dict[str, float]] = None,
+    fair_scheduling: Optional[bool] = None,
+    coalesce_transforms: Optional[bool] = None,
+) -> BridgeServer:
+    global TIMEOUT_SECONDS
+    if timeout_seconds is not None:
+        TIMEOUT_SECONDS = float(timeout_seconds)
+    METHOD_TIMEOUTS.update(method_timeouts or {})
+    SCHEDULER.configure(class_weights=class_weights, client_weights=client_weights, enabled=fair_scheduling)
+    COALESCER.configure(enabled=coalesce_transforms)
+    BODY_LIMITS.configure(
+        json_bytes=max_body_bytes,
+        frame_bytes=max_frame_bytes,
+        routes=route_body_limits,
+        methods=method_body_limits,
+    )
+    ORPHAN_GC.configure(
+        delete_threshold=gc_delete_threshold,
+        datablock_threshold=gc_datablock_threshold,
+        idle_seconds=gc_idle_seconds,
+    )
+    SHM_STORE.configure(min_bytes=shm_min_bytes, enabled=shm_enabled)
+    SHM_STORE.sweep_stale()
+    install_handlers()
+    add_change_listener(EVENTS.on_change)
+    server = BridgeServer(
+        host=host,
+        port=port,
+        unix_socket=unix_socket,
+        pool_size=pool_size,
+        queue_size=queue_size,
+        max_connections=max_connections,
+        idle_timeout=idle_timeout,
+        retry_after=retry_after,
+    )
     server.start()
-    print(f"[MCPBLENDER] Bridge started on http://{host}:{port}", flush=True)
+    print(f"[MCPBLENDER] Bridge started on {server.url}", flush=True)
     return server
 
 
-def main() -> None:  # pragma: no cover - Blender runtime only
-    server = launch_server()
+def parse_args(argv: Optional[list] = None) -> argparse.Namespace:
+    """Bridge options; under Blender they follow `--` (blender --python server.py -- --port 9877)."""
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="mcpblender-bridge")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9876)
+    parser.add_argument("--unix-socket", default=None, help="listen on this Unix domain socket path instead of TCP")
+    parser.add_argument("--max-body-bytes", type=int, default=None, help="default cap for JSON request bodies")
+    parser.add_argument("--max-frame-bytes", type=int, default=None, help="cap for binary frame uploads")
+    parser.add_argument(
+        "--method-body-limit",
+        action="append",
+        default=[],
+        metavar="METHOD=BYTES",
+        help="JSON body cap for one RPC method (repeatable)",
+    )
+    parser.add_argument("--timeout", type=float, default=None, help="default seconds an RPC may take")
+    parser.add_argument(
+        "--method-timeout",
+        action="append",
+        default=[],
+        metavar="METHOD=SECONDS",
+        help="time limit for one RPC method (repeatable)",
+    )
+    parser.add_argument("--pool-size", type=int, default=None, help="worker threads serving requests")
+    parser.add_argument("--queue-size", type=int, default=None, help="requests waiting for a worker before 429")
+    parser.add_argument("--max-connections", type=int, default=None, help="open connections before 503")
+    parser.add_argument("--idle-timeout", type=float, default=None, help="seconds an idle keep-alive connection is kept")
+    parser.add_argument(
+        "--class-weight",
+        action="append",
+        default=[],
+        metavar="CLASS=WEIGHT",
+        help="scheduling weight of a cost class, cheap or expensive (repeatable)",
+    )
+    parser.add_argument(
+        "--client-weight",
+        action="append",
+        default=[],
+        metavar="CLIENT=WEIGHT",
+        help=f"scheduling weight of a client named by {CLIENT_HEADER} (repeatable)",
+    )
+    parser.add_argument("--no-fair-scheduling", action="store_true", help="serve the Blender lock first come, first served")
+    parser.add_argument(
+        "--coalesce-transforms",
+        action="store_true",
+        help="merge queued move_object/transform requests for the same object",
+    )
+    args = parser.parse_args(argv)
+    try:
+        args.method_body_limits = {
+            method: int(limit) for method, limit in (item.split("=", 1) for item in args.method_body_limit)
+        }
+    except ValueError:
+        parser.error("--method-body-limit expects METHOD=BYTES")
+    try:
+        args.method_timeouts = {
+            method: float(limit) for method, limit in (item.split("=", 1) for item in args.method_timeout)
+        }
+    except ValueError:
+        parser.error("--method-timeout expects METHOD=SECONDS")
+    try:
+        args.class_weights = {name: float(weight) for name, weight in (item.split("=", 1) for item in args.class_weight)}
+        args.client_weights = {
+            name: float(weight) for name, weight in (item.split("=", 1) for item in args.client_weight)
+        }
+    except ValueError:
+        parser.error("--class-weight/--client-weight expect NAME=WEIGHT")
+    return args
+
+
+def main(stop: Optional[threading.Event] = None) -> None:
+    """
+    Start the bridge from the command line. Headless (`--background`, or without
+    bpy) there is no event loop to fire bpy.app.timers, so this thread runs job
+    slices and idle purges from MAIN_TIMERS until `stop` is set or Ctrl+C.
+    """
+    args = parse_args()
+    headless = not HAS_BPY or bpy.app.background
+    MAIN_TIMERS.active = headless
+    server = launch_server(
+        host=args.host,
+        port=args.port,
+        unix_socket=args.unix_socket,
+        max_body_bytes=args.max_body_bytes,
+        max_frame_bytes=args.max_frame_bytes,
+        method_body_limits=args.method_body_limits,
+        timeout_seconds=args.timeout,
+        method_timeouts=args.method_timeouts,
+        pool_size=args.pool_size,
+        queue_size=args.queue_size,
+        max_connections=args.max_connections,
+        idle_timeout=args.idle_timeout,
+        class_weights=args.class_weights,
+        client_weights=args.client_weights,
+        fair_scheduling=False if args.no_fair_scheduling else None,
+        coalesce_transforms=args.coalesce_transforms or None,
+    )
+    if not headless:  # pragma: no cover - interactive Blender fires timers from its UI loop
+        return
     try:
-        while True:
-            time.sleep(1)
+        MAIN_TIMERS.run_forever(stop or threading.Event())
     except KeyboardInterrupt:
+        pass
+    finally:
+        MAIN_TIMERS.active = False
         server.stop()
         print("[MCPBLENDER] Bridge stopped", flush=True)
 
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+"""
+Shared-memory side channel for large responses.
+
+When a same-host client opts in (X-MCP-Shm request header), response bodies of at
+least `min_bytes` are written into a POSIX shared-memory segment and only a handle
+{"name", "size", "content_type"} travels over the socket. Ownership passes to the
+client, which unlinks the segment once it has read it. Cleanup rules:
+
+- segments the client never claimed are unlinked after `ttl_seconds` (checked on
+  every put) and when the bridge exits;
+- segment names embed the bridge pid (mcpb_<pid>_<token>), so a restarted bridge
+  sweeps segments left behind by a crashed one.
+"""
+
+import atexit
+import os
+import secrets
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+
+    HAS_SHM = True
+except ImportError:  # pragma: no cover - platforms without _posixshmem
+    resource_tracker = None
+    shared_memory = None
+    HAS_SHM = False
+
+SHM_PREFIX = "mcpb_"
+SHM_HEADER = "X-MCP-Shm"
+SHM_DIR = "/dev/shm"
+DEFAULT_MIN_BYTES = 256 * 1024
+DEFAULT_TTL_SECONDS = 30.0
+
+
+def _create(name: str, size: int):
+    """Create an untracked segment: the store, not multiprocessing, owns its lifetime."""
+    try:
+        return shared_memory.SharedMemory(name=name, create=True, size=size, track=False)
+    except TypeError:  # Python < 3.13 has no track flag
+        segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+        resource_tracker.unregister(segment._name, "shared_memory")
+        return segment
+
+
+def _unlink(name: str) -> bool:
+    try:
+        segment = shared_memory.SharedMemory(name=name, create=False)
+    except FileNotFoundError:
+        return False
+    try:
+        segment.close()
+        segment.unlink()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SharedPayloadStore:
+    """Hands large payloads to same-host clients through shared memory."""
+
+    def __init__(
+        self,
+        min_bytes: int = DEFAULT_MIN_BYTES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.min_bytes = min_bytes
+        self.ttl_seconds = ttl_seconds
+        self.enabled = HAS_SHM
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending: Dict[str, float] = {}
+        self.segments_created = 0
+        self.segments_reaped = 0
+        self.bytes_shared = 0
+
+    def configure(self, **settings: Any) -> None:
+        for key in ("min_bytes", "ttl_seconds", "enabled"):
+            if key in settings and settings[key] is not None:
+                setattr(self, key, settings[key])
+        self.enabled = self.enabled and HAS_SHM
+
+    def accepts(self, size: int) -> bool:
+        return self.enabled and size >= self.min_bytes
+
+    def put(self, body: bytes, content_type: str) -> Dict[str, Any]:
+        """Copy body into a fresh segment and return the handle for the envelope."""
+        self.reap()
+        name = f"{SHM_PREFIX}{os.getpid()}_{secrets.token_hex(8)}"
+        segment = _create(name, max(len(body), 1))
+        try:
+            segment.buf[: len(body)] = body
+        finally:
+            segment.close()
+        with self._lock:
+            self._pending[name] = self._clock() + self.ttl_seconds
+            self.segments_created += 1
+            self.bytes_shared += len(body)
+        return {"name": name, "size": len(body), "content_type": content_type}
+
+    def reap(self, everything: bool = False) -> int:
+        """Unlink segments past their TTL (all of them with everything=True)."""
+        now = self._clock()
+        with self._lock:
+            expired = [name for name, deadline in self._pending.items() if everything or deadline <= now]
+            for name in expired:
+                del self._pending[name]
+        reaped = sum(1 for name in expired if _unlink(name))
+        self.segments_reaped += reaped
+        return reaped
+
+    def sweep_stale(self, directory: str = SHM_DIR) -> int:
+        """Unlink segments whose creating bridge process no longer exists."""
+        if not self.enabled or not os.path.isdir(directory):
+            return 0
+        removed = 0
+        for entry in os.listdir(directory):
+            if not entry.startswith(SHM_PREFIX):
+                continue
+            pid_text = entry[len(SHM_PREFIX) :].split("_", 1)[0]
+            if not pid_text.isdigit() or _pid_alive(int(pid_text)):
+                continue
+            try:
+                os.unlink(os.path.join(directory, entry))
+                removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "min_bytes": self.min_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "pending": len(self._pending),
+            "created": self.segments_created,
+            "reaped": self.segments_reaped,
+            "bytes": self.bytes_shared,
+        }
+
+
+def client_accepts_shm(header_value: Optional[str]) -> bool:
+    return str(header_value or "").strip().lower() in ("1", "true", "yes")
+
+
+SHM_STORE = SharedPayloadStore()
+atexit.register(lambda: SHM_STORE.reap(everything=True) if HAS_SHM else None)
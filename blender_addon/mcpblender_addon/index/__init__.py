@@ -0,0 +1,47 @@
+from .cursor import StaleCursorError, decode_cursor, encode_cursor
+from .name_index import NameIndex
+from .revision import RevisionTracker
+from .scene_index import (
+    NAME_INDEX,
+    REVISIONS,
+    SPATIAL_INDEX,
+    add_change_listener,
+    data_key,
+    ensure_name_index,
+    ensure_spatial_index,
+    install_handlers,
+    object_key,
+    remove_change_listener,
+    resolve_indexed,
+    track_added,
+    track_changed,
+    track_moved,
+    track_removed,
+    uninstall_handlers,
+)
+from .spatial_index import SpatialGrid
+
+__all__ = [
+    "NAME_INDEX",
+    "NameIndex",
+    "REVISIONS",
+    "RevisionTracker",
+    "SPATIAL_INDEX",
+    "SpatialGrid",
+    "StaleCursorError",
+    "add_change_listener",
+    "data_key",
+    "decode_cursor",
+    "encode_cursor",
+    "ensure_name_index",
+    "ensure_spatial_index",
+    "install_handlers",
+    "object_key",
+    "remove_change_listener",
+    "resolve_indexed",
+    "track_added",
+    "track_changed",
+    "track_moved",
+    "track_removed",
+    "uninstall_handlers",
+]
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+"""Opaque pagination cursors: url-safe base64 of a small JSON object."""
+
+import base64
+import json
+from typing import Any, Dict
+
+
+class StaleCursorError(ValueError):
+    """The data a cursor paginates over changed since the cursor was issued."""
+
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    raw = json.dumps(state, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception as exc:
+        raise ValueError("invalid cursor") from exc
+    if not isinstance(state, dict):
+        raise ValueError("invalid cursor")
+    return state
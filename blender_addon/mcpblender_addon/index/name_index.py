@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+"""
+Incremental object-name index for scenegraph.search.
+
+Keys are stable object handles (as_pointer strings), so renames update in place.
+Substring queries of three or more characters intersect trigram posting sets; shorter
+queries scan the cached lowercase names, never touching bpy. Matches are yielded in
+(lowercase name, key) order so callers can paginate with a simple "after" position.
+A bounded log of the positions touched by adds, removes and renames lets a cursor
+check whether anything it has already walked past changed, instead of failing on
+any edit to the scene.
+"""
+
+import bisect
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+GRAM = 3
+CHANGE_LOG_SIZE = 4096
+
+Position = Tuple[str, str]
+
+
+def _grams(lower: str) -> Set[str]:
+    if len(lower) < GRAM:
+        return set()
+    return {lower[i : i + GRAM] for i in range(len(lower) - GRAM + 1)}
+
+
+class NameIndex:
+    def __init__(self) -> None:
+        self._names: Dict[str, str] = {}
+        self._types: Dict[str, str] = {}
+        self._sorted: List[Position] = []
+        self._postings: Dict[str, Set[str]] = {}
+        self.revision = 0
+        self.stale = True
+        self._changes: Deque[Tuple[int, Position]] = deque()
+        # Revisions at or below this one are no longer fully covered by _changes.
+        self._log_floor = 0
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._names
+
+    def name_of(self, key: str) -> Optional[str]:
+        return self._names.get(key)
+
+    def type_of(self, key: str) -> Optional[str]:
+        return self._types.get(key)
+
+    def clear(self) -> None:
+        self._names.clear()
+        self._types.clear()
+        self._sorted.clear()
+        self._postings.clear()
+        self.revision += 1
+        self._changes.clear()
+        self._log_floor = self.revision
+
+    def add(self, key: str, name: str, obj_type: str = "") -> None:
+        """Insert or update an entry; a changed name counts as a rename."""
+        current = self._names.get(key)
+        if current == name:
+            self._types[key] = obj_type or self._types.get(key, "")
+            return
+        self.revision += 1
+        if current is not None:
+            self._unlink(key, current)
+            self._log((current.lower(), key))
+        lower = name.lower()
+        self._names[key] = name
+        self._types[key] = obj_type
+        bisect.insort(self._sorted, (lower, key))
+        for gram in _grams(lower):
+            self._postings.setdefault(gram, set()).add(key)
+        self._log((lower, key))
+
+    def remove(self, key: str) -> None:
+        name = self._names.pop(key, None)
+        if name is None:
+            return
+        self._types.pop(key, None)
+        self._unlink(key, name)
+        self.revision += 1
+        self._log((name.lower(), key))
+
+    def mark(self, keys: Sequence[str]) -> None:
+        """Record a change to these entries' membership (e.g. collection relinks) without renaming them."""
+        positions = [(self._names[key].lower(), key) for key in keys if key in self._names]
+        if positions:
+            self.revision += 1
+            for position in positions:
+                self._log(position)
+
+    def changed_up_to(self, position: Sequence[str], since: int) -> bool:
+        """Whether an entry at or before `position` was added, removed, renamed or marked after revision `since`."""
+        if since < self._log_floor or since > self.revision:
+            return True
+        position = tuple(position)
+        for revision, changed in reversed(self._changes):
+            if revision <= since:
+                break
+            if changed <= position:
+                return True
+        return False
+
+    def _log(self, position: Position) -> None:
+        if len(self._changes) >= CHANGE_LOG_SIZE:
+            self._log_floor = self._changes.popleft()[0]
+        self._changes.append((self.revision, position))
+
+    def _unlink(self, key: str, name: str) -> None:
+        lower = name.lower()
+        pos = bisect.bisect_left(self._sorted, (lower, key))
+        if pos < len(self._sorted) and self._sorted[pos] == (lower, key):
+            del self._sorted[pos]
+        for gram in _grams(lower):
+            keys = self._postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[gram]
+
+    def iter_from(self, after: Optional[Position] = None) -> Iterator[Position]:
+        """Walk every entry in order, starting strictly after `after` (O(log n) seek)."""
+        start = bisect.bisect_right(self._sorted, tuple(after)) if after else 0
+        for i in range(start, len(self._sorted)):
+            yield self._sorted[i]
+
+    def iter_matches(self, query: str = "", mode: str = "substring") -> Iterator[Position]:
+        """Yield (lowercase name, key) positions matching query, in sorted order."""
+        lower = query.lower()
+        if not lower:
+            yield from list(self._sorted)
+            return
+        if mode == "prefix":
+            start = bisect.bisect_left(self._sorted, (lower, ""))
+            for position in self._sorted[start:]:
+                if not position[0].startswith(lower):
+                    break
+                yield position
+            return
+        if mode != "substring":
+            raise ValueError("match must be 'substring' or 'prefix'")
+        if len(lower) < GRAM:
+            yield from [position for position in self._sorted if lower in position[0]]
+            return
+
+        postings = []
+        for gram in _grams(lower):
+            keys = self._postings.get(gram)
+            if not keys:
+                return
+            postings.append(keys)
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        matches = []
+        for key in candidates:
+            name_lower = self._names[key].lower()
+            if lower in name_lower:
+                matches.append((name_lower, key))
+        matches.sort()
+        yield from matches
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+"""
+Scene revision counters.
+
+`revision` moves on any observed change; `structure_revision` only when objects are
+added, removed or relinked between collections. Per-key revisions record the global
+revision at which each object (or datablock) last changed, so caches can validate
+entries without touching bpy. `generation` moves when every key is forgotten at
+once (a file load), so a reused pointer cannot match an entry from the old file.
+"""
+
+from typing import Dict, Iterable
+
+
+class RevisionTracker:
+    def __init__(self) -> None:
+        self.revision = 0
+        self.structure_revision = 0
+        self.generation = 0
+        self._keys: Dict[str, int] = {}
+
+    def bump(self, keys: Iterable[str] = (), structural: bool = False) -> int:
+        self.revision += 1
+        if structural:
+            self.structure_revision += 1
+        for key in keys:
+            self._keys[key] = self.revision
+        return self.revision
+
+    def of(self, key: str) -> int:
+        return self._keys.get(key, 0)
+
+    def forget(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._keys.pop(key, None)
+
+    def reset(self) -> int:
+        self._keys.clear()
+        self.generation += 1
+        return self.bump(structural=True)
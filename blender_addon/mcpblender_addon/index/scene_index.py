@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+"""
+Keeps the in-memory scene indexes in step with bpy.data.
+
+Bridge RPCs report creations and deletions directly; depsgraph_update_post catches
+renames and edits made elsewhere (UI, scripts), and a size mismatch or file load
+forces a full rebuild on the next query. Every observed change is also passed to
+registered change listeners (the bridge's event feed).
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+try:  # pragma: no cover - Blender runtime only
+    import bpy
+
+    HAS_BPY = True
+except ImportError:  # pragma: no cover - Blender runtime only
+    bpy = None
+    HAS_BPY = False
+
+from ..snapshot.light_snapshot import _bbox_world
+from .name_index import NameIndex
+from .revision import RevisionTracker
+from .spatial_index import SpatialGrid, auto_cell_size
+
+NAME_INDEX = NameIndex()
+REVISIONS = RevisionTracker()
+SPATIAL_INDEX = SpatialGrid()
+# Keys whose world bbox must be recomputed before the next spatial query.
+_SPATIAL_DIRTY: Set[str] = set()
+_spatial_stale = True
+
+# listener(kind, key, info): kind is e.g. "object.added"; info carries name/type/etc.
+ChangeListener = Callable[[str, Optional[str], Dict[str, Any]], None]
+_LISTENERS: List[ChangeListener] = []
+
+
+def add_change_listener(listener: ChangeListener) -> None:
+    if listener not in _LISTENERS:
+        _LISTENERS.append(listener)
+
+
+def remove_change_listener(listener: ChangeListener) -> None:
+    if listener in _LISTENERS:
+        _LISTENERS.remove(listener)
+
+
+def _notify(kind: str, key: Optional[str], **info: Any) -> None:
+    for listener in list(_LISTENERS):
+        try:
+            listener(kind, key, info)
+        except Exception:  # pragma: no cover - a broken listener must not break tracking
+            continue
+
+
+def object_key(obj) -> str:
+    return str(obj.as_pointer())
+
+
+def data_key(block) -> str:
+    """Revision key for a non-object datablock (mesh, material, ...)."""
+    return f"data:{block.as_pointer()}"
+
+
+def ensure_name_index() -> NameIndex:
+    objects = bpy.data.objects
+    if NAME_INDEX.stale or len(NAME_INDEX) != len(objects):
+        NAME_INDEX.clear()
+        for obj in objects:
+            NAME_INDEX.add(object_key(obj), obj.name, obj.type)
+        NAME_INDEX.stale = False
+        REVISIONS.bump(structural=True)
+    return NAME_INDEX
+
+
+def resolve_indexed(key: str) -> Optional[Any]:
+    """Map an index key back to its object; a mismatch marks the index stale."""
+    name = NAME_INDEX.name_of(key)
+    obj = bpy.data.objects.get(name) if name is not None else None
+    if obj is None or object_key(obj) != key:
+        NAME_INDEX.stale = True
+        return None
+    return obj
+
+
+def _world_box(obj):
+    bbox = _bbox_world(obj)
+    if bbox is None:
+        point = tuple(obj.matrix_world.translation)
+        return (point, point)
+    return (tuple(bbox["min"]), tuple(bbox["max"]))
+
+
+def ensure_spatial_index() -> SpatialGrid:
+    """Full rebuild when stale, otherwise refresh only the boxes of moved objects."""
+    global _spatial_stale
+    index = ensure_name_index()
+    if _spatial_stale or len(SPATIAL_INDEX) != len(index):
+        boxes = {}
+        for obj in bpy.data.objects:
+            boxes[object_key(obj)] = _world_box(obj)
+        SPATIAL_INDEX.clear(cell_size=auto_cell_size(boxes.values()))
+        for key, box in boxes.items():
+            SPATIAL_INDEX.insert(key, box)
+        _SPATIAL_DIRTY.clear()
+        _spatial_stale = False
+        return SPATIAL_INDEX
+    while _SPATIAL_DIRTY:
+        key = _SPATIAL_DIRTY.pop()
+        obj = resolve_indexed(key) if key in index else None
+        if obj is None:
+            SPATIAL_INDEX.remove(key)
+        else:
+            SPATIAL_INDEX.insert(key, _world_box(obj))
+    return SPATIAL_INDEX
+
+
+def track_added(obj) -> None:
+    key = object_key(obj)
+    NAME_INDEX.add(key, obj.name, obj.type)
+    _SPATIAL_DIRTY.add(key)
+    REVISIONS.bump([key], structural=True)
+    _notify("object.added", key, name=obj.name, type=obj.type)
+
+
+def track_changed(objects: Iterable[Any], kind: str = "object.changed") -> None:
+    """Non-transform edits (materials, names) that invalidate per-object caches."""
+    keys = []
+    for obj in objects:
+        try:
+            key = object_key(obj)
+        except (AttributeError, ReferenceError):
+            continue
+        NAME_INDEX.add(key, obj.name, obj.type)
+        keys.append(key)
+        _notify(kind, key, name=obj.name, type=obj.type)
+    REVISIONS.bump(keys)
+
+
+def track_moved(objects: Iterable[Any]) -> None:
+    global _spatial_stale
+    keys = []
+    for obj in objects:
+        try:
+            keys.append(object_key(obj))
+            # Children follow their parent's world transform.
+            keys.extend(object_key(child) for child in getattr(obj, "children_recursive", ()))
+        except (AttributeError, ReferenceError):
+            _spatial_stale = True
+    _SPATIAL_DIRTY.update(keys)
+    REVISIONS.bump(keys)
+    if _LISTENERS:
+        for key in keys:
+            _notify("object.transformed", key, name=NAME_INDEX.name_of(key), type=NAME_INDEX.type_of(key))
+
+
+def track_removed(keys: Iterable[str]) -> None:
+    keys = list(keys)
+    for key in keys:
+        if _LISTENERS:
+            _notify("object.removed", key, name=NAME_INDEX.name_of(key), type=NAME_INDEX.type_of(key))
+        NAME_INDEX.remove(key)
+        SPATIAL_INDEX.remove(key)
+        _SPATIAL_DIRTY.discard(key)
+    REVISIONS.forget(keys)
+    REVISIONS.bump(structural=True)
+
+
+def _on_depsgraph_update(scene, depsgraph) -> None:  # pragma: no cover - Blender runtime only
+    changed = []
+    structural = False
+    for update in depsgraph.updates:
+        block = getattr(update.id, "original", update.id)
+        if isinstance(block, bpy.types.Object):
+            key = object_key(block)
+            previous = NAME_INDEX.name_of(key)
+            NAME_INDEX.add(key, block.name, block.type)
+            changed.append(key)
+            if previous is None:
+                _notify("object.added", key, name=block.name, type=block.type)
+            elif previous != block.name:
+                _notify("object.renamed", key, name=block.name, type=block.type, previous=previous)
+            if update.is_updated_transform or update.is_updated_geometry:
+                _SPATIAL_DIRTY.add(key)
+            if update.is_updated_transform:
+                _notify("object.transformed", key, name=block.name, type=block.type)
+        elif isinstance(block, bpy.types.Mesh):
+            changed.append(data_key(block))
+        elif isinstance(block, bpy.types.Material):
+            _notify("material.changed", data_key(block), name=block.name)
+        elif isinstance(block, bpy.types.Collection):
+            structural = True
+            # Linking/unlinking changes the members' collection lists.
+            changed.extend(object_key(obj) for obj in block.objects)
+    if changed or structural:
+        REVISIONS.bump(changed, structural=structural)
+    if structural:
+        _notify("scene.structure_changed", None, scene=scene.name)
+
+
+def _on_frame_change(scene, *_args) -> None:  # pragma: no cover - Blender runtime only
+    _notify("frame.changed", None, scene=scene.name, frame=scene.frame_current)
+
+
+def _on_load_post(*_args) -> None:  # pragma: no cover - Blender runtime only
+    global _spatial_stale
+    NAME_INDEX.stale = True
+    _spatial_stale = True
+    REVISIONS.reset()
+    _notify("scene.loaded", None)
+
+
+if HAS_BPY:  # pragma: no cover - Blender runtime only
+    _on_depsgraph_update = bpy.app.handlers.persistent(_on_depsgraph_update)
+    _on_load_post = bpy.app.handlers.persistent(_on_load_post)
+    _on_frame_change = bpy.app.handlers.persistent(_on_frame_change)
+
+
+def install_handlers() -> None:  # pragma: no cover - Blender runtime only
+    if not HAS_BPY:
+        return
+    handlers = bpy.app.handlers
+    if _on_depsgraph_update not in handlers.depsgraph_update_post:
+        handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in handlers.load_post:
+        handlers.load_post.append(_on_load_post)
+    if _on_frame_change not in handlers.frame_change_post:
+        handlers.frame_change_post.append(_on_frame_change)
+
+
+def uninstall_handlers() -> None:  # pragma: no cover - Blender runtime only
+    if not HAS_BPY:
+        return
+    handlers = bpy.app.handlers
+    if _on_depsgraph_update in handlers.depsgraph_update_post:
+        handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in handlers.load_post:
+        handlers.load_post.remove(_on_load_post)
+    if _on_frame_change in handlers.frame_change_post:
+        handlers.frame_change_post.remove(_on_frame_change)
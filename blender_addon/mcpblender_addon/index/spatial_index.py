@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+"""
+Uniform hash grid over world-space bounding boxes.
+
+Each box is registered in every cell it overlaps; boxes spanning more than
+MAX_CELLS_PER_BOX cells are kept in a small "oversized" list checked on every query.
+Region and radius queries only visit overlapping cells; nearest-neighbour search
+walks rings of cells outward and stops once no unvisited cell can beat the current
+k-th distance.
+"""
+
+import heapq
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+Vec3 = Tuple[float, float, float]
+Box = Tuple[Vec3, Vec3]
+Cell = Tuple[int, int, int]
+
+MAX_CELLS_PER_BOX = 512
+DEFAULT_CELL_SIZE = 2.0
+
+
+def box_distance(point: Sequence[float], box: Box) -> float:
+    """Euclidean distance from point to the box (0 when inside)."""
+    lo, hi = box
+    total = 0.0
+    for axis in range(3):
+        p = point[axis]
+        if p < lo[axis]:
+            total += (lo[axis] - p) ** 2
+        elif p > hi[axis]:
+            total += (p - hi[axis]) ** 2
+    return math.sqrt(total)
+
+
+def _overlaps(a: Box, b: Box) -> bool:
+    return all(a[0][i] <= b[1][i] and b[0][i] <= a[1][i] for i in range(3))
+
+
+def _contains(outer: Box, inner: Box) -> bool:
+    return all(outer[0][i] <= inner[0][i] and inner[1][i] <= outer[1][i] for i in range(3))
+
+
+def auto_cell_size(boxes: Iterable[Box]) -> float:
+    """Pick a cell edge close to the median box extent so typical boxes touch few cells."""
+    extents = sorted(max(hi[i] - lo[i] for i in range(3)) for lo, hi in boxes)
+    if not extents:
+        return DEFAULT_CELL_SIZE
+    median = extents[len(extents) // 2]
+    return max(median * 2.0, 1e-3)
+
+
+class SpatialGrid:
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE) -> None:
+        self.cell_size = float(cell_size)
+        self._boxes: Dict[str, Box] = {}
+        self._cells: Dict[Cell, Set[str]] = {}
+        self._box_cells: Dict[str, Tuple[Cell, Cell]] = {}
+        self._oversized: Set[str] = set()
+        self._bounds: Optional[Tuple[Cell, Cell]] = None
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._boxes
+
+    def box_of(self, key: str) -> Optional[Box]:
+        return self._boxes.get(key)
+
+    def clear(self, cell_size: Optional[float] = None) -> None:
+        if cell_size is not None:
+            self.cell_size = float(cell_size)
+        self._boxes.clear()
+        self._cells.clear()
+        self._box_cells.clear()
+        self._oversized.clear()
+        self._bounds = None
+
+    def _cell(self, point: Sequence[float]) -> Cell:
+        size = self.cell_size
+        return (math.floor(point[0] / size), math.floor(point[1] / size), math.floor(point[2] / size))
+
+    def _cell_range(self, box: Box) -> Tuple[Cell, Cell]:
+        return self._cell(box[0]), self._cell(box[1])
+
+    @staticmethod
+    def _range_size(cells: Tuple[Cell, Cell]) -> int:
+        lo, hi = cells
+        return (hi[0] - lo[0] + 1) * (hi[1] - lo[1] + 1) * (hi[2] - lo[2] + 1)
+
+    @staticmethod
+    def _iter_cells(cells: Tuple[Cell, Cell]) -> Iterable[Cell]:
+        lo, hi = cells
+        for x in range(lo[0], hi[0] + 1):
+            for y in range(lo[1], hi[1] + 1):
+                for z in range(lo[2], hi[2] + 1):
+                    yield (x, y, z)
+
+    def insert(self, key: str, box: Box) -> None:
+        box = (tuple(map(float, box[0])), tuple(map(float, box[1])))
+        if self._boxes.get(key) == box:
+            return
+        self.remove(key)
+        self._boxes[key] = box
+        cells = self._cell_range(box)
+        if self._range_size(cells) > MAX_CELLS_PER_BOX:
+            self._oversized.add(key)
+            return
+        self._box_cells[key] = cells
+        for cell in self._iter_cells(cells):
+            self._cells.setdefault(cell, set()).add(key)
+        if self._bounds is None:
+            self._bounds = cells
+        else:
+            lo, hi = self._bounds
+            self._bounds = (
+                tuple(min(lo[i], cells[0][i]) for i in range(3)),
+                tuple(max(hi[i], cells[1][i]) for i in range(3)),
+            )
+
+    def remove(self, key: str) -> None:
+        if self._boxes.pop(key, None) is None:
+            return
+        if key in self._oversized:
+            self._oversized.discard(key)
+            return
+        for cell in self._iter_cells(self._box_cells.pop(key)):
+            keys = self._cells.get(cell)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._cells[cell]
+
+    def query_region(self, lo: Sequence[float], hi: Sequence[float], contained: bool = False) -> List[str]:
+        """Keys whose boxes overlap (or, with contained=True, lie inside) the region."""
+        region: Box = (tuple(map(float, lo)), tuple(map(float, hi)))
+        test = _contains if contained else _overlaps
+        cells = self._cell_range(region)
+        if self._range_size(cells) > max(len(self._cells), 1):
+            candidates: Iterable[str] = self._boxes.keys()
+        else:
+            found: Set[str] = set(self._oversized)
+            for cell in self._iter_cells(cells):
+                keys = self._cells.get(cell)
+                if keys:
+                    found.update(keys)
+            candidates = found
+        return sorted(key for key in candidates if test(region, self._boxes[key]))
+
+    def within_radius(self, point: Sequence[float], radius: float) -> List[Tuple[float, str]]:
+        """(distance, key) pairs for boxes within radius of point, nearest first."""
+        radius = float(radius)
+        lo = tuple(point[i] - radius for i in range(3))
+        hi = tuple(point[i] + radius for i in range(3))
+        hits = []
+        for key in self.query_region(lo, hi):
+            distance = box_distance(point, self._boxes[key])
+            if distance <= radius:
+                hits.append((distance, key))
+        hits.sort()
+        return hits
+
+    def nearest(self, point: Sequence[float], k: int = 1, max_distance: Optional[float] = None) -> List[Tuple[float, str]]:
+        """The k boxes closest to point as (distance, key), nearest first."""
+        if k <= 0 or not self._boxes:
+            return []
+        best: List[Tuple[float, str]] = []  # max-heap via negated distance
+        seen: Set[str] = set()
+
+        def consider(key: str) -> None:
+            if key in seen:
+                return
+            seen.add(key)
+            distance = box_distance(point, self._boxes[key])
+            if max_distance is not None and distance > max_distance:
+                return
+            if len(best) < k:
+                heapq.heappush(best, (-distance, key))
+            elif distance < -best[0][0]:
+                heapq.heapreplace(best, (-distance, key))
+
+        for key in self._oversized:
+            consider(key)
+
+        if self._bounds is not None:
+            center = self._cell(point)
+            lo, hi = self._bounds
+            # Rings closer than the occupied bounds are empty; rings past them too.
+            first_ring = max(0, max(max(lo[i] - center[i], center[i] - hi[i]) for i in range(3)))
+            last_ring = max(max(abs(center[i] - lo[i]), abs(center[i] - hi[i])) for i in range(3))
+            for ring in range(first_ring, last_ring + 1):
+                # Cells on ring r are at least (r - 1) cell edges away from point.
+                floor = (ring - 1) * self.cell_size
+                if len(best) == k and floor > -best[0][0]:
+                    break
+                if max_distance is not None and floor > max_distance:
+                    break
+                if self._ring_size(ring) > len(self._cells):
+                    # Sparse grid: visiting empty cells would cost more than a scan.
+                    for key in self._boxes:
+                        consider(key)
+                    break
+                for cell in self._ring(center, ring):
+                    keys = self._cells.get(cell)
+                    if keys:
+                        for key in keys:
+                            consider(key)
+
+        return sorted((-neg, key) for neg, key in best)
+
+    @staticmethod
+    def _ring_size(ring: int) -> int:
+        return 1 if ring == 0 else (2 * ring + 1) ** 3 - (2 * ring - 1) ** 3
+
+    @staticmethod
+    def _ring(center: Cell, ring: int) -> Iterable[Cell]:
+        if ring == 0:
+            yield center
+            return
+        cx, cy, cz = center
+        for x in range(cx - ring, cx + ring + 1):
+            for y in range(cy - ring, cy + ring + 1):
+                edge = abs(x - cx) == ring or abs(y - cy) == ring
+                if edge:
+                    for z in range(cz - ring, cz + ring + 1):
+                        yield (x, y, z)
+                else:
+                    yield (x, y, cz - ring)
+                    yield (x, y, cz + ring)
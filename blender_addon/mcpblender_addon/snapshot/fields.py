@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+"""
+Field projection for object payloads.
+
+Each payload field has one extractor registered at import time. Callers ask for a
+subset via `fields`; the resolved extractor plan is cached per field set, so
+unrequested fields cost nothing and repeated requests skip validation.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+Extractor = Callable[[Any], Any]
+Plan = Tuple[Tuple[str, Extractor, bool], ...]
+
+# Always emitted so projected rows stay addressable.
+ALWAYS_FIELDS = ("id",)
+
+
+def parse_fields(value: Union[None, str, Iterable[str]]) -> Optional[Tuple[str, ...]]:
+    """Accept a list of names or a comma-separated string; None/empty means all fields."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        names = [part.strip() for part in value.split(",")]
+    else:
+        names = [str(part).strip() for part in value]
+    names = [name for name in names if name]
+    return tuple(names) or None
+
+
+class FieldRegistry:
+    def __init__(self) -> None:
+        self._extractors: Dict[str, Tuple[Extractor, bool]] = {}
+        self._plans: Dict[Optional[Tuple[str, ...]], Plan] = {}
+
+    def field(self, name: str, optional: bool = False) -> Callable[[Extractor], Extractor]:
+        """Register an extractor; optional fields are omitted when they return None."""
+
+        def decorator(fn: Extractor) -> Extractor:
+            self._extractors[name] = (fn, optional)
+            self._plans.clear()
+            return fn
+
+        return decorator
+
+    def names(self) -> List[str]:
+        return list(self._extractors)
+
+    def copy(self) -> "FieldRegistry":
+        """A registry starting with these extractors; fields added to it stay local."""
+        clone = FieldRegistry()
+        clone._extractors = dict(self._extractors)
+        return clone
+
+    def plan(self, fields: Union[None, str, Iterable[str]] = None) -> Plan:
+        wanted = parse_fields(fields)
+        key = None if wanted is None else tuple(sorted(set(wanted)))
+        cached = self._plans.get(key)
+        if cached is not None:
+            return cached
+        if key is None:
+            names = list(self._extractors)
+        else:
+            unknown = [name for name in key if name not in self._extractors]
+            if unknown:
+                raise ValueError(f"unknown fields: {unknown}; available: {self.names()}")
+            # Keep registration order so projected payloads look like full ones.
+            requested = set(key) | set(ALWAYS_FIELDS)
+            names = [name for name in self._extractors if name in requested]
+        plan = tuple((name, *self._extractors[name]) for name in names)
+        self._plans[key] = plan
+        return plan
+
+    @staticmethod
+    def extract(obj: Any, plan: Plan) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {}
+        for name, extractor, optional in plan:
+            value = extractor(obj)
+            if optional and value is None:
+                continue
+            payload[name] = value
+        return payload
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+"""
+Pre-encoded JSON fragments for object payloads.
+
+scene.snapshot keeps each object's payload as compact JSON bytes keyed by object
+key and field plan, validated by the object's revision (bumped on transforms,
+renames, material and collection changes). Unchanged objects are neither
+re-extracted nor re-encoded: the page is an EncodedObjects sequence and
+encode_json() splices the cached bytes straight into the response body.
+"""
+
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union, overload
+
+DEFAULT_FRAGMENT_CACHE_BYTES = 32 * 1024 * 1024
+
+
+def encode_fragment(payload: Dict[str, Any]) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+class EncodedObjects(Sequence[Dict[str, Any]]):
+    """
+    A JSON array held as encoded element fragments. In-process callers can index and
+    iterate it like a list of dicts (decoded on access); encode_json() emits the
+    fragments without decoding them.
+    """
+
+    __slots__ = ("fragments",)
+
+    def __init__(self, fragments: Optional[List[bytes]] = None) -> None:
+        self.fragments: List[bytes] = fragments if fragments is not None else []
+
+    def append(self, fragment: bytes) -> None:
+        self.fragments.append(fragment)
+
+    def __len__(self) -> int:
+        return len(self.fragments)
+
+    @overload
+    def __getitem__(self, index: int) -> Dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Dict[str, Any]]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [json.loads(fragment) for fragment in self.fragments[index]]
+        return json.loads(self.fragments[index])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (json.loads(fragment) for fragment in self.fragments)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, EncodedObjects):
+            return self.fragments == other.fragments
+        return isinstance(other, list) and list(self) == other
+
+    def to_json(self) -> bytes:
+        return b"[" + b",".join(self.fragments) + b"]"
+
+
+def encode_json(payload: Any) -> bytes:
+    """json.dumps(...).encode() that writes EncodedObjects from their cached bytes."""
+    spliced: List[bytes] = []
+    nonce = os.urandom(4).hex()  # placeholders cannot collide with payload strings
+
+    def default(value: Any) -> Any:
+        if isinstance(value, EncodedObjects):
+            spliced.append(value.to_json())
+            return f"\x00{nonce}:{len(spliced) - 1}\x00"
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    body = json.dumps(payload, default=default).encode("utf-8")
+    for i, raw in enumerate(spliced):
+        body = body.replace(f'"\\u0000{nonce}:{i}\\u0000"'.encode("ascii"), raw, 1)
+    return body
+
+
+class FragmentCache:
+    """LRU of encoded object payloads, bounded by total bytes and validated by revision."""
+
+    def __init__(self, max_bytes: int = DEFAULT_FRAGMENT_CACHE_BYTES) -> None:
+        self.max_bytes = int(max_bytes)
+        self._entries: "OrderedDict[Tuple[Any, ...], Tuple[Tuple[Any, ...], bytes]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Tuple[Any, ...], validator: Tuple[Any, ...]) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != validator:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Tuple[Any, ...], validator: Tuple[Any, ...], fragment: bytes) -> None:
+        self._drop(key)
+        if len(fragment) > self.max_bytes:
+            return
+        self._entries[key] = (validator, fragment)
+        self._bytes += len(fragment)
+        while self._bytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "fragments": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def _drop(self, key: Tuple[Any, ...]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+
+FRAGMENT_CACHE = FragmentCache()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+"""
+Snapshot levels of detail and the cost model behind `budget_ms`.
+
+  summary  per-type and per-collection counts plus overall world bounds
+  light    SNAPSHOT_SPEC v1.0 object payloads
+  full     light plus per-object detail (dimensions, modifiers, vertex counts, ...)
+
+SnapshotCostModel keeps a moving average of the observed per-object cost of each
+level, seeded with conservative defaults, so the bridge can tell before capturing
+whether a page fits the caller's budget and pick a cheaper level if it does not.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+from .fields import FieldRegistry, Plan
+from .light_snapshot import OBJECT_FIELDS, _round_vec, _safe_call
+
+# Cheapest first; stepping down moves left.
+LEVELS = ("summary", "light", "full")
+DEFAULT_MIN_LEVEL = "light"
+
+# Milliseconds per object before any capture has been observed.
+DEFAULT_COST_MS = {"summary": 0.02, "compact": 0.03, "light": 0.08, "full": 0.25}
+COST_SMOOTHING = 0.3
+
+FULL_OBJECT_FIELDS = OBJECT_FIELDS.copy()
+_field = FULL_OBJECT_FIELDS.field
+
+
+@_field("dimensions")
+def _field_dimensions(obj) -> List[float]:
+    return _safe_call(lambda: _round_vec(obj.dimensions), [0.0, 0.0, 0.0])
+
+
+@_field("data_name", optional=True)
+def _field_data_name(obj) -> Optional[str]:
+    return _safe_call(lambda: obj.data.name if obj.data is not None else None, None)
+
+
+@_field("modifiers")
+def _field_modifiers(obj) -> List[Dict[str, str]]:
+    return _safe_call(lambda: [{"name": m.name, "type": m.type} for m in obj.modifiers], [])
+
+
+@_field("vertex_count", optional=True)
+def _field_vertex_count(obj) -> Optional[int]:
+    if obj.type != "MESH":
+        return None
+    return _safe_call(lambda: len(obj.data.vertices), None)
+
+
+@_field("hide_render")
+def _field_hide_render(obj) -> bool:
+    return bool(_safe_call(lambda: obj.hide_render, False))
+
+
+@_field("custom_properties")
+def _field_custom_properties(obj) -> List[str]:
+    return _safe_call(lambda: sorted(key for key in obj.keys() if not key.startswith("_")), [])
+
+
+_REGISTRIES = {"light": OBJECT_FIELDS, "full": FULL_OBJECT_FIELDS}
+
+
+def parse_level(value: Any, name: str = "level") -> str:
+    level = str(value).lower()
+    if level not in LEVELS:
+        raise ValueError(f"{name} must be one of {list(LEVELS)}")
+    return level
+
+
+def level_plan(level: str, fields: Any = None) -> Plan:
+    """Field plan of an object level; `fields` projects it like any other plan."""
+    return _REGISTRIES[level].plan(fields)
+
+
+class SnapshotSummary:
+    """Accumulates the summary level one object at a time."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.types: Dict[str, int] = {}
+        self.collections: Dict[str, int] = {}
+        self._lo: Optional[List[float]] = None
+        self._hi: Optional[List[float]] = None
+
+    def add(self, obj_type: str, collections: Sequence[str], bbox: Optional[Dict[str, List[float]]]) -> None:
+        self.count += 1
+        self.types[obj_type] = self.types.get(obj_type, 0) + 1
+        for name in collections:
+            self.collections[name] = self.collections.get(name, 0) + 1
+        if bbox is None:
+            return
+        if self._lo is None or self._hi is None:
+            self._lo, self._hi = list(bbox["min"]), list(bbox["max"])
+            return
+        self._lo = [min(a, b) for a, b in zip(self._lo, bbox["min"])]
+        self._hi = [max(a, b) for a, b in zip(self._hi, bbox["max"])]
+
+    def payload(self) -> Dict[str, Any]:
+        return {
+            "counted": self.count,
+            "types": dict(sorted(self.types.items())),
+            "collections": dict(sorted(self.collections.items())),
+            "bounds": None if self._lo is None else {"min": self._lo, "max": self._hi},
+        }
+
+
+class SnapshotCostModel:
+    """Per-object cost of each level (ms), an exponential moving average of observed captures."""
+
+    def __init__(self, seeds: Optional[Dict[str, float]] = None, smoothing: float = COST_SMOOTHING) -> None:
+        self.smoothing = float(smoothing)
+        self._per_object = dict(DEFAULT_COST_MS if seeds is None else seeds)
+        self._samples = {level: 0 for level in self._per_object}
+        self._lock = threading.Lock()
+
+    def per_object_ms(self, level: str) -> float:
+        return self._per_object[level]
+
+    def estimate_ms(self, level: str, count: int) -> float:
+        return self._per_object[level] * max(0, count)
+
+    def observe(self, level: str, count: int, elapsed_ms: float) -> None:
+        if count <= 0:
+            return
+        sample = elapsed_ms / count
+        with self._lock:
+            seen = self._samples.get(level, 0)
+            current = self._per_object.get(level, sample)
+            # The first observation replaces the seed outright.
+            self._per_object[level] = sample if seen == 0 else current + self.smoothing * (sample - current)
+            self._samples[level] = seen + 1
+
+    def choose(self, level: str, min_level: str, count: int, budget_ms: float) -> str:
+        """`level` if its estimate fits the budget, else the richest cheaper level that does (not below `min_level`)."""
+        floor = LEVELS.index(min_level)
+        candidate = LEVELS.index(level)
+        while candidate > floor and self.estimate_ms(LEVELS[candidate], count) > budget_ms:
+            candidate -= 1
+        return LEVELS[candidate]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            level: {"per_object_ms": round(cost, 5), "samples": self._samples.get(level, 0)}
+            for level, cost in self._per_object.items()
+        }
+
+
+SNAPSHOT_COSTS = SnapshotCostModel()
@@ -11,6 +11,8 @@ import sys
 import time
 from typing import Any, Dict, List, Optional, Tuple
 
+from .fields import FieldRegistry, Plan
+
 SNAPSHOT_SCHEMA_VERSION = "1.0"
 
 try:  # pragma: no cover - Blender runtime only
@@ -52,30 +54,74 @@ def _bbox_world(obj) -> Optional[Dict[str, List[float]]]:  # pragma: no cover -
         return None
 
 
-def _object_payload(obj) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
-    obj_id = _safe_call(lambda: str(obj.as_pointer()), obj.name)
-    collections = _safe_call(lambda: [c.name for c in obj.users_collection], [])
-    visible = _safe_call(lambda: obj.visible_get(), True)
-    materials = _safe_call(lambda: [m.name for m in obj.material_slots if m.material], [])
-    bbox = _bbox_world(obj)
-    polycount = None
-    if obj.type == "MESH":
-        polycount = _safe_call(lambda: len(obj.data.polygons), None)
+OBJECT_FIELDS = FieldRegistry()
+_field = OBJECT_FIELDS.field
 
-    return {
-        "id": obj_id,
-        "name": obj.name,
-        "type": obj.type,
-        "location": _round_vec(obj.location),
-        "rotation_euler": _round_vec(obj.rotation_euler),
-        "scale": _round_vec(obj.scale),
-        "bbox_world": bbox,
-        "parent_id": _safe_call(lambda: str(obj.parent.as_pointer()) if obj.parent else None, None),
-        "collections": collections,
-        "visible": bool(visible),
-        "material_names": materials,
-        **({"polycount": polycount} if polycount is not None else {}),
-    }
+
+@_field("id")
+def _field_id(obj) -> str:
+    return _safe_call(lambda: str(obj.as_pointer()), obj.name)
+
+
+@_field("name")
+def _field_name(obj) -> str:
+    return obj.name
+
+
+@_field("type")
+def _field_type(obj) -> str:
+    return obj.type
+
+
+@_field("location")
+def _field_location(obj) -> List[float]:
+    return _round_vec(obj.location)
+
+
+@_field("rotation_euler")
+def _field_rotation(obj) -> List[float]:
+    return _round_vec(obj.rotation_euler)
+
+
+@_field("scale")
+def _field_scale(obj) -> List[float]:
+    return _round_vec(obj.scale)
+
+
+@_field("bbox_world")
+def _field_bbox(obj) -> Optional[Dict[str, List[float]]]:
+    return _bbox_world(obj)
+
+
+@_field("parent_id")
+def _field_parent(obj) -> Optional[str]:
+    return _safe_call(lambda: str(obj.parent.as_pointer()) if obj.parent else None, None)
+
+
+@_field("collections")
+def _field_collections(obj) -> List[str]:
+    return _safe_call(lambda: [c.name for c in obj.users_collection], [])
+
+
+@_field("visible")
+def _field_visible(obj) -> bool:
+    return bool(_safe_call(lambda: obj.visible_get(), True))
+
+
+@_field("material_names")
+def _field_materials(obj) -> List[str]:
+    return _safe_call(lambda: [m.name for m in obj.material_slots if m.material], [])
+
+
+@_field("polycount", optional=True)
+def _field_polycount(obj) -> Optional[int]:
+    if obj.type != "MESH":
+        return None
+    return _safe_call(lambda: len(obj.data.polygons), None)
+
+
+def _object_payload(obj, plan: Optional[Plan] = None) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
+    return FieldRegistry.extract(obj, plan if plan is not None else OBJECT_FIELDS.plan())
 
 
 def _scene_payload(scene) -> Dict[str, Any]:  # pragma: no cover - Blender runtime only
@@ -101,11 +147,14 @@ def _camera_payload(scene) -> Optional[Dict[str, Any]]:  # pragma: no cover - Bl
     }
 
 
-def make_light_snapshot() -> Dict[str, Any]:
+def make_light_snapshot(fields: Any = None) -> Dict[str, Any]:
     """
-    Build a canonical light snapshot. Never raises; errors are swallowed and replaced
-    with safe defaults to keep the contract stable.
+    Build a canonical light snapshot. `fields` projects object payloads (all
+    SNAPSHOT_SPEC fields by default). The only error raised is ValueError for
+    unknown field names, checked before the scene is read; errors while reading the
+    scene are swallowed and replaced with safe defaults to keep the contract stable.
     """
+    plan = OBJECT_FIELDS.plan(fields)
     if not HAS_BPY:  # pragma: no cover - defensive for non-Blender envs
         return {
             "schema_version": SNAPSHOT_SCHEMA_VERSION,
@@ -128,7 +177,7 @@ def make_light_snapshot() -> Dict[str, Any]:
         collection_names = []
     collections = sorted({name for name in collection_names})
 
-    object_payloads = [_safe_call(lambda obj=obj: _object_payload(obj), {}) for obj in objects]
+    object_payloads = [_safe_call(lambda obj=obj: _object_payload(obj, plan), {}) for obj in objects]
 
     snapshot = {
         "schema_version": SNAPSHOT_SCHEMA_VERSION,
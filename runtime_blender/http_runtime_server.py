@@ -1,22 +1,45 @@
 # D:\MCPBLENDER\runtime_blender\http_runtime_server.py
 # stdlib-only runtime HTTP server running INSIDE Blender (bpy available)
+#
+# Serving layer: one selectors event loop (background thread) owns every socket,
+# parses HTTP/1.1 requests incrementally, keeps connections alive and accepts
+# pipelined requests; Blender work is handed to a main-thread queue and answers go
+# back to the loop, which writes them in request order. A slow client therefore
+# only stalls its own connection.
 
 from __future__ import annotations
 
 import argparse
 import json
+import queue
+import selectors
+import socket
 import sys
 import threading
 import time
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Any, Dict, Tuple
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+try:
+    from runtime_blender import modeling_api
+except ImportError:  # run as a script: blender --python runtime_blender/http_runtime_server.py
+    import modeling_api  # type: ignore
+
+
+def _addon_template_cache() -> Any:
+    """The add-on's primitive template cache when blender_addon is on PYTHONPATH, else None."""
+    try:
+        from mcpblender_addon.actions.mesh_templates import TEMPLATE_CACHE
+    except ImportError:
+        return None
+    return TEMPLATE_CACHE
 
 # ---- Envelope v1 helpers (align with MVP error schema idea "ok/result" + "ok/error") ----
 
-def ok(result: Any) -> Dict[str, Any]:
+def make_success(result: Any) -> Dict[str, Any]:
     return {"ok": True, "result": result}
 
-def err(code: str, message: str, details: Any = None, hint: str | None = None, retryable: bool = False) -> Dict[str, Any]:
+def make_error(code: str, message: str, details: Any = None, hint: str | None = None, retryable: bool = False) -> Dict[str, Any]:
     return {
         "ok": False,
         "error": {
@@ -28,6 +51,9 @@ def err(code: str, message: str, details: Any = None, hint: str | None = None, r
         },
     }
 
+ok = make_success
+err = make_error
+
 def _json_bytes(payload: Dict[str, Any]) -> bytes:
     return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
@@ -52,37 +78,401 @@ def scene_objects() -> Dict[str, Any]:
     except Exception as e:
         return err("scene_error", "failed to list scene objects", details=str(e), retryable=False)
 
-# ---- HTTP Handler ----
+def health() -> Dict[str, Any]:
+    return ok({"name": "mcpblender-runtime", "status": "ok"})
+
+def _pick(params: Dict[str, Any], *names: str) -> Dict[str, Any]:
+    return {name: params[name] for name in names if name in params}
+
+def _transform(params: Dict[str, Any]) -> Dict[str, Any]:
+    modeling_api.transform_object(**_pick(params, "name", "location", "rotation_euler", "scale", "delta"))
+    return {"name": params.get("name")}
+
+# ---- Routes ----
+
+ROUTES: Dict[str, Callable[[], Dict[str, Any]]] = {
+    "/health": health,
+    "/runtime/probe": runtime_probe,
+    "/scene/objects": scene_objects,
+}
+
+POST_ROUTES: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "/scene/reset": lambda p: {"removed": modeling_api.reset_scene(**_pick(p, "purge_orphans"))},
+    "/mesh/add_cube": lambda p: modeling_api.add_cube(**_pick(p, "name", "size", "location")),
+    "/mesh/add_plane": lambda p: modeling_api.add_plane(**_pick(p, "name", "size", "location")),
+    "/mesh/add_cylinder": lambda p: modeling_api.add_cylinder(**_pick(p, "name", "radius", "depth", "vertices", "location")),
+    "/object/transform": _transform,
+}
+
+# Answered on the event loop thread: they never touch bpy.
+INLINE_ROUTES = frozenset({"/health"})
+
+def handle_get_request(path: str) -> Tuple[int, Dict[str, Any]]:
+    handler = ROUTES.get(path.split("?", 1)[0])
+    if handler is None:
+        return 404, err("not_found", f"Unknown route: {path}", retryable=False)
+    return 200, handler()
+
+def handle_post_request(path: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+    handler = POST_ROUTES.get(path.split("?", 1)[0])
+    if handler is None:
+        return 404, err("not_found", f"Unknown route: {path}", retryable=False)
+    if not body or not body.strip():
+        return 400, err("invalid_payload", "request body must be a JSON object", hint="send {} for defaults")
+    try:
+        params = json.loads(body.decode("utf-8"))
+    except (UnicodeDecodeError, ValueError) as e:
+        return 400, err("invalid_json", "request body is not valid JSON", details=str(e))
+    if not isinstance(params, dict):
+        return 400, err("invalid_payload", "request body must be a JSON object")
+    try:
+        return 200, ok(handler(params))
+    except LookupError as e:
+        return 404, err("not_found", str(e))
+    except (TypeError, ValueError) as e:
+        return 400, err("invalid_params", str(e))
+    except RuntimeError as e:
+        return 503, err("runtime_error", str(e), retryable=True)
+    except Exception as e:
+        return 500, err("internal_error", str(e))
+
+# ---- Main-thread queue ----
+# bpy is only safe on Blender's main thread. The loop submits work here; the main
+# thread drains it (run_forever in --background mode, a bpy.app.timers callback
+# in an interactive session).
+
+class MainThreadQueue:
+    def __init__(self) -> None:
+        self._items: "queue.SimpleQueue[Tuple[Callable[[], Any], Callable[[Any], None]]]" = queue.SimpleQueue()
+
+    def submit(self, work: Callable[[], Any], done: Callable[[Any], None]) -> None:
+        self._items.put((work, done))
+
+    def _run(self, work: Callable[[], Any], done: Callable[[Any], None]) -> None:
+        try:
+            result = work()
+        except Exception as e:  # handlers report their own errors; this is the last resort
+            result = (500, err("internal_error", str(e)))
+        done(result)
+
+    def run_pending(self, budget: float = 0.01) -> int:
+        deadline = time.monotonic() + budget
+        count = 0
+        while time.monotonic() < deadline or count == 0:
+            try:
+                work, done = self._items.get_nowait()
+            except queue.Empty:
+                break
+            self._run(work, done)
+            count += 1
+        return count
+
+    def run_forever(self, stop: threading.Event, poll: float = 0.25) -> None:
+        while not stop.is_set():
+            try:
+                work, done = self._items.get(timeout=poll)
+            except queue.Empty:
+                continue
+            self._run(work, done)
+
+# ---- HTTP/1.1 event loop ----
+
+MAX_HEADER_BYTES = 64 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+MAX_PIPELINE = 32
+IDLE_TIMEOUT = 30.0
+REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+    431: "Request Header Fields Too Large", 500: "Internal Server Error", 501: "Not Implemented", 503: "Service Unavailable",
+}
+
+def render_response(status: int, payload: Dict[str, Any], keep_alive: bool) -> bytes:
+    body = _json_bytes(payload)
+    head = (
+        f"HTTP/1.1 {status} {REASONS.get(status, 'Unknown')}\r\n"
+        "Server: MCPBLENDER-Runtime/1.1\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("ascii") + body
+
+class _Connection:
+    def __init__(self, sock: socket.socket, now: float) -> None:
+        self.sock = sock
+        self.inbuf = bytearray()
+        self.outbuf = bytearray()
+        # One [response bytes or None, keep_alive] slot per request, in arrival order.
+        self.pending: Deque[List[Any]] = deque()
+        self.last_active = now
+        self.closing = False  # no more requests; close once queued responses are sent
+        self.closed = False
+        self.events = 0  # selector interest currently registered
+        self.parsing = False
+
+class EventLoopServer:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        main_queue: MainThreadQueue,
+        idle_timeout: float = IDLE_TIMEOUT,
+        max_pipeline: int = MAX_PIPELINE,
+    ) -> None:
+        self.main_queue = main_queue
+        self.idle_timeout = idle_timeout
+        self.max_pipeline = max_pipeline
+        self._listener = socket.create_server((host, port))
+        self._listener.setblocking(False)
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._listener, selectors.EVENT_READ, "accept")
+        self._selector.register(self._wake_r, selectors.EVENT_READ, "wake")
+        self._completions: Deque[Tuple[_Connection, List[Any], int, Dict[str, Any]]] = deque()
+        self._conns: Dict[int, _Connection] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def server_address(self) -> Tuple[str, int]:
+        return self._listener.getsockname()[:2]
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self.serve_forever, name="mcpb-runtime-loop", daemon=True)
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        self._stop.set()
+        self._wake()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+    def serve_forever(self) -> None:
+        try:
+            while not self._stop.is_set():
+                for key, mask in self._selector.select(timeout=0.5):
+                    if key.data == "accept":
+                        self._accept()
+                    elif key.data == "wake":
+                        self._drain_wake()
+                    else:
+                        conn = key.data
+                        if mask & selectors.EVENT_READ:
+                            self._on_readable(conn)
+                        if mask & selectors.EVENT_WRITE and not conn.closed:
+                            self._flush(conn)
+                self._drain_completions()
+                self._reap_idle()
+        finally:
+            for conn in list(self._conns.values()):
+                self._close(conn)
+            self._selector.close()
+            self._listener.close()
+            self._wake_r.close()
+            self._wake_w.close()
+
+    # -- sockets --
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                sock, _ = self._listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn = _Connection(sock, time.monotonic())
+            self._conns[sock.fileno()] = conn
+            self._watch(conn)
 
-class Handler(BaseHTTPRequestHandler):
-    server_version = "MCPBLENDER-Runtime/1.0"
+    def _on_readable(self, conn: _Connection) -> None:
+        try:
+            data = conn.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._close(conn)
+            return
+        if not data:
+            conn.closing = True  # peer finished sending; answer what it already asked
+            if not conn.pending and not conn.outbuf:
+                self._close(conn)
+            else:
+                self._watch(conn)
+            return
+        conn.last_active = time.monotonic()
+        conn.inbuf += data
+        self._parse(conn)
 
-    def _send(self, status: int, payload: Dict[str, Any]) -> None:
-        body = _json_bytes(payload)
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json; charset=utf-8")
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
+    def _watch(self, conn: _Connection) -> None:
+        # Read while the pipeline window has room; write while output is queued. With
+        # neither, the socket stays unregistered until a response comes back.
+        if conn.closed:
+            return
+        events = 0
+        if not conn.closing and len(conn.pending) < self.max_pipeline:
+            events |= selectors.EVENT_READ
+        if conn.outbuf:
+            events |= selectors.EVENT_WRITE
+        if events == conn.events:
+            return
+        if conn.events and events:
+            self._selector.modify(conn.sock, events, conn)
+        elif events:
+            self._selector.register(conn.sock, events, conn)
+        else:
+            self._selector.unregister(conn.sock)
+        conn.events = events
 
-    def do_GET(self) -> None:  # noqa: N802
-        if self.path == "/health":
-            self._send(200, ok({"name": "mcpblender-runtime", "status": "ok"}))
+    def _close(self, conn: _Connection) -> None:
+        if conn.closed:
             return
-        if self.path == "/runtime/probe":
-            payload = runtime_probe()
-            self._send(200, payload)
+        conn.closed = True
+        self._conns.pop(conn.sock.fileno(), None)
+        if conn.events:
+            self._selector.unregister(conn.sock)
+            conn.events = 0
+        try:
+            conn.sock.close()
+        except OSError:
+            pass
+
+    def _reap_idle(self) -> None:
+        cutoff = time.monotonic() - self.idle_timeout
+        for conn in list(self._conns.values()):
+            if not conn.pending and not conn.outbuf and conn.last_active < cutoff:
+                self._close(conn)
+
+    # -- requests --
+
+    def _parse(self, conn: _Connection) -> None:
+        conn.parsing = True
+        try:
+            self._parse_requests(conn)
+        finally:
+            conn.parsing = False
+        self._watch(conn)
+
+    def _parse_requests(self, conn: _Connection) -> None:
+        while not conn.closing and len(conn.pending) < self.max_pipeline:
+            end = conn.inbuf.find(b"\r\n\r\n")
+            if end < 0:
+                if len(conn.inbuf) > MAX_HEADER_BYTES:
+                    self._reject(conn, 431, "request headers too large")
+                break
+            lines = conn.inbuf[:end].decode("iso-8859-1").split("\r\n")
+            parts = lines[0].split()
+            if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+                self._reject(conn, 400, "malformed request line")
+                break
+            method, path, version = parts
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            if "transfer-encoding" in headers:
+                self._reject(conn, 501, "chunked request bodies are not supported")
+                break
+            try:
+                length = int(headers.get("content-length", "0"))
+            except ValueError:
+                self._reject(conn, 400, "invalid Content-Length")
+                break
+            if length < 0 or length > MAX_BODY_BYTES:
+                self._reject(conn, 413, "request body too large")
+                break
+            total = end + 4 + length
+            if len(conn.inbuf) < total:
+                break
+            body = bytes(conn.inbuf[end + 4 : total])
+            del conn.inbuf[:total]
+
+            connection = headers.get("connection", "").lower()
+            keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+            slot: List[Any] = [None, keep_alive]
+            conn.pending.append(slot)
+            if not keep_alive:
+                conn.closing = True
+            self._dispatch(conn, slot, method, path, body)
+
+    def _reject(self, conn: _Connection, status: int, message: str) -> None:
+        conn.inbuf.clear()
+        conn.pending.append([render_response(status, err("bad_request", message), False), False])
+        conn.closing = True
+        self._flush(conn)
+
+    def _dispatch(self, conn: _Connection, slot: List[Any], method: str, path: str, body: bytes) -> None:
+        route = path.split("?", 1)[0]
+        if method == "GET" and route in INLINE_ROUTES:
+            self._fill(conn, slot, *handle_get_request(path))
             return
-        if self.path == "/scene/objects":
-            payload = scene_objects()
-            self._send(200, payload)
+        if method == "GET":
+            work: Callable[[], Tuple[int, Dict[str, Any]]] = lambda: handle_get_request(path)
+        elif method == "POST":
+            work = lambda: handle_post_request(path, body)
+        else:
+            self._fill(conn, slot, 405, err("method_not_allowed", f"{method} is not supported"))
             return
+        self.main_queue.submit(work, lambda result: self._complete(conn, slot, result))
 
-        self._send(404, err("not_found", f"Unknown route: {self.path}", retryable=False))
+    def _complete(self, conn: _Connection, slot: List[Any], result: Tuple[int, Dict[str, Any]]) -> None:
+        # Runs on the main thread: hand the answer back to the loop.
+        status, payload = result
+        self._completions.append((conn, slot, status, payload))
+        self._wake()
 
-    def log_message(self, format: str, *args: Any) -> None:
-        # keep Blender console clean
-        return
+    def _drain_completions(self) -> None:
+        while self._completions:
+            conn, slot, status, payload = self._completions.popleft()
+            if not conn.closed:
+                self._fill(conn, slot, status, payload)
+
+    def _fill(self, conn: _Connection, slot: List[Any], status: int, payload: Dict[str, Any]) -> None:
+        slot[0] = render_response(status, payload, slot[1])
+        self._flush(conn)
+
+    def _flush(self, conn: _Connection) -> None:
+        # Responses leave in request order: stop at the first one still being computed.
+        while conn.pending and conn.pending[0][0] is not None:
+            response, keep_alive = conn.pending.popleft()
+            conn.outbuf += response
+            if not keep_alive:
+                conn.pending.clear()
+                conn.closing = True
+                break
+        while conn.outbuf:
+            try:
+                sent = conn.sock.send(conn.outbuf)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                self._close(conn)
+                return
+            del conn.outbuf[:sent]
+            conn.last_active = time.monotonic()
+        if conn.closing and not conn.pending and not conn.outbuf:
+            self._close(conn)
+            return
+        if conn.inbuf and not conn.parsing and not conn.closing and len(conn.pending) < self.max_pipeline:
+            self._parse(conn)  # pipelined requests waiting behind a full window
+            return
+        if not conn.parsing:
+            self._watch(conn)
+
+    def _wake(self) -> None:
+        try:
+            self._wake_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass
+
+    def _drain_wake(self) -> None:
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
 
 # ---- CLI parsing: IMPORTANT inside Blender ----
 # Blender passes its own CLI args into sys.argv. Only args after "--" are for us.
@@ -99,20 +489,40 @@ def parse_args() -> argparse.Namespace:
     script_argv = _extract_script_argv(sys.argv)
     return parser.parse_args(script_argv)
 
-def serve(host: str, port: int) -> None:
-    httpd = HTTPServer((host, port), Handler)
+def _background_mode() -> bool:
+    try:
+        import bpy  # type: ignore
+        return bool(bpy.app.background)
+    except Exception:
+        return True
+
+def serve(host: str, port: int) -> EventLoopServer:
+    modeling_api.use_template_cache(_addon_template_cache())
+    main_queue = MainThreadQueue()
+    server = EventLoopServer(host, port, main_queue)
+    server.start()
     print(f"MCPBLENDER runtime listening on http://{host}:{port}", flush=True)
 
-    # Serve until Ctrl+C stops Blender process
+    if not _background_mode():
+        # Interactive Blender: drain the queue from a timer and leave the UI running.
+        import bpy  # type: ignore
+
+        def _drain() -> float:
+            main_queue.run_pending()
+            return 0.005
+
+        bpy.app.timers.register(_drain, persistent=True)
+        return server
+
+    # Headless: this (main) thread serves the queue until Ctrl+C stops Blender process
+    stop = threading.Event()
     try:
-        httpd.serve_forever(poll_interval=0.25)
+        main_queue.run_forever(stop)
     except KeyboardInterrupt:
         pass
     finally:
-        try:
-            httpd.shutdown()
-        except Exception:
-            pass
+        server.shutdown()
+    return server
 
 def main() -> None:
     args = parse_args()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence
 
 try:  # pragma: no cover - Blender runtime only
     import bpy
@@ -14,6 +14,16 @@ except Exception:  # pragma: no cover - allow import in tests
     Vector = None
     HAS_BPY = False
 
+# Primitive template cache (a MeshTemplateCache, e.g. the add-on's TEMPLATE_CACHE),
+# injected by the entry point with use_template_cache(). Without one, every
+# primitive is built with bmesh.
+_TEMPLATES: Any = None
+
+
+def use_template_cache(cache: Any) -> None:
+    global _TEMPLATES
+    _TEMPLATES = cache
+
 
 def _require_bpy() -> None:
     if not HAS_BPY:
@@ -28,11 +38,28 @@ def _ensure_location(vec) -> Optional[Vector]:
     return Vector(vec)
 
 
-def reset_scene() -> int:
+def reset_scene(purge_orphans: bool = False) -> int:
     _require_bpy()
     objs = list(bpy.data.objects)
-    for obj in objs:
-        bpy.data.objects.remove(obj, do_unlink=True)
+    owned = {}
+    if purge_orphans:
+        for obj in objs:
+            if obj.data is not None:
+                owned[obj.data.as_pointer()] = obj.data
+            for slot in obj.material_slots:
+                if slot.material is not None:
+                    owned[slot.material.as_pointer()] = slot.material
+    # One batch_remove instead of per-object removes (which rescan the ID lists).
+    if objs:
+        bpy.data.batch_remove(ids=objs)
+    pending = {key: block for key, block in owned.items() if not (_TEMPLATES and _TEMPLATES.is_template(block))}
+    while pending:
+        orphans = {key: block for key, block in pending.items() if block.users == 0 and not block.use_fake_user}
+        if not orphans:
+            break
+        bpy.data.batch_remove(ids=list(orphans.values()))
+        for key in orphans:
+            del pending[key]
     return len(objs)
 
 
@@ -43,12 +70,30 @@ def _link_object(obj) -> None:
     collection.objects.link(obj)
 
 
-def _new_mesh_from_bmesh(name: str, builder) -> bpy.types.Object:
+def clear_template_cache() -> int:
+    if _TEMPLATES is None:
+        return 0
+    count = len(_TEMPLATES)
+    _TEMPLATES.clear()
+    return count
+
+
+def _build_mesh(name: str, builder):
     mesh = bpy.data.meshes.new(name)
     bm = bmesh.new()
-    builder(bm)
-    bm.to_mesh(mesh)
-    bm.free()
+    try:
+        builder(bm)
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
+    return mesh
+
+
+def _new_mesh_from_template(name: str, kind: str, params: Dict[str, Any], builder) -> bpy.types.Object:
+    if _TEMPLATES is None:
+        mesh = _build_mesh(name, builder)
+    else:
+        mesh = _TEMPLATES.acquire_primitive(kind, params, builder, name)
     obj = bpy.data.objects.new(name, mesh)
     _link_object(obj)
     return obj
@@ -57,7 +102,9 @@ def _new_mesh_from_bmesh(name: str, builder) -> bpy.types.Object:
 def add_cube(name: Optional[str] = None, size: float = 2.0, location: Optional[Sequence[float]] = None) -> Dict:
     _require_bpy()
     obj_name = name or "Cube"
-    obj = _new_mesh_from_bmesh(obj_name, lambda bm: bmesh.ops.create_cube(bm, size=size))
+    obj = _new_mesh_from_template(
+        obj_name, "cube", {"size": float(size)}, lambda bm: bmesh.ops.create_cube(bm, size=size)
+    )
     loc = _ensure_location(location)
     if loc is not None:
         obj.location = loc
@@ -67,8 +114,10 @@ def add_cube(name: Optional[str] = None, size: float = 2.0, location: Optional[S
 def add_plane(name: Optional[str] = None, size: float = 2.0, location: Optional[Sequence[float]] = None) -> Dict:
     _require_bpy()
     obj_name = name or "Plane"
-    obj = _new_mesh_from_bmesh(
+    obj = _new_mesh_from_template(
         obj_name,
+        "plane",
+        {"size": float(size)},
         lambda bm: bmesh.ops.create_grid(bm, x_segments=1, y_segments=1, size=size / 2.0),
     )
     loc = _ensure_location(location)
@@ -97,7 +146,8 @@ def add_cylinder(
             cap_ends=True,
         )
 
-    obj = _new_mesh_from_bmesh(obj_name, build_cylinder)
+    params = {"radius": float(radius), "depth": float(depth), "vertices": int(vertices)}
+    obj = _new_mesh_from_template(obj_name, "cylinder", params, build_cylinder)
     loc = _ensure_location(location)
     if loc is not None:
         obj.location = loc
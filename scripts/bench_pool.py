@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+"""
+Throughput of the MCP server's worker pool as the number of workers grows.
+
+Starts stand-in bridges (the real HTTP bridge without Blender) whose RPC burns
+--work-ms of CPU under BPY_LOCK, then drives one session per worker from as many
+threads and reports calls/s. With real Blender workers pass --blender to time
+scene.snapshot instead, e.g.
+
+    python scripts/bench_pool.py --workers 1 2 4 8 --blender /opt/blender/blender
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "server_mcp", "src"), os.path.join(ROOT, "blender_addon")]
+
+from mcpblender_server.pool import PooledBridgeClient, WorkerPool, blender_command  # noqa: E402
+from mcpblender_server.schema import ToolRequest  # noqa: E402
+from mcpblender_server.server import build_registry  # noqa: E402
+
+STAND_IN = """
+import sys, time
+from mcpblender_addon.bridge_http import server
+
+WORK = float(sys.argv[1]) / 1000.0
+
+def busy():
+    end = time.perf_counter() + WORK
+    while time.perf_counter() < end:
+        pass
+    return {"ok": True, "data": {}}
+
+server._handler_map = lambda params: {"scene.snapshot": busy}
+args = server.parse_args(sys.argv[2:])
+server.BridgeServer(unix_socket=args.unix_socket).start()
+while True:
+    time.sleep(1)
+"""
+
+
+def _run(size: int, command, seconds: float) -> float:
+    pool = WorkerPool(size, command=command)
+    pool.start()
+    registry = build_registry(PooledBridgeClient(pool))
+    counts: List[int] = [0] * size
+    stop = time.perf_counter() + seconds
+
+    def drive(slot: int) -> None:
+        session = f"bench-{slot}"
+        while time.perf_counter() < stop:
+            response = registry.dispatch(ToolRequest("scene.snapshot", {}, "b", session_id=session))
+            if not response.ok:
+                raise SystemExit(f"call failed: {response.to_dict()}")
+            counts[slot] += 1
+
+    try:
+        threads = [threading.Thread(target=drive, args=(slot,)) for slot in range(size)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        pool.stop()
+    return sum(counts) / seconds
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--work-ms", type=float, default=5.0, help="CPU time per stand-in RPC")
+    parser.add_argument("--blender", help="benchmark real headless Blender workers instead of stand-ins")
+    args = parser.parse_args()
+
+    if args.blender:
+        command = lambda listen_args: blender_command(listen_args, blender=args.blender)  # noqa: E731
+    else:
+        script = os.path.join(tempfile.mkdtemp(prefix="mcpb-bench-"), "stand_in.py")
+        with open(script, "w", encoding="utf-8") as handle:
+            handle.write(STAND_IN)
+        command = lambda listen_args: [sys.executable, script, str(args.work_ms), *listen_args]  # noqa: E731
+
+    baseline = None
+    for size in args.workers:
+        rate = _run(size, command, args.seconds)
+        baseline = baseline or rate
+        print(f"workers={size:>3}: {rate:8.1f} calls/s  ({rate / baseline:4.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+"""
+Throughput of runtime_blender/http_runtime_server.py: the event-loop server vs the
+previous single-threaded HTTPServer (HTTP/1.0, one connection per request).
+
+Both run in-process without Blender; GET /runtime/probe goes through the main-thread
+queue on the event-loop server, as it would inside Blender. Modes:
+  legacy     HTTPServer + BaseHTTPRequestHandler, new connection per request
+  keepalive  event loop, one persistent connection per client thread
+  pipelined  event loop, --depth requests written back to back per round trip
+"""
+
+import argparse
+import http.client
+import os
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Callable, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from runtime_blender import http_runtime_server as runtime  # noqa: E402
+
+
+class LegacyHandler(BaseHTTPRequestHandler):
+    """The serving layer this module had before the event loop."""
+
+    def do_GET(self) -> None:  # noqa: N802
+        status, payload = runtime.handle_get_request(self.path)
+        body = runtime._json_bytes(payload)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        return
+
+
+def _drive(clients: int, seconds: float, worker: Callable[[List[int], int], None]) -> float:
+    counts = [0] * clients
+    threads = [threading.Thread(target=worker, args=(counts, i)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / seconds
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--depth", type=int, default=8, help="requests per pipelined batch")
+    parser.add_argument("--path", default="/runtime/probe")
+    args = parser.parse_args()
+    request = f"GET {args.path} HTTP/1.1\r\nHost: bench\r\n\r\n".encode("ascii")
+
+    legacy = HTTPServer(("127.0.0.1", 0), LegacyHandler)
+    threading.Thread(target=legacy.serve_forever, daemon=True).start()
+    queue = runtime.MainThreadQueue()
+    stop = threading.Event()
+    threading.Thread(target=queue.run_forever, args=(stop, 0.01), daemon=True).start()
+    loop = runtime.EventLoopServer("127.0.0.1", 0, queue)
+    loop.start()
+
+    def legacy_client(counts: List[int], slot: int) -> None:
+        end = time.perf_counter() + args.seconds
+        while time.perf_counter() < end:
+            conn = http.client.HTTPConnection(*legacy.server_address[:2])
+            conn.request("GET", args.path)
+            conn.getresponse().read()
+            conn.close()
+            counts[slot] += 1
+
+    def keepalive_client(counts: List[int], slot: int) -> None:
+        conn = http.client.HTTPConnection(*loop.server_address)
+        end = time.perf_counter() + args.seconds
+        while time.perf_counter() < end:
+            conn.request("GET", args.path)
+            conn.getresponse().read()
+            counts[slot] += 1
+        conn.close()
+
+    def pipelined_client(counts: List[int], slot: int) -> None:
+        sock = socket.create_connection(loop.server_address)
+        reader = sock.makefile("rb")
+        end = time.perf_counter() + args.seconds
+        while time.perf_counter() < end:
+            sock.sendall(request * args.depth)
+            for _ in range(args.depth):
+                length = 0
+                while True:
+                    line = reader.readline()
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":")[1])
+                    if line in (b"\r\n", b""):
+                        break
+                reader.read(length)
+            counts[slot] += args.depth
+        sock.close()
+
+    try:
+        results = {}
+        for label, worker in (("legacy", legacy_client), ("keepalive", keepalive_client), ("pipelined", pipelined_client)):
+            results[label] = _drive(args.clients, args.seconds, worker)
+        for label, rate in results.items():
+            print(f"{label:>9}: {rate:9.1f} req/s  ({rate / results['legacy']:4.2f}x)")
+    finally:
+        legacy.shutdown()
+        loop.shutdown()
+        stop.set()
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+"""
+Cold-start time of the MCP server entry points.
+
+Each run starts a fresh interpreter and measures wall time until the first
+response on stdout:
+  server     python -m mcpblender_server.server, answering a core.ping line
+  mcp_stdio  python -m mcpblender_server.mcp_stdio, answering an MCP initialize
+             request (skipped when the mcp SDK is not installed)
+plus the bare `import` time of each module. With --profile the entry points also
+report their startup phases (MCPBLENDER_STARTUP_PROFILE) and the median of each
+phase is printed.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "server_mcp", "src")
+
+PING = json.dumps({"method": "core.ping", "params": {}, "request_id": "bench"}) + "\n"
+INITIALIZE = (
+    json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {"protocolVersion": "2024-11-05", "capabilities": {}, "clientInfo": {"name": "bench", "version": "0"}},
+        }
+    )
+    + "\n"
+)
+
+
+def _env(profile: bool, prewarm: bool) -> Dict[str, str]:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [SRC, os.environ.get("PYTHONPATH")])))
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    if profile:
+        env["MCPBLENDER_STARTUP_PROFILE"] = "1"
+    if prewarm:
+        env["MCPBLENDER_PREWARM"] = "1"
+    return env
+
+
+def time_import(module: str, env: Dict[str, str]) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", f"import {module}"], env=env, check=True)
+    return (time.perf_counter() - start) * 1000.0
+
+
+def time_first_response(module: str, line: str, env: Dict[str, str]) -> Tuple[float, Optional[dict]]:
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", module],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+        text=True,
+    )
+    assert proc.stdin is not None and proc.stdout is not None
+    proc.stdin.write(line)
+    proc.stdin.flush()
+    proc.stdout.readline()
+    elapsed = (time.perf_counter() - start) * 1000.0
+    proc.stdin.close()  # EOF ends the server
+    assert proc.stderr is not None
+    err = proc.stderr.read()
+    proc.wait()
+    profile = None
+    for entry in (err or "").splitlines():
+        if entry.startswith('{"startup"'):
+            profile = json.loads(entry)["startup"]
+    return elapsed, profile
+
+
+def _summary(label: str, samples: List[float]) -> str:
+    return f"{label:>22}: median {statistics.median(samples):7.1f} ms  min {min(samples):7.1f} ms"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--profile", action="store_true", help="collect and print per-phase medians")
+    parser.add_argument("--prewarm", action="store_true", help="start the bridge prewarm at startup")
+    args = parser.parse_args()
+    env = _env(args.profile, args.prewarm)
+
+    has_mcp = importlib.util.find_spec("mcp") is not None
+    for module, line in (("mcpblender_server.server", PING), ("mcpblender_server.mcp_stdio", INITIALIZE)):
+        name = module.rsplit(".", 1)[1]
+        imports = [time_import(module, env) for _ in range(args.runs)]
+        print(_summary(f"{name} import", imports))
+        if line is INITIALIZE and not has_mcp:
+            print(f"{'':>24}mcp SDK not installed: first-response timing skipped")
+            continue
+        firsts: List[float] = []
+        phases: Dict[str, List[float]] = {}
+        for _ in range(args.runs):
+            elapsed, profile = time_first_response(module, line, env)
+            firsts.append(elapsed)
+            for phase in (profile or {}).get("phases", []):
+                phases.setdefault(phase["phase"], []).append(phase["ms"])
+        print(_summary(f"{name} first response", firsts))
+        for phase, samples in phases.items():
+            print(f"{'':>24}{phase:<16} {statistics.median(samples):7.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
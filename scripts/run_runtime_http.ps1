@@ -17,6 +17,8 @@ if (-not $blenderExe -or -not (Test-Path $blenderExe)) {
 Write-Host ("Using Blender at " + $blenderExe) -ForegroundColor Yellow
 
 $scriptPath = (Resolve-Path (Join-Path $PSScriptRoot "..\runtime_blender\http_runtime_server.py")).Path
+# The add-on supplies the primitive mesh template cache
+$env:PYTHONPATH = (Resolve-Path (Join-Path $PSScriptRoot "..\blender_addon")).Path
 
 # Important: pass args as an array so quoting/order are preserved
 $blenderArgs = @(
@@ -1,4 +1,13 @@
 """MCPBLENDER Core server package."""
-from .server import ToolRegistry, build_registry, run_stdio_server
+from . import startup as _startup  # noqa: F401 - starts the startup profile clock
 
 __all__ = ["ToolRegistry", "build_registry", "run_stdio_server"]
+
+
+def __getattr__(name: str):
+    # Resolved on first use so `python -m mcpblender_server.mcp_stdio` does not pay for the stdio server's imports.
+    if name in __all__:
+        from . import server
+
+        return getattr(server, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
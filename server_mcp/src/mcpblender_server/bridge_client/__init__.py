@@ -1,3 +1,5 @@
+from .frames import FRAME_CONTENT_TYPE, decode_frame, encode_frame
 from .http_bridge import BridgeClient
+from .shm import SharedPayload
 
-__all__ = ["BridgeClient"]
+__all__ = ["BridgeClient", "FRAME_CONTENT_TYPE", "SharedPayload", "decode_frame", "encode_frame"]
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+"""
+Reader for the bridge's GET /events change feed (Server-Sent Events).
+
+parse_sse turns the raw stream into event dicts ({"id", "kind", "key", ...}); a
+"stream.reset" event means changes were missed and any cached scene state should
+be dropped and re-read.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator
+
+RESET_KIND = "stream.reset"
+
+
+def parse_sse(lines: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+    event_id = None
+    kind = None
+    data = []
+    for raw in lines:
+        line = raw.decode("utf-8").rstrip("\r\n")
+        if not line:
+            if data:
+                payload = json.loads("\n".join(data))
+                payload.setdefault("kind", kind or "message")
+                if event_id is not None:
+                    payload.setdefault("id", int(event_id))
+                yield payload
+            event_id, kind, data = None, None, []
+            continue
+        if line.startswith(":"):
+            continue  # keepalive comment
+        field, _, value = line.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+        if field == "id":
+            event_id = value
+        elif field == "event":
+            kind = value
+        elif field == "data":
+            data.append(value)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+"""
+Client side of the bridge's binary frame format (see the addon's mesh_buffers):
+
+    b"MCPM" | u16 version | u16 reserved | u32 header_len | JSON header | sections
+
+Sections are already little-endian bytes here; the client never touches individual
+values, it only frames and unframes them.
+"""
+
+import json
+import struct
+from typing import Any, Dict, List, Sequence, Tuple
+
+FRAME_CONTENT_TYPE = "application/vnd.mcpblender.frame"
+FRAME_MAGIC = b"MCPM"
+FRAME_VERSION = 1
+_PREAMBLE = struct.Struct("<4sHHI")
+_ALIGN = 8
+ITEM_SIZES = {"f32": 4, "u32": 4, "u16": 2, "u8": 1}
+
+# (name, dtype, components, little-endian bytes)
+RawSection = Tuple[str, str, int, bytes]
+
+
+def _padding(length: int) -> int:
+    return -length % _ALIGN
+
+
+def encode_frame(header: Dict[str, Any], sections: Sequence[RawSection]) -> bytes:
+    chunks: List[bytes] = []
+    entries = []
+    offset = 0
+    for name, dtype, components, data in sections:
+        itemsize = ITEM_SIZES[dtype]
+        if len(data) % (itemsize * components):
+            raise ValueError(f"{name} length is not a multiple of {itemsize * components} bytes")
+        entries.append(
+            {
+                "name": name,
+                "dtype": dtype,
+                "components": components,
+                "count": len(data) // (itemsize * components),
+                "offset": offset,
+                "length": len(data),
+            }
+        )
+        pad = _padding(len(data))
+        chunks.append(bytes(data))
+        if pad:
+            chunks.append(b"\0" * pad)
+        offset += len(data) + pad
+    header_bytes = json.dumps({**header, "sections": entries}, separators=(",", ":")).encode("utf-8")
+    header_bytes += b" " * _padding(_PREAMBLE.size + len(header_bytes))
+    return b"".join([_PREAMBLE.pack(FRAME_MAGIC, FRAME_VERSION, 0, len(header_bytes)), header_bytes, *chunks])
+
+
+def decode_frame(frame: bytes) -> Tuple[Dict[str, Any], Dict[str, memoryview]]:
+    """Header plus a zero-copy view per section."""
+    if len(frame) < _PREAMBLE.size:
+        raise ValueError("frame too short")
+    magic, version, _, header_len = _PREAMBLE.unpack_from(frame)
+    if magic != FRAME_MAGIC or version != FRAME_VERSION:
+        raise ValueError("not a supported frame")
+    start = _PREAMBLE.size + header_len
+    header = json.loads(bytes(frame[_PREAMBLE.size : start]).decode("utf-8"))
+    view = memoryview(frame)
+    sections = {}
+    for entry in header.get("sections", ()):
+        begin = start + int(entry["offset"])
+        sections[entry["name"]] = view[begin : begin + int(entry["length"])]
+    return header, sections
@@ -1,59 +1,247 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
 import time
-import urllib.error
-import urllib.request
-from typing import Any, Dict
+import urllib.parse
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+from .events import parse_sse
+from .frames import FRAME_CONTENT_TYPE, RawSection, encode_frame
+from .shm import HAS_SHM, SHM_HEADER, SharedPayload, is_local_url
+from .unix import build_opener, resolve_base_url
+
+DEFAULT_BASE_URL = "http://127.0.0.1:9876"
+BASE_URL_ENV = "MCPBLENDER_BRIDGE_URL"
+
+# Absolute deadline sent with every RPC, Unix time in seconds.
+DEADLINE_HEADER = "X-MCP-Deadline"
+# Names the caller for the bridge's fair scheduler; defaults to one id per process.
+CLIENT_HEADER = "X-MCP-Client"
+CLIENT_ID_ENV = "MCPBLENDER_CLIENT_ID"
+# Per-method call timeouts in seconds (others use BridgeClient.timeout); they match
+# the bridge's own caps so slow methods are not abandoned while still running.
+METHOD_TIMEOUTS: Dict[str, float] = {
+    "scene.snapshot": 5.0,
+    "scenegraph.get_mesh": 10.0,
+    "object.transform_many": 10.0,
+    "object.delete_many": 10.0,
+    "mesh.from_buffers": 15.0,
+    "scene.purge_orphans": 10.0,
+}
+# Extra socket time past the deadline for the bridge's timeout reply to arrive.
+RESPONSE_GRACE_SECONDS = 0.25
 
 
 class BridgeClient:
-    """HTTP client for the Blender bridge with retries and timeouts."""
+    """
+    HTTP client for the Blender bridge with retries and timeouts. `base_url` is
+    http://host:port or unix:///path/to/bridge.sock for a Unix domain socket bridge;
+    it defaults to $MCPBLENDER_BRIDGE_URL, then http://127.0.0.1:9876.
+
+    Construction is cheap: urllib.request and the opener are set up by the first
+    request, or ahead of it by prewarm().
 
-    def __init__(self, base_url: str = "http://127.0.0.1:9876", timeout: float = 2.0, retries: int = 2) -> None:
-        self.base_url = base_url.rstrip("/")
+    Every RPC carries an absolute deadline (DEADLINE_HEADER): now plus the method's
+    timeout (`method_timeouts` over METHOD_TIMEOUTS, else `timeout`). Retries stop
+    once it has passed, and the bridge drops work that is still queued by then.
+
+    `client_id` (CLIENT_HEADER) is what the bridge schedules fairly against other
+    clients: $MCPBLENDER_CLIENT_ID, else one id per process.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: float = 2.0,
+        retries: int = 2,
+        use_shm: Optional[bool] = None,
+        method_timeouts: Optional[Dict[str, float]] = None,
+        client_id: Optional[str] = None,
+    ) -> None:
+        self.base_url, self.socket_path = resolve_base_url(base_url or os.environ.get(BASE_URL_ENV) or DEFAULT_BASE_URL)
+        self._opener: Any = None
+        self._opener_lock = threading.Lock()
         self.timeout = timeout
         self.retries = retries
+        self.method_timeouts = {**METHOD_TIMEOUTS, **(method_timeouts or {})}
+        self.client_id = client_id or os.environ.get(CLIENT_ID_ENV) or f"mcp-{os.getpid()}"
+        # Shared-memory responses only make sense when the bridge is on this host.
+        self.use_shm = HAS_SHM and (is_local_url(self.base_url) if use_shm is None else use_shm)
+
+    @property
+    def opener(self) -> Any:
+        if self._opener is None:
+            with self._opener_lock:
+                if self._opener is None:
+                    self._opener = build_opener(self.socket_path)
+        return self._opener
+
+    def prewarm(self) -> threading.Thread:
+        """
+        Set up the HTTP stack and probe /health on a daemon thread, so the first
+        real call does not pay for imports and connection setup. Failures are
+        ignored; the first call reports them as usual.
+        """
+
+        def warm() -> None:
+            try:
+                self.opener
+                self._request_health(retries=0)
+            except Exception:
+                pass
+
+        thread = threading.Thread(target=warm, name="mcpblender-bridge-prewarm", daemon=True)
+        thread.start()
+        return thread
+
+    def _request_health(self, retries: Optional[int] = None) -> Dict[str, Any]:
+        import urllib.request
+
+        def op() -> Dict[str, Any]:
+            req = urllib.request.Request(f"{self.base_url}/health", method="GET")
+            with self.opener.open(req, timeout=self.timeout) as resp:
+                return json.loads(resp.read().decode("utf-8"))
+
+        return self._with_retries(op, retries)
 
     def health(self) -> Dict[str, Any]:
         try:
-            def op() -> Dict[str, Any]:
-                req = urllib.request.Request(f"{self.base_url}/health", method="GET")
-                with urllib.request.urlopen(req, timeout=self.timeout) as resp:
-                    return json.loads(resp.read().decode("utf-8"))
-
-            return self._with_retries(op)
+            return self._request_health()
         except Exception as exc:
             return {"ok": False, "error": {"code": "bridge_unreachable", "message": str(exc)}}
 
-    def call_rpc(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    def timeout_for(self, method: str) -> float:
+        return self.method_timeouts.get(method, self.timeout)
+
+    def _deadline(self, method: str, timeout: Optional[float]) -> float:
+        return time.time() + (self.timeout_for(method) if timeout is None else timeout)
+
+    def call_rpc(self, method: str, params: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
         payload = json.dumps({"method": method, "params": params or {}}).encode("utf-8")
+        return self._post(payload, {"Content-Type": "application/json"}, deadline=self._deadline(method, timeout))
+
+    def call_rpc_binary(
+        self, method: str, params: Dict[str, Any], zero_copy: bool = False, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Like call_rpc for methods that return binary frames (scenegraph.get_mesh):
+        the frame arrives as raw bytes under "frame" instead of base64 in JSON. With
+        zero_copy=True a frame delivered through shared memory stays mapped and
+        "frame" is a SharedPayload the caller must release().
+        """
+        payload = json.dumps({"method": method, "params": params or {}}).encode("utf-8")
+        headers = {"Content-Type": "application/json", "Accept": f"{FRAME_CONTENT_TYPE}, application/json"}
+        return self._post(payload, headers, zero_copy=zero_copy, deadline=self._deadline(method, timeout))
+
+    def call_rpc_frame(
+        self, method: str, params: Dict[str, Any], sections: Sequence[RawSection], timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Upload raw buffers as one binary frame (mesh.from_buffers); params ride in its header."""
+        payload = encode_frame({"method": method, "params": params or {}}, sections)
+        return self._post(payload, {"Content-Type": FRAME_CONTENT_TYPE}, deadline=self._deadline(method, timeout))
+
+    def iter_events(
+        self,
+        since: Optional[int] = None,
+        objects: Sequence[str] = (),
+        types: Sequence[str] = (),
+        kinds: Sequence[str] = (),
+        read_timeout: float = 30.0,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Follow the bridge's /events change feed. Filters are applied by the bridge;
+        `since` resumes after a previously seen event id. The generator ends when the
+        connection drops; reconnect with since=<last id> to continue without gaps.
+        `read_timeout` must exceed the bridge's 15 s keepalive interval.
+        """
+        import urllib.request
+
+        query = {"objects": ",".join(objects), "types": ",".join(types), "kinds": ",".join(kinds)}
+        query = {name: value for name, value in query.items() if value}
+        headers = {"Accept": "text/event-stream"}
+        if since is not None:
+            headers["Last-Event-ID"] = str(since)
+        url = f"{self.base_url}/events"
+        if query:
+            url += "?" + urllib.parse.urlencode(query)
+        req = urllib.request.Request(url, headers=headers, method="GET")
+        with self.opener.open(req, timeout=read_timeout) as resp:
+            yield from parse_sse(resp)
+
+    def _post(
+        self, payload: bytes, headers: Dict[str, str], zero_copy: bool = False, deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        import urllib.error
+        import urllib.request
+
+        if deadline is None:
+            deadline = time.time() + self.timeout
+        headers = {**headers, DEADLINE_HEADER: f"{deadline:.3f}", CLIENT_HEADER: self.client_id}
+        if self.use_shm:
+            headers[SHM_HEADER] = "1"
 
         def op() -> Dict[str, Any]:
-            req = urllib.request.Request(
-                f"{self.base_url}/rpc",
-                data=payload,
-                headers={"Content-Type": "application/json"},
-                method="POST",
-            )
-            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
-                return json.loads(resp.read().decode("utf-8"))
+            left = deadline - time.time()
+            if left <= 0:
+                raise TimeoutError("deadline exceeded")
+            req = urllib.request.Request(f"{self.base_url}/rpc", data=payload, headers=headers, method="POST")
+            with self.opener.open(req, timeout=left + RESPONSE_GRACE_SECONDS) as resp:
+                return self._read_response(resp.read(), resp.headers.get("Content-Type", ""), zero_copy)
 
         try:
-            return self._with_retries(op)
-        except (urllib.error.URLError, urllib.error.HTTPError) as exc:
+            return self._with_retries(op, deadline=deadline)
+        except urllib.error.HTTPError as exc:
+            # Error envelopes (4xx/5xx, e.g. the bridge's own 504 timeout) come back as-is.
+            try:
+                return self._read_response(exc.read(), exc.headers.get("Content-Type", ""))
+            except Exception:
+                return {"ok": False, "error": {"code": "bridge_unreachable", "message": str(exc)}}
+        except TimeoutError as exc:
+            return {"ok": False, "error": {"code": "timeout", "message": str(exc) or "deadline exceeded"}}
+        except urllib.error.URLError as exc:
+            if isinstance(exc.reason, TimeoutError):
+                return {"ok": False, "error": {"code": "timeout", "message": str(exc.reason) or "deadline exceeded"}}
             return {"ok": False, "error": {"code": "bridge_unreachable", "message": str(exc)}}
         except Exception as exc:  # pragma: no cover - defensive
             return {"ok": False, "error": {"code": "bridge_error", "message": str(exc)}}
 
-    def _with_retries(self, fn):
+    @staticmethod
+    def _read_response(body: bytes, content_type: str, zero_copy: bool = False) -> Dict[str, Any]:
+        if content_type.startswith(FRAME_CONTENT_TYPE):
+            return {"ok": True, "frame": body}
+        result = json.loads(body.decode("utf-8"))
+        handle = result.get("shm") if isinstance(result, dict) else None
+        if handle is None:
+            return result
+        shared = SharedPayload(handle)
+        if shared.content_type.startswith(FRAME_CONTENT_TYPE):
+            if zero_copy:
+                return {"ok": True, "frame": shared}
+            with shared:
+                return {"ok": True, "frame": bytes(shared.view)}
+        with shared:
+            return json.loads(str(shared.view, "utf-8"))
+
+    def _with_retries(self, fn, retries: Optional[int] = None, deadline: Optional[float] = None):
+        """Retry connection failures; never past `deadline` and never after a timeout (the bridge may still be running it)."""
+        import urllib.error
+
         last_error: Exception | None = None
-        for attempt in range(self.retries + 1):
+        for attempt in range((self.retries if retries is None else retries) + 1):
             try:
                 return fn()
-            except (urllib.error.URLError, urllib.error.HTTPError) as exc:
+            except urllib.error.HTTPError:
+                raise
+            except urllib.error.URLError as exc:
+                if isinstance(exc.reason, TimeoutError):
+                    raise
                 last_error = exc
-                time.sleep(0.15 * (attempt + 1))
+                backoff = 0.15 * (attempt + 1)
+                if deadline is not None and time.time() + backoff >= deadline:
+                    break
+                time.sleep(backoff)
         if last_error:
             raise last_error
         raise RuntimeError("Bridge request failed without specific error")
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+"""
+Client half of the bridge's shared-memory side channel.
+
+The bridge answers opted-in requests with {"ok": true, "shm": {name, size,
+content_type}}; the client maps the segment, reads it in place and unlinks it.
+Unlinking is the client's job: the bridge only reaps segments nobody claimed.
+"""
+
+import importlib.util
+import os
+import urllib.parse
+from typing import Any, Dict, Optional
+
+# multiprocessing.shared_memory is imported on first use (it costs ~10 ms at startup);
+# probe for its platform backend instead.
+HAS_SHM = os.name == "nt" or importlib.util.find_spec("_posixshmem") is not None
+
+SHM_HEADER = "X-MCP-Shm"
+
+
+def is_local_url(base_url: str) -> bool:
+    parts = urllib.parse.urlsplit(base_url)
+    if parts.scheme == "unix":
+        return True
+    host = parts.hostname or ""
+    if host in ("localhost", "127.0.0.1", "::1"):
+        return True
+    import ipaddress
+
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class SharedPayload:
+    """A mapped response segment; `view` is valid until release()."""
+
+    def __init__(self, handle: Dict[str, Any]) -> None:
+        self.name = str(handle["name"])
+        self.size = int(handle["size"])
+        self.content_type = str(handle.get("content_type", "application/json"))
+        from multiprocessing import shared_memory
+
+        self._segment = shared_memory.SharedMemory(name=self.name, create=False)
+        self.view: Optional[memoryview] = self._segment.buf[: self.size]
+
+    def release(self) -> None:
+        if self.view is None:
+            return
+        self.view.release()
+        self.view = None
+        self._segment.close()
+        try:
+            self._segment.unlink()
+        except FileNotFoundError:  # reaped by the bridge after its TTL
+            pass
+
+    def __enter__(self) -> "SharedPayload":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+    def __del__(self) -> None:  # pragma: no cover - safety net for forgotten releases
+        try:
+            self.release()
+        except Exception:
+            pass
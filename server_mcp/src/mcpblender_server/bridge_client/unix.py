@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+"""
+urllib support for bridges listening on a Unix domain socket.
+
+`unix:///run/mcpb.sock` base URLs are rewritten to `unix://%2Frun%2Fmcpb.sock`
+so the socket path travels in the host slot; UnixHandler then opens an
+http.client connection over AF_UNIX and the request path stays `/rpc`/`/health`.
+"""
+
+import functools
+import urllib.parse
+from typing import Any, Optional, Tuple
+
+UNIX_SCHEME = "unix"
+
+
+@functools.lru_cache(maxsize=None)
+def unix_handler_class() -> Any:
+    """
+    The urllib handler class for unix:// URLs. Defined on first use: http.client and
+    urllib.request are most of the client's import time and a process that never
+    talks to the bridge should not pay for them.
+    """
+    import http.client
+    import socket
+    import urllib.request
+
+    class UnixHTTPConnection(http.client.HTTPConnection):
+        def __init__(self, socket_path: str, timeout: Optional[float] = None, **_kwargs) -> None:
+            super().__init__("localhost", timeout=timeout)
+            self.socket_path = urllib.parse.unquote(socket_path)
+
+        def connect(self) -> None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            if self.timeout is not None and self.timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+                sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path)
+            except OSError:
+                sock.close()
+                raise
+            self.sock = sock
+
+    class UnixHandler(urllib.request.AbstractHTTPHandler):
+        def unix_open(self, req: urllib.request.Request):
+            return self.do_open(UnixHTTPConnection, req)
+
+        unix_request = urllib.request.AbstractHTTPHandler.do_request_
+
+    return UnixHandler
+
+
+def resolve_base_url(base_url: str) -> Tuple[str, Optional[str]]:
+    """(request base URL, socket path or None) for an http:// or unix:// base URL."""
+    parts = urllib.parse.urlsplit(base_url)
+    if parts.scheme != UNIX_SCHEME:
+        return base_url.rstrip("/"), None
+    path = urllib.parse.unquote(parts.netloc + parts.path) if parts.netloc else parts.path
+    if not path:
+        raise ValueError(f"unix URL without a socket path: {base_url}")
+    return f"{UNIX_SCHEME}://{urllib.parse.quote(path, safe='')}", path
+
+
+def build_opener(socket_path: Optional[str]) -> Any:
+    import urllib.request
+
+    if socket_path is None:
+        return urllib.request.build_opener()
+    return urllib.request.build_opener(unix_handler_class()())
@@ -2,20 +2,29 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-from typing import Any, Dict, Optional
-
-from mcp.server.fastmcp import FastMCP
-from mcp.server import stdio
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from mcpblender_server.bridge_client import BridgeClient
+from mcpblender_server.startup import PREWARM_ENV, STARTUP, env_flag
+from mcpblender_server.tools.schemas import TOOL_SCHEMAS, make_tool_function
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mcp.server.fastmcp import FastMCP
+
 
+def _build_mcp(bridge: Optional[BridgeClient] = None) -> "FastMCP":
+    # The SDK is imported here rather than at module load so a prewarm started by
+    # _serve_stdio overlaps with it and the startup profile can time it separately.
+    from mcp.server.fastmcp import FastMCP
 
-def _build_mcp(bridge: Optional[BridgeClient] = None) -> FastMCP:
+    STARTUP.mark("mcp_import")
     bridge_client = bridge or BridgeClient()
     mcp = FastMCP("mcpblender-core")
 
     def call_bridge(method: str, params: Dict[str, Any]) -> Any:
         resp = bridge_client.call_rpc(method, params or {})
+        STARTUP.mark("first_call")
+        STARTUP.report()
         if resp and resp.get("ok"):
             return resp.get("data")
         error = (resp or {}).get("error") or {}
@@ -23,69 +32,24 @@ def _build_mcp(bridge: Optional[BridgeClient] = None) -> FastMCP:
         message = error.get("message", "bridge call failed")
         raise RuntimeError(f"{code}: {message}")
 
-    @mcp.tool()
-    def scene_snapshot() -> Any:
-        """Capture a canonical scene snapshot."""
-        return call_bridge("scene.snapshot", {})
-
-    @mcp.tool()
-    def object_create_cube(name: str | None = None, size: float | None = None, location: Any | None = None) -> Any:
-        """Create a cube via bridge."""
-        params: Dict[str, Any] = {}
-        if name is not None:
-            params["name"] = name
-        if size is not None:
-            params["size"] = size
-        if location is not None:
-            params["location"] = location
-        return call_bridge("object.create_cube", params)
-
-    @mcp.tool()
-    def object_move_object(
-        id: str | None = None, name: str | None = None, delta: Any | None = None, location: Any | None = None
-    ) -> Any:
-        """Move object by id or name."""
-        params: Dict[str, Any] = {}
-        if id is not None:
-            params["id"] = id
-        if name is not None:
-            params["name"] = name
-        if delta is not None:
-            params["delta"] = delta
-        if location is not None:
-            params["location"] = location
-        return call_bridge("object.move_object", params)
-
-    @mcp.tool()
-    def material_assign_simple(
-        id: str | None = None,
-        name: str | None = None,
-        material_name: str | None = None,
-        base_color: Any | None = None,
-        metallic: float | None = None,
-        roughness: float | None = None,
-    ) -> Any:
-        """Assign a simple material via bridge."""
-        params: Dict[str, Any] = {}
-        if id is not None:
-            params["id"] = id
-        if name is not None:
-            params["name"] = name
-        if material_name is not None:
-            params["material_name"] = material_name
-        if base_color is not None:
-            params["base_color"] = base_color
-        if metallic is not None:
-            params["metallic"] = metallic
-        if roughness is not None:
-            params["roughness"] = roughness
-        return call_bridge("material.assign_simple", params)
+    # Tool signatures come from the registry's schemas, so the two front ends cannot drift.
+    for method, schema in TOOL_SCHEMAS.items():
+        if schema.get("local"):
+            continue
+        tool = make_tool_function(method, schema, call_bridge)
+        mcp.tool(name=tool.__name__, description=tool.__doc__)(tool)
+    STARTUP.mark("tools")
 
     return mcp
 
 
-async def _serve_stdio() -> None:
-    mcp = _build_mcp()
+async def _serve_stdio(prewarm: Optional[bool] = None) -> None:
+    STARTUP.mark("import")
+    bridge = BridgeClient()
+    if env_flag(PREWARM_ENV) if prewarm is None else prewarm:
+        # Runs while the SDK loads and the host performs the initialize handshake.
+        bridge.prewarm()
+    mcp = _build_mcp(bridge)
     if hasattr(mcp, "run_stdio_async"):
         await mcp.run_stdio_async()
         await asyncio.Future()
@@ -97,6 +61,8 @@ async def _serve_stdio() -> None:
             await maybe
         await asyncio.Future()
         return
+    from mcp.server import stdio
+
     ctx = None
     run_coro = None
 
@@ -128,8 +94,16 @@ async def _serve_stdio() -> None:
     raise RuntimeError("Failed to start stdio server")
 
 
-def main() -> None:  # pragma: no cover - runtime entry
-    asyncio.run(_serve_stdio())
+def main(argv: Optional[list] = None) -> None:  # pragma: no cover - runtime entry
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="mcpblender-mcp")
+    parser.add_argument("--prewarm", action="store_true", default=None, help="connect to the bridge in the background at startup")
+    parser.add_argument("--profile-startup", action="store_true", help="report startup phase timings on stderr")
+    args = parser.parse_args(argv)
+    if args.profile_startup:
+        STARTUP.enabled = True
+    asyncio.run(_serve_stdio(prewarm=args.prewarm))
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+"""
+Pool of Blender bridge processes with sticky session routing.
+
+One Blender process serializes every call on BPY_LOCK, so independent agent
+sessions get their own worker: the first call of a session binds it to the least
+loaded healthy worker and every later call goes to that same process (its scene
+lives there). When all workers are taken, new sessions queue (FIFO) until one is
+released or its owner goes idle; at most max_queued sessions wait at a time.
+When the last session of a worker is released, the worker is restarted before
+it takes another session, so a new session never sees an earlier session's
+objects. A monitor thread health-checks workers and restarts any that exit or
+stop answering; sessions stay bound to the restarted worker, whose scene starts
+empty again.
+
+PooledBridgeClient exposes the BridgeClient interface and routes each call by
+CURRENT_SESSION, which ToolRegistry.dispatch sets from the request's session_id.
+"""
+
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+from .bridge_client import BridgeClient
+from .bridge_client.frames import RawSection
+from .state import CURRENT_SESSION, DEFAULT_SESSION
+
+ADDON_PATH_ENV = "MCPBLENDER_ADDON_PATH"
+BLENDER_ENV = "MCPBLENDER_BLENDER"
+
+STARTING = "starting"
+READY = "ready"
+UNHEALTHY = "unhealthy"
+STOPPED = "stopped"
+
+Command = Callable[[Sequence[str]], List[str]]
+
+
+class PoolBusyError(RuntimeError):
+    """No worker became free for a new session within the queue timeout, or the queue is full."""
+
+
+def default_addon_path() -> str:
+    env = os.environ.get(ADDON_PATH_ENV)
+    if env:
+        return env
+    # Source checkout: <repo>/server_mcp/src/mcpblender_server/pool.py -> <repo>/blender_addon
+    return str(Path(__file__).resolve().parents[3] / "blender_addon")
+
+
+def blender_command(listen_args: Sequence[str], blender: Optional[str] = None, addon_path: Optional[str] = None) -> List[str]:
+    """Headless bridge launch, the Linux counterpart of scripts/run_blender_bridge.ps1."""
+    server_py = os.path.join(addon_path or default_addon_path(), "mcpblender_addon", "bridge_http", "server.py")
+    blender = blender or os.environ.get(BLENDER_ENV, "blender")
+    return [blender, "--background", "--factory-startup", "--python", server_py, "--", *listen_args]
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+class Worker:
+    def __init__(self, index: int, listen_args: List[str], url: str, client: BridgeClient) -> None:
+        self.index = index
+        self.listen_args = listen_args
+        self.url = url
+        self.client = client
+        self.process: Optional[subprocess.Popen] = None
+        self.state = STOPPED
+        self.sessions: set = set()
+        self.failures = 0
+        self.restarts = 0
+        self.recycles = 0
+        self.recycling = False
+        self.started_at = 0.0
+        self.ready = threading.Event()
+        self.lock = threading.Lock()  # one terminate/spawn at a time
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "url": self.url,
+            "state": self.state,
+            "pid": self.process.pid if self.process else None,
+            "sessions": sorted(self.sessions),
+            "restarts": self.restarts,
+            "recycles": self.recycles,
+        }
+
+
+class Session:
+    def __init__(self, session_id: str, worker: Worker, now: float) -> None:
+        self.id = session_id
+        self.worker = worker
+        self.last_used = now
+        self.lock = threading.Lock()  # one call at a time per session keeps its calls ordered
+
+
+class WorkerPool:
+    def __init__(
+        self,
+        size: int,
+        command: Command = blender_command,
+        socket_dir: Optional[str] = None,
+        max_sessions_per_worker: int = 1,
+        queue_timeout: float = 30.0,
+        max_queued: Optional[int] = None,
+        health_interval: float = 2.0,
+        start_timeout: float = 60.0,
+        max_failures: int = 3,
+        session_idle_seconds: float = 900.0,
+        recycle_workers: bool = True,
+        client_factory: Callable[[str], BridgeClient] = lambda url: BridgeClient(base_url=url),
+        env: Optional[Dict[str, str]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if size < 1:
+            raise ValueError("pool size must be at least 1")
+        self.size = size
+        self.command = command
+        self.max_sessions_per_worker = max_sessions_per_worker
+        self.queue_timeout = queue_timeout
+        self.max_queued = max_queued
+        self.health_interval = health_interval
+        self.start_timeout = start_timeout
+        self.max_failures = max_failures
+        self.session_idle_seconds = session_idle_seconds
+        self.recycle_workers = recycle_workers
+        self._env = env
+        self._clock = clock
+        self._own_socket_dir = socket_dir is None and hasattr(socket, "AF_UNIX")
+        self._socket_dir = socket_dir or (tempfile.mkdtemp(prefix="mcpb-pool-") if self._own_socket_dir else None)
+        self._cond = threading.Condition()
+        self._sessions: Dict[str, Session] = {}
+        self._waiting: Deque[str] = deque()
+        self._monitor: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self.workers = [self._make_worker(i, client_factory) for i in range(size)]
+
+    def _make_worker(self, index: int, client_factory: Callable[[str], BridgeClient]) -> Worker:
+        if self._socket_dir:
+            path = os.path.join(self._socket_dir, f"worker{index}.sock")
+            listen_args, url = ["--unix-socket", path], f"unix://{path}"
+        else:  # pragma: no cover - platforms without AF_UNIX
+            port = _free_port()
+            listen_args, url = ["--port", str(port)], f"http://127.0.0.1:{port}"
+        return Worker(index, listen_args, url, client_factory(url))
+
+    # -- lifecycle -----------------------------------------------------------
+
+    def start(self, wait: bool = True) -> None:
+        for worker in self.workers:
+            self._spawn(worker)
+        if wait:
+            for worker in self.workers:
+                self.wait_ready(worker, self.start_timeout)
+        if self._monitor is None:
+            self._monitor = threading.Thread(target=self._monitor_loop, name="mcpb-pool-monitor", daemon=True)
+            self._monitor.start()
+
+    def stop(self) -> None:
+        self._stopping.set()
+        for worker in self.workers:
+            self._terminate(worker)
+        if self._monitor is not None:
+            self._monitor.join(timeout=self.health_interval + 1)
+            self._monitor = None
+        if self._own_socket_dir and self._socket_dir:
+            shutil.rmtree(self._socket_dir, ignore_errors=True)
+
+    def _spawn(self, worker: Worker) -> None:
+        env = dict(self._env if self._env is not None else os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [default_addon_path(), env.get("PYTHONPATH")]))
+        worker.ready.clear()
+        worker.state = STARTING
+        worker.failures = 0
+        worker.started_at = self._clock()
+        worker.process = subprocess.Popen(
+            self.command(worker.listen_args),
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def _terminate(self, worker: Worker) -> None:
+        process, worker.process = worker.process, None
+        worker.state = STOPPED
+        worker.ready.clear()
+        if process is None or process.poll() is not None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    def restart(self, worker: Worker) -> None:
+        with worker.lock:
+            self._terminate(worker)
+            worker.restarts += 1
+            self._spawn(worker)
+
+    def _recycle(self, worker: Worker, session: Session) -> None:
+        """Fresh process for a worker whose last session left; it takes no session until spawned."""
+        try:
+            with session.lock, worker.lock:  # let a call still in flight finish first
+                self._terminate(worker)
+                worker.recycles += 1
+                self._spawn(worker)
+        finally:
+            with self._cond:
+                worker.recycling = False
+                self._cond.notify_all()
+
+    def wait_ready(self, worker: Worker, timeout: float) -> bool:
+        deadline = self._clock() + timeout
+        while not worker.ready.is_set():
+            if worker.state == STARTING and self._probe(worker):
+                self._mark_ready(worker)
+                break
+            remaining = deadline - self._clock()
+            if remaining <= 0 or self._stopping.is_set():
+                return False
+            worker.ready.wait(min(0.05, remaining))
+        return True
+
+    def _probe(self, worker: Worker) -> bool:
+        if worker.process is None or worker.process.poll() is not None:
+            return False
+        try:
+            return bool(worker.client.health().get("ok"))
+        except Exception:
+            return False
+
+    def _mark_ready(self, worker: Worker) -> None:
+        worker.state = READY
+        worker.failures = 0
+        worker.ready.set()
+        with self._cond:
+            self._cond.notify_all()
+
+    def check_health(self) -> None:
+        """One monitor pass: restart dead or unresponsive workers, expire idle sessions."""
+        for worker in self.workers:
+            if self._stopping.is_set():
+                return
+            if worker.recycling:
+                continue
+            exited = worker.process is None or worker.process.poll() is not None
+            if worker.state == STARTING and not exited:
+                if self._probe(worker):
+                    self._mark_ready(worker)
+                elif self._clock() - worker.started_at > self.start_timeout:
+                    self.restart(worker)
+                continue
+            if exited:
+                self.restart(worker)
+                continue
+            if self._probe(worker):
+                worker.failures = 0
+                worker.state = READY
+                continue
+            worker.failures += 1
+            worker.state = UNHEALTHY
+            if worker.failures >= self.max_failures:
+                self.restart(worker)
+        self._expire_idle()
+
+    def _monitor_loop(self) -> None:
+        while not self._stopping.wait(self.health_interval):
+            try:
+                self.check_health()
+            except Exception:  # pragma: no cover - keep monitoring whatever happens
+                continue
+
+    # -- sessions ------------------------------------------------------------
+
+    def acquire(self, session_id: str, timeout: Optional[float] = None) -> Session:
+        """The session's worker binding, waiting in the queue for a free worker if needed."""
+        deadline = self._clock() + (self.queue_timeout if timeout is None else timeout)
+        with self._cond:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.last_used = self._clock()
+                return session
+            if self.max_queued is not None and len(self._waiting) >= self.max_queued:
+                raise PoolBusyError(f"all {self.size} workers are busy and {len(self._waiting)} sessions are queued")
+            self._waiting.append(session_id)
+            try:
+                while True:
+                    worker = self._free_worker() if self._waiting[0] == session_id else None
+                    if worker is not None:
+                        session = Session(session_id, worker, self._clock())
+                        worker.sessions.add(session_id)
+                        self._sessions[session_id] = session
+                        return session
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        raise PoolBusyError(f"all {self.size} workers are busy")
+                    self._cond.wait(remaining)
+            finally:
+                self._waiting.remove(session_id)
+                self._cond.notify_all()
+
+    def release(self, session_id: str) -> bool:
+        with self._cond:
+            session = self._sessions.pop(session_id, None)
+            if session is None:
+                return False
+            worker = session.worker
+            worker.sessions.discard(session_id)
+            recycle = worker.recycling = self.recycle_workers and not worker.sessions and not self._stopping.is_set()
+            self._cond.notify_all()
+        if recycle:
+            threading.Thread(target=self._recycle, args=(worker, session), name="mcpb-pool-recycle", daemon=True).start()
+        return True
+
+    def _free_worker(self) -> Optional[Worker]:
+        candidates = [
+            w
+            for w in self.workers
+            if w.state in (READY, STARTING) and not w.recycling and len(w.sessions) < self.max_sessions_per_worker
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda w: (w.state != READY, len(w.sessions), w.index))
+
+    def _expire_idle(self) -> None:
+        now = self._clock()
+        with self._cond:
+            idle = [s.id for s in self._sessions.values() if now - s.last_used > self.session_idle_seconds]
+        for session_id in idle:
+            self.release(session_id)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "size": self.size,
+                "sessions": len(self._sessions),
+                "queued": len(self._waiting),
+                "workers": [worker.describe() for worker in self.workers],
+            }
+
+
+def _pool_error(code: str, message: str) -> Dict[str, Any]:
+    return {"ok": False, "error": {"code": code, "message": message}}
+
+
+class PooledBridgeClient:
+    """BridgeClient look-alike that sends each call to the current session's worker."""
+
+    def __init__(self, pool: WorkerPool) -> None:
+        self.pool = pool
+
+    def _call(self, fn: Callable[[BridgeClient], Dict[str, Any]]) -> Dict[str, Any]:
+        try:
+            session = self.pool.acquire(CURRENT_SESSION.get())
+        except PoolBusyError as exc:
+            return _pool_error("pool_busy", str(exc))
+        with session.lock:
+            worker = session.worker
+            if not self.pool.wait_ready(worker, self.pool.queue_timeout):
+                return _pool_error("worker_unavailable", f"worker {worker.index} is not ready")
+            session.last_used = self.pool._clock()
+            return fn(worker.client)
+
+    def health(self) -> Dict[str, Any]:
+        return self._call(lambda client: client.health())
+
+    def call_rpc(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._call(lambda client: client.call_rpc(method, params))
+
+    def call_rpc_binary(self, method: str, params: Dict[str, Any], zero_copy: bool = False) -> Dict[str, Any]:
+        return self._call(lambda client: client.call_rpc_binary(method, params, zero_copy=zero_copy))
+
+    def call_rpc_frame(self, method: str, params: Dict[str, Any], sections: Sequence[RawSection]) -> Dict[str, Any]:
+        return self._call(lambda client: client.call_rpc_frame(method, params, sections))
+
+    def end_session(self) -> bool:
+        return self.pool.release(CURRENT_SESSION.get())
+
+    def close(self) -> None:
+        self.pool.stop()
+
+    def __enter__(self) -> "PooledBridgeClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
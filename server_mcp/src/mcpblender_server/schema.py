@@ -76,6 +76,7 @@ class ToolRequest:
     method: str
     params: Dict[str, Any]
     request_id: str
+    session_id: Optional[str] = None
 
     @classmethod
     def from_json(cls, raw: str) -> "ToolRequest":
@@ -93,7 +94,13 @@ class ToolRequest:
         request_id = payload.get("request_id")
         if not isinstance(request_id, str) or not request_id:
             raise ValueError("request_id is required")
-        return cls(method=method, params=params, request_id=request_id)
+        session_id = payload.get("session_id")
+        if session_id is not None and (not isinstance(session_id, str) or not session_id):
+            raise ValueError("session_id must be a non-empty string")
+        return cls(method=method, params=params, request_id=request_id, session_id=session_id)
 
     def to_json(self) -> str:
-        return json.dumps({"method": self.method, "params": self.params, "request_id": self.request_id})
+        payload = {"method": self.method, "params": self.params, "request_id": self.request_id}
+        if self.session_id is not None:
+            payload["session_id"] = self.session_id
+        return json.dumps(payload)
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import sys
-from typing import Any, Callable, Dict
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from mcpblender_server.bridge_client import BridgeClient
 from mcpblender_server.schema import ResponsePayload, ToolRequest, error_response
-from mcpblender_server.state import ServerState
+from mcpblender_server.startup import PREWARM_ENV, STARTUP, env_flag
+from mcpblender_server.state import CURRENT_SESSION, DEFAULT_SESSION, ServerState
 from mcpblender_server.tools import register_tools
+from mcpblender_server.tools.schemas import Schema, Validator, compile_schema
 
 
 class ToolRegistry:
@@ -14,9 +17,19 @@ class ToolRegistry:
         self.bridge_client = bridge_client
         self.state = state or ServerState()
         self._tools: Dict[str, Callable[[ToolRequest], ResponsePayload]] = {}
+        self._validators: Dict[str, Validator] = {}
 
-    def register(self, name: str, handler: Callable[[ToolRequest], ResponsePayload]) -> None:
+    def register(
+        self, name: str, handler: Callable[[ToolRequest], ResponsePayload], schema: Optional[Schema] = None
+    ) -> None:
         self._tools[name] = handler
+        if schema is not None:
+            self._validators[name] = compile_schema(schema)
+        else:
+            self._validators.pop(name, None)
+
+    def tool_names(self) -> List[str]:
+        return list(self._tools)
 
     def response_from_bridge(self, payload: Any, fallback_request_id: str) -> ResponsePayload:
         from mcpblender_server.schema import ResponsePayload as RP
@@ -31,11 +44,27 @@ class ToolRegistry:
         handler = self._tools.get(request.method)
         if handler is None:
             return error_response(request.request_id, "tool_not_found", f"Method '{request.method}' is not registered")
+        validator = self._validators.get(request.method)
+        if validator is not None:
+            problems = validator(request.params)
+            if problems:
+                first = problems[0]
+                self.state.record_error({"code": "invalid_params", "method": request.method, "message": first["message"]})
+                return error_response(
+                    request.request_id,
+                    "invalid_params",
+                    f"{request.method}: {first['path']} {first['message']}",
+                    {"errors": problems},
+                )
+        # A pooled bridge client routes on this; a plain BridgeClient ignores it.
+        token = CURRENT_SESSION.set(request.session_id or DEFAULT_SESSION)
         try:
             return handler(request)
         except Exception as exc:  # pragma: no cover - defensive path
             self.state.record_error({"type": exc.__class__.__name__, "message": str(exc)})
             return error_response(request.request_id, "internal_error", str(exc))
+        finally:
+            CURRENT_SESSION.reset(token)
 
 
 def build_registry(bridge_client: BridgeClient, state: ServerState | None = None) -> ToolRegistry:
@@ -44,27 +73,83 @@ def build_registry(bridge_client: BridgeClient, state: ServerState | None = None
     return registry
 
 
-def run_stdio_server() -> None:
-    """Run a simple newline-delimited JSON stdio server."""
+# Pool bookkeeping that never waits for a worker. It runs on the reader thread, so
+# session.end can free a worker even while every executor thread is blocked.
+POOL_INLINE_METHODS = frozenset({"session.end", "pool.stats"})
 
-    def send(response: ResponsePayload) -> None:
-        sys.stdout.write(response.to_json() + "\n")
-        sys.stdout.flush()
 
-    with BridgeClient() as bridge:
+def run_stdio_server(workers: int = 0, blender: Optional[str] = None, prewarm: Optional[bool] = None) -> None:
+    """
+    Run a simple newline-delimited JSON stdio server. With workers > 0 the server
+    starts that many headless Blender bridges, routes requests by session_id and
+    handles requests concurrently (responses may then arrive out of order; match
+    them by request_id). With prewarm (default: $MCPBLENDER_PREWARM) the bridge
+    connection is set up in the background while the first request is awaited.
+    """
+    STARTUP.mark("import")
+    write_lock = threading.Lock()
+
+    def send(response: ResponsePayload) -> None:
+        with write_lock:
+            sys.stdout.write(response.to_json() + "\n")
+            sys.stdout.flush()
+        STARTUP.mark("first_response")
+        STARTUP.report()
+
+    executor = None
+    if workers > 0:
+        from concurrent.futures import ThreadPoolExecutor
+
+        from mcpblender_server.pool import PooledBridgeClient, WorkerPool, blender_command
+
+        # Queued sessions block their thread: cap them at half the executor so bound
+        # sessions always have threads left.
+        pool = WorkerPool(
+            workers, command=lambda listen_args: blender_command(listen_args, blender=blender), max_queued=workers * 2
+        )
+        pool.start()
+        bridge: Any = PooledBridgeClient(pool)
+        executor = ThreadPoolExecutor(max_workers=workers * 4)
+    else:
+        bridge = BridgeClient()
+        if env_flag(PREWARM_ENV) if prewarm is None else prewarm:
+            bridge.prewarm()
+    STARTUP.mark("bridge_client")
+
+    with bridge:
         registry = build_registry(bridge)
+        STARTUP.mark("registry")
         for line in sys.stdin:
             line = line.strip()
             if not line:
                 continue
+            STARTUP.mark("stdin_wait")
             try:
                 request = ToolRequest.from_json(line)
             except Exception as exc:
                 send(error_response("unknown", "invalid_request", str(exc)))
                 continue
-            response = registry.dispatch(request)
-            send(response)
+            if executor is None or request.method in POOL_INLINE_METHODS:
+                send(registry.dispatch(request))
+            else:
+                executor.submit(lambda r=request: send(registry.dispatch(r)))
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:  # pragma: no cover - CLI entry point
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="mcpblender-server")
+    parser.add_argument("--workers", type=int, default=0, help="run a pool of N headless Blender bridges")
+    parser.add_argument("--blender", default=None, help="Blender executable for --workers (default: $MCPBLENDER_BLENDER or blender)")
+    parser.add_argument("--prewarm", action="store_true", default=None, help="connect to the bridge in the background at startup")
+    parser.add_argument("--profile-startup", action="store_true", help="report startup phase timings on stderr")
+    args = parser.parse_args(argv)
+    if args.profile_startup:
+        STARTUP.enabled = True
+    run_stdio_server(workers=args.workers, blender=args.blender, prewarm=args.prewarm)
 
 
 if __name__ == "__main__":  # pragma: no cover
-    run_stdio_server()
+    main()
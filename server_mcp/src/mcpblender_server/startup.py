@@ -0,0 +1,67 @@
+"""
+Startup phase timing for the server entry points.
+
+With MCPBLENDER_STARTUP_PROFILE=1 (or `--profile-startup`) each entry point marks
+its phases (imports, bridge client, registry, ready, first response) and writes
+one JSON line to stderr once the first call is answered:
+
+    {"startup": {"phases": [{"phase": "import", "ms": 41.2}, ...], "total_ms": 63.0}}
+
+Times are relative to the import of this package, which is the first thing both
+entry points do.
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
+
+PROFILE_ENV = "MCPBLENDER_STARTUP_PROFILE"
+PREWARM_ENV = "MCPBLENDER_PREWARM"
+
+
+def env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class StartupProfile:
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        clock: Callable[[], float] = time.perf_counter,
+        stream: Optional[TextIO] = None,
+    ) -> None:
+        self.enabled = env_flag(PROFILE_ENV) if enabled is None else enabled
+        self.clock = clock
+        self.stream = stream
+        self.origin = clock()
+        self._last = self.origin
+        self.phases: List[Tuple[str, float]] = []
+        self.reported = False
+
+    def mark(self, phase: str) -> None:
+        """Close `phase`: it took the time since the previous mark."""
+        if not self.enabled or self.reported:
+            return
+        now = self.clock()
+        self.phases.append((phase, (now - self._last) * 1000.0))
+        self._last = now
+
+    def payload(self) -> Dict[str, Any]:
+        return {
+            "phases": [{"phase": phase, "ms": round(ms, 2)} for phase, ms in self.phases],
+            "total_ms": round((self._last - self.origin) * 1000.0, 2),
+        }
+
+    def report(self) -> None:
+        """Write the profile once (later calls are no-ops)."""
+        if not self.enabled or self.reported:
+            return
+        self.reported = True
+        stream = self.stream or sys.stderr
+        stream.write(json.dumps({"startup": self.payload()}) + "\n")
+        stream.flush()
+
+
+STARTUP = StartupProfile()
@@ -1,6 +1,11 @@
 from collections import deque
+from contextvars import ContextVar
 from typing import Any, Deque, Dict, Optional
 
+DEFAULT_SESSION = "default"
+# Set by ToolRegistry.dispatch from the request's session_id; PooledBridgeClient routes on it.
+CURRENT_SESSION: ContextVar[str] = ContextVar("mcpblender_session", default=DEFAULT_SESSION)
+
 
 class ServerState:
     """Lightweight in-memory diagnostics tracker."""
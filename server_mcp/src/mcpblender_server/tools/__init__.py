@@ -1,19 +1,29 @@
 from __future__ import annotations
 
+import base64
+import binascii
 from typing import Callable, TYPE_CHECKING
 
 from mcpblender_server.schema import ResponsePayload, error_response, success_response
+from mcpblender_server.tools.schemas import TOOL_SCHEMAS, public_schema
 
 if TYPE_CHECKING:  # pragma: no cover
     from mcpblender_server.server import ToolRegistry
     from mcpblender_server.schema import ToolRequest
 
+# Base64 params of mesh.from_buffers forwarded to the bridge as binary frame sections.
+UPLOAD_SECTIONS = (("positions", "f32", 3), ("indices", "u32", 1), ("face_sizes", "u32", 1), ("uvs", "f32", 2))
+
 
 def register_tools(registry: "ToolRegistry") -> None:
     bridge = registry.bridge_client
     state = registry.state
 
-    registry.register(
+    def add(name: str, handler: Callable[["ToolRequest"], ResponsePayload]) -> None:
+        # Every tool is registered with its schema so bad calls fail before reaching the bridge.
+        registry.register(name, handler, schema=TOOL_SCHEMAS.get(name))
+
+    add(
         "core.ping",
         lambda request: success_response(
             request.request_id,
@@ -21,7 +31,7 @@ def register_tools(registry: "ToolRegistry") -> None:
         ),
     )
 
-    registry.register(
+    add(
         "blender.health",
         lambda request: registry.response_from_bridge(bridge.health(), request.request_id),
     )
@@ -36,16 +46,78 @@ def register_tools(registry: "ToolRegistry") -> None:
 
         return handler
 
-    registry.register("scene.snapshot", call("scene.snapshot"))
-    registry.register("scenegraph.search", call("scenegraph.search"))
-    registry.register("scenegraph.get", call("scenegraph.get"))
-    registry.register("object.create_cube", call("object.create_cube"))
-    registry.register("object.move_object", call("object.move_object"))
-    registry.register("object.transform", call("object.transform"))
-    registry.register("object.delete", call("object.delete"))
-    registry.register("material.assign_simple", call("material.assign_simple"))
+    def upload(method: str) -> Callable[["ToolRequest"], ResponsePayload]:
+        def handler(request: "ToolRequest") -> ResponsePayload:
+            params = dict(request.params)
+            sections = []
+            for name, dtype, components in UPLOAD_SECTIONS:
+                value = params.get(name)
+                if not isinstance(value, str):
+                    continue
+                try:
+                    sections.append((name, dtype, components, base64.b64decode(value, validate=True)))
+                except (binascii.Error, ValueError):
+                    return error_response(request.request_id, "invalid_params", f"{name} is not valid base64")
+                del params[name]
+            try:
+                raw = bridge.call_rpc_frame(method, params, sections) if sections else bridge.call_rpc(method, params)
+            except ValueError as exc:
+                return error_response(request.request_id, "invalid_params", str(exc))
+            except Exception as exc:
+                return error_response(request.request_id, "bridge_unreachable", str(exc))
+            return registry.response_from_bridge(raw, request.request_id)
+
+        return handler
+
+    add("scene.snapshot", call("scene.snapshot"))
+    add("scenegraph.search", call("scenegraph.search"))
+    add("scenegraph.get", call("scenegraph.get"))
+    add("scenegraph.query_region", call("scenegraph.query_region"))
+    add("scenegraph.nearest", call("scenegraph.nearest"))
+    add("scenegraph.within_radius", call("scenegraph.within_radius"))
+    add("scenegraph.get_mesh", call("scenegraph.get_mesh"))
+    add("object.create_cube", call("object.create_cube"))
+    add("object.move_object", call("object.move_object"))
+    add("object.transform", call("object.transform"))
+    add("object.transform_many", call("object.transform_many"))
+    add("object.delete", call("object.delete"))
+    add("object.delete_many", call("object.delete_many"))
+    add("material.assign_simple", call("material.assign_simple"))
+    add("mesh.from_buffers", upload("mesh.from_buffers"))
+    add("scene.purge_orphans", call("scene.purge_orphans"))
+    add("jobs.submit", call("jobs.submit"))
+    add("jobs.status", call("jobs.status"))
+    add("jobs.result", call("jobs.result"))
+    add("jobs.cancel", call("jobs.cancel"))
+
+    def end_session(request: "ToolRequest") -> ResponsePayload:
+        # Frees the session's pool worker for queued sessions; a single bridge has nothing to free.
+        release = getattr(bridge, "end_session", None)
+        return success_response(request.request_id, {"released": bool(release and release())})
+
+    def pool_stats(request: "ToolRequest") -> ResponsePayload:
+        pool = getattr(bridge, "pool", None)
+        if pool is None:
+            return error_response(request.request_id, "pool_disabled", "server is not running a worker pool")
+        return success_response(request.request_id, pool.stats())
+
+    add("session.end", end_session)
+    add("pool.stats", pool_stats)
+
+    def describe(request: "ToolRequest") -> ResponsePayload:
+        name = request.params.get("name")
+        if name is not None:
+            if name not in TOOL_SCHEMAS:
+                return error_response(request.request_id, "tool_not_found", f"Method '{name}' is not registered")
+            return success_response(request.request_id, {"tools": {name: public_schema(TOOL_SCHEMAS[name])}})
+        return success_response(
+            request.request_id,
+            {"tools": {tool: public_schema(TOOL_SCHEMAS[tool]) for tool in registry.tool_names() if tool in TOOL_SCHEMAS}},
+        )
+
+    add("tools.describe", describe)
 
-    registry.register(
+    add(
         "diagnostics.tail",
         lambda request: success_response(request.request_id, state.diagnostics_payload()),
     )
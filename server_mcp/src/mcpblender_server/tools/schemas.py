@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+"""
+Parameter schemas for the registered tools.
+
+Schemas use a small JSON Schema subset (type, enum, minimum/maximum,
+exclusiveMinimum, minLength, minItems/maxItems, items, properties, required,
+anyOf). compile_schema turns one into a closure tree once, at registration, so
+ToolRegistry.dispatch can reject malformed calls before they cost a bridge round
+trip. The same schemas are published through `tools.describe` and drive the
+FastMCP tool signatures in mcp_stdio.
+"""
+
+import inspect
+from typing import Any, Callable, Dict, List, Optional
+
+Schema = Dict[str, Any]
+Errors = List[Dict[str, str]]
+Check = Callable[[Any, str, Errors], None]
+Validator = Callable[[Dict[str, Any]], Errors]
+
+NUMBER = {"type": "number"}
+VEC3 = {"type": "array", "items": NUMBER, "minItems": 3, "maxItems": 3}
+COLOR = {"type": "array", "items": NUMBER, "minItems": 3, "maxItems": 4}
+NAMES = {"type": "array", "items": {"type": "string"}}
+FIELDS = {"type": ["string", "array"], "items": {"type": "string"}}
+CURSOR = {"type": ["string", "null"]}
+BUFFER = {"type": ["string", "array"]}
+ID = {"type": "string", "minLength": 1}
+
+
+def _tool(description: str, properties: Optional[Schema] = None, required: Optional[List[str]] = None, **extra: Any) -> Schema:
+    schema: Schema = {"description": description, "type": "object", "properties": properties or {}}
+    if required:
+        schema["required"] = required
+    schema.update(extra)
+    return schema
+
+
+def one_of_required(*names: str) -> List[Schema]:
+    return [{"required": [name]} for name in names]
+
+
+TOOL_SCHEMAS: Dict[str, Schema] = {
+    "core.ping": _tool("Local heartbeat.", local=True),
+    "blender.health": _tool("Probe the Blender bridge for readiness and version.", local=True),
+    "scene.snapshot": _tool(
+        "Capture a canonical scene snapshot, one page of objects in name order.",
+        {
+            "fields": FIELDS,
+            "page_size": {"type": "integer", "minimum": 1},
+            "limit": {"type": "integer", "minimum": 1},
+            "cursor": CURSOR,
+            "consistency": {"enum": ["strict", "relaxed"]},
+            "level": {"enum": ["summary", "light", "full"]},
+            "min_level": {"enum": ["summary", "light", "full"]},
+            "budget_ms": {"type": "number", "minimum": 1},
+        },
+    ),
+    "scenegraph.search": _tool(
+        "Search objects by name with optional type/collection/parent filters.",
+        {
+            "query": {"type": "string"},
+            "match": {"enum": ["substring", "prefix"]},
+            "type": {"type": "string"},
+            "collection": {"type": "string"},
+            "parent": {"type": "string"},
+            "limit": {"type": "integer", "minimum": 1},
+            "cursor": CURSOR,
+            "fields": FIELDS,
+        },
+    ),
+    "scenegraph.get": _tool(
+        "Resolve one object by id or name.",
+        {"id": ID, "name": ID, "fields": FIELDS},
+        anyOf=one_of_required("id", "name"),
+    ),
+    "scenegraph.query_region": _tool(
+        "Objects whose world bounding box overlaps an axis-aligned region.",
+        {"min": VEC3, "max": VEC3, "contained": {"type": "boolean"}, "limit": {"type": "integer", "minimum": 1}},
+        ["min", "max"],
+    ),
+    "scenegraph.nearest": _tool(
+        "The k objects closest to a point.",
+        {
+            "point": VEC3,
+            "k": {"type": "integer", "minimum": 1},
+            "max_distance": {"type": "number", "minimum": 0},
+            "limit": {"type": "integer", "minimum": 1},
+        },
+        ["point"],
+    ),
+    "scenegraph.within_radius": _tool(
+        "Objects within a radius of a point, nearest first.",
+        {"point": VEC3, "radius": {"type": "number", "minimum": 0}, "limit": {"type": "integer", "minimum": 1}},
+        ["point"],
+    ),
+    "scenegraph.get_mesh": _tool(
+        "Mesh geometry of one object as a binary frame.",
+        {
+            "id": ID,
+            "name": ID,
+            "evaluated": {"type": "boolean"},
+            "normals": {"type": "boolean"},
+            "uvs": {"type": "boolean"},
+            "quantize": {"enum": [None, False, 0, 8, 16]},
+        },
+        anyOf=one_of_required("id", "name"),
+    ),
+    "object.create_cube": _tool(
+        "Create a cube.",
+        {
+            "name": {"type": "string"},
+            "size": {"type": "number", "exclusiveMinimum": 0},
+            "location": VEC3,
+            "rotation": VEC3,
+            "scale": VEC3,
+            "share_mesh": {"type": "boolean"},
+        },
+    ),
+    "object.move_object": _tool(
+        "Move an object by id or name, by delta or to a location.",
+        {"id": ID, "name": ID, "delta": VEC3, "location": VEC3},
+        anyOf=one_of_required("id", "name"),
+    ),
+    "object.transform": _tool(
+        "Set location/rotation/scale of an object.",
+        {"id": ID, "name": ID, "location": VEC3, "rotation": VEC3, "scale": VEC3, "space": {"enum": ["world", "local"]}},
+        anyOf=one_of_required("id", "name"),
+    ),
+    "object.transform_many": _tool(
+        "Transform many objects in one call from parallel arrays.",
+        {
+            "ids": NAMES,
+            "names": NAMES,
+            "locations": {"type": "array"},
+            "rotations": {"type": "array"},
+            "scales": {"type": "array"},
+            "space": {"enum": ["world", "local"]},
+            "mode": {"enum": ["absolute", "delta"]},
+            "result": {"enum": ["count", "objects"]},
+        },
+        anyOf=one_of_required("ids", "names"),
+    ),
+    "object.delete": _tool(
+        "Delete one object by name.",
+        {"name": ID, "object": ID},
+        anyOf=one_of_required("name", "object"),
+    ),
+    "object.delete_many": _tool(
+        "Delete objects by ids/names or by collection, type and name prefix filters.",
+        {
+            "ids": NAMES,
+            "names": NAMES,
+            "collection": {"type": "string"},
+            "type": {"type": "string"},
+            "name_prefix": {"type": "string"},
+            "all": {"type": "boolean"},
+            "purge_orphans": {"type": "boolean"},
+            "result": {"enum": ["count", "names"]},
+        },
+        anyOf=one_of_required("ids", "names", "collection", "type", "name_prefix", "all"),
+    ),
+    "material.assign_simple": _tool(
+        "Assign a simple principled material to an object.",
+        {
+            "object": ID,
+            "name": ID,
+            "material_name": {"type": "string"},
+            "color": COLOR,
+            "base_color": COLOR,
+            "metallic": {"type": "number", "minimum": 0, "maximum": 1},
+            "roughness": {"type": "number", "minimum": 0, "maximum": 1},
+        },
+        anyOf=one_of_required("object", "name"),
+    ),
+    "mesh.from_buffers": _tool(
+        "Create a mesh object from packed vertex/index buffers (base64 little-endian or lists).",
+        {
+            "name": {"type": "string"},
+            "positions": BUFFER,
+            "indices": BUFFER,
+            "face_sizes": BUFFER,
+            "face_size": {"type": "integer", "minimum": 3},
+            "uvs": BUFFER,
+            "location": VEC3,
+        },
+        ["positions"],
+    ),
+    "scene.purge_orphans": _tool(
+        "Remove datablocks without users.",
+        {"types": {"type": ["string", "array"], "items": {"type": "string"}}, "dry_run": {"type": "boolean"}},
+    ),
+    "jobs.submit": _tool(
+        "Run a bridge method as an asynchronous job.",
+        {"method": ID, "params": {"type": "object"}, "chunk_size": {"type": "integer", "minimum": 1}},
+        ["method"],
+    ),
+    "jobs.status": _tool("Status of a job.", {"job_id": ID}, ["job_id"]),
+    "jobs.result": _tool("Result envelope of a finished job.", {"job_id": ID}, ["job_id"]),
+    "jobs.cancel": _tool("Cancel a job at its next chunk boundary.", {"job_id": ID}, ["job_id"]),
+    "session.end": _tool("Release this session's worker in a worker pool.", local=True),
+    "pool.stats": _tool("Worker pool state.", local=True),
+    "tools.describe": _tool("Parameter schemas of the registered tools.", {"name": {"type": "string"}}, local=True),
+    "diagnostics.tail": _tool("Recent MCP server logs, last error and request ids.", local=True),
+}
+
+# ---- compilation -----------------------------------------------------------
+
+_TYPE_TESTS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, (list, tuple)),
+    "object": lambda v: isinstance(v, dict),
+    "null": lambda v: v is None,
+}
+
+
+def _error(errors: Errors, path: str, message: str) -> None:
+    errors.append({"path": path or "params", "message": message})
+
+
+def _join(path: str, name: str) -> str:
+    return f"{path}.{name}" if path else name
+
+
+def _compile(schema: Schema) -> Check:
+    checks: List[Check] = []
+
+    names = schema.get("type")
+    if names is not None:
+        names = (names,) if isinstance(names, str) else tuple(names)
+        tests = tuple(_TYPE_TESTS[name] for name in names)
+        expected = " or ".join(names)
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+
+        def check_enum(value: Any, path: str, errors: Errors) -> None:
+            if not any(value == option and type(value) is type(option) for option in allowed):
+                _error(errors, path, f"must be one of {allowed}")
+
+        checks.append(check_enum)
+
+    bounds = [(key, schema[key]) for key in ("minimum", "maximum", "exclusiveMinimum") if key in schema]
+    if bounds:
+
+        def check_bounds(value: Any, path: str, errors: Errors) -> None:
+            if not _TYPE_TESTS["number"](value):
+                return
+            for key, limit in bounds:
+                if (key == "minimum" and value < limit) or (key == "maximum" and value > limit):
+                    _error(errors, path, f"must be {'>=' if key == 'minimum' else '<='} {limit}")
+                elif key == "exclusiveMinimum" and value <= limit:
+                    _error(errors, path, f"must be > {limit}")
+
+        checks.append(check_bounds)
+
+    if "minLength" in schema:
+        min_length = schema["minLength"]
+
+        def check_length(value: Any, path: str, errors: Errors) -> None:
+            if isinstance(value, str) and len(value) < min_length:
+                _error(errors, path, "must not be empty" if min_length == 1 else f"needs at least {min_length} characters")
+
+        checks.append(check_length)
+
+    if "minItems" in schema or "maxItems" in schema or "items" in schema:
+        lo, hi = schema.get("minItems"), schema.get("maxItems")
+        item_check = _compile(schema["items"]) if "items" in schema else None
+
+        def check_items(value: Any, path: str, errors: Errors) -> None:
+            if not isinstance(value, (list, tuple)):
+                return
+            if lo is not None and hi is not None and lo == hi and len(value) != lo:
+                _error(errors, path, f"expected {lo} items, got {len(value)}")
+            elif lo is not None and len(value) < lo:
+                _error(errors, path, f"expected at least {lo} items, got {len(value)}")
+            elif hi is not None and len(value) > hi:
+                _error(errors, path, f"expected at most {hi} items, got {len(value)}")
+            if item_check is not None:
+                for i, item in enumerate(value):
+                    item_check(item, f"{path}[{i}]", errors)
+
+        checks.append(check_items)
+
+    if "properties" in schema or "required" in schema:
+        properties = {name: _compile(sub) for name, sub in schema.get("properties", {}).items()}
+        required = tuple(schema.get("required", ()))
+
+        def check_object(value: Any, path: str, errors: Errors) -> None:
+            if not isinstance(value, dict):
+                return
+            for name in required:
+                if value.get(name) is None:
+                    _error(errors, _join(path, name), "is required")
+            for name, check in properties.items():
+                if name in value and value[name] is not None:
+                    check(value[name], _join(path, name), errors)
+
+        checks.append(check_object)
+
+    if "anyOf" in schema:
+        options = [_compile(option) for option in schema["anyOf"]]
+        alternatives = [option.get("required", []) for option in schema["anyOf"]]
+        if all(len(names_) == 1 and set(option) == {"required"} for names_, option in zip(alternatives, schema["anyOf"])):
+            message = "one of " + ", ".join(names_[0] for names_ in alternatives) + " is required"
+        else:
+            message = "does not match any allowed form"
+
+        def check_any(value: Any, path: str, errors: Errors) -> None:
+            for option in options:
+                trial: Errors = []
+                option(value, path, trial)
+                if not trial:
+                    return
+            _error(errors, path, message)
+
+        checks.append(check_any)
+
+    def check(value: Any, path: str, errors: Errors) -> None:
+        if names is not None and not any(test(value) for test in tests):
+            _error(errors, path, f"expected {expected}")
+            return
+        for sub in checks:
+            sub(value, path, errors)
+
+    return check
+
+
+def compile_schema(schema: Schema) -> Validator:
+    check = _compile(schema)
+
+    def validate(params: Dict[str, Any]) -> Errors:
+        errors: Errors = []
+        check(params, "", errors)
+        return errors
+
+    return validate
+
+
+def public_schema(schema: Schema) -> Schema:
+    """The schema as published to clients (internal markers stripped)."""
+    return {key: value for key, value in schema.items() if key != "local"}
+
+
+# ---- FastMCP signatures ------------------------------------------------------
+
+_ANNOTATIONS = {"string": str, "number": float, "integer": int, "boolean": bool, "array": list, "object": dict}
+
+
+def _annotation(schema: Schema) -> Any:
+    names = schema.get("type")
+    if isinstance(names, str):
+        return _ANNOTATIONS.get(names, Any)
+    return Any
+
+
+def tool_signature(schema: Schema) -> inspect.Signature:
+    required = set(schema.get("required", ()))
+    params = []
+    for name, sub in schema.get("properties", {}).items():
+        annotation = _annotation(sub)
+        if name in required:
+            params.append(inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, annotation=annotation))
+        else:
+            params.append(
+                inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Optional[annotation])
+            )
+    return inspect.Signature(params, return_annotation=Any)
+
+
+def make_tool_function(name: str, schema: Schema, call: Callable[[str, Dict[str, Any]], Any]) -> Callable[..., Any]:
+    """A function whose signature mirrors `schema`; unset (None) arguments are not forwarded."""
+
+    def tool(**kwargs: Any) -> Any:
+        return call(name, {key: value for key, value in kwargs.items() if value is not None})
+
+    tool.__name__ = name.replace(".", "_")
+    tool.__qualname__ = tool.__name__
+    tool.__doc__ = schema.get("description", "")
+    tool.__signature__ = tool_signature(schema)  # type: ignore[attr-defined]
+    return tool
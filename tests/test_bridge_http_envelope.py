@@ -1,4 +1,5 @@
 import json
+import threading
 
 import pytest
 
@@ -39,3 +40,24 @@ def test_health_payload_contains_fields():
     assert "uptime_seconds" in payload
     assert "blender_version" in payload
     assert "ready" in payload
+
+
+def test_mutations_are_noted_under_the_lock(monkeypatch):
+    held = []
+
+    def probe():
+        acquired = server.BPY_LOCK.acquire(blocking=False)
+        if acquired:
+            server.BPY_LOCK.release()
+        held.append(not acquired)
+
+    def note_mutation(deleted=0):
+        thread = threading.Thread(target=probe)
+        thread.start()
+        thread.join(5)
+
+    monkeypatch.setattr(server, "_handler_map", lambda params: {"object.delete": lambda: {"ok": True, "data": {}}})
+    monkeypatch.setattr(server.ORPHAN_GC, "note_mutation", note_mutation)
+
+    assert server.dispatch_rpc("object.delete", {"name": "Cube"})["ok"]
+    assert held == [True]
@@ -0,0 +1,158 @@
+import http.client
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from mcpblender_addon import bridge_limits
+from mcpblender_addon.bridge_http import events, server
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def bridge():
+    started = []
+
+    def make(**limits):
+        instance = server.BridgeServer(host="127.0.0.1", port=0, **limits)
+        instance.start()
+        started.append(instance)
+        return instance
+
+    yield make
+    for instance in started:
+        instance.stop()
+
+
+def _connect(instance):
+    host, port = instance._server.server_address[:2]
+    return http.client.HTTPConnection(host, port, timeout=5)
+
+
+def _get_health(conn):
+    conn.request("GET", "/health")
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def _raw_request(instance, body=b""):
+    sock = socket.create_connection(instance._server.server_address[:2], timeout=5)
+    sock.sendall(b"GET /health HTTP/1.1\r\nHost: x\r\n\r\n" + body)
+    return sock
+
+
+def _read_reply(sock):
+    data = b""
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    head, _, body = data.partition(b"\r\n\r\n")
+    return head.decode("latin-1"), body
+
+
+def test_idle_keep_alive_connections_do_not_hold_workers(bridge):
+    instance = bridge(pool_size=1)
+    first, second = _connect(instance), _connect(instance)
+    try:
+        assert _get_health(first)[0] == 200  # stays open, parked
+        status, payload = _get_health(second)  # the single worker is free again
+        assert status == 200
+        assert payload["pool"]["pool_size"] == 1
+        assert _wait_for(lambda: instance._server.pool_stats()["parked"] == 2)
+        assert _get_health(first)[0] == 200  # a parked connection resumes
+    finally:
+        first.close()
+        second.close()
+
+
+def test_idle_connections_are_reaped(bridge):
+    instance = bridge(idle_timeout=0.2)
+    sock = _raw_request(instance)
+    head, _ = _read_reply(sock)  # answered, then closed by the bridge once idle
+    sock.close()
+    assert head.startswith("HTTP/1.1 200")
+    assert instance._server.pool_stats()["reaped"] == 1
+    assert _wait_for(lambda: instance._server.pool_stats()["open"] == 0)
+
+
+def test_connection_limit_answers_503_with_retry_after(bridge):
+    instance = bridge(max_connections=1, retry_after=7)
+    held = _connect(instance)
+    try:
+        assert _get_health(held)[0] == 200
+        sock = _raw_request(instance)
+        head, body = _read_reply(sock)
+        sock.close()
+    finally:
+        held.close()
+
+    assert head.startswith("HTTP/1.1 503")
+    assert "Retry-After: 7" in head
+    assert json.loads(body)["error"]["code"] == "too_many_connections"
+    assert instance._server.pool_stats()["rejected"]["503"] == 1
+
+
+def test_full_queue_answers_429_and_queued_work_still_runs(bridge, monkeypatch):
+    release = threading.Event()
+    table = {"slow": lambda: release.wait(5) and {"ok": True, "data": {}}}
+    monkeypatch.setattr(server, "_handler_map", lambda params: table)
+    instance = bridge(pool_size=1, queue_size=1)
+    stats = instance._server.pool_stats
+
+    slow = _connect(instance)
+    slow.request("POST", "/rpc", body=json.dumps({"method": "slow", "params": {}}))
+    assert _wait_for(lambda: stats()["busy"] == 1)
+    waiting = _raw_request(instance)
+    assert _wait_for(lambda: stats()["queued"] == 1)
+    refused = _raw_request(instance)
+    head, body = _read_reply(refused)
+    refused.close()
+    release.set()
+
+    assert head.startswith("HTTP/1.1 429")
+    assert "Retry-After: 1" in head
+    assert json.loads(body)["error"]["code"] == "server_busy"
+    assert slow.getresponse().status == 200
+    assert waiting.recv(65536).startswith(b"HTTP/1.1 200")
+    slow.close()
+    waiting.close()
+
+
+def test_event_streams_run_outside_the_pool(bridge, monkeypatch):
+    monkeypatch.setattr(server, "EVENTS", events.EventBus(coalesce_seconds=0.0))
+    monkeypatch.setattr(server, "EVENTS_KEEPALIVE_SECONDS", 0.05)
+    instance = bridge(pool_size=1)
+    stream = _connect(instance)
+    stream.request("GET", "/events")
+    assert stream.getresponse().status == 200
+    other = _connect(instance)
+    try:
+        assert _get_health(other)[0] == 200
+        assert _wait_for(lambda: instance._server.pool_stats()["busy"] == 0)
+    finally:
+        other.close()
+        stream.close()
+
+
+def test_limits_validate_and_come_from_the_environment():
+    with pytest.raises(ValueError):
+        server.BridgeServer(host="127.0.0.1", port=0, pool_size=0)
+    assert bridge_limits({}) == {}
+    assert bridge_limits({"MCPBLENDER_BRIDGE_POOL_SIZE": "4", "MCPBLENDER_BRIDGE_IDLE_TIMEOUT": "2.5"}) == {
+        "pool_size": 4,
+        "idle_timeout": 2.5,
+    }
+    args = server.parse_args(["--pool-size", "3", "--max-connections", "10"])
+    assert (args.pool_size, args.max_connections, args.queue_size) == (3, 10, None)
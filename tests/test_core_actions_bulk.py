@@ -0,0 +1,255 @@
+from array import array
+from types import SimpleNamespace
+
+import pytest
+
+import mcpblender_addon.actions.core_actions as core
+import mcpblender_addon.actions.orphans as orphans
+from mcpblender_addon.actions.deadline import DeadlineExceeded, deadline_scope
+
+
+class FakeObject:
+    def __init__(self, name, location=(0.0, 0.0, 0.0)):
+        self.name = name
+        self.name_full = name
+        self.parent = None
+        self.location = tuple(location)
+        self.rotation_euler = (0.0, 0.0, 0.0)
+        self.scale = (1.0, 1.0, 1.0)
+        self.tags = 0
+
+    def as_pointer(self):
+        return id(self)
+
+    def update_tag(self, refresh=None):
+        self.tags += 1
+
+
+class FakeObjects:
+    def __init__(self, objs):
+        self._objs = list(objs)
+        self.foreach_calls = 0
+
+    def __iter__(self):
+        return iter(self._objs)
+
+    def __len__(self):
+        return len(self._objs)
+
+    def get(self, name):
+        return next((o for o in self._objs if o.name == name), None)
+
+    def keys(self):
+        return [o.name for o in self._objs]
+
+    def foreach_get(self, attr, buf):
+        for i, obj in enumerate(self._objs):
+            buf[i * 3 : i * 3 + 3] = type(buf)("f", getattr(obj, attr))
+
+    def foreach_set(self, attr, buf):
+        self.foreach_calls += 1
+        for i, obj in enumerate(self._objs):
+            setattr(obj, attr, tuple(buf[i * 3 : i * 3 + 3]))
+
+
+@pytest.fixture
+def scene(monkeypatch):
+    objs = FakeObjects([FakeObject(f"Obj{i}", (float(i), 0.0, 0.0)) for i in range(8)])
+    monkeypatch.setattr(core, "_require_bpy", lambda: None)
+    monkeypatch.setattr(core, "_update_view_layer", lambda: None)
+    monkeypatch.setattr(core, "bpy", SimpleNamespace(data=SimpleNamespace(objects=objs)))
+    return objs
+
+
+def test_bulk_absolute_uses_foreach(scene):
+    ids = ["Obj0", "Obj1", "Obj2", "Obj3"]
+    result = core.transform_many({"ids": ids, "locations": [1.0, 2.0, 3.0] * 4, "space": "local"})
+
+    assert result == {"count": 4, "missing": []}
+    assert scene.foreach_calls == 1
+    assert scene.get("Obj2").location == (1.0, 2.0, 3.0)
+    assert scene.get("Obj2").tags == 1
+    assert scene.get("Obj5").location == (5.0, 0.0, 0.0)
+
+
+def test_small_batch_delta_writes_per_object(scene):
+    result = core.transform_many(
+        {"ids": ["Obj7"], "locations": [[1.0, 1.0, 1.0]], "scales": [[0.5, 0.0, 0.0]], "mode": "delta", "result": "objects"}
+    )
+
+    assert scene.foreach_calls == 0
+    assert result["objects"][0]["location"] == [8.0, 1.0, 1.0]
+    assert result["objects"][0]["scale"] == [1.5, 1.0, 1.0]
+
+
+def test_packed_rows_are_read_in_place(scene):
+    locations = array("d", [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    rows = core._vector_rows(locations, 2, "locations")
+    assert len(rows) == 2 and rows[1] == (4.0, 5.0, 6.0)
+
+    core.transform_many({"ids": ["Obj6", "Obj7"], "locations": locations, "mode": "delta"})
+    assert scene.get("Obj7").location == (11.0, 5.0, 6.0)
+    with pytest.raises(ValueError):
+        core._vector_rows(array("d", [1.0, 2.0]), 1, "locations")
+
+
+def test_missing_ids_are_reported(scene):
+    result = core.transform_many({"ids": ["Obj0", "Nope"], "rotations": [[0, 0, 1], [0, 0, 2]]})
+    assert result["count"] == 1
+    assert result["missing"] == ["Nope"]
+
+
+def test_transform_many_past_deadline_writes_nothing(scene):
+    with deadline_scope(0.0), pytest.raises(DeadlineExceeded):
+        core.transform_many({"ids": ["Obj0"], "locations": [[9.0, 9.0, 9.0]]})
+    assert scene.get("Obj0").location == (0.0, 0.0, 0.0)
+
+
+def test_world_rows_apply_parents_before_children(scene, monkeypatch):
+    events = []
+    parent, child, grandchild = scene.get("Obj1"), scene.get("Obj2"), scene.get("Obj3")
+    child.parent, grandchild.parent = parent, child
+    monkeypatch.setattr(core, "_update_view_layer", lambda: events.append("update"))
+    monkeypatch.setattr(core, "_apply_world_parented", lambda obj, columns, row, delta: events.append(obj.name))
+    monkeypatch.setattr(core, "_apply_per_object", lambda targets, columns, delta: events.extend(o.name for o, _ in targets))
+
+    core.transform_many({"ids": ["Obj3", "Obj2", "Obj1"], "locations": [[1.0, 0.0, 0.0]] * 3})
+
+    assert events == ["Obj1", "update", "Obj2", "update", "Obj3", "update"]
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        {"ids": ["Obj0"]},
+        {"ids": ["Obj0", "Obj1"], "locations": [[0, 0, 0]]},
+        {"ids": ["Obj0"], "locations": [[0, 0]]},
+        {"ids": ["Obj0"], "locations": [[0, 0, 0]], "mode": "relative"},
+    ],
+)
+def test_invalid_batches_rejected(scene, args):
+    with pytest.raises(ValueError):
+        core.transform_many(args)
+
+
+class FakeBlock:
+    def __init__(self, id_type, materials=()):
+        self.id_type = id_type
+        self.users = 1
+        self.use_fake_user = False
+        self.materials = list(materials)
+
+    def as_pointer(self):
+        return id(self)
+
+
+class FakeData:
+    def __init__(self, objs):
+        self.objects = objs
+        self.collections = {}
+        self.removed = []
+
+    def batch_remove(self, ids):
+        self.removed.append(list(ids))
+        for block in ids:
+            if isinstance(block, FakeObject):
+                self.objects._objs.remove(block)
+                if block.data is not None:
+                    block.data.users -= 1
+            elif block.id_type == "MESH":
+                for mat in block.materials:
+                    mat.users -= 1
+
+
+@pytest.fixture
+def deletable(monkeypatch):
+    shared_mat = FakeBlock("MATERIAL")
+    shared_mat.users = 3
+    objs = []
+    for i, obj_type in enumerate(["MESH", "MESH", "EMPTY", "MESH"]):
+        obj = FakeObject(("Tmp_" if i < 3 else "Keep_") + str(i))
+        obj.type = obj_type
+        obj.data = FakeBlock("MESH", [shared_mat]) if obj_type == "MESH" else None
+        obj.material_slots = []
+        objs.append(obj)
+    data = FakeData(FakeObjects(objs))
+    monkeypatch.setattr(core, "_require_bpy", lambda: None)
+    monkeypatch.setattr(core, "_update_view_layer", lambda: None)
+    fake_bpy = SimpleNamespace(data=data, context=SimpleNamespace(scene=None))
+    monkeypatch.setattr(core, "bpy", fake_bpy)
+    monkeypatch.setattr(orphans, "bpy", fake_bpy)
+    return data, shared_mat
+
+
+def test_delete_many_by_filter_single_batch(deletable):
+    data, _ = deletable
+    result = core.delete_many({"name_prefix": "Tmp_", "type": "mesh", "result": "names"})
+
+    assert result["deleted"] == 2
+    assert result["names"] == ["Tmp_0", "Tmp_1"]
+    assert len(data.removed) == 1
+    assert [o.name for o in data.objects] == ["Tmp_2", "Keep_3"]
+
+
+def test_delete_many_purges_orphaned_data(deletable):
+    data, shared_mat = deletable
+    result = core.delete_many({"name_prefix": "Tmp_", "purge_orphans": True})
+
+    assert result["freed"] == {"MESH": 2}
+    assert shared_mat.users == 1
+
+    result = core.delete_many({"ids": ["Keep_3", "Ghost"], "purge_orphans": True})
+    assert result["missing"] == ["Ghost"]
+    assert result["freed"] == {"MESH": 1, "MATERIAL": 1}
+
+
+def test_delete_many_requires_a_filter(deletable):
+    with pytest.raises(ValueError):
+        core.delete_many({})
+
+
+def test_delete_many_in_chunks_reports_progress(deletable):
+    data, _ = deletable
+    steps = core.iter_delete_many({"all": True, "result": "names"}, chunk_size=3)
+
+    assert next(steps) == (3, 4)
+    assert len(data.objects) == 1
+    result = core.run_to_completion(steps)
+    assert result["deleted"] == 4
+    assert result["names"] == ["Tmp_0", "Tmp_1", "Tmp_2", "Keep_3"]
+    assert len(data.removed) == 2
+
+
+def test_delete_many_stops_between_batches_at_deadline(deletable, monkeypatch):
+    data, _ = deletable
+    monkeypatch.setattr(core, "DEADLINE_DELETE_CHUNK", 3)
+    with deadline_scope(0.0):
+        result = core.delete_many({"all": True})
+
+    assert result["deleted"] == 3  # the first batch always runs
+    assert result["truncated"] and result["remaining"] == 1
+    assert len(data.removed) == 1 and len(data.objects) == 1
+
+
+def test_purge_orphans_steps_one_collection_at_a_time(monkeypatch):
+    material = FakeBlock("MATERIAL")
+    orphan, live = FakeBlock("MESH", [material]), FakeBlock("MESH")
+    orphan.users = 0
+    data = SimpleNamespace(meshes=[orphan, live], materials=[material], removed=[])
+
+    def batch_remove(ids):
+        data.removed.append(list(ids))
+        for block in ids:
+            for mat in block.materials:
+                mat.users -= 1
+
+    data.batch_remove = batch_remove
+    monkeypatch.setattr(orphans, "HAS_BPY", True)
+    monkeypatch.setattr(orphans, "bpy", SimpleNamespace(data=data))
+
+    steps = orphans.iter_purge_orphans({"types": ["materials", "meshes"]})
+    assert next(steps) == (1, 2)
+    assert data.removed == [[orphan]]
+    result = core.run_to_completion(steps)
+    assert result["freed"] == {"MESH": 1, "MATERIAL": 1}
+    assert data.removed == [[orphan], [material]]
@@ -1,5 +1,7 @@
 from types import SimpleNamespace
 
+import pytest
+
 import mcpblender_addon.actions.core_actions as core
 
 
@@ -25,12 +27,44 @@ class FakeMatrix:
     def to_scale(self):
         return self._scale
 
+    def copy(self):
+        return FakeMatrix(self.translation.copy(), self.rotation, self._scale)
+
+    def __matmul__(self, other):  # only pure translations are composed here
+        moved = FakeVector([a + b for a, b in zip(self.translation, other.translation)])
+        return FakeMatrix(moved, other.rotation, other.to_scale())
+
 
 class FakeMatrixBuilder:
     @staticmethod
     def LocRotScale(translation, rotation, scale):
         return FakeMatrix(translation=translation, rotation=rotation, scale=scale)
 
+    @staticmethod
+    def Translation(offset):
+        return FakeMatrix(translation=FakeVector(list(offset)))
+
+
+class ParentedObject:
+    """Child of a parent at `parent_offset`: matrix_world and location differ by that offset."""
+
+    name = "Child"
+    type = "EMPTY"
+
+    def __init__(self, location, parent_offset):
+        self.location = FakeVector(location)
+        self.parent_offset = parent_offset
+        self.rotation_euler = None
+        self.scale = FakeVector([1.0, 1.0, 1.0])
+
+    @property
+    def matrix_world(self):
+        return FakeMatrix(FakeVector([a + b for a, b in zip(self.location, self.parent_offset)]))
+
+    @matrix_world.setter
+    def matrix_world(self, matrix):
+        self.location = FakeVector([a - b for a, b in zip(matrix.translation, self.parent_offset)])
+
 
 def test_world_rotation_updates_matrix(monkeypatch):
     obj = SimpleNamespace(
@@ -55,3 +89,26 @@ def test_world_rotation_updates_matrix(monkeypatch):
     assert isinstance(obj.matrix_world, FakeMatrix)
     assert obj.matrix_world.rotation == rotation
     assert obj.rotation_euler == rotation
+
+
+@pytest.mark.parametrize(
+    "args, world",
+    [
+        ({"location": [5.0, 0.0, 0.0]}, [5.0, 0.0, 0.0]),
+        ({"delta": [1.0, 0.0, 0.0]}, [12.0, 2.0, 0.0]),
+    ],
+)
+def test_world_moves_of_parented_objects_keep_the_parent_offset(monkeypatch, args, world):
+    obj = ParentedObject([1.0, 2.0, 0.0], parent_offset=[10.0, 0.0, 0.0])
+    monkeypatch.setattr(core, "_require_bpy", lambda: None)
+    monkeypatch.setattr(core, "Vector", FakeVector)
+    monkeypatch.setattr(core, "Matrix", FakeMatrixBuilder)
+    monkeypatch.setattr(core, "_target_object", lambda args: obj)
+    monkeypatch.setattr(core, "track_moved", lambda objs: None)
+    monkeypatch.setattr(core, "_update_view_layer", lambda: None)
+    monkeypatch.setattr(core, "_object_payload", lambda obj: {})
+
+    core.transform_object({**args, "space": "world"})
+
+    assert list(obj.matrix_world.translation) == world
+    assert list(obj.location) == [world[0] - 10.0, world[1], world[2]]
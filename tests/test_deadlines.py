@@ -0,0 +1,127 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from mcpblender_addon.actions import deadline
+from mcpblender_addon.bridge_http import server
+from mcpblender_server.bridge_client import BridgeClient
+from mcpblender_server.bridge_client.http_bridge import DEADLINE_HEADER
+
+
+@pytest.fixture
+def handlers(monkeypatch):
+    calls = []
+
+    def slow():
+        calls.append(deadline.remaining())
+        while not deadline.expired():
+            time.sleep(0.005)
+        deadline.check_deadline("slow")
+
+    table = {
+        "quick": lambda: calls.append(deadline.remaining()) or {"ok": True, "data": {}},
+        "slow": slow,
+    }
+    monkeypatch.setattr(server, "_handler_map", lambda params: table)
+    return calls
+
+
+def test_scope_keeps_the_earliest_deadline():
+    assert deadline.remaining() is None and not deadline.expired()
+    with deadline.deadline_scope(time.monotonic() + 10):
+        with deadline.deadline_scope(time.monotonic() + 60):
+            assert deadline.remaining() <= 10
+        with deadline.deadline_scope(0.0):
+            with pytest.raises(deadline.DeadlineExceeded):
+                deadline.check_deadline()
+    assert deadline.current_deadline() is None
+
+
+def test_queued_request_is_dropped_when_its_deadline_passes(handlers):
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with server.BPY_LOCK:
+            held.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    held.wait(5)
+    try:
+        result = server.dispatch_rpc("quick", {}, deadline=time.monotonic() + 0.05)
+    finally:
+        release.set()
+        holder.join()
+
+    assert result["error"]["code"] == "timeout"
+    assert result["error"]["details"] == {"stage": "queued"}
+    assert handlers == []  # never ran
+
+
+def test_method_timeout_caps_the_client_deadline(handlers, monkeypatch):
+    monkeypatch.setitem(server.METHOD_TIMEOUTS, "slow", 0.1)
+    start = time.monotonic()
+    result = server.dispatch_rpc("slow", {}, deadline=time.monotonic() + 30)
+
+    assert result["error"]["details"] == {"stage": "running"}
+    assert time.monotonic() - start < 1.0
+    assert handlers[0] <= 0.1
+
+    assert server.dispatch_rpc("quick", {})["ok"]
+    assert handlers[-1] <= server.TIMEOUT_SECONDS
+
+
+def test_header_is_converted_to_a_local_deadline():
+    assert server.parse_deadline(None) is None
+    assert server.parse_deadline("soon") is None
+    local = server.parse_deadline(f"{time.time() + 2:.3f}")
+    assert 1.5 < local - time.monotonic() <= 2.01
+
+
+class _Recorder(BaseHTTPRequestHandler):
+    seen = []
+
+    def do_POST(self):  # noqa: N802
+        self.rfile.read(int(self.headers["Content-Length"]))
+        _Recorder.seen.append(float(self.headers[DEADLINE_HEADER]) - time.time())
+        body = json.dumps({"ok": False, "error": {"code": "timeout", "message": "deadline exceeded"}}).encode()
+        self.send_response(504)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_client_sends_per_method_deadlines_and_does_not_retry_errors():
+    _Recorder.seen = []
+    httpd = HTTPServer(("127.0.0.1", 0), _Recorder)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        client = BridgeClient(f"http://127.0.0.1:{httpd.server_port}", timeout=2.0, method_timeouts={"scene.snapshot": 7.0})
+        result = client.call_rpc("scene.snapshot", {})
+        client.call_rpc("object.create_cube", {})
+        client.call_rpc("object.create_cube", {}, timeout=0.5)
+    finally:
+        httpd.shutdown()
+
+    assert result["error"]["code"] == "timeout"  # the bridge's envelope, not bridge_unreachable
+    assert len(_Recorder.seen) == 3  # error replies are not retried
+    assert 6.5 < _Recorder.seen[0] <= 7.01
+    assert 1.5 < _Recorder.seen[1] <= 2.01
+    assert 0 < _Recorder.seen[2] <= 0.51
+
+
+def test_client_gives_up_at_the_deadline():
+    client = BridgeClient("http://127.0.0.1:9", timeout=0.2, retries=50)
+    start = time.monotonic()
+    result = client.call_rpc("object.create_cube", {})
+    assert result["error"]["code"] in ("bridge_unreachable", "timeout")
+    assert time.monotonic() - start < 1.0
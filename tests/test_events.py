@@ -0,0 +1,124 @@
+import threading
+
+import pytest
+
+import mcpblender_addon.index.scene_index as scene_index
+from mcpblender_addon.bridge_http import events, server
+from mcpblender_server.bridge_client import BridgeClient
+from mcpblender_server.bridge_client.events import parse_sse
+
+
+@pytest.fixture
+def bus():
+    now = [0.0]
+    return events.EventBus(capacity=4, coalesce_seconds=0.05, clock=lambda: now[0]), now
+
+
+def test_bursts_for_one_object_coalesce(bus):
+    bus, now = bus
+    for x in range(10):
+        bus.publish("object.transformed", "1", name="Cube", location=[x, 0, 0])
+    bus.publish("object.transformed", "2", name="Lamp")
+    assert bus.read(0, timeout=0) == ([], False)  # still inside the window
+
+    now[0] = 0.06
+    published, reset = bus.read(0, timeout=0)
+    assert not reset
+    assert [(e.id, e.key) for e in published] == [(1, "1"), (2, "2")]
+    assert published[0].data["location"] == [9, 0, 0]
+    assert bus.stats()["coalesced"] == 9
+
+
+def test_rename_chain_keeps_first_name(bus):
+    bus, _ = bus
+    bus.publish("object.renamed", "1", name="B", previous="A")
+    bus.publish("object.renamed", "1", name="C", previous="B")
+    bus.flush()
+    (event,), _ = bus.read(0, timeout=0)
+    assert event.data == {"name": "C", "previous": "A"}
+
+
+def test_resume_and_reset_after_overflow(bus):
+    bus, _ = bus
+    for key in "abcdef":
+        bus.publish("object.added", key)
+    bus.flush()
+
+    resumed, reset = bus.read(4, timeout=0)
+    assert [e.key for e in resumed] == ["e", "f"] and not reset
+    assert bus.read(1, timeout=0) == ([], True)  # ids 2 and 3 fell out of the ring
+    assert bus.read(99, timeout=0) == ([], True)  # id from an earlier bridge process
+
+
+def test_filters_match_objects_types_and_kind_prefixes():
+    moved = events.Event(1, "object.transformed", "7", {"name": "Cube", "type": "MESH"}, 0.0)
+    frame = events.Event(2, "frame.changed", None, {"frame": 3}, 0.0)
+
+    assert events.EventFilter(objects=["Cube"]).matches(moved)
+    assert not events.EventFilter(objects=["Lamp"]).matches(moved)
+    assert events.EventFilter(objects=["Lamp"]).matches(frame)
+    assert not events.EventFilter(types=["light"]).matches(moved)
+    assert events.EventFilter(kinds=["object"]).matches(moved)
+    assert not events.EventFilter(kinds=["object.added"]).matches(moved)
+    assert not events.EventFilter(kinds=["object"]).matches(frame)
+
+
+def test_index_tracking_reports_changes(monkeypatch):
+    seen = []
+    listener = lambda kind, key, info: seen.append((kind, info.get("name")))  # noqa: E731
+    monkeypatch.setattr(scene_index, "_LISTENERS", [])
+    scene_index.add_change_listener(listener)
+
+    class Obj:
+        name, type = "Cube", "MESH"
+
+        def as_pointer(self):
+            return 42
+
+    obj = Obj()
+    scene_index.track_added(obj)
+    scene_index.track_moved([obj])
+    scene_index.track_changed([obj], kind="material.changed")
+    scene_index.track_removed([scene_index.object_key(obj)])
+    assert seen == [
+        ("object.added", "Cube"),
+        ("object.transformed", "Cube"),
+        ("material.changed", "Cube"),
+        ("object.removed", "Cube"),
+    ]
+
+
+def test_sse_stream_delivers_filtered_events(monkeypatch):
+    bus = events.EventBus(coalesce_seconds=0.0)
+    monkeypatch.setattr(server, "EVENTS", bus)
+    monkeypatch.setattr(server, "EVENTS_KEEPALIVE_SECONDS", 0.05)
+    bridge = server.BridgeServer(host="127.0.0.1", port=0)
+    bridge.start()
+    try:
+        bus.publish("object.added", "1", name="Cube", type="MESH")
+        bus.publish("object.added", "2", name="Lamp", type="LIGHT")
+        received = []
+
+        def follow():
+            for event in BridgeClient(base_url=bridge.url).iter_events(since=0, types=["MESH"], read_timeout=5):
+                received.append(event)
+                if event["kind"] == "frame.changed":
+                    break
+
+        reader = threading.Thread(target=follow)
+        reader.start()
+        bus.publish("frame.changed", None, frame=12)
+        reader.join(timeout=5)
+    finally:
+        bridge.stop()
+
+    assert [(e["id"], e["kind"], e.get("name")) for e in received] == [
+        (1, "object.added", "Cube"),
+        (3, "frame.changed", None),
+    ]
+    assert received[1]["frame"] == 12
+
+
+def test_parse_sse_skips_comments_and_joins_data_lines():
+    lines = [b": keepalive\n", b"\n", b"id: 5\n", b"event: object.added\n", b'data: {"key":\n', b'data: "1"}\n', b"\n"]
+    assert list(parse_sse(lines)) == [{"key": "1", "kind": "object.added", "id": 5}]
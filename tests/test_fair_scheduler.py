@@ -0,0 +1,117 @@
+import threading
+import time
+
+import pytest
+
+from mcpblender_addon.bridge_http import server
+from mcpblender_addon.bridge_http.scheduler import FairScheduler, cost_class
+from mcpblender_server.bridge_client import BridgeClient
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def _run_queued(scheduler, clock, requests, holder="holder", cost=1.0):
+    """Queue `requests` ([(client, method)]) behind `holder`'s turn, then return the order they are served in."""
+    order = []
+    held = scheduler.acquire(holder, "scene.snapshot", 1000)
+    threads = []
+
+    def run(client, method):
+        turn = scheduler.acquire(client, method, 1000)
+        order.append(client)
+        clock.now += cost
+        scheduler.release(turn)
+
+    for queued, (client, method) in enumerate(requests, start=1):
+        thread = threading.Thread(target=run, args=(client, method))
+        thread.start()
+        threads.append(thread)
+        assert _wait_for(lambda: scheduler.stats()["queued"] == queued)  # fixes the arrival order
+    clock.now += cost
+    scheduler.release(held)
+    for thread in threads:
+        thread.join(5)
+    return order
+
+
+def test_a_snapshot_loop_does_not_starve_other_clients():
+    clock = _Clock()
+    requests = [("hog", "scene.snapshot")] * 3 + [("editor", "object.transform")]
+
+    fair = _run_queued(FairScheduler(clock=clock), clock, requests, holder="hog")
+    fifo = _run_queued(FairScheduler(enabled=False, clock=clock), clock, requests, holder="hog")
+
+    assert fair == ["editor", "hog", "hog", "hog"]
+    assert fifo == ["hog", "hog", "hog", "editor"]
+
+
+def test_client_weights_set_the_share_of_turns():
+    clock = _Clock()
+    scheduler = FairScheduler(client_weights={"a": 3}, clock=clock)
+    order = _run_queued(scheduler, clock, [("a", "scene.snapshot"), ("b", "scene.snapshot")] * 8)
+
+    assert order[:8].count("a") == 6
+    stats = scheduler.stats()["clients"]
+    assert stats["a"]["served"] == stats["b"]["served"] == 8
+    assert stats["a"]["weight"] == 3.0
+    assert stats["b"]["max_wait_ms"] > stats["a"]["max_wait_ms"]
+
+
+def test_requests_that_time_out_in_the_queue_are_dropped_and_counted():
+    scheduler = FairScheduler()
+    held = scheduler.acquire("holder", "scene.snapshot", 1)
+    assert scheduler.acquire("late", "object.transform", 0.05) is None
+    stats = scheduler.stats()
+    scheduler.release(held)
+
+    assert stats["running"] == "holder"
+    assert stats["queued"] == 0
+    assert stats["clients"]["late"]["dropped"] == 1
+    assert stats["clients"]["late"]["queued"] == {"cheap": 0}
+
+
+def test_weights_are_validated_and_parsed_from_the_command_line():
+    assert cost_class("scene.snapshot") == "expensive" and cost_class("object.move_object") == "cheap"
+    with pytest.raises(ValueError):
+        FairScheduler(class_weights={"bulk": 2})
+    with pytest.raises(ValueError):
+        FairScheduler(client_weights={"a": 0})
+    args = server.parse_args(["--class-weight", "cheap=8", "--client-weight", "ui=2", "--no-fair-scheduling"])
+    assert args.class_weights == {"cheap": 8.0}
+    assert args.client_weights == {"ui": 2.0}
+    assert args.no_fair_scheduling
+
+
+def test_bridge_schedules_by_client_header(monkeypatch):
+    scheduler = FairScheduler()
+    monkeypatch.setattr(server, "SCHEDULER", scheduler)
+    monkeypatch.setattr(server, "_handler_map", lambda params: {"quick": lambda: {"ok": True, "data": {}}})
+    bridge = server.BridgeServer(host="127.0.0.1", port=0)
+    bridge.start()
+    try:
+        assert BridgeClient(bridge.url, client_id="agent-a", use_shm=False).call_rpc("quick", {})["ok"]
+        anonymous = BridgeClient(bridge.url, use_shm=False)
+        assert anonymous.call_rpc("quick", {})["ok"]
+        health = BridgeClient(bridge.url, use_shm=False).health()
+    finally:
+        bridge.stop()
+
+    clients = scheduler.stats()["clients"]
+    assert clients["agent-a"]["served"] == 1
+    assert clients[anonymous.client_id]["queued"] == {"cheap": 0}
+    assert "agent-a" in health["scheduler"]["clients"]
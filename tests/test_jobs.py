@@ -0,0 +1,182 @@
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from mcpblender_addon.actions.steps import run_to_completion
+from mcpblender_addon.bridge_http import gc, jobs, server
+
+
+class ManualTimers:
+    """Collects scheduled callbacks; run() plays bpy.app.timers' reschedule semantics."""
+
+    def __init__(self):
+        self.pending = []
+
+    def __call__(self, callback, delay):
+        self.pending.append(callback)
+
+    def tick(self):
+        callbacks, self.pending = self.pending, []
+        for callback in callbacks:
+            if callback() is not None:
+                self.pending.append(callback)
+
+    def run(self, limit=100):
+        for _ in range(limit):
+            if not self.pending:
+                return
+            self.tick()
+
+
+def counting_job(total, seen):
+    for i in range(total):
+        seen.append(i)
+        yield i + 1, total
+    return {"ok": True, "data": {"count": total}}
+
+
+@pytest.fixture
+def manager():
+    timers = ManualTimers()
+    clock = [0.0]
+
+    def tick_clock():
+        clock[0] += 0.01
+        return clock[0]
+
+    # Every clock read advances 10 ms, so a 20 ms slice covers about one chunk.
+    return jobs.JobManager(lock=threading.RLock(), slice_seconds=0.02, schedule=timers, clock=tick_clock), timers
+
+
+def test_job_runs_in_slices_and_reports_progress(manager):
+    manager, timers = manager
+    seen = []
+    job = manager.submit("demo", counting_job(5, seen))
+    assert job.status()["state"] == "queued"
+
+    timers.tick()
+    assert job.state == "running"
+    assert 0 < job.done < 5
+    assert job.status()["progress"]["total"] == 5
+
+    timers.run()
+    assert job.state == "done"
+    assert job.result == {"ok": True, "data": {"count": 5}}
+    assert seen == [0, 1, 2, 3, 4]
+
+
+def test_cancel_stops_at_next_chunk(manager):
+    manager, timers = manager
+    seen = []
+    job = manager.submit("demo", counting_job(50, seen))
+    timers.tick()
+    manager.cancel(job.id)
+    timers.run()
+
+    assert job.state == "cancelled"
+    assert len(seen) < 50
+    assert job.result["error"]["code"] == "cancelled"
+
+
+def test_busy_lock_defers_the_slice(manager):
+    manager, timers = manager
+    job = manager.submit("demo", counting_job(1, []))
+    holder = threading.Thread(target=lambda: (manager._lock.acquire(), release.wait(), manager._lock.release()))
+    release = threading.Event()
+    holder.start()
+    try:
+        timers.tick()
+        assert job.state == "queued"
+    finally:
+        release.set()
+        holder.join()
+    timers.run()
+    assert job.state == "done"
+
+
+def test_failures_and_bounded_store(manager):
+    manager, timers = manager
+    manager.max_finished = 3
+
+    def broken():
+        yield 0, 1
+        raise RuntimeError("kaput")
+
+    failed = manager.submit("demo", broken())
+    timers.run()
+    assert failed.state == "failed"
+    assert failed.status()["error"]["message"] == "kaput"
+
+    later = [manager.submit("demo", counting_job(1, [])) for _ in range(3)]
+    timers.run()
+    assert manager.get(failed.id) is None
+    assert all(manager.get(job.id) is not None for job in later)
+
+
+def test_job_rpcs_round_trip(monkeypatch):
+    timers = ManualTimers()
+    monkeypatch.setattr(server, "JOBS", jobs.JobManager(lock=server.BPY_LOCK, schedule=timers))
+    monkeypatch.setattr(server, "_handler_map", lambda params, real=server._handler_map: {**real(params), "scenegraph.search": lambda: {"ok": True, "data": {"objects": []}}})
+
+    submitted = server.dispatch_rpc("jobs.submit", {"method": "scenegraph.search", "params": {}})
+    job_id = submitted["data"]["job_id"]
+    assert server.dispatch_rpc("jobs.result", {"job_id": job_id})["error"]["code"] == "job_pending"
+
+    timers.run()
+    assert server.dispatch_rpc("jobs.status", {"job_id": job_id})["data"]["state"] == "done"
+    assert server.dispatch_rpc("jobs.result", {"job_id": job_id}) == {"ok": True, "data": {"objects": []}}
+    assert server.dispatch_rpc("jobs.submit", {"method": "jobs.status"})["error"]["code"] == "tool_not_found"
+    assert server.dispatch_rpc("jobs.cancel", {"job_id": "nope"})["error"]["code"] == "not_found"
+
+
+def test_headless_main_runs_job_slices(monkeypatch):
+    registered = []  # under --background, bpy.app.timers never fire
+    headless = SimpleNamespace(app=SimpleNamespace(background=True, timers=SimpleNamespace(register=lambda *a, **k: registered.append(a))))
+    for module in (gc, server):
+        monkeypatch.setattr(module, "HAS_BPY", True)
+        monkeypatch.setattr(module, "bpy", headless)
+    launched = threading.Event()
+    monkeypatch.setattr(server, "launch_server", lambda **kwargs: launched.set() or SimpleNamespace(stop=lambda: None))
+    monkeypatch.setattr(server, "JOBS", jobs.JobManager(lock=server.BPY_LOCK))
+    monkeypatch.setattr(server, "_handler_map", lambda params, real=server._handler_map: {**real(params), "scenegraph.search": lambda: {"ok": True, "data": {"objects": []}}})
+    monkeypatch.setattr(sys, "argv", ["server.py"])
+
+    stop = threading.Event()
+    loop = threading.Thread(target=server.main, kwargs={"stop": stop})
+    loop.start()
+    try:
+        assert launched.wait(5)
+        job_id = server.dispatch_rpc("jobs.submit", {"method": "scenegraph.search", "params": {}})["data"]["job_id"]
+        deadline = time.monotonic() + 5
+        while server.dispatch_rpc("jobs.status", {"job_id": job_id})["data"]["state"] != "done" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert server.dispatch_rpc("jobs.result", {"job_id": job_id}) == {"ok": True, "data": {"objects": []}}
+    finally:
+        stop.set()
+        loop.join(5)
+    assert registered == [] and not gc.MAIN_TIMERS.active
+
+
+def test_long_running_reads_get_step_runners(monkeypatch):
+    calls = []
+
+    def fake_steps(name, result):
+        def steps(*args):
+            calls.append((name, args[1:]))
+            yield 1, 2
+            yield 2, 2
+            return result
+
+        return steps
+
+    monkeypatch.setattr(server, "iter_capture_snapshot", fake_steps("snapshot", {"objects": []}))
+    monkeypatch.setattr(server, "iter_get_mesh", fake_steps("mesh", ({"vertex_count": 3}, b"frame")))
+    monkeypatch.setattr(server, "iter_purge_orphans", fake_steps("purge", {"freed": {}, "total": 0, "dry_run": True}))
+
+    assert run_to_completion(server._job_steps("scene.snapshot", {}, 50))["data"] == {"objects": []}
+    assert run_to_completion(server._job_steps("scenegraph.get_mesh", {}))["binary"] == b"frame"
+    assert run_to_completion(server._job_steps("scene.purge_orphans", {}))["data"]["dry_run"]
+    assert calls == [("snapshot", (50,)), ("mesh", ()), ("purge", ())]
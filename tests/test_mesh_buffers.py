@@ -0,0 +1,237 @@
+import base64
+from array import array
+from types import SimpleNamespace
+
+import pytest
+
+import mcpblender_addon.actions.mesh_buffers as mesh_buffers
+from mcpblender_addon.bridge_http import server
+from mcpblender_addon.index import RevisionTracker, data_key
+
+
+class FakeCollection:
+    def __init__(self, **columns):
+        self._columns = columns
+        self.reads = 0
+
+    def __len__(self):
+        first = next(iter(self._columns.values()))
+        return len(first)
+
+    def foreach_get(self, attr, buf):
+        self.reads += 1
+        flat = [v for row in self._columns[attr] for v in (row if isinstance(row, tuple) else (row,))]
+        buf[:] = array(buf.typecode, flat)
+
+
+class FakeMesh:
+    def __init__(self):
+        self.name_full = "Tri"
+        self.vertices = FakeCollection(
+            co=[(0.0, 0.0, 0.0), (2.0, 0.0, 0.0), (0.0, 1.0, -1.0)],
+            normal=[(0.0, 0.0, 1.0)] * 3,
+        )
+        self.loops = [0, 1, 2]
+        self.loop_triangles = FakeCollection(vertices=[(0, 1, 2)], loops=[(0, 1, 2)])
+        layer = SimpleNamespace(name="UVMap", data=FakeCollection(uv=[(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]))
+        self.uv_layers = SimpleNamespace(active=layer)
+
+    def calc_loop_triangles(self):
+        return None
+
+    def as_pointer(self):
+        return id(self)
+
+
+class FakeObject:
+    def __init__(self, mesh):
+        self.name = self.name_full = "TriObj"
+        self.type = "MESH"
+        self.data = mesh
+        self.cleared = 0
+
+    def as_pointer(self):
+        return id(self)
+
+    def evaluated_get(self, depsgraph):
+        return self
+
+    def to_mesh(self):
+        return self.data
+
+    def to_mesh_clear(self):
+        self.cleared += 1
+
+
+@pytest.fixture
+def mesh_scene(monkeypatch):
+    mesh = FakeMesh()
+    obj = FakeObject(mesh)
+    fake_bpy = SimpleNamespace(
+        data=SimpleNamespace(objects={obj.name: obj}),
+        context=SimpleNamespace(evaluated_depsgraph_get=lambda: None),
+    )
+    monkeypatch.setattr(mesh_buffers, "HAS_BPY", True)
+    monkeypatch.setattr(mesh_buffers, "bpy", fake_bpy)
+    monkeypatch.setattr(mesh_buffers, "REVISIONS", RevisionTracker())
+    monkeypatch.setattr(mesh_buffers, "FRAME_CACHE", mesh_buffers.MeshFrameCache())
+    return obj
+
+
+def test_frame_round_trip_is_aligned():
+    sections = [("a", "f32", 3, array("f", [1.0, 2.0, 3.0])), ("b", "u16", 1, array("H", [7]))]
+    frame = mesh_buffers.encode_frame({"kind": "test"}, sections)
+    header, decoded = mesh_buffers.decode_frame(frame)
+
+    assert header["kind"] == "test"
+    assert list(decoded["a"]) == [1.0, 2.0, 3.0]
+    assert list(decoded["b"]) == [7]
+    _, start = mesh_buffers.read_frame_header(frame)
+    assert start % 8 == 0
+    assert all(entry["offset"] % 8 == 0 for entry in header["sections"])
+    with pytest.raises(ValueError):
+        mesh_buffers.decode_frame(b"XXXX" + frame[4:])
+
+
+def test_get_mesh_sections_and_cache(mesh_scene):
+    header, frame = mesh_buffers.get_mesh({"name": "TriObj", "uvs": True})
+    _, sections = mesh_buffers.decode_frame(frame)
+
+    assert header["vertex_count"] == 3 and header["triangle_count"] == 1
+    assert list(sections["positions"]) == [0.0, 0.0, 0.0, 2.0, 0.0, 0.0, 0.0, 1.0, -1.0]
+    assert list(sections["triangles"]) == [0, 1, 2]
+    assert list(sections["uvs"]) == [0.0, 0.0, 1.0, 0.0, 0.0, 1.0]
+    assert header["uv_layer"] == "UVMap"
+
+    reads = mesh_scene.data.vertices.reads
+    assert mesh_buffers.get_mesh({"name": "TriObj", "uvs": True})[1] is frame
+    assert mesh_scene.data.vertices.reads == reads
+
+    mesh_buffers.REVISIONS.bump([data_key(mesh_scene.data)])
+    mesh_buffers.get_mesh({"name": "TriObj", "uvs": True})
+    assert mesh_scene.data.vertices.reads > reads
+
+
+def test_quantized_positions_stay_within_a_step(mesh_scene):
+    header, frame = mesh_buffers.get_mesh({"name": "TriObj", "quantize": 16, "normals": False, "evaluated": True})
+    _, sections = mesh_buffers.decode_frame(frame)
+    quant = header["quantization"]
+
+    assert "normals" not in sections
+    assert mesh_scene.cleared == 1
+    expected = [0.0, 0.0, 0.0, 2.0, 0.0, 0.0, 0.0, 1.0, -1.0]
+    for i, code in enumerate(sections["positions"]):
+        axis = i % 3
+        span = quant["max"][axis] - quant["min"][axis]
+        value = quant["min"][axis] + code * span / 65535
+        assert value == pytest.approx(expected[i], abs=span / 65535 + 1e-9)
+
+
+def test_get_mesh_steps_per_section_and_rereads_a_changed_mesh(mesh_scene):
+    steps = mesh_buffers.iter_get_mesh({"name": "TriObj", "uvs": True})
+    assert [next(steps), next(steps)] == [(1, 5), (2, 5)]
+
+    mesh_scene.data.vertices._columns["co"][0] = (9.0, 9.0, 9.0)  # edited between two steps
+    mesh_buffers.REVISIONS.bump([data_key(mesh_scene.data)])
+    header, frame = mesh_buffers.run_to_completion(steps)
+
+    _, sections = mesh_buffers.decode_frame(frame)
+    assert list(sections["positions"])[:3] == [9.0, 9.0, 9.0]
+    assert mesh_buffers.get_mesh({"name": "TriObj", "uvs": True})[1] is frame
+
+
+def test_invalid_quantize_rejected(mesh_scene):
+    with pytest.raises(ValueError):
+        mesh_buffers.get_mesh({"name": "TriObj", "quantize": 12})
+
+
+def test_json_clients_get_base64_frame():
+    result = server.inline_binary({"ok": True, "data": {"vertex_count": 3}, "binary": b"MCPM-frame"})
+    assert "binary" not in result
+    assert base64.b64decode(result["data"]["frame_base64"]) == b"MCPM-frame"
+    assert server.wants_binary("application/vnd.mcpblender.frame, application/json")
+    assert not server.wants_binary("application/json")
+
+
+class FakeColumnCollection:
+    def __init__(self):
+        self.size = 0
+        self.columns = {}
+
+    def add(self, count):
+        self.size += count
+
+    def foreach_set(self, attr, buf):
+        assert len(buf) % max(self.size, 1) == 0
+        self.columns[attr] = list(buf)
+
+
+class FakeNewMesh:
+    def __init__(self, name):
+        self.name = name
+        self.vertices = FakeColumnCollection()
+        self.loops = FakeColumnCollection()
+        self.polygons = FakeColumnCollection()
+        self.updated = False
+
+    def update(self, calc_edges=False):
+        self.updated = calc_edges
+
+
+@pytest.fixture
+def mesh_data(monkeypatch):
+    fake_bpy = SimpleNamespace(data=SimpleNamespace(meshes=SimpleNamespace(new=FakeNewMesh)))
+    monkeypatch.setattr(mesh_buffers, "bpy", fake_bpy)
+
+
+def test_build_mesh_from_base64_and_frame_sections(mesh_data):
+    positions = array("f", [0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1, 0])
+    args = {
+        "positions": base64.b64encode(positions.tobytes()).decode(),
+        "indices": [0, 1, 2, 3, 0, 2],
+    }
+    mesh = mesh_buffers.build_mesh("Quad", args)
+    assert mesh.vertices.size == 4
+    assert mesh.polygons.columns["loop_start"] == [0, 3]
+    assert mesh.polygons.columns["loop_total"] == [3, 3]
+    assert mesh.updated
+
+    frame = mesh_buffers.encode_frame(
+        {}, [("positions", "f32", 3, positions), ("indices", "u32", 1, array("i", [0, 1, 2, 3])), ("face_sizes", "u32", 1, array("i", [4]))]
+    )
+    _, sections = mesh_buffers.decode_frame(frame)
+    mesh = mesh_buffers.build_mesh("Quad", {"buffers": sections})
+    assert mesh.loops.columns["vertex_index"] == [0, 1, 2, 3]
+    assert mesh.polygons.columns["loop_total"] == [4]
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        {"positions": [0, 0, 0, 1, 0, 0, 1, 1, 0], "indices": [0, 1, 3]},
+        {"positions": [0, 0, 0, 1, 0, 0, 1, 1, 0], "indices": [0, 1, 2, 0]},
+        {"positions": [0, 0, 0, 1, 0, 0, 1, 1, 0], "indices": [0, 1, 2], "face_sizes": [2, 1]},
+        {"positions": [0, 0, 0, 1, 0], "indices": [0, 1, 2]},
+        {"positions": "%%%", "indices": [0, 1, 2]},
+    ],
+)
+def test_build_mesh_rejects_bad_buffers(mesh_data, args):
+    with pytest.raises(ValueError):
+        mesh_buffers.build_mesh("Bad", args)
+
+
+def test_frame_rpc_passes_sections_as_buffers(monkeypatch):
+    seen = {}
+    monkeypatch.setattr(server, "_handler_map", lambda params: {"mesh.from_buffers": lambda: seen.update(params) or {"ok": True, "data": {}}})
+    monkeypatch.setattr(server.ORPHAN_GC, "note_mutation", lambda deleted=0: None)
+    frame = mesh_buffers.encode_frame(
+        {"method": "mesh.from_buffers", "params": {"name": "Up"}}, [("indices", "u32", 1, array("i", [0, 1, 2]))]
+    )
+
+    assert server.handle_rpc_bytes(frame, server.FRAME_CONTENT_TYPE)["ok"]
+    assert seen["name"] == "Up"
+    assert list(seen["buffers"]["indices"]) == [0, 1, 2]
+
+    other = mesh_buffers.encode_frame({"method": "scene.snapshot"}, [])
+    assert server.handle_rpc_bytes(other, server.FRAME_CONTENT_TYPE)["error"]["code"] == "invalid_payload"
+    assert server.body_limit(server.FRAME_CONTENT_TYPE) > server.body_limit("application/json")
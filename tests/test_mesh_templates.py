@@ -0,0 +1,142 @@
+from types import SimpleNamespace
+
+import mcpblender_addon.actions.mesh_templates as templates
+from runtime_blender import modeling_api
+
+
+class FakeMesh:
+    def __init__(self, name, meshes):
+        self.name = name
+        self.users = 0
+        self._meshes = meshes
+
+    def copy(self):
+        return self._meshes.new(self.name + ".copy")
+
+
+class FakeMeshes:
+    def __init__(self):
+        self.items = {}
+
+    def new(self, name):
+        mesh = FakeMesh(name, self)
+        self.items[id(mesh)] = mesh
+        return mesh
+
+    def get(self, name):
+        for mesh in self.items.values():
+            if mesh.name == name:
+                return mesh
+        return None
+
+    def remove(self, mesh):
+        self.items.pop(id(mesh), None)
+
+
+class FakeBMesh:
+    def new(self):
+        return SimpleNamespace(to_mesh=lambda mesh: None, free=lambda: None)
+
+
+def _install(monkeypatch):
+    meshes = FakeMeshes()
+    monkeypatch.setattr(templates, "bpy", SimpleNamespace(data=SimpleNamespace(meshes=meshes)))
+    monkeypatch.setattr(templates, "bmesh", FakeBMesh())
+    return meshes
+
+
+def test_template_built_once_and_copied(monkeypatch):
+    _install(monkeypatch)
+    cache = templates.MeshTemplateCache(capacity=4)
+    builds = []
+    key = templates.template_key("cube", size=2.0)
+
+    first = cache.acquire(key, builds.append, "A_mesh")
+    second = cache.acquire(key, builds.append, "B_mesh")
+
+    assert len(builds) == 1
+    assert first is not second
+    assert (first.name, second.name) == ("A_mesh", "B_mesh")
+    assert cache.stats()["hits"] == 1
+
+
+def _template(cache, key):
+    return cache._templates[key]
+
+
+def test_shared_mesh_is_a_linked_copy_not_the_template(monkeypatch):
+    _install(monkeypatch)
+    cache = templates.MeshTemplateCache()
+    key = templates.template_key("cube", size=1.0)
+    shared = cache.acquire(key, lambda bm: None, "Shared_mesh", share=True)
+    again = cache.acquire(key, lambda bm: None, "Other_mesh", share=True)
+    plain = cache.acquire(key, lambda bm: None, "Plain_mesh")
+
+    assert again is shared
+    assert not cache.is_template(shared)
+    assert shared.name == "Shared_mesh"
+    assert plain is not shared and plain.name == "Plain_mesh"
+    assert _template(cache, key).name.startswith(templates.TEMPLATE_PREFIX)
+
+
+def test_removed_shared_mesh_is_remade(monkeypatch):
+    meshes = _install(monkeypatch)
+    cache = templates.MeshTemplateCache()
+    key = templates.template_key("cube", size=1.0)
+    shared = cache.acquire(key, lambda bm: None, "Shared_mesh", share=True)
+    meshes.remove(shared)
+
+    remade = cache.acquire(key, lambda bm: None, "Shared_mesh", share=True)
+    assert remade is not shared
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction_removes_unused_templates(monkeypatch):
+    meshes = _install(monkeypatch)
+    cache = templates.MeshTemplateCache(capacity=1)
+    first = templates.template_key("cube", size=1.0)
+    cache.acquire(first, lambda bm: None, "a")
+    old = _template(cache, first)
+    cache.acquire(templates.template_key("cube", size=3.0), lambda bm: None, "b")
+
+    assert len(cache) == 1
+    assert id(old) not in meshes.items
+
+
+def test_removed_template_is_rebuilt(monkeypatch):
+    meshes = _install(monkeypatch)
+    cache = templates.MeshTemplateCache()
+    key = templates.template_key("plane", size=2.0)
+    cache.acquire(key, lambda bm: None, "p")
+    template = _template(cache, key)
+    meshes.remove(template)
+
+    assert cache.prune() == 1
+    cache.acquire(key, lambda bm: None, "p")
+    assert _template(cache, key) is not template
+    assert cache.stats()["misses"] == 2
+
+
+def test_template_key_normalizes_floats():
+    assert templates.template_key("cube", size=2.0000000001) == templates.template_key("cube", size=2.0)
+
+
+def test_runtime_builds_from_the_injected_cache(monkeypatch):
+    meshes = _install(monkeypatch)
+    objects = SimpleNamespace(new=lambda name, mesh: SimpleNamespace(name=name, data=mesh))
+    monkeypatch.setattr(modeling_api, "bpy", SimpleNamespace(data=SimpleNamespace(meshes=meshes, objects=objects)))
+    monkeypatch.setattr(modeling_api, "bmesh", FakeBMesh())
+    monkeypatch.setattr(modeling_api, "_link_object", lambda obj: None)
+    monkeypatch.setattr(modeling_api, "_TEMPLATES", None)
+    cache = templates.MeshTemplateCache()
+    builds = []
+
+    modeling_api.use_template_cache(cache)
+    first = modeling_api._new_mesh_from_template("A", "cube", {"size": 2.0}, builds.append)
+    second = modeling_api._new_mesh_from_template("B", "cube", {"size": 2.0}, builds.append)
+    assert len(builds) == 1 and (first.data.name, second.data.name) == ("A", "B")
+
+    modeling_api.use_template_cache(None)  # no add-on: every primitive is built
+    third = modeling_api._new_mesh_from_template("C", "cube", {"size": 2.0}, builds.append)
+    assert len(builds) == 2 and third.data.name == "C"
+    assert modeling_api.clear_template_cache() == 0 and len(cache) == 1
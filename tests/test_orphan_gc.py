@@ -0,0 +1,86 @@
+import threading
+
+from mcpblender_addon.bridge_http.gc import OrphanGCPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _policy(datablocks=0, **kwargs):
+    clock = FakeClock()
+    scheduled = []
+    purges = []
+
+    def purge(args):
+        purges.append(args)
+        return {"freed": {"MESH": 3}, "total": 3, "remaining_datablocks": datablocks}
+
+    policy = OrphanGCPolicy(
+        purge=purge,
+        count_datablocks=lambda: datablocks,
+        lock=threading.RLock(),
+        schedule=lambda callback, delay: scheduled.append(callback),
+        clock=clock,
+        **kwargs,
+    )
+    return policy, clock, scheduled, purges
+
+
+def test_purge_scheduled_after_delete_threshold():
+    policy, clock, scheduled, purges = _policy(delete_threshold=3, idle_seconds=1.0)
+    policy.note_mutation(deleted=2)
+    assert scheduled == []
+    policy.note_mutation(deleted=1)
+    policy.note_mutation(deleted=5)
+    assert len(scheduled) == 1
+
+    clock.now += 5
+    assert scheduled[0]() is None
+    assert len(purges) == 1
+    assert policy.stats()["deletes_since_purge"] == 0
+    assert policy.runs == 1
+
+
+def test_purge_waits_for_idle_period():
+    policy, clock, scheduled, purges = _policy(delete_threshold=1, idle_seconds=2.0)
+    policy.note_mutation(deleted=1)
+    clock.now += 0.5
+    policy.touch()
+    assert scheduled[0]() == 2.0
+    assert purges == []
+
+
+def test_purge_skipped_while_lock_busy():
+    policy, clock, scheduled, purges = _policy(delete_threshold=1, idle_seconds=1.0)
+    policy.note_mutation(deleted=1)
+    clock.now += 5
+    started, done = threading.Event(), threading.Event()
+
+    def hold():
+        with policy._lock:
+            started.set()
+            done.wait()
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    started.wait()
+    try:
+        assert scheduled[0]() == 1.0
+        assert purges == []
+    finally:
+        done.set()
+        holder.join()
+
+
+def test_datablock_threshold_does_not_retrigger_on_live_data():
+    policy, clock, scheduled, purges = _policy(datablocks=600, delete_threshold=100, datablock_threshold=500)
+    policy.note_mutation()
+    clock.now += 10
+    scheduled[0]()
+    policy.note_mutation()
+    assert len(scheduled) == 1
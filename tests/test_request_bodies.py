@@ -0,0 +1,124 @@
+import http.client
+import io
+import json
+from array import array
+
+import pytest
+
+from mcpblender_addon.bridge_http import body, server
+
+
+def _stream(raw, limit=1 << 30):
+    return body.BodyStream(io.BytesIO(raw), len(raw), limit)
+
+
+def _chunked(raw, size=7):
+    pieces = [raw[i : i + size] for i in range(0, len(raw), size)]
+    return b"".join(b"%x\r\n%s\r\n" % (len(piece), piece) for piece in pieces) + b"0\r\n\r\n"
+
+
+def test_limits_per_route_and_method():
+    limits = body.BodyLimits(json_bytes=100, frame_bytes=1000, routes={"/small": 10}, methods={"bulk": 500})
+    assert limits.for_route("/rpc") == 500  # reading is capped by the largest method limit
+    assert limits.for_method("/rpc", "other") == 100
+    assert limits.for_method("/rpc", "bulk") == 500
+    assert limits.for_method("/small", "other") == 10
+    assert limits.for_route("/rpc", frame=True) == 1000
+
+
+def test_chunked_body_is_decoded_and_capped():
+    raw = b'{"method": "m", "params": {}}'
+    wire = io.BytesIO(_chunked(raw) + b"NEXT")
+    stream = body.BodyStream.from_headers(wire, {"Transfer-Encoding": "chunked"}, limit=1024)
+    assert stream.read_all() == raw and stream.finished
+    assert wire.read() == b"NEXT"  # stops at the terminating chunk
+
+    capped = body.BodyStream.from_headers(io.BytesIO(_chunked(raw)), {"Transfer-Encoding": "chunked"}, limit=10)
+    with pytest.raises(body.PayloadTooLarge):
+        capped.read_all()
+    with pytest.raises(body.PayloadTooLarge):
+        body.BodyStream.from_headers(io.BytesIO(raw), {"Content-Length": str(len(raw))}, limit=10)
+
+
+def test_method_limit_applies_once_the_method_is_parsed(monkeypatch):
+    monkeypatch.setattr(body, "STREAM_CHUNK_BYTES", 16)
+    limits = body.BodyLimits(json_bytes=100, methods={"bulk": 5000})
+
+    def read(method):
+        raw = json.dumps({"method": method, "params": {"pad": "x" * 2000}}).encode()
+        stream = body.BodyStream.from_headers(io.BytesIO(_chunked(raw, 16)), {"Transfer-Encoding": "chunked"}, limits.for_route("/rpc"))
+        return raw, stream, lambda: body.read_json(stream, method_limit=lambda m: limits.for_method("/rpc", m))
+
+    raw, stream, parse = read("other")
+    with pytest.raises(body.PayloadTooLarge):
+        parse()
+    assert stream.limit == 100 and stream.consumed < len(raw)  # cut off before the padding was read
+
+    raw, stream, parse = read("bulk")
+    assert parse()["method"] == "bulk" and stream.consumed == len(raw)
+
+
+@pytest.mark.parametrize("chunk", [1, 3, 64, 65536])
+def test_streamed_arrays_are_packed(monkeypatch, chunk):
+    monkeypatch.setattr(body, "STREAM_CHUNK_BYTES", chunk)
+    payload = {
+        "method": "object.transform_many",
+        "params": {"ids": ["1", "2"], "locations": [[0.5, -1, 2e3], [4, 5, 6]], "mode": "delta", "note": 'a "quoted" ]'},
+    }
+    parsed = body.read_json(_stream(json.dumps(payload).encode()), server._stream_arrays)
+
+    locations = parsed["params"].pop("locations")
+    assert isinstance(locations, array) and locations.typecode == "d"
+    assert locations.tolist() == [0.5, -1.0, 2000.0, 4.0, 5.0, 6.0]
+    assert parsed["params"] == {"ids": ["1", "2"], "mode": "delta", "note": 'a "quoted" ]'}
+
+
+@pytest.mark.parametrize("chunk", [2, 65536])
+def test_unpackable_arrays_fall_back_to_lists(monkeypatch, chunk):
+    monkeypatch.setattr(body, "STREAM_CHUNK_BYTES", chunk)
+    raw = b'{"params": {"positions": [1, 2, null], "locations": [[1, 2, 3], [4, 5]]}, "method": "mesh.from_buffers"}'
+    params = body.read_json(_stream(raw), server._stream_arrays)["params"]
+    assert params["positions"] == [1, 2, None]
+    assert params["locations"] == [[1, 2, 3], [4, 5]]
+
+
+@pytest.mark.parametrize("raw", [b'{"a": 1', b"[1, 2,]", b'{"params": {"indices": [1, 2,]}}', b"{} x", b'"\xff"'])
+def test_invalid_json_is_rejected(raw):
+    with pytest.raises(ValueError):
+        body.read_json(_stream(raw), server._stream_arrays)
+
+
+@pytest.fixture
+def bridge(monkeypatch):
+    def handlers(params):
+        echo = {key: type(value).__name__ for key, value in params.items()}
+        return {name: (lambda: {"ok": True, "data": echo}) for name in ("object.transform_many", "object.create_cube")}
+
+    monkeypatch.setattr(server, "_handler_map", handlers)
+    monkeypatch.setattr(server, "STREAM_THRESHOLD_BYTES", 0)
+    instance = server.BridgeServer(port=0)
+    instance.start()
+    yield instance._server.server_address[:2]
+    instance.stop()
+
+
+def _post(address, raw, headers):
+    conn = http.client.HTTPConnection(*address, timeout=5)
+    conn.request("POST", "/rpc", body=raw, headers=headers)
+    response = conn.getresponse()
+    result = response.status, json.loads(response.read())
+    conn.close()
+    return result
+
+
+def test_chunked_rpc_is_streamed_and_limited_per_method(bridge, monkeypatch):
+    raw = json.dumps({"method": "object.transform_many", "params": {"ids": ["1"], "locations": [[1, 2, 3]]}}).encode()
+    status, payload = _post(bridge, _chunked(raw), {"Transfer-Encoding": "chunked", "Content-Type": "application/json"})
+    assert status == 200
+    assert payload["data"] == {"ids": "list", "locations": "array"}
+
+    monkeypatch.setattr(server, "BODY_LIMITS", body.BodyLimits(json_bytes=32, methods={"object.transform_many": 4096}))
+    small = json.dumps({"method": "object.create_cube", "params": {"name": "x" * 64}}).encode()
+    status, payload = _post(bridge, small, {"Content-Type": "application/json"})
+    assert status == 413 and payload["error"]["code"] == "payload_too_large"
+    assert _post(bridge, raw, {"Content-Type": "application/json"})[0] == 200
@@ -0,0 +1,98 @@
+import http.client
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from runtime_blender import http_runtime_server as runtime
+
+
+@pytest.fixture
+def server(monkeypatch):
+    def slow(params):
+        time.sleep(params.get("seconds", 0.1))
+        return {"slept": True}
+
+    monkeypatch.setitem(runtime.POST_ROUTES, "/test/slow", slow)
+    main_queue = runtime.MainThreadQueue()
+    stop = threading.Event()
+    main = threading.Thread(target=main_queue.run_forever, args=(stop, 0.01))  # stands in for Blender's main thread
+    main.start()
+    loop = runtime.EventLoopServer("127.0.0.1", 0, main_queue)
+    loop.start()
+    yield loop.server_address
+    loop.shutdown()
+    stop.set()
+    main.join()
+
+
+def _read_responses(sock, count):
+    data = b""
+    responses = []
+    while len(responses) < count:
+        chunk = sock.recv(65536)
+        assert chunk, "connection closed early"
+        data += chunk
+        while True:
+            end = data.find(b"\r\n\r\n")
+            if end < 0:
+                break
+            head = data[:end].decode("ascii")
+            length = int(head.lower().split("content-length: ")[1].split("\r\n")[0])
+            if len(data) < end + 4 + length:
+                break
+            responses.append((int(head.split()[1]), json.loads(data[end + 4 : end + 4 + length])))
+            data = data[end + 4 + length :]
+    return responses
+
+
+def test_connection_is_kept_alive_across_requests(server):
+    conn = http.client.HTTPConnection(*server, timeout=5)
+    conn.request("GET", "/health")
+    first = conn.getresponse()
+    assert first.status == 200 and json.loads(first.read())["result"]["status"] == "ok"
+    sock = conn.sock
+
+    conn.request("POST", "/mesh/add_cube", body=b"{}", headers={"Content-Type": "application/json"})
+    second = conn.getresponse()
+    assert second.status == 503  # no bpy here, but the request went through the main-thread queue
+    assert json.loads(second.read())["error"]["code"] == "runtime_error"
+
+    conn.request("GET", "/nope")
+    assert conn.getresponse().status == 404
+    assert conn.sock is sock
+    conn.close()
+
+
+def test_pipelined_requests_are_answered_in_order(server):
+    with socket.create_connection(server, timeout=5) as sock:
+        body = b'{"seconds": 0.1}'
+        sock.sendall(
+            b"POST /test/slow HTTP/1.1\r\nHost: x\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body)
+            + b"GET /health HTTP/1.1\r\nHost: x\r\n\r\n"
+            + b"POST /scene/reset HTTP/1.1\r\nHost: x\r\nContent-Length: 0\r\n\r\n"
+        )
+        responses = _read_responses(sock, 3)
+
+    assert [status for status, _ in responses] == [200, 200, 400]
+    assert responses[0][1]["result"] == {"slept": True}
+    assert responses[2][1]["error"]["code"] == "invalid_payload"
+
+
+def test_slow_client_does_not_block_others(server):
+    with socket.create_connection(server, timeout=5) as stalled:
+        stalled.sendall(b"GET /health HTTP/1.1\r\nHo")  # never finishes its request
+        conn = http.client.HTTPConnection(*server, timeout=2)
+        conn.request("GET", "/health")
+        assert conn.getresponse().status == 200
+        conn.close()
+
+
+def test_connection_close_is_honoured(server):
+    with socket.create_connection(server, timeout=5) as sock:
+        sock.sendall(b"GET /health HTTP/1.0\r\n\r\n")
+        (status, _), = _read_responses(sock, 1)
+        assert status == 200
+        assert sock.recv(1) == b""
@@ -0,0 +1,321 @@
+from types import SimpleNamespace
+
+import pytest
+
+import mcpblender_addon.actions.core_actions as core
+import mcpblender_addon.actions.deadline as deadline
+import mcpblender_addon.index.scene_index as scene_index
+from mcpblender_addon.actions.deadline import deadline_scope
+from mcpblender_addon.snapshot import levels
+from mcpblender_addon.snapshot.fragments import FragmentCache
+from mcpblender_addon.index import NameIndex, RevisionTracker, StaleCursorError, decode_cursor, encode_cursor
+
+
+def _keys(index, query, mode="substring"):
+    return [key for _, key in index.iter_matches(query, mode)]
+
+
+def test_substring_prefix_and_short_queries():
+    index = NameIndex()
+    index.add("1", "Cube", "MESH")
+    index.add("2", "Cube.001", "MESH")
+    index.add("3", "Lamp", "LIGHT")
+    index.add("4", "BigCube", "MESH")
+
+    assert _keys(index, "cube") == ["4", "1", "2"]
+    assert _keys(index, "cube", "prefix") == ["1", "2"]
+    assert _keys(index, "am") == ["3"]
+    assert _keys(index, "") == ["4", "1", "2", "3"]
+    assert _keys(index, "zzz") == []
+
+
+def test_rename_and_remove_update_postings():
+    index = NameIndex()
+    index.add("1", "Cube", "MESH")
+    revision = index.revision
+    index.add("1", "Sphere", "MESH")
+    assert index.revision > revision
+    assert _keys(index, "cube") == []
+    assert _keys(index, "sph") == ["1"]
+
+    index.remove("1")
+    assert len(index) == 0
+    assert _keys(index, "sph") == []
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    token = encode_cursor({"a": ["cube", "1"]})
+    assert decode_cursor(token) == {"a": ["cube", "1"]}
+    with pytest.raises(ValueError):
+        decode_cursor("not a cursor!")
+
+
+class FakeObject:
+    def __init__(self, name, obj_type="MESH"):
+        self.name = name
+        self.name_full = name
+        self.type = obj_type
+        self.parent = None
+        self.users_collection = []
+        self.location = self.rotation_euler = self.scale = (0.0, 0.0, 0.0)
+
+    def as_pointer(self):
+        return id(self)
+
+
+class FakeObjects(dict):
+    def __iter__(self):
+        return iter(self.values())
+
+
+@pytest.fixture
+def indexed_scene(monkeypatch):
+    objects = FakeObjects({f"Cube.{i:03d}": FakeObject(f"Cube.{i:03d}") for i in range(25)})
+    objects["Light"] = FakeObject("Light", "LIGHT")
+    objects["Unlinked"] = FakeObject("Unlinked")
+    scene = SimpleNamespace(name="Scene", objects=[o for n, o in objects.items() if n != "Unlinked"], as_pointer=lambda: 1)
+    fake_bpy = SimpleNamespace(data=SimpleNamespace(objects=objects), context=SimpleNamespace(scene=scene))
+    revisions = RevisionTracker()
+    monkeypatch.setattr(core, "_require_bpy", lambda: None)
+    monkeypatch.setattr(core, "bpy", fake_bpy)
+    monkeypatch.setattr(core, "REVISIONS", revisions)
+    monkeypatch.setattr(core, "_scene_members_cache", {"scene": None, "revision": -1, "keys": frozenset()})
+    monkeypatch.setattr(core, "FRAGMENT_CACHE", FragmentCache())
+    monkeypatch.setattr(scene_index, "bpy", fake_bpy)
+    monkeypatch.setattr(scene_index, "NAME_INDEX", NameIndex())
+    monkeypatch.setattr(scene_index, "REVISIONS", revisions)
+    return objects
+
+
+def test_search_paginates_with_total_count(indexed_scene):
+    first = core.scenegraph_search({"query": "cube", "limit": 10})
+    assert first["count"] == 25
+    assert [o["name"] for o in first["objects"]][:2] == ["Cube.000", "Cube.001"]
+
+    seen = [o["name"] for o in first["objects"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        page = core.scenegraph_search({"query": "cube", "limit": 10, "cursor": cursor})
+        seen.extend(o["name"] for o in page["objects"])
+        cursor = page["next_cursor"]
+    assert seen == sorted(name for name in indexed_scene.keys() if name.startswith("Cube"))
+
+
+def test_snapshot_pages_cover_scene_in_order(indexed_scene):
+    page = core.capture_snapshot({"page_size": 10, "fields": ["name"]})
+    assert page["total"] == 26
+    assert not page["complete"]
+    names = [o["name"] for o in page["objects"]]
+    while page["next_cursor"]:
+        page = core.capture_snapshot({"page_size": 10, "cursor": page["next_cursor"]})
+        names.extend(o["name"] for o in page["objects"])
+    assert page["complete"]
+    assert names == sorted(n for n in indexed_scene.keys() if n != "Unlinked")
+
+
+def test_snapshot_cursor_survives_edits_that_keep_the_order(indexed_scene):
+    cursor = core.capture_snapshot({"page_size": 5})["next_cursor"]
+    scene_index.track_moved([indexed_scene["Cube.000"]])
+    scene_index.track_changed([indexed_scene["Cube.020"]])
+    late = indexed_scene["Cube.100"] = FakeObject("Cube.100")
+    core.bpy.context.scene.objects.append(late)
+    scene_index.track_added(late)
+
+    page = core.capture_snapshot({"page_size": 5, "cursor": cursor})
+    assert page["objects"][0]["name"] == "Cube.005"
+    assert page["total"] == 27
+
+
+@pytest.mark.parametrize("change", ["rename", "remove", "add", "unlink"])
+def test_snapshot_cursor_goes_stale_when_paged_objects_change(indexed_scene, change):
+    cursor = core.capture_snapshot({"page_size": 5})["next_cursor"]
+    scene = core.bpy.context.scene
+    if change == "rename":
+        renamed = indexed_scene["Cube.009"]
+        renamed.name = "Aaa"
+        scene_index.track_changed([renamed])
+    elif change == "remove":
+        removed = indexed_scene.pop("Cube.002")
+        scene.objects.remove(removed)
+        scene_index.track_removed([scene_index.object_key(removed)])
+    elif change == "add":
+        early = indexed_scene["Aaa"] = FakeObject("Aaa")
+        scene.objects.append(early)
+        scene_index.track_added(early)
+    else:
+        scene.objects.remove(indexed_scene["Cube.001"])
+        scene_index.REVISIONS.bump(structural=True)
+
+    with pytest.raises(StaleCursorError):
+        core.capture_snapshot({"page_size": 5, "cursor": cursor})
+    relaxed = core.capture_snapshot({"page_size": 5, "cursor": cursor, "consistency": "relaxed"})
+    assert relaxed["objects"][0]["name"] == "Cube.005"
+
+
+def test_name_index_change_log_covers_only_recent_revisions(monkeypatch):
+    import mcpblender_addon.index.name_index as name_index
+
+    monkeypatch.setattr(name_index, "CHANGE_LOG_SIZE", 2)
+    index = NameIndex()
+    index.add("1", "b")
+    since = index.revision
+    index.add("2", "z")
+    assert not index.changed_up_to(("b", "1"), since)
+    assert index.changed_up_to(("z", "2"), since)
+
+    index.add("3", "y")
+    index.add("4", "x")  # the log no longer reaches back to `since`
+    assert index.changed_up_to(("b", "1"), since)
+    index.clear()
+    assert index.changed_up_to(("b", "1"), index.revision - 1)
+
+
+def test_snapshot_job_captures_the_page_in_chunks(indexed_scene):
+    steps = core.iter_capture_snapshot({"page_size": 12, "fields": ["name"]}, chunk_size=5)
+    assert [next(steps), next(steps)] == [(5, 12), (10, 12)]
+    page = core.run_to_completion(steps)
+
+    assert [o["name"] for o in page["objects"]] == [f"Cube.{i:03d}" for i in range(12)]
+    assert not page["complete"]
+    rest = core.capture_snapshot({"page_size": 100, "cursor": page["next_cursor"]})
+    assert rest["objects"][0]["name"] == "Cube.012"
+    assert rest["complete"]
+
+
+def test_snapshot_job_spends_one_budget_at_one_level(indexed_scene, monkeypatch):
+    clock = [0.0]
+    fake_time = SimpleNamespace(monotonic=lambda: clock[0], perf_counter=lambda: clock[0], time=lambda: 0.0)
+    monkeypatch.setattr(core, "time", fake_time)
+    monkeypatch.setattr(deadline, "time", fake_time)
+    monkeypatch.setattr(core, "SNAPSHOT_COSTS", levels.SnapshotCostModel({"summary": 0.01, "light": 0.1, "full": 10.0}))
+    args = {"level": "full", "min_level": "summary", "budget_ms": 100, "page_size": 20}
+    steps = core.iter_capture_snapshot(args, chunk_size=5)
+    assert next(steps) == (5, 20)
+
+    # Later chunks neither re-pick the level nor get a fresh budget.
+    monkeypatch.setattr(core, "SNAPSHOT_COSTS", levels.SnapshotCostModel({"summary": 0.01, "light": 1000.0}))
+    assert next(steps) == (10, 20)
+    clock[0] = 0.2
+    page = core.run_to_completion(steps)
+
+    assert page["level"] == "light" and page["requested_level"] == "full"
+    assert page["truncated"] and len(page["objects"]) == 11
+    assert page["budget"] == {"budget_ms": 100.0, "elapsed_ms": 200.0}
+
+
+def test_search_type_filter_and_foreign_cursor(indexed_scene):
+    result = core.scenegraph_search({"type": "light"})
+    assert result["count"] == 1
+    assert result["objects"][0]["name"] == "Light"
+
+    cursor = core.scenegraph_search({"query": "cube", "limit": 1})["next_cursor"]
+    with pytest.raises(ValueError):
+        core.scenegraph_search({"query": "light", "cursor": cursor})
+
+
+def test_snapshot_reencodes_only_changed_objects(indexed_scene, monkeypatch):
+    built = []
+    real_payload = core._object_payload
+    monkeypatch.setattr(core, "_object_payload", lambda obj, plan=None: built.append(obj.name) or real_payload(obj, plan))
+
+    first = core.capture_snapshot({"page_size": 100})
+    assert len(built) == 26
+    built.clear()
+
+    cube = indexed_scene["Cube.003"]
+    cube.location = (1.0, 2.0, 3.0)
+    scene_index.track_moved([cube])
+    second = core.capture_snapshot({"page_size": 100})
+
+    assert built == ["Cube.003"]
+    assert second["objects"][3]["location"] == [1.0, 2.0, 3.0]
+    assert second["objects"][4] == first["objects"][4]
+    assert core.FRAGMENT_CACHE.stats()["hits"] == 25
+
+
+def test_summary_level_counts_types_and_collections(indexed_scene, monkeypatch):
+    indexed_scene["Light"].users_collection = [SimpleNamespace(name="Lights")]
+    monkeypatch.setattr(core, "_bbox_world", lambda obj: {"min": [-1.0, 0.0, 0.0], "max": [1.0, 2.0, 0.5]})
+
+    summary = core.capture_snapshot({"level": "summary"})
+    assert "objects" not in summary and summary["complete"]
+    assert summary["counted"] == summary["total"] == 26
+    assert summary["types"] == {"LIGHT": 1, "MESH": 25}
+    assert summary["collections"] == {"Lights": 1}
+    assert summary["bounds"] == {"min": [-1.0, 0.0, 0.0], "max": [1.0, 2.0, 0.5]}
+
+
+def test_budget_steps_level_down(indexed_scene, monkeypatch):
+    monkeypatch.setattr(core, "SNAPSHOT_COSTS", levels.SnapshotCostModel({"summary": 0.01, "light": 0.1, "full": 10.0}))
+    page = core.capture_snapshot({"level": "full", "budget_ms": 100, "page_size": 50})
+    assert page["level"] == "light" and page["requested_level"] == "full"
+    assert "bbox_world" in page["objects"][0] and "modifiers" not in page["objects"][0]
+
+    assert core.capture_snapshot({"level": "full", "budget_ms": 100, "min_level": "full"})["level"] == "full"
+
+    with pytest.raises(ValueError):
+        core.capture_snapshot({"cursor": encode_cursor({"s": "Scene", "a": ["cube.000", "0"], "l": "summary"})})
+
+
+def test_cursor_pins_level_under_budget(indexed_scene, monkeypatch):
+    monkeypatch.setattr(core, "SNAPSHOT_COSTS", levels.SnapshotCostModel({"summary": 0.01, "light": 0.1, "full": 10.0}))
+    args = {"level": "light", "min_level": "summary", "budget_ms": 100, "page_size": 10}
+    page = core.capture_snapshot(args)
+    assert page["level"] == "light"
+    names = [o["name"] for o in page["objects"]]
+
+    # The model now says light no longer fits; later pages still continue at light.
+    monkeypatch.setattr(core, "SNAPSHOT_COSTS", levels.SnapshotCostModel({"summary": 0.01, "light": 1000.0}))
+    while page["next_cursor"]:
+        page = core.capture_snapshot({**args, "cursor": page["next_cursor"]})
+        assert page["level"] == "light" and "requested_level" not in page
+        names.extend(o["name"] for o in page["objects"])
+    assert names == sorted(n for n in indexed_scene.keys() if n != "Unlinked")
+
+
+def test_budget_truncates_with_cursor(indexed_scene, monkeypatch):
+    ticks = iter(range(1000))
+    monkeypatch.setattr(core, "time", SimpleNamespace(perf_counter=lambda: next(ticks) / 1000.0, time=lambda: 0.0))
+    monkeypatch.setattr(core, "SNAPSHOT_COSTS", levels.SnapshotCostModel())
+
+    page = core.capture_snapshot({"level": "light", "budget_ms": 5, "page_size": 100})
+    assert page["truncated"] and not page["complete"]
+    names = [o["name"] for o in page["objects"]]
+    assert 0 < len(names) < 26
+    while page["next_cursor"]:
+        page = core.capture_snapshot({"level": "light", "budget_ms": 5, "cursor": page["next_cursor"]})
+        names.extend(o["name"] for o in page["objects"])
+    assert names == sorted(n for n in indexed_scene.keys() if n != "Unlinked")
+    assert core.SNAPSHOT_COSTS.stats()["light"]["samples"] > 1
+
+
+def test_cost_model_learns_from_observations():
+    model = levels.SnapshotCostModel({"light": 1.0, "full": 1.0}, smoothing=0.5)
+    model.observe("full", 100, 400.0)  # first sample replaces the seed
+    assert model.per_object_ms("full") == 4.0
+    model.observe("full", 100, 200.0)
+    assert model.per_object_ms("full") == 3.0
+    assert model.choose("full", "light", 100, 250) == "light"
+    assert model.choose("full", "full", 100, 250) == "full"
+    assert model.choose("full", "light", 100, 1000) == "full"
+
+
+def test_search_past_deadline_returns_partial_pages(indexed_scene, monkeypatch):
+    monkeypatch.setattr(core, "DEADLINE_POLL_EVERY", 4)
+    seen = []
+    cursor = None
+    with deadline_scope(0.0):
+        while True:
+            page = core.scenegraph_search({"query": "cube", "limit": 10, "cursor": cursor})
+            assert page["truncated"] and len(page["objects"]) <= 4
+            seen.extend(o["name"] for o in page["objects"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+    assert seen == sorted(name for name in indexed_scene.keys() if name.startswith("Cube"))
+
+
+def test_snapshot_treats_request_deadline_as_budget(indexed_scene):
+    with deadline_scope(0.0):
+        page = core.capture_snapshot({"page_size": 100})
+    assert page["truncated"] and len(page["objects"]) == 1 and page["next_cursor"]
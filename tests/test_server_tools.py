@@ -100,3 +100,26 @@ def test_object_delete_forwards_call():
     )
     assert response.ok
     assert bridge.call_rpc_calls[-1][0] == "object.delete"
+
+
+def test_mesh_upload_forwards_base64_as_frame():
+    import base64
+
+    from mcpblender_server.bridge_client import decode_frame, encode_frame
+
+    class UploadBridge(FakeBridge):
+        def call_rpc_frame(self, method, params, sections):
+            self.frame = encode_frame({"method": method, "params": params}, sections)
+            return {"ok": True, "data": {"name": params["name"]}}
+
+    bridge = UploadBridge()
+    registry = build_registry(bridge)
+    positions = bytes(36)
+    params = {"name": "Tri", "positions": base64.b64encode(positions).decode(), "indices": [0, 1, 2]}
+    response = registry.dispatch(ToolRequest(method="mesh.from_buffers", params=params, request_id="up"))
+
+    assert response.ok
+    header, sections = decode_frame(bridge.frame)
+    assert header["params"] == {"name": "Tri", "indices": [0, 1, 2]}
+    assert bytes(sections["positions"]) == positions
+    assert header["sections"][0]["count"] == 3
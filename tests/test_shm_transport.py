@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+from mcpblender_addon.bridge_http import server, shm
+from mcpblender_server.bridge_client import BridgeClient, SharedPayload
+
+pytestmark = pytest.mark.skipif(not shm.HAS_SHM or not os.path.isdir(shm.SHM_DIR), reason="needs POSIX shared memory")
+
+
+@pytest.fixture
+def store(monkeypatch):
+    now = [0.0]
+    store = shm.SharedPayloadStore(min_bytes=64, ttl_seconds=5.0, clock=lambda: now[0])
+    monkeypatch.setattr(server, "SHM_STORE", store)
+    yield store, now
+    store.reap(everything=True)
+
+
+@pytest.fixture
+def bridge(monkeypatch, store):
+    big = {"objects": [{"name": f"Obj{i}"} for i in range(200)]}
+    monkeypatch.setattr(server, "_handler_map", lambda params: {"scene.snapshot": lambda: {"ok": True, "data": big}})
+    instance = server.BridgeServer(host="127.0.0.1", port=0)
+    instance.start()
+    yield instance.url, big
+    instance.stop()
+
+
+def test_large_response_travels_through_shared_memory(bridge, store):
+    url, big = bridge
+    result = BridgeClient(base_url=url).call_rpc("scene.snapshot", {})
+
+    assert result == {"ok": True, "data": big}
+    assert store[0].segments_created == 1
+    # The client unlinked the segment after reading it; nothing is left to reap.
+    assert store[0].reap(everything=True) == 0
+
+
+def test_opted_out_client_gets_inline_json(bridge, store):
+    url, big = bridge
+    result = BridgeClient(base_url=url, use_shm=False).call_rpc("scene.snapshot", {})
+
+    assert result["data"] == big
+    assert store[0].segments_created == 0
+
+
+def test_unclaimed_segments_expire(store):
+    store, now = store
+    handle = store.put(b"x" * 128, "application/json")
+    assert os.path.exists(os.path.join(shm.SHM_DIR, handle["name"]))
+
+    assert store.reap() == 0
+    now[0] = 6.0
+    assert store.reap() == 1
+    assert not os.path.exists(os.path.join(shm.SHM_DIR, handle["name"]))
+
+
+def test_zero_copy_payload_releases_segment(store):
+    store, _ = store
+    handle = store.put(b"frame-bytes" * 10, "application/vnd.mcpblender.frame")
+    with SharedPayload(handle) as payload:
+        assert bytes(payload.view[:11]) == b"frame-bytes"
+    assert payload.view is None
+    assert not os.path.exists(os.path.join(shm.SHM_DIR, handle["name"]))
+
+
+def test_sweep_removes_segments_of_dead_bridges(tmp_path):
+    dead = tmp_path / f"{shm.SHM_PREFIX}999999999_abc"
+    alive = tmp_path / f"{shm.SHM_PREFIX}{os.getpid()}_abc"
+    other = tmp_path / "unrelated"
+    for path in (dead, alive, other):
+        path.write_bytes(b"")
+
+    assert shm.SharedPayloadStore().sweep_stale(str(tmp_path)) == 1
+    assert not dead.exists() and alive.exists() and other.exists()
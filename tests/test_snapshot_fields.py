@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import pytest
+
+from mcpblender_addon.snapshot import light_snapshot
+from mcpblender_addon.snapshot.fields import FieldRegistry, parse_fields
+
+
+def _registry(calls):
+    registry = FieldRegistry()
+
+    @registry.field("id")
+    def _id(obj):
+        calls.append("id")
+        return obj.name
+
+    @registry.field("name")
+    def _name(obj):
+        calls.append("name")
+        return obj.name
+
+    @registry.field("expensive")
+    def _expensive(obj):
+        calls.append("expensive")
+        return 42
+
+    @registry.field("maybe", optional=True)
+    def _maybe(obj):
+        return None
+
+    return registry
+
+
+def test_projection_only_runs_requested_extractors():
+    calls = []
+    registry = _registry(calls)
+    obj = SimpleNamespace(name="Cube")
+
+    assert registry.extract(obj, registry.plan(["name"])) == {"id": "Cube", "name": "Cube"}
+    assert "expensive" not in calls
+    assert registry.extract(obj, registry.plan()) == {"id": "Cube", "name": "Cube", "expensive": 42}
+
+
+def test_plans_are_cached_and_validated():
+    registry = _registry([])
+    assert registry.plan("name, id") is registry.plan(["id", "name"])
+    with pytest.raises(ValueError):
+        registry.plan(["nope"])
+
+
+def test_parse_fields_defaults_to_all():
+    assert parse_fields(None) is None
+    assert parse_fields("") is None
+    assert parse_fields("a,b") == ("a", "b")
+
+
+def test_light_snapshot_registers_spec_fields_in_order():
+    assert light_snapshot.OBJECT_FIELDS.names() == [
+        "id",
+        "name",
+        "type",
+        "location",
+        "rotation_euler",
+        "scale",
+        "bbox_world",
+        "parent_id",
+        "collections",
+        "visible",
+        "material_names",
+        "polycount",
+    ]
+    obj = SimpleNamespace(name="Empty", type="EMPTY", location=(1.0, 2.0, 3.0))
+    plan = light_snapshot.OBJECT_FIELDS.plan(["location", "polycount"])
+    assert light_snapshot.FieldRegistry.extract(obj, plan) == {"id": "Empty", "location": [1.0, 2.0, 3.0]}
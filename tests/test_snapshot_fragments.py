@@ -0,0 +1,28 @@
+import json
+
+from mcpblender_addon.snapshot.fragments import EncodedObjects, FragmentCache, encode_fragment, encode_json
+
+
+def test_encode_json_splices_cached_fragments():
+    objects = EncodedObjects([encode_fragment({"id": "1", "location": (1.0, 0.0, 0.0)}), b'{"id":"2"}'])
+    body = encode_json({"ok": True, "data": {"objects": objects, "note": "\x00fragment:0\x00"}})
+
+    decoded = json.loads(body)
+    assert decoded["data"]["objects"] == [{"id": "1", "location": [1.0, 0.0, 0.0]}, {"id": "2"}]
+    assert decoded["data"]["note"] == "\x00fragment:0\x00"
+    assert objects == decoded["data"]["objects"]
+    assert [o["id"] for o in objects] == ["1", "2"] and len(objects) == 2
+
+
+def test_fragment_cache_validates_and_evicts_by_bytes():
+    cache = FragmentCache(max_bytes=20)
+    cache.put(("a",), (1,), b"x" * 10)
+    cache.put(("b",), (1,), b"y" * 10)
+    assert cache.get(("a",), (1,)) == b"x" * 10
+    assert cache.get(("a",), (2,)) is None  # revision moved on
+
+    cache.put(("c",), (1,), b"z" * 10)  # evicts "b", the least recently used
+    assert cache.get(("b",), (1,)) is None
+    stats = cache.stats()
+    assert stats["bytes"] == 20 and stats["evictions"] == 1
+    assert stats["hit_rate"] == round(1 / 3, 4)
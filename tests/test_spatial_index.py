@@ -0,0 +1,55 @@
+import random
+
+from mcpblender_addon.index.spatial_index import SpatialGrid, auto_cell_size, box_distance
+
+
+def _unit_box(x, y, z):
+    return ((x - 0.5, y - 0.5, z - 0.5), (x + 0.5, y + 0.5, z + 0.5))
+
+
+def _grid(count=500, seed=7):
+    rng = random.Random(seed)
+    boxes = {str(i): _unit_box(rng.uniform(-50, 50), rng.uniform(-50, 50), rng.uniform(-5, 5)) for i in range(count)}
+    grid = SpatialGrid(cell_size=auto_cell_size(boxes.values()))
+    for key, box in boxes.items():
+        grid.insert(key, box)
+    return grid, boxes
+
+
+def test_region_query_matches_brute_force():
+    grid, boxes = _grid()
+    lo, hi = (-10.0, -10.0, -10.0), (10.0, 5.0, 10.0)
+    expected = sorted(
+        key for key, (blo, bhi) in boxes.items() if all(blo[i] <= hi[i] and lo[i] <= bhi[i] for i in range(3))
+    )
+    assert grid.query_region(lo, hi) == expected
+    inside = grid.query_region(lo, hi, contained=True)
+    assert set(inside) <= set(expected)
+
+
+def test_nearest_and_radius_match_brute_force():
+    grid, boxes = _grid()
+    for point in [(0.0, 0.0, 0.0), (48.0, -48.0, 0.0), (500.0, 500.0, 500.0)]:
+        brute = sorted((box_distance(point, box), key) for key, box in boxes.items())
+        assert [key for _, key in grid.nearest(point, k=5)] == [key for _, key in brute[:5]]
+        within = grid.within_radius(point, 12.0)
+        assert within == [hit for hit in brute if hit[0] <= 12.0]
+
+
+def test_update_and_remove_move_boxes():
+    grid = SpatialGrid(cell_size=1.0)
+    grid.insert("a", _unit_box(0, 0, 0))
+    grid.insert("a", _unit_box(20, 0, 0))
+    assert grid.query_region((-1, -1, -1), (1, 1, 1)) == []
+    assert grid.nearest((19, 0, 0), k=1)[0][1] == "a"
+    grid.remove("a")
+    assert len(grid) == 0
+    assert grid.nearest((0, 0, 0), k=1) == []
+
+
+def test_oversized_boxes_are_always_considered():
+    grid = SpatialGrid(cell_size=1.0)
+    grid.insert("ground", ((-1000.0, -1000.0, -0.1), (1000.0, 1000.0, 0.0)))
+    grid.insert("cube", _unit_box(3, 3, 3))
+    assert grid.query_region((500, 500, -1), (501, 501, 1)) == ["ground"]
+    assert grid.nearest((3, 3, 1), k=1)[0][1] == "ground"
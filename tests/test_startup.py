@@ -0,0 +1,86 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from mcpblender_server.bridge_client import BridgeClient
+from mcpblender_server.startup import StartupProfile
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "server_mcp", "src")
+
+
+def test_profile_reports_phases_once():
+    ticks = iter([0.0, 0.010, 0.012, 0.020])
+    stream = io.StringIO()
+    profile = StartupProfile(enabled=True, clock=lambda: next(ticks), stream=stream)
+    profile.mark("import")
+    profile.mark("registry")
+    profile.report()
+    profile.mark("first_response")
+    profile.report()
+
+    (line,) = stream.getvalue().splitlines()
+    assert json.loads(line) == {
+        "startup": {"phases": [{"phase": "import", "ms": 10.0}, {"phase": "registry", "ms": 2.0}], "total_ms": 12.0}
+    }
+
+
+def test_disabled_profile_is_silent():
+    stream = io.StringIO()
+    profile = StartupProfile(enabled=False, stream=stream)
+    profile.mark("import")
+    profile.report()
+    assert stream.getvalue() == "" and profile.phases == []
+
+
+@pytest.mark.parametrize(
+    "module, heavy",
+    [
+        ("mcpblender_server.server", ["urllib.request", "concurrent.futures", "multiprocessing.shared_memory", "mcpblender_server.pool"]),
+        ("mcpblender_server.mcp_stdio", ["urllib.request", "multiprocessing.shared_memory", "mcp"]),
+    ],
+)
+def test_entry_points_defer_heavy_imports(module, heavy):
+    code = f"import sys, {module}; print([m for m in {heavy!r} if m in sys.modules])"
+    out = subprocess.run([sys.executable, "-c", code], env=dict(os.environ, PYTHONPATH=SRC), capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
+
+
+def test_bridge_client_connects_lazily_and_prewarms():
+    probes = []
+
+    class Health(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            probes.append(self.path)
+            body = b'{"ok": true, "data": {"status": "ready"}}'
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Health)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = BridgeClient(f"http://127.0.0.1:{server.server_port}")
+        assert client._opener is None
+
+        client.prewarm().join(5)
+        assert client._opener is not None
+        assert probes == ["/health"]
+    finally:
+        server.shutdown()
+
+
+def test_prewarm_ignores_unreachable_bridge():
+    client = BridgeClient("http://127.0.0.1:9", timeout=0.2)
+    thread = client.prewarm()
+    thread.join(5)
+    assert not thread.is_alive()
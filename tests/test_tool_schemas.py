@@ -0,0 +1,83 @@
+import inspect
+
+import pytest
+
+from mcpblender_server.schema import ToolRequest
+from mcpblender_server.server import build_registry
+from mcpblender_server.tools.schemas import TOOL_SCHEMAS, compile_schema, make_tool_function
+
+
+class FakeBridge:
+    def __init__(self) -> None:
+        self.call_rpc_calls = []
+
+    def call_rpc(self, method, params):
+        self.call_rpc_calls.append((method, params))
+        return {"ok": True, "data": {"method": method, "params": params}}
+
+
+@pytest.mark.parametrize(
+    "method, params, path",
+    [
+        ("object.delete", {}, "params"),
+        ("object.create_cube", {"location": [1, 2]}, "location"),
+        ("object.create_cube", {"size": "big"}, "size"),
+        ("object.create_cube", {"size": 0}, "size"),
+        ("object.transform", {"id": "1", "space": "screen"}, "space"),
+        ("object.transform_many", {"ids": ["1", 2]}, "ids[1]"),
+        ("scenegraph.query_region", {"min": [0, 0, 0]}, "max"),
+        ("mesh.from_buffers", {"positions": 5}, "positions"),
+        ("jobs.status", {"job_id": ""}, "job_id"),
+    ],
+)
+def test_invalid_calls_are_rejected_before_the_bridge(method, params, path):
+    bridge = FakeBridge()
+    registry = build_registry(bridge)
+    response = registry.dispatch(ToolRequest(method=method, params=params, request_id="bad"))
+
+    assert not response.ok
+    assert response.error.code == "invalid_params"
+    assert path in [problem["path"] for problem in response.error.details["errors"]]
+    assert bridge.call_rpc_calls == []
+    assert registry.state.diagnostics_payload()["last_error"]["code"] == "invalid_params"
+
+
+def test_errors_are_collected_per_field():
+    validate = compile_schema(TOOL_SCHEMAS["object.create_cube"])
+    errors = validate({"location": [0, 0, "x"], "rotation": [0], "share_mesh": 1})
+    assert errors == [
+        {"path": "location[2]", "message": "expected number"},
+        {"path": "rotation", "message": "expected 3 items, got 1"},
+        {"path": "share_mesh", "message": "expected boolean"},
+    ]
+    assert validate({"name": "Box", "size": 2, "location": [0, 0, 1.5]}) == []
+
+
+def test_alternative_selectors_are_reported_together():
+    validate = compile_schema(TOOL_SCHEMAS["object.move_object"])
+    assert validate({"delta": [1, 0, 0]}) == [{"path": "params", "message": "one of id, name is required"}]
+    assert validate({"name": "Cube", "delta": [1, 0, 0]}) == []
+
+
+def test_describe_publishes_schemas():
+    registry = build_registry(FakeBridge())
+    response = registry.dispatch(ToolRequest(method="tools.describe", params={}, request_id="d"))
+    assert response.ok
+    tools = response.data["tools"]
+    assert tools["object.create_cube"]["properties"]["location"]["minItems"] == 3
+    assert "local" not in tools["core.ping"]
+
+    one = registry.dispatch(ToolRequest(method="tools.describe", params={"name": "object.delete"}, request_id="d1"))
+    assert list(one.data["tools"]) == ["object.delete"]
+
+
+def test_tool_function_signature_follows_schema():
+    calls = []
+    tool = make_tool_function("scenegraph.nearest", TOOL_SCHEMAS["scenegraph.nearest"], lambda m, p: calls.append((m, p)))
+    signature = inspect.signature(tool)
+
+    assert tool.__name__ == "scenegraph_nearest"
+    assert signature.parameters["point"].default is inspect.Parameter.empty
+    assert signature.parameters["k"].default is None
+    tool(point=[0, 0, 0], k=2, max_distance=None, limit=None)
+    assert calls == [("scenegraph.nearest", {"point": [0, 0, 0], "k": 2})]
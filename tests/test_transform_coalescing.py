@@ -0,0 +1,179 @@
+import threading
+import time
+
+import pytest
+
+from mcpblender_addon.bridge_http import server
+from mcpblender_addon.bridge_http.coalesce import Batch, TransformCoalescer, coalesce_key
+from mcpblender_addon.bridge_http.scheduler import FairScheduler
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+@pytest.fixture
+def bridge_state(monkeypatch):
+    calls = []
+
+    def handler_map(params):
+        def apply():
+            calls.append(params)
+            return {"ok": True, "data": {"name": params.get("name")}}
+
+        return {"object.move_object": apply, "object.transform": apply}
+
+    coalescer = TransformCoalescer(enabled=True)
+    monkeypatch.setattr(server, "_handler_map", handler_map)
+    monkeypatch.setattr(server, "COALESCER", coalescer)
+    monkeypatch.setattr(server, "SCHEDULER", FairScheduler())
+    return coalescer, calls
+
+
+def _submit_while_locked(coalescer, requests, deadline=None, hold=0.0):
+    """Dispatch `requests` one after another while BPY_LOCK is held, then release it after `hold` seconds."""
+    results = [None] * len(requests)
+    threads = []
+
+    def call(index, method, params):
+        results[index] = server.dispatch_rpc(method, params, deadline)
+
+    with server.BPY_LOCK:
+        for index, (method, params) in enumerate(requests):
+            before = coalescer.stats()
+            thread = threading.Thread(target=call, args=(index, method, params))
+            thread.start()
+            threads.append(thread)
+            seen = before["batches"] + before["merged"]
+            assert _wait_for(lambda: coalescer.stats()["batches"] + coalescer.stats()["merged"] > seen)
+        assert _wait_for(lambda: server.SCHEDULER.stats()["running"] is not None)
+        time.sleep(hold)
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+def test_batch_merges_last_writer_wins_and_sums_deltas():
+    batch = Batch(("Cube", "world"), "object.move_object", {"name": "Cube", "delta": [1, 0, 0]})
+    batch.merge({"name": "Cube", "delta": [0, 2, 0]})
+    assert batch.params() == {"name": "Cube", "space": "world", "delta": [1.0, 2.0, 0.0]}
+
+    batch.merge({"name": "Cube", "location": [5, 5, 5], "scale": [2, 2, 2]})
+    batch.merge({"name": "Cube", "delta": [0, 0, 1], "scale": [3, 3, 3]})
+    assert batch.params() == {"name": "Cube", "space": "world", "location": [5.0, 5.0, 6.0], "scale": [3.0, 3.0, 3.0]}
+    assert batch.members == 4
+
+
+def test_only_plain_single_object_transforms_are_merged():
+    assert coalesce_key({"name": "Cube", "location": [1, 2, 3]}) == ("Cube", "world")
+    assert coalesce_key({"id": "k1", "rotation": [0, 0, 1], "space": "local"}) == ("k1", "local")
+    assert coalesce_key({"location": [1, 2, 3]}) is None
+    assert coalesce_key({"name": "Cube", "location": [1, 2]}) is None
+    assert coalesce_key({"name": "Cube", "location": [1, 2, 3], "extra": True}) is None
+
+
+def test_queued_transforms_of_one_object_run_once(bridge_state):
+    coalescer, calls = bridge_state
+    results = _submit_while_locked(
+        coalescer,
+        [
+            ("object.move_object", {"name": "Cube", "delta": [1, 0, 0]}),
+            ("object.move_object", {"name": "Cube", "delta": [1, 0, 0]}),
+            ("object.transform", {"name": "Cube", "location": [5, 5, 5], "rotation": [0, 0, 1]}),
+            ("object.move_object", {"name": "Cube", "delta": [0, 1, 0]}),
+            ("object.transform", {"name": "Lamp", "location": [1, 1, 1]}),
+        ],
+    )
+
+    assert sorted(calls, key=lambda p: p["name"]) == [
+        {"name": "Cube", "space": "world", "location": [5.0, 6.0, 5.0], "rotation": [0.0, 0.0, 1.0]},
+        {"name": "Lamp", "space": "world", "location": [1.0, 1.0, 1.0]},
+    ]
+    assert all(result == results[0] for result in results[:4])
+    assert results[0]["data"]["coalesced"] == 4
+    assert results[4]["data"] == {"name": "Lamp", "coalesced": 1}
+    assert coalescer.stats() == {"enabled": True, "batches": 2, "merged": 3, "pending": 0}
+
+
+def test_requests_after_the_batch_started_open_a_new_one():
+    coalescer = TransformCoalescer(enabled=True)
+    applied = []
+    late = []
+
+    def handler_for(method, params):
+        return lambda: applied.append(params) or {"ok": True, "data": {}}
+
+    def submit(location, run):
+        return coalescer.submit("object.transform", {"name": "Cube", "location": location}, None, run, handler_for)
+
+    def run_and_send_another(call):
+        result = call()  # the batch is closed now
+        thread = threading.Thread(target=lambda: late.append(submit([2, 2, 2], lambda call: call())))
+        thread.start()
+        thread.join(5)
+        return result
+
+    first = submit([1, 1, 1], run_and_send_another)
+
+    assert [p["location"] for p in applied] == [[1.0, 1.0, 1.0], [2.0, 2.0, 2.0]]
+    assert first["data"]["coalesced"] == late[0]["data"]["coalesced"] == 1
+    assert coalescer.stats()["batches"] == 2
+
+
+def test_merged_callers_share_a_queued_timeout(bridge_state):
+    coalescer, calls = bridge_state
+    results = _submit_while_locked(
+        coalescer,
+        [
+            ("object.move_object", {"name": "Cube", "delta": [1, 0, 0]}),
+            ("object.move_object", {"name": "Cube", "delta": [1, 0, 0]}),
+        ],
+        deadline=time.monotonic() + 0.3,
+        hold=0.5,
+    )
+    assert calls == []
+    assert [r["error"]["details"] for r in results] == [{"stage": "queued"}] * 2
+    assert coalescer.stats()["pending"] == 0
+
+
+def test_callers_with_an_earlier_deadline_run_on_their_own():
+    coalescer = TransformCoalescer(enabled=True)
+    started, release = threading.Event(), threading.Event()
+    applied = []
+
+    def handler_for(method, params):
+        return lambda: applied.append(params["location"]) or {"ok": True, "data": {}}
+
+    def held(call):
+        started.set()
+        release.wait(5)
+        return call()
+
+    def submit(location, deadline, run=lambda call: call()):
+        params = {"name": "Cube", "location": location}
+        return coalescer.submit("object.transform", params, handler_for("object.transform", params), run, handler_for, deadline)
+
+    leader = threading.Thread(target=submit, args=([1, 1, 1], 10.0, held))
+    leader.start()
+    assert started.wait(5)
+    joiner = threading.Thread(target=submit, args=([3, 3, 3], 20.0))
+    joiner.start()
+    assert _wait_for(lambda: coalescer.stats()["merged"] == 1)
+
+    assert submit([2, 2, 2], 5.0)["ok"]  # would otherwise wait on a batch due after its deadline
+    assert applied == [[2, 2, 2]]
+    release.set()
+    leader.join(5)
+    joiner.join(5)
+    assert applied == [[2, 2, 2], [3.0, 3.0, 3.0]]
+    assert coalescer.stats()["merged"] == 1
+
+
+def test_coalescing_is_off_unless_enabled():
+    assert not server.COALESCER.enabled
+    assert server.parse_args(["--coalesce-transforms"]).coalesce_transforms
@@ -0,0 +1,77 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+from mcpblender_addon.bridge_http import server
+from mcpblender_server.bridge_client import BridgeClient
+from mcpblender_server.bridge_client.unix import resolve_base_url
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+
+
+@pytest.fixture
+def unix_bridge(monkeypatch, tmp_path):
+    monkeypatch.setattr(server, "_handler_map", lambda params: {"scene.snapshot": lambda: {"ok": True, "data": dict(params)}})
+    instance = server.BridgeServer(unix_socket=str(tmp_path / "bridge.sock"))
+    instance.start()
+    yield instance
+    instance.stop()
+
+
+def test_health_and_rpc_over_unix_socket(unix_bridge):
+    client = BridgeClient(base_url=unix_bridge.url)
+
+    assert client.socket_path == unix_bridge.unix_socket
+    assert client.health()["source"] == "mcpblender_bridge"
+    assert client.call_rpc("scene.snapshot", {"page_size": 1}) == {"ok": True, "data": {"page_size": 1}}
+    assert oct(os.stat(unix_bridge.unix_socket).st_mode & 0o777) == "0o600"
+
+
+def test_stop_removes_socket_and_stale_socket_is_replaced(tmp_path):
+    path = str(tmp_path / "stale.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()  # leaves the file behind, like a crashed bridge
+
+    instance = server.BridgeServer(unix_socket=path)
+    instance.start()
+    with pytest.raises(OSError):
+        server.BridgeServer(unix_socket=path)  # live bridge is not stolen
+    instance.stop()
+    assert not os.path.exists(path)
+
+
+def test_base_url_forms():
+    assert resolve_base_url("http://127.0.0.1:9876/") == ("http://127.0.0.1:9876", None)
+    assert resolve_base_url("unix:///tmp/b.sock") == ("unix://%2Ftmp%2Fb.sock", "/tmp/b.sock")
+    assert resolve_base_url("unix://%2Ftmp%2Fb.sock")[1] == "/tmp/b.sock"
+
+
+def test_bridge_cli_arguments():
+    args = server.parse_args(["--port", "9877", "--unix-socket", "/tmp/b.sock"])
+    assert (args.host, args.port, args.unix_socket) == ("127.0.0.1", 9877, "/tmp/b.sock")
+
+
+def test_bridge_script_starts_headless(tmp_path):
+    """The documented launch runs server.py as __main__ (blender --python .../server.py)."""
+    path = tmp_path / "script.sock"
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.dirname(server.__file__))))
+    process = subprocess.Popen(
+        [sys.executable, server.__file__, "--", "--unix-socket", str(path)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        deadline = time.monotonic() + 20
+        while not path.exists() and process.poll() is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert process.poll() is None, process.stderr.read().decode()
+        assert BridgeClient(base_url=f"unix://{path}").health()["ok"]
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
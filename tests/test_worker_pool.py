@@ -0,0 +1,211 @@
+import io
+import os
+import socket
+import sys
+import threading
+import time
+
+import pytest
+
+from mcpblender_server import pool as pool_module
+from mcpblender_server import server
+from mcpblender_server.pool import PoolBusyError, PooledBridgeClient, WorkerPool, blender_command
+from mcpblender_server.schema import ToolRequest
+from mcpblender_server.server import build_registry
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="pool workers listen on Unix sockets")
+
+# Stand-in bridge: the real HTTP bridge without Blender, answering every RPC with its pid.
+STAND_IN = """
+import os, sys, time
+from mcpblender_addon.bridge_http import server
+
+class AnyMethod(dict):
+    def get(self, method, default=None):
+        return lambda: {"ok": True, "data": {"pid": os.getpid(), "method": method}}
+
+server._handler_map = lambda params: AnyMethod()
+args = server.parse_args(sys.argv[1:])
+bridge = server.BridgeServer(unix_socket=args.unix_socket)
+bridge.start()
+while True:
+    time.sleep(1)
+"""
+
+
+@pytest.fixture
+def make_pool(tmp_path):
+    script = tmp_path / "stand_in.py"
+    script.write_text(STAND_IN)
+    pools = []
+
+    def make(size, **kwargs):
+        kwargs.setdefault("start_timeout", 20.0)
+        pool = WorkerPool(size, command=lambda listen_args: [sys.executable, str(script), *listen_args], **kwargs)
+        pool.start()
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.stop()
+
+
+def _python_command(listen_args):
+    """blender_command's script and arguments, run by this interpreter instead of Blender (no bpy)."""
+    command = blender_command(listen_args)
+    return [sys.executable, *command[command.index("--python") + 1 :]]
+
+
+def test_worker_starts_from_the_real_bridge_script():
+    pool = WorkerPool(1, command=_python_command, start_timeout=20.0)
+    try:
+        pool.start()
+        assert pool.workers[0].state == "ready"
+        assert PooledBridgeClient(pool).health()["ok"]
+        assert pool.workers[0].process.poll() is None
+    finally:
+        pool.stop()
+
+
+def _pid(registry, session, request_id="r"):
+    response = registry.dispatch(ToolRequest("scene.snapshot", {}, request_id, session_id=session))
+    assert response.ok, response.error
+    return response.data["pid"]
+
+
+def test_sessions_stick_to_their_worker(make_pool):
+    pool = make_pool(2)
+    registry = build_registry(PooledBridgeClient(pool))
+
+    first, second = _pid(registry, "a"), _pid(registry, "b")
+    assert first != second
+    assert {first, second} == {w.process.pid for w in pool.workers}
+    assert [_pid(registry, "a") for _ in range(3)] == [first] * 3
+    assert pool.stats()["sessions"] == 2
+
+
+def test_new_sessions_queue_until_a_worker_is_released(make_pool):
+    pool = make_pool(1, queue_timeout=0.2)
+    registry = build_registry(PooledBridgeClient(pool))
+    _pid(registry, "a")
+
+    busy = registry.dispatch(ToolRequest("scene.snapshot", {}, "r", session_id="b"))
+    assert busy.error.code == "pool_busy"
+
+    waiter = threading.Thread(target=lambda: pool.acquire("b", timeout=5))
+    waiter.start()
+    time.sleep(0.05)
+    assert pool.stats()["queued"] == 1
+    assert registry.dispatch(ToolRequest("session.end", {}, "end", session_id="a")).data == {"released": True}
+    waiter.join(timeout=5)
+    assert pool.workers[0].sessions == {"b"}
+
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_released_worker_is_recycled_before_the_next_session(make_pool):
+    pool = make_pool(1)
+    registry = build_registry(PooledBridgeClient(pool))
+    first = _pid(registry, "a")
+
+    assert registry.dispatch(ToolRequest("session.end", {}, "end", session_id="a")).data == {"released": True}
+    second = _pid(registry, "b")
+
+    assert second != first and second == pool.workers[0].process.pid
+    assert pool.workers[0].recycles == 1 and pool.workers[0].restarts == 0
+    assert _pid(registry, "b") == second
+
+
+def test_queued_sessions_are_bounded(make_pool):
+    pool = make_pool(1, max_queued=1, queue_timeout=5.0)
+    registry = build_registry(PooledBridgeClient(pool))
+    _pid(registry, "a")
+
+    waiter = threading.Thread(target=lambda: pool.acquire("b"))
+    waiter.start()
+    assert _wait_for(lambda: pool.stats()["queued"] == 1)
+    started = time.monotonic()
+    with pytest.raises(PoolBusyError):
+        pool.acquire("c")
+    assert time.monotonic() - started < 1.0
+
+    pool.release("a")
+    waiter.join(timeout=10)
+    assert pool.workers[0].sessions == {"b"}
+
+
+class BlockedBridge:
+    """Pooled client whose calls block until session.end, like sessions queued for a worker."""
+
+    def __init__(self, pool):
+        self.freed = threading.Event()
+
+    def call_rpc(self, method, params):
+        return {"ok": self.freed.wait(5), "data": {}}
+
+    call_rpc_binary = call_rpc
+
+    def end_session(self):
+        self.freed.set()
+        return True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return None
+
+
+class IdlePool:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def start(self):
+        pass
+
+
+def test_session_end_runs_while_every_executor_thread_is_blocked(monkeypatch):
+    monkeypatch.setattr(pool_module, "WorkerPool", IdlePool)
+    monkeypatch.setattr(pool_module, "PooledBridgeClient", BlockedBridge)
+    blocked = [ToolRequest("scene.snapshot", {}, f"r{i}", session_id=f"s{i}") for i in range(8)]
+    lines = [request.to_json() for request in blocked] + [ToolRequest("session.end", {}, "end", session_id="s0").to_json()]
+    monkeypatch.setattr(sys, "stdin", io.StringIO("\n".join(lines) + "\n"))
+    output = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", output)
+
+    started = time.monotonic()
+    server.run_stdio_server(workers=1)
+
+    assert time.monotonic() - started < 4.0
+    assert output.getvalue().count('"ok": true') == 9
+
+
+def test_dead_worker_is_restarted_and_keeps_its_sessions(make_pool):
+    pool = make_pool(1)
+    registry = build_registry(PooledBridgeClient(pool))
+    before = _pid(registry, "a")
+
+    pool.workers[0].process.kill()
+    pool.workers[0].process.wait()
+    pool.check_health()
+
+    assert pool.workers[0].restarts == 1
+    after = _pid(registry, "a")
+    assert after != before and after == pool.workers[0].process.pid
+    assert os.path.exists(pool.workers[0].url[len("unix://") :])
+
+
+def test_request_session_id_round_trips():
+    request = ToolRequest.from_json('{"method": "core.ping", "request_id": "r", "session_id": "s1"}')
+    assert request.session_id == "s1"
+    assert ToolRequest.from_json(request.to_json()) == request
+    with pytest.raises(ValueError):
+        ToolRequest.from_json('{"method": "core.ping", "request_id": "r", "session_id": 5}')